@@ -4,18 +4,42 @@ Story 2.4 — Calculate Baseline Captation Rates.
 
 GET  /baselines/{tenant_id}          — retrieve the current baseline.
 POST /baselines/{tenant_id}/recalculate — trigger a (re)calculation.
+POST /baselines/recalculate          — recompute every tenant in the background
+                                        (superusers only).
 """
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_current_user
+from app.core.security import get_current_superuser, get_current_user
 from app.db.session import get_db
+from app.services.captation_rates import CaptationRatesService
 from app.services.captation_service import CaptationService, InsufficientDataError
+from app.workers.baseline_recompute import run_baseline_recompute
 
 router = APIRouter(prefix="/baselines", tags=["baselines"])
 _service = CaptationService()
 
 
+@router.post("/recalculate", status_code=202)
+async def recalculate_portfolio(
+    background_tasks: BackgroundTasks,
+    tenant_ids: Optional[List[str]] = Body(default=None, embed=True),
+    current_user: dict = Depends(get_current_superuser),
+):
+    """Recompute the baselines of *tenant_ids* (default: every tenant with PMS data).
+
+    Spans tenants, so it is restricted to superusers (403 otherwise). Runs
+    in the background; per-tenant outcomes and durations are logged.
+    """
+    background_tasks.add_task(run_baseline_recompute, tenant_ids)
+    return {
+        "status": "accepted",
+        "tenants": len(tenant_ids) if tenant_ids is not None else "all",
+    }
+
+
 @router.get("/{tenant_id}")
 async def get_baseline(
     tenant_id: str,
@@ -48,9 +72,13 @@ async def recalculate_baseline(
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """(Re)calculate the captation baseline from all historical PMS sync data."""
+    """(Re)calculate the captation baseline from all historical PMS sync data.
+
+    Also refreshes the tenant's hour-block ``captation_rates``.
+    """
     try:
         baseline = await _service.calculate_baseline(tenant_id, db)
+        await CaptationRatesService().refresh(tenant_id, db, baseline)
     except InsufficientDataError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     except Exception as exc:
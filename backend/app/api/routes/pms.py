@@ -8,16 +8,14 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
-
 from app.core.security import get_current_user
-from app.db.models import RestaurantProfile
+from app.db.models import PMSBackfillJob, RestaurantProfile
 from app.db.session import get_db
 from app.integrations.apaleo_mcp_client import ApaleoMCPClient
-from app.services.apaleo_adapter import ApaleoSyncError, ApaleoPMSAdapter
-from app.services.apaleo_mcp_adapter import ApaleoMCPAdapter
-from app.services.pms_sync import MockPMSAdapter, PMSSyncService
+from app.services.apaleo_adapter import ApaleoSyncError
+from app.services.pms_backfill import DEFAULT_CHUNK_DAYS, PMSBackfillService
+from app.services.pms_sync import PMSSyncService, get_pms_adapter
+from app.workers.pms_backfill import run_backfill_job
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +45,9 @@ async def probe_mcp_connection(
     1. Required env vars are present (APALEO_CLIENT_ID, APALEO_CLIENT_SECRET,
        APALEO_MCP_SERVER_URL).
     2. OAuth2 client-credentials token can be acquired.
-    3. MCP session can be initialised (streamable-HTTP, list_tools handshake).
+    3. A pooled MCP session answers a ping (the session is opened and
+       initialised on first use) and the server lists its tools (cached
+       by the pool for APALEO_MCP_TOOLS_TTL_SECONDS).
 
     Returns a JSON payload with connection status and latency — no DB writes,
     no background tasks, safe to call as a readiness probe.
@@ -69,19 +69,13 @@ async def probe_mcp_connection(
 
     t0 = time.monotonic()
     try:
-        token = await client._get_token()  # noqa: SLF001 — internal probe only
+        await client._get_token()  # noqa: SLF001 — internal probe only
         token_ms = round((time.monotonic() - t0) * 1000, 1)
 
         t1 = time.monotonic()
-        async with streamablehttp_client(
-            client.server_url,
-            headers={"Authorization": f"Bearer {token}"},
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                tools_result = await session.list_tools()
-                tool_names = [t.name for t in (tools_result.tools or [])]
+        await client.ping()
         mcp_ms = round((time.monotonic() - t1) * 1000, 1)
+        tool_names = [t.name for t in await client.list_tools()]
 
     except Exception as exc:
         raise HTTPException(
@@ -141,16 +135,7 @@ async def trigger_pms_sync(
     """
     sync_date = target_date or date.today()
 
-    # Initialize appropriate adapter
-    if use_mock:
-        adapter = MockPMSAdapter()
-        adapter_label = "mock"
-    elif use_mcp:
-        adapter = ApaleoMCPAdapter()
-        adapter_label = "apaleo_mcp"
-    else:
-        adapter = ApaleoPMSAdapter()
-        adapter_label = "apaleo_raw"
+    adapter_label = "mock" if use_mock else "apaleo_mcp" if use_mcp else "apaleo_raw"
 
     # Fetch property for this user
     result = await db.execute(
@@ -164,7 +149,7 @@ async def trigger_pms_sync(
     # Use the linked property ID
     property_id = profile.tenant_id
 
-    service = PMSSyncService(adapter)
+    service = PMSSyncService(get_pms_adapter(adapter_label))
 
     # Run sync in background (includes DB persistence)
     background_tasks.add_task(_sync_task, service, property_id, sync_date)
@@ -177,3 +162,109 @@ async def trigger_pms_sync(
         "adapter": adapter_label,
         "triggered_by": current_user.get("email")
     }
+
+
+# ---------------------------------------------------------------------------
+# Bulk history backfill
+# ---------------------------------------------------------------------------
+
+def _backfill_status(job: PMSBackfillJob) -> Dict[str, Any]:
+    return {
+        "job_id": job.id,
+        "property_id": job.tenant_id,
+        "start_date": job.start_date.isoformat(),
+        "end_date": job.end_date.isoformat(),
+        "adapter": job.adapter,
+        "status": job.status,
+        "chunks_completed": len(job.completed_chunks or []),
+        "chunks_total": job.chunks_total,
+        "rows_written": job.rows_written,
+        "error": job.error_message,
+    }
+
+
+async def _get_owned_profile(db: AsyncSession, current_user: Dict[str, Any]) -> RestaurantProfile:
+    result = await db.execute(
+        select(RestaurantProfile).where(RestaurantProfile.owner_id == current_user["id"])
+    )
+    profile = result.scalars().first()
+    if not profile:
+        raise HTTPException(status_code=404, detail="No restaurant profile linked to this user.")
+    return profile
+
+
+async def _get_owned_job(
+    db: AsyncSession, current_user: Dict[str, Any], job_id: int
+) -> PMSBackfillJob:
+    profile = await _get_owned_profile(db, current_user)
+    job = await db.get(PMSBackfillJob, job_id)
+    if job is None or job.tenant_id != profile.tenant_id:
+        raise HTTPException(status_code=404, detail="Backfill job not found.")
+    return job
+
+
+@router.post("/backfill")
+async def trigger_pms_backfill(
+    background_tasks: BackgroundTasks,
+    start_date: date,
+    end_date: date,
+    chunk_days: int = Query(DEFAULT_CHUNK_DAYS, ge=1, le=366),
+    use_mock: bool = Query(True, description="Whether to use the Mock adapter for pilot verification"),
+    use_mcp: bool = Query(False, description="Use Apaleo MCP Server instead of raw REST API (HOS-101)"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Imports PMS history for [start_date, end_date] into pms_sync_logs.
+
+    The range is fetched in concurrent chunks in the background; poll
+    ``GET /pms/backfill/{job_id}`` for progress. Adapter priority: mock > mcp > raw API.
+    """
+    adapter_label = "mock" if use_mock else "apaleo_mcp" if use_mcp else "apaleo_raw"
+    profile = await _get_owned_profile(db, current_user)
+
+    try:
+        job = await PMSBackfillService.create_job(
+            db,
+            tenant_id=profile.tenant_id,
+            start_date=start_date,
+            end_date=end_date,
+            adapter_name=adapter_label,
+            chunk_days=chunk_days,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    background_tasks.add_task(run_backfill_job, job.id)
+    return {
+        "message": "PMS backfill started in background",
+        **_backfill_status(job),
+        "triggered_by": current_user.get("email"),
+    }
+
+
+@router.get("/backfill/{job_id}")
+async def get_pms_backfill(
+    job_id: int,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Returns the progress of a backfill job owned by the caller's property."""
+    return _backfill_status(await _get_owned_job(db, current_user, job_id))
+
+
+@router.post("/backfill/{job_id}/resume")
+async def resume_pms_backfill(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-runs a backfill job; only chunks not yet completed are fetched."""
+    job = await _get_owned_job(db, current_user, job_id)
+    if job.status == "completed":
+        raise HTTPException(status_code=409, detail="Backfill job already completed.")
+    if job.status == "running":
+        raise HTTPException(status_code=409, detail="Backfill job is already running.")
+    background_tasks.add_task(run_backfill_job, job.id)
+    return {"message": "PMS backfill resumed in background", **_backfill_status(job)}
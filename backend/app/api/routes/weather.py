@@ -4,6 +4,9 @@ POST /api/v1/weather/sync
   - 202 Accepted immediately (BackgroundTasks pattern)
   - Background task calls WeatherIngestionService.sync_property
 
+GET /api/v1/weather/forecasts
+  - Hourly forecasts for a property, joined from its shared grid cell
+
 Architecture constraints:
 - Fat Backend: no weather calls from Next.js.
 - RFC 7807 error format via problem_details_handler (registered in main.py).
@@ -12,16 +15,20 @@ Architecture constraints:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.core.security import get_current_user
 from app.db.models import RestaurantProfile
 from app.db.session import AsyncSessionLocal, get_db
-from app.schemas.weather import WeatherSyncRequest, WeatherSyncResponse
+from app.schemas.weather import (
+    WeatherForecastOut,
+    WeatherSyncRequest,
+    WeatherSyncResponse,
+)
 from app.services.weather_ingestion import WeatherIngestionService
 
 router = APIRouter(prefix="/weather", tags=["weather"])
@@ -54,7 +61,7 @@ async def trigger_weather_sync(
 
     If `propertyId` is omitted in the body, the user's default property is used.
     """
-    # Resolve the target property (body.tenant_id is optional; None = use caller's property)
+    # Resolve the target property (body.tenant_id is optional; None = caller's)
     property_id = body.tenant_id
 
     if property_id is None:
@@ -94,6 +101,50 @@ async def trigger_weather_sync(
     )
 
 
+@router.get(
+    "/forecasts",
+    response_model=List[WeatherForecastOut],
+    summary="List hourly weather forecasts for a property",
+    responses={
+        403: {"description": "Property not linked to this user"},
+        404: {"description": "No property linked to this user"},
+    },
+)
+async def list_weather_forecasts(
+    tenant_id: Optional[str] = Query(None, description="Target property (tenant_id)."),
+    hours: int = Query(168, gt=0, le=168, description="Look-ahead window in hours"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> List[WeatherForecastOut]:
+    """Return the next *hours* of hourly forecasts for the property.
+
+    Forecasts are stored once per lat/lon grid cell and joined to the
+    property at read time. Defaults to the authenticated user's property;
+    an explicit ``tenant_id`` must be a property owned by the caller.
+    """
+    query = select(RestaurantProfile).where(
+        RestaurantProfile.owner_id == current_user["id"]
+    )
+    if tenant_id is not None:
+        query = query.where(RestaurantProfile.tenant_id == tenant_id)
+    result = await db.execute(query)
+    profile = result.scalars().first()
+    if not profile:
+        if tenant_id is None:
+            raise HTTPException(
+                status_code=404,
+                detail="No restaurant profile linked to this user.",
+            )
+        raise HTTPException(
+            status_code=403,
+            detail=f"Property '{tenant_id}' is not linked to this user.",
+        )
+    tenant_id = profile.tenant_id
+
+    rows = await _service.get_forecasts_for_property(tenant_id, db, hours=hours)
+    return [WeatherForecastOut.model_validate(row) for row in rows]
+
+
 async def _run_sync(property_id: str) -> None:
     """Background coroutine: open a fresh DB session and run the sync."""
     try:
@@ -1,6 +1,6 @@
 import uuid
 import os
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import (
     AuthenticationBackend,
@@ -39,3 +39,10 @@ async def get_current_user(user: User = Depends(current_active_user)):
         "is_superuser": user.is_superuser,
         "department_role": getattr(user, "department_role", None)
     }
+
+
+async def get_current_superuser(current_user: dict = Depends(get_current_user)):
+    """get_current_user restricted to superusers (portfolio-wide operations)."""
+    if not current_user.get("is_superuser"):
+        raise HTTPException(status_code=403, detail="Superuser privileges required.")
+    return current_user
@@ -0,0 +1,11 @@
+"""Timezone helpers shared by the ingestion and detection services."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+def as_utc(dt: datetime) -> datetime:
+    """Return ``dt`` in UTC; naive datetimes (e.g. from SQLite) are taken as UTC."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, Date, DateTime, JSON, ForeignKey, Boolean, Numeric, Text, UniqueConstraint
+from sqlalchemy import Column, String, Float, Integer, BigInteger, Date, DateTime, JSON, ForeignKey, Boolean, Numeric, Text, UniqueConstraint
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
 from sqlalchemy import JSON as JSONB  # JSON is dialect-agnostic (works with SQLite in tests)
@@ -100,6 +100,33 @@ class PMSSyncLog(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class PMSBackfillJob(Base):
+    """
+    Progress of a bulk PMS history import over a date range.
+
+    The range is split into ``chunk_days`` chunks fetched concurrently via
+    ``get_historical_data``. Each chunk's PMSSyncLog rows and its entry in
+    ``completed_chunks`` are committed together, so an interrupted or
+    partially failed job resumes with only the missing chunks.
+    """
+    __tablename__ = "pms_backfill_jobs"
+
+    id = Column(Integer, primary_key=True)
+    tenant_id = Column(String, ForeignKey("restaurant_profiles.tenant_id"), index=True, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)                  # inclusive
+    chunk_days = Column(Integer, nullable=False)
+    adapter = Column(String, nullable=False)                 # mock | apaleo_mcp | apaleo_raw
+
+    status = Column(String, nullable=False, default="pending")  # pending, running, completed, partial, failed
+    chunks_total = Column(Integer, nullable=False, default=0)
+    completed_chunks = Column(JSON, nullable=False, default=list)  # ISO start date per finished chunk
+    rows_written = Column(Integer, nullable=False, default=0)
+    error_message = Column(String)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class CaptationBaseline(Base):
     """
     Stores calculated captation rate baselines per tenant/property.
@@ -135,6 +162,63 @@ class CaptationBaseline(Base):
     computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
 
+class CaptationRunningStats(Base):
+    """
+    Running captation-rate sums and counts per tenant (Story 2.4 follow-up).
+
+    Each new PMS sync folds one sample in, so the baseline factors are
+    re-derived in O(1) instead of re-reading the whole PMSSyncLog history.
+    ``CaptationService.calculate_baseline`` rebuilds the row from scratch
+    (repair path, also used after a backfill replaced history).
+    """
+    __tablename__ = "captation_running_stats"
+
+    tenant_id = Column(String, ForeignKey("restaurant_profiles.tenant_id"), primary_key=True)
+
+    samples_count = Column(Integer, nullable=False, default=0)
+    rate_sum = Column(Float, nullable=False, default=0.0)
+
+    # Per-bucket counts and captation-rate sums (JSON), keyed like the
+    # baseline factors: weekday "0"…"6" (0=Monday), month "1"…"12".
+    dow_counts = Column(JSON, nullable=False, default=dict)
+    dow_sums = Column(JSON, nullable=False, default=dict)
+    month_counts = Column(JSON, nullable=False, default=dict)
+    month_sums = Column(JSON, nullable=False, default=dict)
+
+    period_start = Column(Date)
+    period_end = Column(Date)
+
+    # Exponentially decayed counterparts (CAPTATION_BASELINE_MODE=ewma).
+    # Weights are relative to ewma_reference_date (newest sample, weight 1)
+    # and halve every ewma_half_life_days; NULL half-life = not maintained.
+    ewma_half_life_days = Column(Float)
+    ewma_reference_date = Column(Date)
+    ewma_weight = Column(Float, nullable=False, default=0.0)
+    ewma_rate_sum = Column(Float, nullable=False, default=0.0)
+    ewma_dow_weights = Column(JSON, nullable=False, default=dict)
+    ewma_dow_sums = Column(JSON, nullable=False, default=dict)
+    ewma_month_weights = Column(JSON, nullable=False, default=dict)
+    ewma_month_sums = Column(JSON, nullable=False, default=dict)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class CaptationRate(Base):
+    """
+    Baseline F&B revenue per (property, weekday, 4-hour UTC block).
+    Materialized from CaptationBaseline by app/services/captation_rates.py
+    and read by the anomaly detector (Story 3.3a): 42 rows per property.
+    """
+    __tablename__ = "captation_rates"
+
+    property_id = Column(String, primary_key=True)
+    day_of_week = Column(String, primary_key=True)      # "monday" … "sunday"
+    hour_block = Column(Integer, primary_key=True)      # 0, 4, 8, 12, 16, 20
+    tenant_id = Column(String, index=True, nullable=False)
+    baseline_revenue = Column(Numeric(10, 2), nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class WeatherForecast(Base):
     """
     Normalized weather forecast records ingested from Open-Meteo.
@@ -167,6 +251,84 @@ class WeatherForecast(Base):
     )
 
 
+class WeatherCellForecast(Base):
+    """
+    Shared weather forecast rows keyed by rounded lat/lon grid cell.
+    One row per (cell_id, forecast_timestamp), fetched once per cell and
+    joined to properties at read time via PropertyWeatherCell, so nearby
+    properties no longer store duplicate copies of the same forecast.
+    On PostgreSQL the table is RANGE-partitioned by month on
+    forecast_timestamp (see supabase migrations); partitions are created and
+    expired by DataRetentionService.
+    """
+    __tablename__ = "weather_cell_forecasts"
+
+    id = Column(Integer, primary_key=True)
+    cell_id = Column(String, nullable=False, index=True)   # e.g. "48.86:2.35"
+
+    condition_code = Column(Integer)          # WMO weather interpretation code
+    temperature_c = Column(Float)
+    precipitation_prob = Column(Integer)      # 0-100 %
+    wind_speed_kmh = Column(Float)
+    forecast_timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    source = Column(String, nullable=False, default="open-meteo")
+
+    fetched_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("cell_id", "forecast_timestamp", name="uq_weather_cell_forecast"),
+    )
+
+
+class WeatherCellWindow(Base):
+    """
+    4-hour weather rollups per grid cell, materialised at ingestion from
+    WeatherCellForecast. Windows are UTC-aligned (00, 04, ... 20h) to match
+    the anomaly detection windows, so detection reads one row by primary key
+    instead of sorting hourly rows.
+    """
+    __tablename__ = "weather_cell_windows"
+
+    cell_id = Column(String, primary_key=True)
+    window_start = Column(DateTime(timezone=True), primary_key=True)
+    worst_condition_code = Column(Integer)      # WMO code of the most severe hour
+    max_precipitation_prob = Column(Integer)    # 0-100 %
+    mean_temperature_c = Column(Float)
+    mean_wind_speed_kmh = Column(Float)
+    hours = Column(Integer, nullable=False)     # hourly rows aggregated (<= 4)
+    fetched_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class PropertyWeatherCell(Base):
+    """
+    Maps a property to the weather grid cell that covers its coordinates.
+    Refreshed on every weather sync so a property that moves (GPS edit)
+    is re-linked to its new cell.
+    """
+    __tablename__ = "property_weather_cells"
+
+    property_id = Column(String, primary_key=True)
+    tenant_id = Column(String, ForeignKey("restaurant_profiles.tenant_id"), index=True, nullable=False)
+    cell_id = Column(String, nullable=False, index=True)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class WeatherFetchState(Base):
+    """
+    Per-cell fetch cache state for the weather sync.
+    A cell is skipped (no HTTP) while its last fetch belongs to the current
+    model run and is younger than the freshness TTL; the upsert is skipped
+    when the normalized payload hash is unchanged.
+    """
+    __tablename__ = "weather_fetch_state"
+
+    cell_id = Column(String, primary_key=True)
+    model_run = Column(DateTime(timezone=True), nullable=False)
+    fetched_at = Column(DateTime(timezone=True), nullable=False)
+    payload_hash = Column(String, nullable=False)   # sha256 hex of normalized rows
+
+
 class DemandAnomaly(Base):
     """
     Detected demand anomaly window for a property.
@@ -240,6 +402,70 @@ class LocalEvent(Base):
     )
 
 
+class EventCatalog(Base):
+    """
+    Shared PredictHQ event catalogue — one row per PredictHQ event_id.
+    Events are public data: neighbouring properties reuse the same row and
+    reach it through PropertyEvent instead of storing per-tenant copies.
+    Supersedes the per-tenant local_events table for new syncs.
+    """
+    __tablename__ = "event_catalog"
+
+    event_id = Column(String, primary_key=True)
+
+    title = Column(String, nullable=False)
+    category = Column(String, nullable=False)
+    rank = Column(Integer)
+    local_rank = Column(Integer)
+    phq_attendance = Column(Integer)
+
+    start_dt = Column(DateTime(timezone=True), nullable=False, index=True)
+    end_dt = Column(DateTime(timezone=True))
+
+    latitude = Column(Float)
+    longitude = Column(Float)
+
+    raw_labels = Column(JSON)
+
+    # PredictHQ ``updated`` timestamp — changes are applied only when newer
+    phq_updated = Column(DateTime(timezone=True))
+
+    fetched_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class PropertyEvent(Base):
+    """
+    Links a property to a catalogued event within its search radius.
+    distance_km is the great-circle distance from the property to the event
+    centroid (NULL when PredictHQ returned no geometry).
+    """
+    __tablename__ = "property_events"
+
+    property_id = Column(String, primary_key=True)
+    event_id = Column(String, ForeignKey("event_catalog.event_id", ondelete="CASCADE"), primary_key=True)
+    tenant_id = Column(String, ForeignKey("restaurant_profiles.tenant_id"), index=True, nullable=False)
+    distance_km = Column(Float)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class EventSyncState(Base):
+    """
+    Per-cluster incremental sync cursor for PredictHQ.
+    updated_watermark is the newest PredictHQ ``updated`` value seen; the next
+    incremental run only requests events changed since then. A full window
+    re-fetch is forced once full_synced_at is older than the resync interval,
+    or when the cluster has members not listed in member_ids.
+    """
+    __tablename__ = "event_sync_state"
+
+    cluster_id = Column(String, primary_key=True)
+    member_ids = Column(Text)  # comma-separated tenant_ids covered by the watermark
+    updated_watermark = Column(DateTime(timezone=True))
+    synced_at = Column(DateTime(timezone=True), nullable=False)
+    full_synced_at = Column(DateTime(timezone=True), nullable=False)
+
+
 class StaffingRecommendation(Base):
     """
     Ready-to-dispatch staffing recommendations produced by the
@@ -332,6 +558,47 @@ class RecommendationCache(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ServiceForecast(Base):
+    """
+    Precomputed Prophet forecast per (tenant, service type, date).
+    Refreshed nightly and after training by app/services/forecast_materializer.py
+    so that AetherixEngine.get_forecast does not run Prophet on the request path.
+    model_version is the registry version (model file mtime) the row came from.
+    """
+    __tablename__ = "service_forecasts"
+
+    tenant_id = Column(String, primary_key=True)
+    service_type = Column(String, primary_key=True)     # breakfast | lunch | dinner
+    target_date = Column(Date, primary_key=True)
+    model_version = Column(BigInteger, nullable=False)
+    predicted_covers = Column(Integer, nullable=False)
+    range_min = Column(Integer, nullable=False)
+    range_max = Column(Integer, nullable=False)
+    confidence = Column(Float, nullable=False)
+    generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ModelTrainingRun(Base):
+    """
+    One per-(tenant, service type) Prophet fit by app/services/model_training.py:
+    outcome, fit duration and in-sample error of the model saved to the registry.
+    """
+    __tablename__ = "model_training_runs"
+
+    id = Column(Integer, primary_key=True)
+    tenant_id = Column(String, index=True, nullable=False)
+    service_type = Column(String, nullable=False)
+    status = Column(String, nullable=False)              # trained | insufficient_data | failed
+    model_version = Column(BigInteger)                   # registry version of the saved model
+    training_rows = Column(Integer, nullable=False, default=0)
+    fit_seconds = Column(Float)
+    in_sample_mae = Column(Float)
+    in_sample_mape = Column(Float)
+    error_message = Column(String)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class FBPattern(Base):
     """
     F&B operational patterns stored as embeddings.
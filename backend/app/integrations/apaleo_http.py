@@ -0,0 +1,195 @@
+"""
+Process-wide Apaleo OAuth2 token cache and pooled HTTP client.
+
+Both the REST adapter (``ApaleoPMSAdapter``) and the MCP client
+(``ApaleoMCPClient``) used to keep token state per instance and open a new
+``httpx.AsyncClient`` per call, so a multi-property sync paid one token
+request plus one TLS handshake for every PMS call. This module centralises
+both:
+
+- ``ApaleoTokenManager`` caches one bearer token per (client_id, scope)
+  for the whole process. Concurrent callers that find the token missing or
+  expiring share a single refresh request (single-flight).
+- ``get_apaleo_http_client()`` returns one keep-alive ``httpx.AsyncClient``
+  per event loop, reused for the token endpoint and all REST calls.
+  ``close_apaleo_http_client()`` is called from the FastAPI lifespan.
+
+Env vars:
+    APALEO_HTTP_MAX_CONNECTIONS  — pool size (default 20)
+    APALEO_HTTP_TIMEOUT_SECONDS  — per-request timeout (default 30)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+logger = logging.getLogger(__name__)
+
+APALEO_TOKEN_URL = "https://identity.apaleo.com/connect/token"
+
+_MAX_CONNECTIONS = int(os.getenv("APALEO_HTTP_MAX_CONNECTIONS", "20"))
+_TIMEOUT_SECONDS = float(os.getenv("APALEO_HTTP_TIMEOUT_SECONDS", "30"))
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=_MAX_CONNECTIONS,
+    max_keepalive_connections=_MAX_CONNECTIONS,
+)
+
+# Refresh this long before the server-side expiry so a token never lapses
+# mid-request.
+_EXPIRY_BUFFER_SECONDS = 60
+
+
+# ---------------------------------------------------------------------------
+# Pooled HTTP client
+# ---------------------------------------------------------------------------
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_apaleo_http_client() -> httpx.AsyncClient:
+    """Return the shared Apaleo HTTP client, creating it on first use.
+
+    httpx connection pools are bound to the event loop that opened them, so
+    a new client is created if the running loop changed (e.g. between tests).
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(timeout=_TIMEOUT_SECONDS, limits=_HTTP_LIMITS)
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_apaleo_http_client() -> None:
+    """Close the shared client (application shutdown)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+# ---------------------------------------------------------------------------
+# Token manager
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _CachedToken:
+    access_token: str
+    expires_at: float  # time.time() epoch seconds
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at - _EXPIRY_BUFFER_SECONDS
+
+
+class ApaleoTokenManager:
+    """OAuth2 client-credentials tokens shared by every Apaleo caller.
+
+    Tokens are keyed by (client_id, scope): the REST adapter requests
+    explicit scopes while the MCP server accepts the client's defaults, so
+    the two may hold different tokens but never more than one each.
+    """
+
+    def __init__(self, token_url: str = APALEO_TOKEN_URL) -> None:
+        self.token_url = token_url
+        self._tokens: dict[tuple[str, str | None], _CachedToken] = {}
+        self._locks: dict[tuple[str, str | None], asyncio.Lock] = {}
+        self._locks_loop: asyncio.AbstractEventLoop | None = None
+
+    async def get_token(
+        self,
+        client_id: str,
+        client_secret: str,
+        scope: str | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> tuple[str, float]:
+        """Return ``(access_token, expires_at)``, refreshing at most once at a time.
+
+        Raises:
+            ValueError: credentials missing.
+            httpx.HTTPStatusError: token endpoint failure (after 3 attempts).
+        """
+        if not client_id or not client_secret:
+            raise ValueError("Apaleo credentials missing in environment.")
+
+        key = (client_id, scope)
+        cached = self._tokens.get(key)
+        if cached and cached.is_fresh(time.time()):
+            return cached.access_token, cached.expires_at
+
+        async with self._lock(key):
+            # Another caller may have refreshed while we waited for the lock.
+            cached = self._tokens.get(key)
+            if cached and cached.is_fresh(time.time()):
+                return cached.access_token, cached.expires_at
+
+            token_data = await self._request_token(
+                http_client or get_apaleo_http_client(), client_id, client_secret, scope
+            )
+            expires_in = token_data.get("expires_in", 3600)
+            cached = _CachedToken(
+                access_token=token_data["access_token"],
+                expires_at=time.time() + expires_in,
+            )
+            self._tokens[key] = cached
+            logger.info("Apaleo token refreshed  client_id=%s  expires_in=%ss", client_id, expires_in)
+            return cached.access_token, cached.expires_at
+
+    def invalidate(self, client_id: str, scope: str | None = None) -> None:
+        """Drop a cached token (e.g. after a 401) so the next call refreshes it."""
+        self._tokens.pop((client_id, scope), None)
+
+    def clear(self) -> None:
+        self._tokens.clear()
+
+    def _lock(self, key: tuple[str, str | None]) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._locks_loop is not loop:
+            self._locks = {}
+            self._locks_loop = loop
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    @retry(
+        retry=retry_if_exception_type(httpx.HTTPStatusError),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _request_token(
+        self,
+        http_client: httpx.AsyncClient,
+        client_id: str,
+        client_secret: str,
+        scope: str | None,
+    ) -> dict:
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+        }
+        if scope:
+            data["scope"] = scope
+        response = await http_client.post(self.token_url, data=data)
+        response.raise_for_status()
+        return response.json()
+
+
+_token_manager = ApaleoTokenManager()
+
+
+def get_token_manager() -> ApaleoTokenManager:
+    """The process-wide token manager."""
+    return _token_manager
@@ -9,6 +9,15 @@ Required env vars:
     APALEO_CLIENT_SECRET    — OAuth2 client secret
     APALEO_MCP_SERVER_URL   — Apaleo MCP endpoint (provided on alpha access)
 
+Optional:
+    APALEO_MCP_POOL_SIZE            — long-lived sessions per server (default 4)
+    APALEO_MCP_PING_AFTER_SECONDS   — ping idle sessions before reuse (default 30)
+    APALEO_MCP_TOOLS_TTL_SECONDS    — cached ``list_tools`` lifetime (default 300)
+    APALEO_MCP_CONNECT_TIMEOUT_SECONDS — connect + ``initialize`` limit (default 15)
+
+Sessions are pooled: the streamable-HTTP connection and ``initialize``
+handshake are paid once per pooled session, not once per tool call.
+
 Usage::
 
     client = ApaleoMCPClient()
@@ -18,16 +27,20 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
 import os
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
-import httpx
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
 
+from app.integrations.apaleo_http import ApaleoTokenManager, get_token_manager
 from app.integrations.apaleo_logger import (
     ApaleoAgentLogger,
     ApaleoWriteBlockedError,
@@ -38,14 +51,229 @@ from app.integrations.apaleo_logger import (
 logger = logging.getLogger(__name__)
 _agent_logger = ApaleoAgentLogger()
 
-_APALEO_TOKEN_URL = "https://identity.apaleo.com/connect/token"
+_POOL_SIZE = int(os.getenv("APALEO_MCP_POOL_SIZE", "4"))
+_PING_AFTER_IDLE = float(os.getenv("APALEO_MCP_PING_AFTER_SECONDS", "30"))
+_TOOLS_TTL = float(os.getenv("APALEO_MCP_TOOLS_TTL_SECONDS", "300"))
+_CONNECT_TIMEOUT = float(os.getenv("APALEO_MCP_CONNECT_TIMEOUT_SECONDS", "15"))
+_CLOSE_TIMEOUT = 5.0
+
+
+# ---------------------------------------------------------------------------
+# Session pool
+# ---------------------------------------------------------------------------
+
+class _PooledSession:
+    """
+    One long-lived, initialised MCP session.
+
+    The streamable-HTTP transport and ``ClientSession`` are anyio context
+    managers that must be entered and exited by the same task, so each
+    session is owned by a background task that holds them open until
+    ``close()`` signals it.
+    """
+
+    def __init__(self, server_url: str, token: str) -> None:
+        self.server_url = server_url
+        self.token = token
+        self.session: ClientSession | None = None
+        self.last_used = time.monotonic()
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Exception | None = None
+        self._task: asyncio.Task | None = None
+
+    async def open(self) -> None:
+        """Connect and run the ``initialize`` handshake; raises on failure.
+
+        Bounded by APALEO_MCP_CONNECT_TIMEOUT_SECONDS: on timeout (or if the
+        caller is cancelled) the owner task is cancelled so the half-open
+        transport does not linger.
+        """
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), _CONNECT_TIMEOUT)
+        except BaseException:
+            await self._abort()
+            raise
+        if self.session is None:
+            raise self._error or RuntimeError("MCP session closed during initialisation")
+
+    async def _run(self) -> None:
+        try:
+            async with streamablehttp_client(
+                self.server_url,
+                headers={"Authorization": f"Bearer {self.token}"},
+            ) as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as exc:  # noqa: BLE001 — surfaced via open() / is_alive
+            self._error = exc
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def is_alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(self._task, _CLOSE_TIMEOUT)
+
+    async def _abort(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class ApaleoMCPSessionPool:
+    """
+    Bounded pool of initialised MCP sessions for one server.
+
+    - At most ``size`` sessions are checked out at once; idle ones are
+      reused most-recently-used first.
+    - Before reuse a session is health-checked: it must still be connected,
+      carry the current bearer token (tokens rotate) and, when idle for
+      longer than APALEO_MCP_PING_AFTER_SECONDS, answer a ping.
+    - A session whose call failed at the transport level is discarded, so
+      the next checkout reconnects. Tool-level ``McpError`` responses keep
+      the session.
+    - ``list_tools()`` is cached for APALEO_MCP_TOOLS_TTL_SECONDS.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        token_provider: Callable[[], Awaitable[str]],
+        size: int = _POOL_SIZE,
+    ) -> None:
+        self.server_url = server_url
+        self._token_provider = token_provider
+        self._slots = asyncio.Semaphore(max(1, size))
+        self._idle: list[_PooledSession] = []
+        self._tools: list[Any] | None = None
+        self._tools_fetched_at = 0.0
+        self._closed = False
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        """Check out a healthy session for the duration of the block."""
+        async with self._slots:
+            pooled = await self._checkout()
+            try:
+                yield pooled.session  # type: ignore[misc]
+            except McpError:
+                self._release(pooled)
+                raise
+            except BaseException:
+                await pooled.close()
+                raise
+            else:
+                self._release(pooled)
+
+    async def ping(self) -> None:
+        """Round-trip a ping on a pooled session (readiness probes)."""
+        async with self.acquire() as session:
+            await session.send_ping()
+
+    async def list_tools(self, *, refresh: bool = False) -> list[Any]:
+        """Return the server's tools, served from cache within the TTL."""
+        fresh = time.monotonic() - self._tools_fetched_at < _TOOLS_TTL
+        if self._tools is not None and fresh and not refresh:
+            return self._tools
+        async with self.acquire() as session:
+            result = await session.list_tools()
+        self._tools = list(result.tools or [])
+        self._tools_fetched_at = time.monotonic()
+        return self._tools
+
+    async def close(self) -> None:
+        """Close idle sessions; sessions still checked out close on release."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await pooled.close()
+
+    async def _checkout(self) -> _PooledSession:
+        token = await self._token_provider()
+        while self._idle:
+            pooled = self._idle.pop()
+            if await self._is_healthy(pooled, token):
+                return pooled
+            await pooled.close()
+
+        pooled = _PooledSession(self.server_url, token)
+        await pooled.open()
+        logger.debug("Apaleo MCP session opened  server=%s", self.server_url)
+        return pooled
+
+    @staticmethod
+    async def _is_healthy(pooled: _PooledSession, token: str) -> bool:
+        if not pooled.is_alive or pooled.token != token:
+            return False
+        if time.monotonic() - pooled.last_used < _PING_AFTER_IDLE:
+            return True
+        try:
+            await pooled.session.send_ping()  # type: ignore[union-attr]
+        except Exception as exc:  # noqa: BLE001
+            logger.info("Apaleo MCP idle session failed ping (%s) — reconnecting", exc)
+            return False
+        return True
+
+    def _release(self, pooled: _PooledSession) -> None:
+        pooled.last_used = time.monotonic()
+        if self._closed:
+            asyncio.ensure_future(pooled.close())
+        else:
+            self._idle.append(pooled)
+
+
+# One pool per (server, client) for the running event loop; sessions cannot
+# be shared across loops.
+_pools: dict[tuple[str, str], ApaleoMCPSessionPool] = {}
+_pools_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _shared_pool(
+    server_url: str,
+    client_id: str,
+    token_provider: Callable[[], Awaitable[str]],
+) -> ApaleoMCPSessionPool:
+    global _pools, _pools_loop
+    loop = asyncio.get_running_loop()
+    if _pools_loop is not loop:
+        _pools = {}
+        _pools_loop = loop
+    key = (server_url, client_id)
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = ApaleoMCPSessionPool(server_url, token_provider)
+    return pool
+
+
+async def close_mcp_session_pools() -> None:
+    """Close every pooled MCP session (application shutdown)."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
 
 
 class ApaleoMCPClient:
     """
     Thin async wrapper around Apaleo's MCP Server.
 
-    Handles OAuth2 token lifecycle and exposes a single ``call_tool``
+    Obtains OAuth2 tokens from the shared token manager and exposes a single ``call_tool``
     coroutine. Falls back gracefully: if ``is_configured`` is False,
     ``call_tool`` raises ``RuntimeError`` — the adapter layer converts
     that to mock/default data.
@@ -56,12 +284,14 @@ class ApaleoMCPClient:
         client_id: str | None = None,
         client_secret: str | None = None,
         server_url: str | None = None,
+        token_manager: ApaleoTokenManager | None = None,
+        session_pool: ApaleoMCPSessionPool | None = None,
     ) -> None:
         self.client_id: str = client_id or os.getenv("APALEO_CLIENT_ID", "")
         self.client_secret: str = client_secret or os.getenv("APALEO_CLIENT_SECRET", "")
         self.server_url: str = server_url or os.getenv("APALEO_MCP_SERVER_URL", "")
-        self._token: str | None = None
-        self._token_expiry: float = 0.0
+        self._token_manager = token_manager or get_token_manager()
+        self._session_pool = session_pool
 
     @property
     def is_configured(self) -> bool:
@@ -69,26 +299,28 @@ class ApaleoMCPClient:
         return bool(self.client_id and self.client_secret and self.server_url)
 
     async def _get_token(self) -> str:
-        """Fetch or reuse a valid OAuth2 bearer token (30s buffer)."""
-        if self._token and time.time() < self._token_expiry - 30:
-            return self._token
-
-        async with httpx.AsyncClient(timeout=10) as http:
-            resp = await http.post(
-                _APALEO_TOKEN_URL,
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                },
-            )
-            resp.raise_for_status()
+        """Fetch or reuse a valid OAuth2 bearer token.
+
+        Tokens live in the process-wide ``ApaleoTokenManager`` (shared with
+        the REST adapter), so new client instances do not re-authenticate.
+        """
+        token, _ = await self._token_manager.get_token(self.client_id, self.client_secret)
+        return token
+
+    @property
+    def session_pool(self) -> ApaleoMCPSessionPool:
+        """The pool shared by every client for this server + client_id."""
+        return self._session_pool or _shared_pool(
+            self.server_url, self.client_id, self._get_token
+        )
 
-        data = resp.json()
-        self._token = data["access_token"]
-        self._token_expiry = time.time() + data.get("expires_in", 3600)
-        logger.debug("Apaleo MCP token refreshed (expires in %ss)", data.get("expires_in", 3600))
-        return self._token  # type: ignore[return-value]
+    async def list_tools(self, *, refresh: bool = False) -> list[Any]:
+        """Tools exposed by the server (cached, see ``ApaleoMCPSessionPool``)."""
+        return await self.session_pool.list_tools(refresh=refresh)
+
+    async def ping(self) -> None:
+        """Round-trip a ping over a pooled session."""
+        await self.session_pool.ping()
 
     async def call_tool(
         self,
@@ -100,9 +332,9 @@ class ApaleoMCPClient:
         """
         Call an Apaleo MCP tool and return its decoded result.
 
-        Args:
-            tool_name:  MCP tool name (e.g. ``"APALEO_GET_OCCUPANCY_METRICS"``).
-        Opens a short-lived MCP session per call (streamable-HTTP transport).
+        Runs on a pooled, already-initialised MCP session. Read tools are
+        retried once on a fresh session if the pooled one fails at the
+        transport level; writes are never retried.
 
         Write-guard (HOS-107)
         ---------------------
@@ -149,19 +381,11 @@ class ApaleoMCPClient:
                 "Set APALEO_READONLY=false to enable writes."
             )
 
-        token = await self._get_token()
         mode = "write" if write else "read"
         t0 = time.monotonic()
 
         try:
-            async with streamablehttp_client(
-                self.server_url,
-                headers={"Authorization": f"Bearer {token}"},
-            ) as (read_stream, write_stream, _):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-                    logger.debug("Calling Apaleo MCP tool %r with args %r", tool_name, arguments)
-                    result = await session.call_tool(tool_name, arguments)
+            result = await self._call_pooled(tool_name, arguments, retry=not write)
 
             duration_ms = (time.monotonic() - t0) * 1000
 
@@ -197,3 +421,26 @@ class ApaleoMCPClient:
                 error=str(exc),
             )
             raise
+
+    async def _call_pooled(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        *,
+        retry: bool,
+    ) -> Any:
+        """Call a tool on a pooled session, reconnecting once for reads."""
+        attempts = 2 if retry else 1
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.session_pool.acquire() as session:
+                    logger.debug("Calling Apaleo MCP tool %r with args %r", tool_name, arguments)
+                    return await session.call_tool(tool_name, arguments)
+            except McpError:
+                raise
+            except Exception as exc:
+                if attempt == attempts:
+                    raise
+                logger.warning(
+                    "Apaleo MCP session failed on %r (%s) — reconnecting", tool_name, exc
+                )
@@ -12,7 +12,7 @@ import logging
 from contextlib import asynccontextmanager
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import (
@@ -30,11 +30,19 @@ from app.api.routes import (
 )
 from app.api.routes import webhook as twilio_inbound_webhook
 from app.core.error_handlers import problem_details_handler
+from app.core.security import get_current_superuser
 from app.db.models import Base
 from app.db.session import engine
+from app.integrations.apaleo_http import close_apaleo_http_client
+from app.integrations.apaleo_mcp_client import close_mcp_session_pools
+from app.services.compute_pool import get_compute_pool, shutdown_compute_pool
 from app.workers.anomaly_scan import register_anomaly_scan_job
+from app.workers.data_retention import register_data_retention_job
 from app.workers.dispatch_worker import register_dispatch_job
 from app.workers.event_sync import start_event_scheduler, stop_event_scheduler
+from app.workers.forecast_refresh import register_forecast_refresh_job
+from app.workers.model_training import register_model_training_job
+from app.workers.pms_sync import register_pms_sync_job
 from app.workers.weather_sync import start_weather_scheduler, stop_weather_scheduler
 
 logger = logging.getLogger(__name__)
@@ -52,6 +60,10 @@ async def lifespan(app: FastAPI):
     # Register and start background cron jobs (anomaly scan + alert dispatch)
     register_anomaly_scan_job(_scheduler)
     register_dispatch_job(_scheduler)  # Story 4.2: dispatch alerts every 2 minutes
+    register_data_retention_job(_scheduler)  # monthly partitions + pruning, daily
+    register_pms_sync_job(_scheduler)  # nightly portfolio PMS sync (previous day)
+    register_model_training_job(_scheduler)  # nightly per-tenant Prophet retraining
+    register_forecast_refresh_job(_scheduler)  # nightly materialized Prophet forecasts
     _scheduler.start()
     logger.info("APScheduler started with %d jobs", len(_scheduler.get_jobs()))
 
@@ -64,6 +76,9 @@ async def lifespan(app: FastAPI):
     # --------------- shutdown ---------------
     stop_weather_scheduler()
     stop_event_scheduler()
+    await close_mcp_session_pools()
+    await close_apaleo_http_client()
+    shutdown_compute_pool()
 
     if _scheduler.running:
         _scheduler.shutdown(wait=False)
@@ -115,3 +130,9 @@ app.include_router(twilio_inbound_webhook.router)
 async def health_check():
     """Returns 200 OK when the service is up."""
     return {"status": "ok"}
+
+
+@app.get("/metrics/compute-pool", tags=["ops"])
+async def compute_pool_metrics(current_user: dict = Depends(get_current_superuser)):
+    """Queue depth and utilisation of the CPU-bound work pool (superusers only)."""
+    return get_compute_pool().stats()
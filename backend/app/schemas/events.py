@@ -37,6 +37,7 @@ class EventRecord(_CamelModel):
     latitude: Optional[float] = Field(None, description="Event centroid latitude")
     longitude: Optional[float] = Field(None, description="Event centroid longitude")
     raw_labels: Optional[List[str]] = Field(None, description="PredictHQ label tags")
+    updated: Optional[datetime] = Field(None, description="Last PredictHQ modification (UTC)")
 
 
 # ---------------------------------------------------------------------------
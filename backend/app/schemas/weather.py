@@ -55,7 +55,7 @@ class WeatherSyncResponse(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Read schema (for future GET endpoints)
+# Read schema (GET /api/v1/weather/forecasts)
 # ---------------------------------------------------------------------------
 
 class WeatherForecastOut(BaseModel):
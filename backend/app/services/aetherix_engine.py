@@ -1,6 +1,10 @@
+import logging
 from datetime import date, datetime
 from typing import Dict, Any, List, Optional
-from app.services.prediction_engine import PredictionEngine
+from app.services.compute_pool import get_compute_pool
+from app.services.forecast_materializer import ForecastMaterializer, as_prediction_result
+from app.services.model_registry import get_model_registry
+from app.services.prediction_engine import PredictionEngine, PredictionResult
 from app.services.rag_service import RAGService
 from app.services.reasoning_service import ReasoningService
 from app.services.staffing_service import StaffingService
@@ -9,6 +13,8 @@ from app.db.session import AsyncSessionLocal
 from app.db.models import RecommendationCache
 from sqlalchemy.future import select
 
+logger = logging.getLogger(__name__)
+
 class AetherixEngine:
     """
     The Hybrid Hub (Phase 2).
@@ -16,7 +22,10 @@ class AetherixEngine:
     """
     
     def __init__(self):
+        # Fallback for tenants without a trained model (mock forecast)
         self.forecaster = PredictionEngine()
+        self.models = get_model_registry()
+        self.materialized = ForecastMaterializer(self.models)
         self.rag = RAGService()
         self.reasoner = ReasoningService()
         self.staffer = StaffingService()
@@ -24,8 +33,8 @@ class AetherixEngine:
 
     async def get_forecast(self, tenant_id: str, target_date: date, service_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Hybrid orchestration logic."""
-        # 1. Prediction (Prophet)
-        forecast = self.forecaster.predict(target_date, features=context.get('regressors'))
+        # 1. Prediction (Prophet) — precomputed when available, else live
+        forecast = await self._predict(tenant_id, target_date, service_type, context)
         predicted_covers = forecast.predicted
         confidence = forecast.confidence
         is_mock = forecast.is_mock
@@ -68,6 +77,28 @@ class AetherixEngine:
         
         return result
 
+    async def _predict(self, tenant_id: str, target_date: date, service_type: str, context: Dict[str, Any]) -> PredictionResult:
+        """Materialized forecast (service_forecasts), live Prophet prediction on a miss."""
+        regressors = context.get('regressors')
+        if not regressors:
+            try:
+                async with AsyncSessionLocal() as db:
+                    row = await self.materialized.lookup(tenant_id, service_type, target_date, db)
+                if row is not None:
+                    return as_prediction_result(row)
+            except Exception as exc:  # noqa: BLE001 — a cache read must never fail the forecast
+                logger.warning("service_forecasts lookup failed for %s: %s", tenant_id, exc)
+
+        # Model loading and Prophet inference are CPU-bound: keep them off the event loop
+        return await get_compute_pool().run(
+            self._predict_live, tenant_id, target_date, service_type, regressors
+        )
+
+    def _predict_live(self, tenant_id: str, target_date: date, service_type: str, regressors: Optional[Dict[str, Any]]) -> PredictionResult:
+        # The tenant's own model when one was trained, else the shared (mock) engine
+        forecaster = self.models.get(tenant_id, service_type) or self.forecaster
+        return forecaster.predict(target_date, features=regressors)
+
     async def _cache_recommendation(self, tenant_id: str, target_date: date, data: Dict):
         async with AsyncSessionLocal() as db:
             # Check if exists
@@ -20,15 +20,16 @@ import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import sqlalchemy.exc
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import AnomalyDetectionError
-from app.db.models import DemandAnomaly, LocalEvent, WeatherForecast
-from app.services.demand_modifiers import event_modifier, weather_modifier
+from app.db.models import DemandAnomaly, WeatherCellWindow
+from app.services.demand_modifiers import event_modifier, weather_window_modifier
+from app.services.event_spatial_index import EventSpatialIndex, NearbyEvent
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,9 @@ ANOMALY_DEVIATION_THRESHOLD: float = float(
     os.getenv("ANOMALY_DEVIATION_THRESHOLD", "20.0")
 )
 
+# Events farther than this from a property have no demand impact
+EVENT_IMPACT_RADIUS_KM: float = float(os.getenv("EVENT_IMPACT_RADIUS_KM", "5.0"))
+
 # Combined modifier cap: weather + events bounded to [-0.50, +0.75]
 _COMBINED_MIN = -0.50
 _COMBINED_MAX = +0.75
@@ -95,12 +99,16 @@ class AnomalyDetectionService:
         db: AsyncSession,
         property_id: uuid.UUID,
         tenant_id: uuid.UUID,
+        event_index: Optional[EventSpatialIndex] = None,
+        coordinates: Optional[Tuple[float, float]] = None,
     ) -> List[DemandAnomaly]:
         """Detect demand anomalies for a single property over the next 14 days.
 
         Steps for each 4-hour window:
-          1. Load baseline demand from captation_rates (day-of-week segmented).
-          2. Get weather forecast covering that window.
+          1. Look up baseline demand in captation_rates (weekday × 4-hour
+             block; the property's 42 rows are read once per scan).
+          2. Get the weather rollup (worst condition, max precipitation,
+             mean temperature / wind) materialised for that window.
           3. Get local events overlapping that window.
           4. Compute expected_demand = baseline * (1 + combined_modifier).
           5. Compute deviation_pct.
@@ -111,6 +119,14 @@ class AnomalyDetectionService:
             db:          Async SQLAlchemy session.
             property_id: UUID of the property being scanned.
             tenant_id:   UUID of the owning tenant (for RLS-safe inserts).
+            event_index: Scan-wide spatial index of catalogued events. With
+                         ``coordinates`` the property's nearby events are
+                         resolved once and filtered per window in memory;
+                         otherwise each window queries property_events.
+                         Both paths return the events within
+                         EVENT_IMPACT_RADIUS_KM plus the linked events
+                         without a centroid.
+            coordinates: (latitude, longitude) of the property.
 
         Returns:
             List of DemandAnomaly ORM instances that were upserted.
@@ -119,26 +135,33 @@ class AnomalyDetectionService:
         windows = self.generate_windows(now_utc)
         anomalies_to_upsert: List[dict] = []
 
+        # Hour-block baselines, read once for all of this property's windows
+        baseline_rates: Dict[Tuple[str, str], Dict[Tuple[str, int], Decimal]] = {}
+
+        nearby: Optional[List[NearbyEvent]] = None
+        if event_index is not None and coordinates is not None:
+            nearby = event_index.nearby(
+                *coordinates, EVENT_IMPACT_RADIUS_KM, linked_to=str(tenant_id)
+            )
+
         for window_start, window_end in windows:
             # 1. Baseline demand from captation_rates (fallback to 1000.0 if missing)
             baseline_demand = await self._get_baseline_demand(
-                db, property_id, tenant_id, window_start
+                db, property_id, tenant_id, window_start, cache=baseline_rates
             )
 
-            # 2. Weather forecast
+            # 2. Weather rollup for the window
             weather_row = await self._get_weather_for_window(
                 db, property_id, window_start
             )
             weather_mod = 0.0
             weather_factor = None
             if weather_row:
-                weather_mod, weather_factor = weather_modifier(
-                    weather_row.condition_code
-                )
+                weather_mod, weather_factor = weather_window_modifier(weather_row)
 
             # 3. Local events overlapping the window
             event_rows = await self._get_events_for_window(
-                db, property_id, window_start, window_end
+                db, property_id, window_start, window_end, nearby=nearby
             )
             event_mod = 0.0
             event_factors: list = []
@@ -249,11 +272,20 @@ class AnomalyDetectionService:
             logger.info("anomaly_scan: no active properties found, skipping")
             return
 
+        # One catalogue read + one coordinates read for the whole scan; each
+        # property then resolves its nearby events from the in-memory index.
+        windows = self.generate_windows(datetime.now(timezone.utc))
+        event_index, coordinates = await self._load_event_index(
+            db, windows[0][0], windows[-1][1]
+        )
+
         tasks = [
             self.detect_for_property(
                 db,
                 property_id=row[0],
                 tenant_id=row[1],
+                event_index=event_index,
+                coordinates=coordinates.get(str(row[1])),
             )
             for row in properties
         ]
@@ -300,38 +332,55 @@ class AnomalyDetectionService:
         property_id: uuid.UUID,
         tenant_id: uuid.UUID,
         window_start: datetime,
+        cache: Optional[Dict[Tuple[str, str], Dict[Tuple[str, int], Decimal]]] = None,
     ) -> Decimal:
-        """Load baseline demand from captation_rates table (Story 2.4).
+        """Baseline demand for the window from captation_rates (Story 2.4).
+
+        The property's 42 (day_of_week, hour_block) rows are read in one
+        query and kept in ``cache`` for the remaining windows of the scan.
 
         Falls back to Decimal("1000.00") if no baseline is found so that
         modifier maths still runs correctly during early test/dev.
         """
+        key = (str(property_id), str(tenant_id))
+        if cache is not None and key in cache:
+            rates = cache[key]
+        else:
+            rates = await self._load_captation_rates(db, property_id, tenant_id)
+            if cache is not None:
+                cache[key] = rates
+
         dow = window_start.strftime("%A").lower()  # e.g. "monday"
         hour_block = (window_start.hour // 4) * 4  # 0, 4, 8, 12, 16, 20
+        return rates.get((dow, hour_block), Decimal("1000.00"))
 
+    async def _load_captation_rates(
+        self,
+        db: AsyncSession,
+        property_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+    ) -> Dict[Tuple[str, int], Decimal]:
+        """Load the property's hour-block baselines, keyed by (day_of_week, hour_block)."""
         try:
             result = await db.execute(
                 text(
                     """
-                    SELECT baseline_revenue
+                    SELECT day_of_week, hour_block, baseline_revenue
                     FROM captation_rates
                     WHERE property_id = :property_id
                       AND tenant_id   = :tenant_id
-                      AND day_of_week = :dow
-                      AND hour_block  = :hour_block
-                    LIMIT 1
                     """
                 ),
                 {
                     "property_id": str(property_id),
                     "tenant_id": str(tenant_id),
-                    "dow": dow,
-                    "hour_block": hour_block,
                 },
             )
-            row = result.fetchone()
-            if row and row[0] is not None:
-                return Decimal(str(row[0]))
+            return {
+                (row[0], int(row[1])): Decimal(str(row[2]))
+                for row in result.fetchall()
+                if row[2] is not None
+            }
         except sqlalchemy.exc.ProgrammingError:
             # Table does not exist (dev/test environment) — use fallback silently
             logger.debug(
@@ -346,86 +395,147 @@ class AnomalyDetectionService:
             raise AnomalyDetectionError(
                 f"DB error during baseline lookup for property {property_id}"
             )
-
-        return Decimal("1000.00")
+        return {}
 
     async def _get_weather_for_window(
         self,
         db: AsyncSession,
         property_id: uuid.UUID,
         window_start: datetime,
-    ) -> Optional[WeatherForecast]:
-        """Return the nearest weather forecast row for the given window start."""
+    ) -> Optional[WeatherCellWindow]:
+        """Return the 4-hour weather rollup for the given window start.
+
+        Rollups are materialised per grid cell at ingestion
+        (weather_cell_windows) and joined to the property through
+        property_weather_cells — one primary-key lookup per window.
+        """
         try:
             result = await db.execute(
                 text(
                     """
-                    SELECT id, condition_code, forecast_timestamp
-                    FROM weather_forecasts
-                    WHERE property_id = :property_id
-                      AND forecast_timestamp >= :ts_from
-                      AND forecast_timestamp <  :ts_to
-                    ORDER BY ABS(EXTRACT(EPOCH FROM (forecast_timestamp - :ts_from)))
-                    LIMIT 1
+                    SELECT cw.worst_condition_code, cw.max_precipitation_prob,
+                           cw.mean_temperature_c, cw.mean_wind_speed_kmh
+                    FROM property_weather_cells pc
+                    JOIN weather_cell_windows cw ON cw.cell_id = pc.cell_id
+                    WHERE pc.property_id = :property_id
+                      AND cw.window_start = :window_start
                     """
                 ),
                 {
                     "property_id": str(property_id),
-                    "ts_from": window_start.isoformat(),
-                    "ts_to": (window_start + timedelta(hours=4)).isoformat(),
+                    "window_start": window_start,
                 },
             )
             row = result.fetchone()
             if row:
-                wf = WeatherForecast()
-                wf.id = row[0]
-                wf.condition_code = row[1]
-                return wf
+                return WeatherCellWindow(
+                    worst_condition_code=row[0],
+                    max_precipitation_prob=row[1],
+                    mean_temperature_c=row[2],
+                    mean_wind_speed_kmh=row[3],
+                )
         except sqlalchemy.exc.SQLAlchemyError:
             logger.debug(
-                "weather_forecasts lookup failed for property %s", property_id
+                "weather_cell_windows lookup failed for property %s", property_id
             )
         return None
 
+    async def _load_event_index(
+        self,
+        db: AsyncSession,
+        horizon_start: datetime,
+        horizon_end: datetime,
+    ) -> Tuple[Optional[EventSpatialIndex], Dict[str, Tuple[float, float]]]:
+        """Build the scan-wide event index and tenant → (lat, lng) map.
+
+        Returns ``(None, {})`` on DB error so the scan falls back to
+        per-window property_events lookups.
+        """
+        try:
+            event_index = await EventSpatialIndex.load(db, horizon_start, horizon_end)
+            result = await db.execute(
+                text(
+                    """
+                    SELECT tenant_id, latitude, longitude
+                    FROM restaurant_profiles
+                    WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+                    """
+                )
+            )
+            coordinates = {
+                str(row[0]): (float(row[1]), float(row[2]))
+                for row in result.fetchall()
+            }
+        except sqlalchemy.exc.SQLAlchemyError:
+            logger.warning(
+                "anomaly_scan: event index unavailable — falling back to "
+                "per-window event lookups",
+                exc_info=True,
+            )
+            return None, {}
+
+        logger.info(
+            "anomaly_scan: event index built — %d events, %d located properties",
+            len(event_index),
+            len(coordinates),
+        )
+        return event_index, coordinates
+
     async def _get_events_for_window(
         self,
         db: AsyncSession,
         property_id: uuid.UUID,
         window_start: datetime,
         window_end: datetime,
-    ) -> List[LocalEvent]:
-        """Return all active local events overlapping the given window."""
+        nearby: Optional[List[NearbyEvent]] = None,
+    ) -> List[NearbyEvent]:
+        """Return the property's events overlapping the given window.
+
+        With ``nearby`` (pre-resolved from the spatial index) this is an
+        in-memory filter; otherwise the linked events within
+        EVENT_IMPACT_RADIUS_KM (or without a centroid) are read from
+        property_events.
+        """
+        if nearby is not None:
+            return [e for e in nearby if e.overlaps(window_start, window_end)]
+
         try:
             result = await db.execute(
                 text(
                     """
-                    SELECT id, predicthq_event_id, category, impact_score
-                    FROM local_events
-                    WHERE property_id = :property_id
-                      AND start_dt < :window_end
-                      AND (end_dt IS NULL OR end_dt > :window_start)
-                    ORDER BY impact_score DESC NULLS LAST
+                    SELECT ec.event_id, ec.category, ec.rank, ec.phq_attendance,
+                           ec.start_dt, ec.end_dt, pe.distance_km
+                    FROM property_events pe
+                    JOIN event_catalog ec ON ec.event_id = pe.event_id
+                    WHERE pe.property_id = :property_id
+                      AND (pe.distance_km IS NULL OR pe.distance_km <= :radius_km)
+                      AND ec.start_dt < :window_end
+                      AND (ec.end_dt IS NULL OR ec.end_dt > :window_start)
+                    ORDER BY ec.rank DESC NULLS LAST
                     """
                 ),
                 {
                     "property_id": str(property_id),
-                    "window_start": window_start.isoformat(),
-                    "window_end": window_end.isoformat(),
+                    "window_start": window_start,
+                    "window_end": window_end,
+                    "radius_km": EVENT_IMPACT_RADIUS_KM,
                 },
             )
-            rows = result.fetchall()
-            events = []
-            for row in rows:
-                e = LocalEvent()
-                e.id = row[0]
-                e.predicthq_event_id = row[1]
-                e.category = row[2]
-                e.impact_score = row[3]
-                events.append(e)
-            return events
+            return [
+                NearbyEvent(
+                    event_id=row[0],
+                    category=row[1],
+                    rank=row[2],
+                    phq_attendance=row[3],
+                    start_dt=row[4],
+                    end_dt=row[5],
+                    distance_km=row[6],
+                )
+                for row in result.fetchall()
+            ]
         except sqlalchemy.exc.SQLAlchemyError:
             logger.debug(
-                "local_events lookup failed for property %s", property_id
+                "property_events lookup failed for property %s", property_id
             )
         return []
 
@@ -1,20 +1,26 @@
 from app.services.pms_sync import PMSAdapter
+from app.integrations.apaleo_http import (
+    ApaleoTokenManager,
+    get_apaleo_http_client,
+    get_token_manager,
+)
 from app.integrations.apaleo_logger import (
     ApaleoAgentLogger,
     ApaleoWriteBlockedError,
     is_readonly_mode,
 )
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 import os
 import logging
 import time
 import httpx
 from datetime import date, datetime
-from tenacity import retry, retry_if_exception_type, wait_exponential, stop_after_attempt
 
 logger = logging.getLogger(__name__)
 _agent_logger = ApaleoAgentLogger()
 
+_APALEO_SCOPE = "offline_access openid profile read:occupancy read:revenue write:schedules"
+
 
 class ApaleoSyncError(Exception):
     """Raised when the Apaleo API returns an error response during sync."""
@@ -26,54 +32,54 @@ class ApaleoPMSAdapter(PMSAdapter):
     Implementation of Story 2.1 (Establish PMS API Connection & Auth).
     """
 
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        token_manager: Optional[ApaleoTokenManager] = None,
+    ):
         self.api_base_url = "https://api.apaleo.com"
         self.client_id = client_id or os.getenv("APALEO_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("APALEO_CLIENT_SECRET")
         self.access_token: Optional[str] = None
         self.token_expiry: float = 0
+        # Injected for tests; otherwise the process-wide pooled client/cache.
+        self._http_client = http_client
+        self._token_manager = token_manager or get_token_manager()
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        return self._http_client or get_apaleo_http_client()
 
-    @retry(
-        retry=retry_if_exception_type(httpx.HTTPStatusError),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-    )
     async def _authenticate(self):
-        """Fetch/Refresh OAuth2 token for Apaleo (retries up to 3x on HTTPStatusError)."""
+        """Fetch/Refresh the OAuth2 token via the shared token manager.
+
+        The token is cached process-wide, so new adapter instances (one per
+        /pms/sync request) reuse it instead of hitting the identity server.
+        """
         # Check if token is still valid (with 60s buffer)
         if self.access_token and time.time() < self.token_expiry - 60:
             return
 
-        if not self.client_id or not self.client_secret:
-            raise ValueError("Apaleo credentials missing in environment.")
+        self.access_token, self.token_expiry = await self._token_manager.get_token(
+            self.client_id or "",
+            self.client_secret or "",
+            _APALEO_SCOPE,
+            http_client=self._http,
+        )
 
-        token_url = "https://identity.apaleo.com/connect/token"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                token_url,
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "scope": "offline_access openid profile read:occupancy read:revenue write:schedules"
-                }
-            )
-            response.raise_for_status()
-
-        token_data = response.json()
-        self.access_token = token_data.get("access_token")
-        expires_in = token_data.get("expires_in", 3600)
-        self.token_expiry = time.time() + expires_in
-        logger.info("Successfully authenticated with Apaleo")
+    def _on_unauthorized(self) -> None:
+        """Drop the (revoked or expired) shared token so the next call refreshes it."""
+        self.access_token = None
+        self._token_manager.invalidate(self.client_id or "", _APALEO_SCOPE)
 
     async def get_occupancy(self, property_id: str, target_date: date) -> int:
         """
         Fetches occupancy metrics for a given date.
         Raises ApaleoSyncError on non-200 responses.
         """
-        if not self.access_token:
-            await self._authenticate()
+        await self._authenticate()
 
         tool = "REST_GET_OCCUPANCY"
         params = {"date": target_date.isoformat(), "propertyId": property_id}
@@ -82,19 +88,20 @@ class ApaleoPMSAdapter(PMSAdapter):
         t0 = time.monotonic()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers)
-                duration_ms = (time.monotonic() - t0) * 1000
-                if response.status_code == 200:
-                    data = response.json()
-                    result = int(data.get("occupancy") or 85)
-                    _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
-                                      result_summary=str(result))
-                    return result
-                else:
-                    _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
-                                      error=f"HTTP {response.status_code}")
-                    raise ApaleoSyncError(f"HTTP {response.status_code}")
+            response = await self._http.get(url, params=params, headers=headers)
+            duration_ms = (time.monotonic() - t0) * 1000
+            if response.status_code == 200:
+                data = response.json()
+                result = int(data.get("occupancy") or 85)
+                _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
+                                  result_summary=str(result))
+                return result
+            else:
+                if response.status_code == 401:
+                    self._on_unauthorized()
+                _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
+                                  error=f"HTTP {response.status_code}")
+                raise ApaleoSyncError(f"HTTP {response.status_code}")
         except ApaleoSyncError:
             raise
         except Exception as e:
@@ -108,8 +115,7 @@ class ApaleoPMSAdapter(PMSAdapter):
         Fetches revenue metrics.
         Raises ApaleoSyncError on non-200 responses.
         """
-        if not self.access_token:
-            await self._authenticate()
+        await self._authenticate()
 
         tool = "REST_GET_REVENUE"
         params = {
@@ -123,20 +129,21 @@ class ApaleoPMSAdapter(PMSAdapter):
         t0 = time.monotonic()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers)
-                duration_ms = (time.monotonic() - t0) * 1000
-                if response.status_code == 200:
-                    data = response.json()
-                    revenue_list = data.get("revenue", [])
-                    fb_revenue = sum(item.get("amount", 0.0) for item in revenue_list if category.lower() in item.get("category", "").lower())
-                    result = fb_revenue if fb_revenue > 0 else sum(item.get("amount", 0.0) for item in revenue_list)
-                    _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
-                                      result_summary=str(result))
-                    return result
+            response = await self._http.get(url, params=params, headers=headers)
+            duration_ms = (time.monotonic() - t0) * 1000
+            if response.status_code == 200:
+                data = response.json()
+                revenue_list = data.get("revenue", [])
+                fb_revenue = sum(item.get("amount", 0.0) for item in revenue_list if category.lower() in item.get("category", "").lower())
+                result = fb_revenue if fb_revenue > 0 else sum(item.get("amount", 0.0) for item in revenue_list)
                 _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
-                                  error=f"HTTP {response.status_code}")
-                raise ApaleoSyncError(f"HTTP {response.status_code}")
+                                  result_summary=str(result))
+                return result
+            if response.status_code == 401:
+                self._on_unauthorized()
+            _agent_logger.log(tool, params, mode="read", duration_ms=duration_ms,
+                              error=f"HTTP {response.status_code}")
+            raise ApaleoSyncError(f"HTTP {response.status_code}")
         except ApaleoSyncError:
             raise
         except Exception as e:
@@ -148,9 +155,26 @@ class ApaleoPMSAdapter(PMSAdapter):
         """
         Fetches bulk historical data from Apaleo Stay API with full pagination.
         Raises ApaleoSyncError on non-200 responses.
+
+        Materialises every page; large exports should consume
+        ``iter_historical_pages`` instead.
+        """
+        all_records: List[Dict[str, Any]] = []
+        async for page in self.iter_historical_pages(property_id, start_date, end_date):
+            all_records.extend(page)
+        return all_records
+
+    async def iter_historical_pages(
+        self, property_id: str, start_date: date, end_date: date
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
         """
-        if not self.access_token:
-            await self._authenticate()
+        Yields stay records from the Apaleo Stay API one page at a time.
+
+        Only the current page is held in memory, so callers can aggregate
+        multi-year exports incrementally. Raises ApaleoSyncError on non-200
+        responses.
+        """
+        await self._authenticate()
 
         tool = "REST_GET_HISTORICAL_DATA"
         base_params = {
@@ -161,44 +185,46 @@ class ApaleoPMSAdapter(PMSAdapter):
         url = f"{self.api_base_url}/reports/v1/stay-records"
         headers = {"Authorization": f"Bearer {self.access_token}"}
         t0 = time.monotonic()
-        all_records: List[Dict[str, Any]] = []
+        total_records = 0
+        pages = 0
 
         try:
-            async with httpx.AsyncClient() as client:
-                params = dict(base_params)
-                while True:
-                    response = await client.get(url, params=params, headers=headers)
-                    if response.status_code != 200:
-                        duration_ms = (time.monotonic() - t0) * 1000
-                        logger.warning(f"Failed to fetch historical data: {response.status_code}")
-                        _agent_logger.log(tool, base_params, mode="read", duration_ms=duration_ms,
-                                          error=f"HTTP {response.status_code}")
-                        raise ApaleoSyncError(f"HTTP {response.status_code}")
-
-                    data = response.json()
-                    # Support both list response (legacy) and paginated object response
-                    if isinstance(data, list):
-                        all_records.extend(data)
-                        break
-                    else:
-                        page_records = data.get("stayRecords", [])
-                        all_records.extend(page_records)
-                        page_info = data.get("pageInfo", {})
-                        if not page_info.get("hasNext", False):
-                            break
-                        next_token = page_info.get("nextPageToken")
-                        if not next_token:
-                            break
-                        params = {**base_params, "pageToken": next_token}
+            params = dict(base_params)
+            while True:
+                response = await self._http.get(url, params=params, headers=headers)
+                if response.status_code != 200:
+                    if response.status_code == 401:
+                        self._on_unauthorized()
+                    duration_ms = (time.monotonic() - t0) * 1000
+                    logger.warning(f"Failed to fetch historical data: {response.status_code}")
+                    _agent_logger.log(tool, base_params, mode="read", duration_ms=duration_ms,
+                                      error=f"HTTP {response.status_code}")
+                    raise ApaleoSyncError(f"HTTP {response.status_code}")
+
+                data = response.json()
+                # Support both list response (legacy) and paginated object response
+                if isinstance(data, list):
+                    page_records, next_token = data, None
+                else:
+                    page_records = data.get("stayRecords", [])
+                    page_info = data.get("pageInfo", {})
+                    next_token = page_info.get("nextPageToken") if page_info.get("hasNext", False) else None
+
+                pages += 1
+                total_records += len(page_records)
+                yield page_records
+
+                if not next_token:
+                    break
+                params = {**base_params, "pageToken": next_token}
 
             duration_ms = (time.monotonic() - t0) * 1000
             logger.info(
-                "Apaleo historical data: fetched %d total records for %s (%s→%s)",
-                len(all_records), property_id, start_date, end_date,
+                "Apaleo historical data: fetched %d total records in %d pages for %s (%s→%s)",
+                total_records, pages, property_id, start_date, end_date,
             )
             _agent_logger.log(tool, base_params, mode="read", duration_ms=duration_ms,
-                              result_summary=f"{len(all_records)} records")
-            return all_records
+                              result_summary=f"{total_records} records")
 
         except ApaleoSyncError:
             raise
@@ -241,8 +267,7 @@ class ApaleoPMSAdapter(PMSAdapter):
                 "Set APALEO_READONLY=false to enable writes."
             )
 
-        if not self.access_token:
-            await self._authenticate()
+        await self._authenticate()
 
         url = f"{self.api_base_url}/operations/v1/schedules"
         payload = {**params, "source": "Aetherix-AI"}
@@ -250,18 +275,19 @@ class ApaleoPMSAdapter(PMSAdapter):
         t0 = time.monotonic()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=headers)
-                duration_ms = (time.monotonic() - t0) * 1000
-                if response.status_code in [200, 201, 204]:
-                    logger.info(f"Successfully pushed staffing to Apaleo for {property_id}")
-                    _agent_logger.log(tool, params, mode="write", duration_ms=duration_ms,
-                                      result_summary=f"HTTP {response.status_code}")
-                    return True
-                logger.error(f"Apaleo Push Failed ({response.status_code}): {response.text}")
+            response = await self._http.post(url, json=payload, headers=headers)
+            duration_ms = (time.monotonic() - t0) * 1000
+            if response.status_code in [200, 201, 204]:
+                logger.info(f"Successfully pushed staffing to Apaleo for {property_id}")
                 _agent_logger.log(tool, params, mode="write", duration_ms=duration_ms,
-                                  error=f"HTTP {response.status_code}")
-                return False
+                                  result_summary=f"HTTP {response.status_code}")
+                return True
+            if response.status_code == 401:
+                self._on_unauthorized()
+            logger.error(f"Apaleo Push Failed ({response.status_code}): {response.text}")
+            _agent_logger.log(tool, params, mode="write", duration_ms=duration_ms,
+                              error=f"HTTP {response.status_code}")
+            return False
         except ApaleoWriteBlockedError:
             raise
         except Exception as e:
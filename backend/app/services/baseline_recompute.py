@@ -0,0 +1,141 @@
+"""Portfolio-wide captation baseline recomputation.
+
+``POST /baselines/{tenant_id}/recalculate`` repairs one tenant; after a
+data fix every tenant needs it. The recompute:
+
+1. Runs each tenant's statistics query (``CaptationService.aggregate_stats``,
+   one GROUP BY inside Postgres) concurrently, bounded by
+   BASELINE_RECOMPUTE_CONCURRENCY, each in its own short session.
+2. Writes baselines, running aggregates and hour-block ``captation_rates``
+   for BASELINE_RECOMPUTE_BATCH_SIZE tenants per transaction.
+3. Reports the outcome and duration of every tenant.
+
+One tenant failing never affects the others; a failed batch write marks
+only that batch's tenants as failed.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import distinct
+from sqlalchemy.future import select
+
+from app.db.models import CaptationRunningStats, PMSSyncLog
+from app.db.session import AsyncSessionLocal
+from app.services.captation_rates import CaptationRatesService
+from app.services.captation_service import MIN_DATA_POINTS, CaptationService
+
+logger = logging.getLogger(__name__)
+
+_CONCURRENCY = int(os.getenv("BASELINE_RECOMPUTE_CONCURRENCY", "8"))
+_BATCH_SIZE = int(os.getenv("BASELINE_RECOMPUTE_BATCH_SIZE", "200"))
+
+
+@dataclass
+class TenantRecompute:
+    """Outcome of one tenant's recomputation."""
+
+    tenant_id: str
+    status: str  # recalculated | insufficient_data | failed
+    duration_ms: float
+    data_points: int = 0
+    error: Optional[str] = None
+
+
+async def recompute_portfolio(
+    tenant_ids: Optional[Iterable[str]] = None,
+    concurrency: int = _CONCURRENCY,
+    batch_size: int = _BATCH_SIZE,
+) -> List[TenantRecompute]:
+    """Recompute the captation baseline of every tenant (default: all with sync data)."""
+    if tenant_ids is None:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(distinct(PMSSyncLog.tenant_id)))
+            tenant_ids = sorted(result.scalars().all())
+    tenants = list(dict.fromkeys(tenant_ids))
+
+    service = CaptationService()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    t_start = time.monotonic()
+
+    async def _aggregate(tenant_id: str) -> Tuple[TenantRecompute, Optional[CaptationRunningStats]]:
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                async with AsyncSessionLocal() as db:
+                    stats = await service.aggregate_stats(tenant_id, db)
+            except Exception as exc:  # noqa: BLE001 — isolate per-tenant failures
+                logger.warning("Baseline recompute FAILED  tenant=%s: %s", tenant_id, exc)
+                return _outcome(tenant_id, "failed", started, error=str(exc)), None
+        status = "recalculated" if stats.samples_count >= MIN_DATA_POINTS else "insufficient_data"
+        return _outcome(tenant_id, status, started, stats.samples_count), stats
+
+    outcomes: List[TenantRecompute] = []
+    size = max(1, batch_size)
+    for i in range(0, len(tenants), size):
+        computed = await asyncio.gather(*(_aggregate(t) for t in tenants[i:i + size]))
+        await _write_batch(service, computed)
+        outcomes.extend(outcome for outcome, _ in computed)
+
+    _log_summary(outcomes, time.monotonic() - t_start)
+    return outcomes
+
+
+async def _write_batch(
+    service: CaptationService,
+    computed: List[Tuple[TenantRecompute, Optional[CaptationRunningStats]]],
+) -> None:
+    """Store one batch of results in a single transaction."""
+    stats = [s for _, s in computed if s is not None]
+    if not stats:
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            baselines = await service.store_baselines(stats, db)
+            rates = CaptationRatesService()
+            for tenant_id, baseline in baselines.items():
+                await rates.refresh(tenant_id, db, baseline, commit=False)
+            await db.commit()
+    except Exception as exc:  # noqa: BLE001 — one failed batch must not stop the run
+        logger.error("Baseline recompute batch write FAILED (%d tenants): %s", len(stats), exc)
+        for outcome, tenant_stats in computed:
+            if tenant_stats is not None:
+                outcome.status, outcome.error = "failed", str(exc)
+
+
+def _outcome(
+    tenant_id: str,
+    status: str,
+    started: float,
+    data_points: int = 0,
+    error: Optional[str] = None,
+) -> TenantRecompute:
+    return TenantRecompute(
+        tenant_id=tenant_id,
+        status=status,
+        duration_ms=round((time.monotonic() - started) * 1000, 1),
+        data_points=data_points,
+        error=error,
+    )
+
+
+def _log_summary(outcomes: List[TenantRecompute], elapsed: float) -> None:
+    counts = {s: sum(1 for o in outcomes if o.status == s)
+              for s in ("recalculated", "insufficient_data", "failed")}
+    slowest = max(outcomes, key=lambda o: o.duration_ms, default=None)
+    logger.info(
+        "Baseline recompute OK  tenants=%d  recalculated=%d  insufficient=%d  failed=%d  "
+        "elapsed=%.1fs  slowest=%s (%.0f ms)",
+        len(outcomes),
+        counts["recalculated"],
+        counts["insufficient_data"],
+        counts["failed"],
+        elapsed,
+        slowest.tenant_id if slowest else "-",
+        slowest.duration_ms if slowest else 0.0,
+    )
@@ -0,0 +1,172 @@
+"""Hour-block captation rates materializer.
+
+Story 2.4 → Story 3.3a: ``AnomalyDetectionService`` reads the baseline F&B
+demand of each 4-hour window from ``captation_rates``, keyed by
+(property, weekday, hour block). This module produces that table from the
+tenant's ``CaptationBaseline`` and its recent ``PMSSyncLog`` occupancy:
+
+    daily_revenue(dow)      = avg_fb_revenue_per_room × dow_factor(dow)
+                              × average occupancy over the last
+                                CAPTATION_RATES_OCCUPANCY_DAYS days
+    block_revenue(dow, h)   = daily_revenue(dow) × HOUR_BLOCK_SHARES[h]
+
+PMS data is daily, so the split across the day uses a fixed service
+profile (``HOUR_BLOCK_SHARES``). Each property gets 42 rows (7 weekdays ×
+6 blocks), upserted in place.
+
+Refreshes are per tenant and run after every baseline update (PMS sync,
+backfill, manual recalculation): their cost depends on the tenant's
+number of properties, never on the length of its history.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+import sqlalchemy.exc
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.models import CaptationBaseline, PMSSyncLog
+from app.services.captation_service import CaptationService
+
+logger = logging.getLogger(__name__)
+
+# Window of recent sync days used for the occupancy level
+OCCUPANCY_DAYS = int(os.getenv("CAPTATION_RATES_OCCUPANCY_DAYS", "28"))
+
+# Share of daily F&B revenue per 4-hour UTC block (block start hour → share)
+HOUR_BLOCK_SHARES = {
+    0: 0.02,
+    4: 0.06,   # early breakfast
+    8: 0.22,   # breakfast / brunch
+    12: 0.28,  # lunch
+    16: 0.30,  # early dinner / bar
+    20: 0.12,  # late dinner / bar
+}
+
+# Matches AnomalyDetectionService: window_start.strftime("%A").lower()
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+_UPSERT_RATES_SQL = """
+    INSERT INTO captation_rates
+        (tenant_id, property_id, day_of_week, hour_block, baseline_revenue, updated_at)
+    VALUES
+        (:tenant_id, :property_id, :day_of_week, :hour_block, :baseline_revenue, :updated_at)
+    ON CONFLICT (property_id, day_of_week, hour_block) DO UPDATE SET
+        tenant_id        = EXCLUDED.tenant_id,
+        baseline_revenue = EXCLUDED.baseline_revenue,
+        updated_at       = EXCLUDED.updated_at
+"""
+
+BlockRate = Tuple[str, int, float]
+
+
+def block_rates(baseline: CaptationBaseline, avg_occupancy: float) -> List[BlockRate]:
+    """The 42 (day_of_week, hour_block, baseline_revenue) rows for one property."""
+    rates: List[BlockRate] = []
+    for dow, day_name in enumerate(WEEKDAYS):
+        factor = float((baseline.dow_factors or {}).get(str(dow), 1.0))
+        daily = baseline.avg_fb_revenue_per_room * factor * avg_occupancy
+        for hour_block, share in HOUR_BLOCK_SHARES.items():
+            rates.append((day_name, hour_block, round(daily * share, 2)))
+    return rates
+
+
+class CaptationRatesService:
+    """Materializes ``captation_rates`` for one tenant at a time."""
+
+    async def refresh(
+        self,
+        tenant_id: str,
+        db: AsyncSession,
+        baseline: Optional[CaptationBaseline] = None,
+        *,
+        commit: bool = True,
+    ) -> int:
+        """Recompute the tenant's hour-block rates; returns the rows written.
+
+        Nothing is written when the tenant has no baseline, no recent
+        occupancy or no active property. ``commit=False`` leaves the
+        upsert in the caller's transaction (batched refreshes).
+        """
+        if baseline is None:
+            baseline = await CaptationService().get_baseline(tenant_id, db)
+            if baseline is None:
+                return 0
+
+        property_ids = await self._property_ids(tenant_id, db)
+        if not property_ids:
+            logger.debug("captation_rates: no active property for tenant=%s", tenant_id)
+            return 0
+
+        avg_occupancy = await self._recent_occupancy(tenant_id, baseline.period_end, db)
+        if not avg_occupancy:
+            return 0
+
+        updated_at = datetime.utcnow()
+        rates = block_rates(baseline, avg_occupancy)
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "property_id": property_id,
+                "day_of_week": day_name,
+                "hour_block": hour_block,
+                "baseline_revenue": revenue,
+                "updated_at": updated_at,
+            }
+            for property_id in property_ids
+            for day_name, hour_block, revenue in rates
+        ]
+        await db.execute(text(_UPSERT_RATES_SQL), rows)
+        if commit:
+            await db.commit()
+
+        logger.info(
+            "captation_rates refreshed  tenant=%s  properties=%d  rows=%d  occupancy=%.1f",
+            tenant_id,
+            len(property_ids),
+            len(rows),
+            avg_occupancy,
+        )
+        return len(rows)
+
+    # ── Internal helpers ────────────────────────────────────────────────────
+
+    @staticmethod
+    async def _property_ids(tenant_id: str, db: AsyncSession) -> List[str]:
+        """Active properties of the tenant (empty if ``properties`` is absent)."""
+        try:
+            # SAVEPOINT: a missing table must not abort the caller's transaction
+            async with db.begin_nested():
+                result = await db.execute(
+                    text(
+                        "SELECT id FROM properties "
+                        "WHERE CAST(tenant_id AS TEXT) = :tenant_id AND is_active = TRUE"
+                    ),
+                    {"tenant_id": tenant_id},
+                )
+                return [str(row[0]) for row in result.fetchall()]
+        except (sqlalchemy.exc.ProgrammingError, sqlalchemy.exc.OperationalError):
+            # Table does not exist (dev/test environment)
+            return []
+
+    @staticmethod
+    async def _recent_occupancy(
+        tenant_id: str, period_end: date, db: AsyncSession
+    ) -> Optional[float]:
+        """Mean occupancy over the last OCCUPANCY_DAYS days of valid sync data."""
+        result = await db.execute(
+            select(func.avg(PMSSyncLog.occupancy)).where(
+                PMSSyncLog.tenant_id == tenant_id,
+                PMSSyncLog.occupancy > 0,
+                PMSSyncLog.fb_revenue.isnot(None),
+                PMSSyncLog.sync_date > period_end - timedelta(days=OCCUPANCY_DAYS),
+                PMSSyncLog.sync_date <= period_end,
+            )
+        )
+        value = result.scalar()
+        return float(value) if value is not None else None
@@ -5,31 +5,52 @@ Story 2.4 — Calculate Baseline Captation Rates (FR3).
 Captation rate = F&B revenue per occupied room.
 
 The service:
-1. Loads all PMSSyncLog rows for a tenant where occupancy > 0.
+1. Aggregates all PMSSyncLog rows for a tenant where occupancy > 0 —
+   inside the database, one GROUP BY (weekday, month) query.
 2. Computes the overall average captation rate.
 3. Computes day-of-week adjustment factors (ratio of each DoW's average
    to the overall average).
 4. Computes monthly (seasonal) adjustment factors.
 5. Upserts the result into CaptationBaseline.
 6. Exposes a lightweight ``get_baseline`` helper for Story 3.3a.
+
+Incremental updates: every factor is a ratio of means, so per-weekday and
+per-month sums and counts (``CaptationRunningStats``) are enough to derive
+the baseline. ``record_sync`` folds one new sync into them in O(1), keeping
+sync latency flat as history grows; ``calculate_baseline`` is the full
+recompute, used as a repair operation and after a backfill rewrote history.
+
+EWMA mode (CAPTATION_BASELINE_MODE=ewma): every mean above becomes an
+exponentially weighted mean with a half-life of CAPTATION_EWMA_HALF_LIFE_DAYS,
+so the baseline follows menu or pricing changes instead of weighting a
+two-year-old day like yesterday. The decayed sums are kept next to the plain
+ones and updated in O(1) per sync as well; changing the half-life triggers
+a full recompute on the tenant's next sync.
 """
 from __future__ import annotations
 
 import logging
+import os
 from datetime import date, datetime
 from typing import Optional
 
-import pandas as pd
+from sqlalchemy import extract, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.db.models import CaptationBaseline, PMSSyncLog
+from app.db.models import CaptationBaseline, CaptationRunningStats, PMSSyncLog
 
 logger = logging.getLogger(__name__)
 
 # Minimum number of data points before we attempt a calculation.
 MIN_DATA_POINTS = 7
 
+# "mean" (all history weighted equally) or "ewma" (recent days weigh more)
+BASELINE_MODE = os.getenv("CAPTATION_BASELINE_MODE", "mean")
+EWMA_HALF_LIFE_DAYS = float(os.getenv("CAPTATION_EWMA_HALF_LIFE_DAYS", "90"))
+
+_MODES = ("mean", "ewma")
+
 
 class InsufficientDataError(ValueError):
     """Raised when there are not enough non-zero occupancy records."""
@@ -38,6 +59,18 @@ class InsufficientDataError(ValueError):
 class CaptationService:
     """Calculates and stores captation rate baselines per tenant."""
 
+    def __init__(
+        self,
+        mode: str = BASELINE_MODE,
+        half_life_days: float = EWMA_HALF_LIFE_DAYS,
+    ) -> None:
+        if mode not in _MODES:
+            raise ValueError(f"Unknown captation baseline mode {mode!r} (expected one of {_MODES})")
+        if half_life_days <= 0:
+            raise ValueError("half_life_days must be > 0")
+        self.mode = mode
+        self.half_life_days = half_life_days
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -47,47 +80,164 @@ class CaptationService:
     ) -> CaptationBaseline:
         """Calculate (or recalculate) the captation baseline for *tenant_id*.
 
-        Fetches all PMSSyncLog rows with occupancy > 0, runs the stats, then
-        upserts a single ``CaptationBaseline`` row for the tenant.
+        Aggregates all PMSSyncLog rows with occupancy > 0 in SQL, then
+        upserts a single ``CaptationBaseline`` row for the tenant. The running
+        aggregates used by ``record_sync`` are rebuilt from the same query.
 
         Raises:
             InsufficientDataError: if fewer than MIN_DATA_POINTS valid rows exist.
         """
-        rows = await self._load_sync_logs(tenant_id, db)
+        stats = await self.aggregate_stats(tenant_id, db)
+        await db.merge(stats)
 
-        if len(rows) < MIN_DATA_POINTS:
+        if stats.samples_count < MIN_DATA_POINTS:
+            await db.commit()
             raise InsufficientDataError(
-                f"Tenant '{tenant_id}' has only {len(rows)} valid PMS sync records "
+                f"Tenant '{tenant_id}' has only {stats.samples_count} valid PMS sync records "
                 f"(minimum required: {MIN_DATA_POINTS})."
             )
 
-        df = self._to_dataframe(rows)
-        avg_rate = self._compute_overall_avg(df)
-        dow_factors = self._compute_dow_factors(df, avg_rate)
-        monthly_factors = self._compute_monthly_factors(df, avg_rate)
+        baseline = await self._upsert_from_stats(tenant_id, stats, db)
 
-        period_start = df["sync_date"].min().date()
-        period_end = df["sync_date"].max().date()
+        logger.info(
+            "Captation baseline computed for tenant=%s  avg=%.2f  points=%d",
+            tenant_id,
+            baseline.avg_fb_revenue_per_room,
+            stats.samples_count,
+        )
+        return baseline
 
-        baseline = await self._upsert_baseline(
-            tenant_id=tenant_id,
-            period_start=period_start,
-            period_end=period_end,
-            avg_fb_revenue_per_room=avg_rate,
-            dow_factors=dow_factors,
-            monthly_factors=monthly_factors,
-            data_points_count=len(df),
-            db=db,
+    async def record_sync(
+        self,
+        tenant_id: str,
+        sync_date: date,
+        occupancy: Optional[int],
+        fb_revenue: Optional[float],
+        db: AsyncSession,
+    ) -> Optional[CaptationBaseline]:
+        """Fold one newly synced day into the baseline without reloading history.
+
+        Updates the tenant's running sums/counts and re-derives the factors
+        from them. Falls back to ``calculate_baseline`` when no running
+        aggregates exist yet (first sync, or data predating them) or, in
+        EWMA mode, when they were built with another half-life. Returns
+        None when the sample is not usable (no occupancy or no revenue).
+
+        Raises:
+            InsufficientDataError: if fewer than MIN_DATA_POINTS samples exist.
+        """
+        if not occupancy or occupancy <= 0 or fb_revenue is None:
+            return None
+
+        result = await db.execute(
+            select(CaptationRunningStats)
+            .where(CaptationRunningStats.tenant_id == tenant_id)
+            .with_for_update()
         )
+        stats = result.scalars().first()
+        if stats is None or not self._ewma_current(stats):
+            return await self.calculate_baseline(tenant_id, db)
 
-        logger.info(
-            "Captation baseline computed for tenant=%s  avg=%.2f  points=%d",
+        self._add_sample(stats, sync_date, fb_revenue / occupancy)
+        if self.mode == "ewma":
+            self._add_decayed(stats, sync_date, 1, fb_revenue / occupancy)
+        else:
+            stats.ewma_half_life_days = None  # decayed sums no longer maintained
+
+        if stats.samples_count < MIN_DATA_POINTS:
+            await db.commit()
+            raise InsufficientDataError(
+                f"Tenant '{tenant_id}' has only {stats.samples_count} valid PMS sync records "
+                f"(minimum required: {MIN_DATA_POINTS})."
+            )
+
+        baseline = await self._upsert_from_stats(tenant_id, stats, db)
+        logger.debug(
+            "Captation baseline updated for tenant=%s  avg=%.2f  points=%d",
             tenant_id,
-            avg_rate,
-            len(df),
+            baseline.avg_fb_revenue_per_room,
+            stats.samples_count,
         )
         return baseline
 
+    async def aggregate_stats(
+        self, tenant_id: str, db: AsyncSession
+    ) -> CaptationRunningStats:
+        """Aggregate the tenant's valid PMSSyncLog rows inside the database.
+
+        One ``GROUP BY weekday, month`` query returns at most 84 rows of
+        (count, captation-rate sum, first/last date) instead of every ORM
+        row; weekday and month totals are summed from those cells. In
+        EWMA mode the decayed sums are rebuilt too (``_aggregate_decayed``).
+        """
+        dow = extract("dow", PMSSyncLog.sync_date)  # 0=Sunday in SQL
+        month = extract("month", PMSSyncLog.sync_date)
+        rate = PMSSyncLog.fb_revenue / PMSSyncLog.occupancy
+        result = await db.execute(
+            select(
+                dow,
+                month,
+                func.count(),
+                func.sum(rate),
+                func.min(PMSSyncLog.sync_date),
+                func.max(PMSSyncLog.sync_date),
+            )
+            .where(
+                PMSSyncLog.tenant_id == tenant_id,
+                PMSSyncLog.occupancy > 0,
+                PMSSyncLog.fb_revenue.isnot(None),
+            )
+            .group_by(dow, month)
+        )
+        stats = self._empty_stats(tenant_id)
+        for sql_dow, month_no, count, rate_sum, first, last in result.all():
+            self._add_bucket(
+                stats, (int(sql_dow) + 6) % 7, int(month_no), count, float(rate_sum), first, last
+            )
+        if self.mode == "ewma":
+            await self._aggregate_decayed(stats, db)
+        return stats
+
+    async def store_baselines(
+        self, stats: list[CaptationRunningStats], db: AsyncSession
+    ) -> dict[str, CaptationBaseline]:
+        """Write aggregates and derived baselines for many tenants in one commit.
+
+        Used by the portfolio recompute: existing rows are prefetched with
+        two IN queries instead of one lookup per tenant. Tenants below
+        MIN_DATA_POINTS get their running aggregates only.
+        """
+        tenant_ids = [s.tenant_id for s in stats]
+        # Loads current aggregates into the identity map, so merge() does not re-select
+        await db.execute(
+            select(CaptationRunningStats).where(CaptationRunningStats.tenant_id.in_(tenant_ids))
+        )
+        result = await db.execute(
+            select(CaptationBaseline)
+            .where(CaptationBaseline.tenant_id.in_(tenant_ids))
+            .order_by(CaptationBaseline.computed_at.desc())
+        )
+        existing: dict[str, CaptationBaseline] = {}
+        for row in result.scalars().all():
+            existing.setdefault(row.tenant_id, row)
+
+        baselines: dict[str, CaptationBaseline] = {}
+        computed_at = datetime.utcnow()
+        for tenant_stats in stats:
+            await db.merge(tenant_stats)
+            if tenant_stats.samples_count < MIN_DATA_POINTS:
+                continue
+            baseline = existing.get(tenant_stats.tenant_id)
+            if baseline is None:
+                baseline = CaptationBaseline(tenant_id=tenant_stats.tenant_id)
+                db.add(baseline)
+            for column, value in self._baseline_values(tenant_stats).items():
+                setattr(baseline, column, value)
+            baseline.computed_at = computed_at
+            baselines[tenant_stats.tenant_id] = baseline
+        await db.commit()
+        return baselines
+
     async def get_baseline(
         self, tenant_id: str, db: AsyncSession
     ) -> Optional[CaptationBaseline]:
@@ -104,75 +254,181 @@ class CaptationService:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _load_sync_logs(
-        self, tenant_id: str, db: AsyncSession
-    ) -> list[PMSSyncLog]:
-        """Fetch all PMSSyncLog rows for the tenant that have occupancy > 0."""
+    # ── Running aggregates ──────────────────────────────────────────────
+
+    def _empty_stats(self, tenant_id: str) -> CaptationRunningStats:
+        return CaptationRunningStats(
+            tenant_id=tenant_id,
+            samples_count=0,
+            rate_sum=0.0,
+            dow_counts={},
+            dow_sums={},
+            month_counts={},
+            month_sums={},
+            ewma_half_life_days=self.half_life_days if self.mode == "ewma" else None,
+            ewma_weight=0.0,
+            ewma_rate_sum=0.0,
+            ewma_dow_weights={},
+            ewma_dow_sums={},
+            ewma_month_weights={},
+            ewma_month_sums={},
+        )
+
+    @classmethod
+    def _add_sample(
+        cls, stats: CaptationRunningStats, sync_date: date, rate: float
+    ) -> None:
+        """Fold one captation rate into *stats* (O(1))."""
+        cls._add_bucket(stats, sync_date.weekday(), sync_date.month, 1, rate, sync_date, sync_date)
+
+    @staticmethod
+    def _add_bucket(
+        stats: CaptationRunningStats,
+        dow: int,
+        month: int,
+        count: int,
+        rate_sum: float,
+        first: date,
+        last: date,
+    ) -> None:
+        """Add *count* samples of one weekday/month cell to *stats*."""
+        dow_key, month_key = str(dow), str(month)
+        stats.samples_count += count
+        stats.rate_sum += rate_sum
+        # Reassign the JSON dicts so SQLAlchemy notices the change.
+        stats.dow_counts = {**stats.dow_counts, dow_key: stats.dow_counts.get(dow_key, 0) + count}
+        stats.dow_sums = {**stats.dow_sums, dow_key: stats.dow_sums.get(dow_key, 0.0) + rate_sum}
+        stats.month_counts = {**stats.month_counts, month_key: stats.month_counts.get(month_key, 0) + count}
+        stats.month_sums = {**stats.month_sums, month_key: stats.month_sums.get(month_key, 0.0) + rate_sum}
+        stats.period_start = min(filter(None, (stats.period_start, first)))
+        stats.period_end = max(filter(None, (stats.period_end, last)))
+
+    # ── Exponentially weighted aggregates ───────────────────────────────
+
+    def _ewma_current(self, stats: CaptationRunningStats) -> bool:
+        """True unless EWMA mode needs decayed sums that were not maintained."""
+        return self.mode != "ewma" or stats.ewma_half_life_days == self.half_life_days
+
+    async def _aggregate_decayed(
+        self, stats: CaptationRunningStats, db: AsyncSession
+    ) -> None:
+        """Rebuild the decayed sums from per-day totals (repair path only).
+
+        Per-day (count, rate sum) tuples are folded oldest first, so the
+        result is exactly what the incremental updates would have produced.
+        """
         result = await db.execute(
-            select(PMSSyncLog)
+            select(
+                PMSSyncLog.sync_date,
+                func.count(),
+                func.sum(PMSSyncLog.fb_revenue / PMSSyncLog.occupancy),
+            )
             .where(
-                PMSSyncLog.tenant_id == tenant_id,
+                PMSSyncLog.tenant_id == stats.tenant_id,
                 PMSSyncLog.occupancy > 0,
                 PMSSyncLog.fb_revenue.isnot(None),
             )
+            .group_by(PMSSyncLog.sync_date)
             .order_by(PMSSyncLog.sync_date)
         )
-        return list(result.scalars().all())
-
-    def _to_dataframe(self, rows: list[PMSSyncLog]) -> pd.DataFrame:
-        """Convert ORM rows to a pandas DataFrame with derived columns."""
-        data = [
-            {
-                "sync_date": pd.Timestamp(row.sync_date),
-                "occupancy": row.occupancy,
-                "fb_revenue": row.fb_revenue,
-            }
-            for row in rows
-        ]
-        df = pd.DataFrame(data)
-        # Core metric per record
-        df["captation_rate"] = df["fb_revenue"] / df["occupancy"]
-        # Calendar helpers
-        df["dow"] = df["sync_date"].dt.dayofweek  # 0=Monday … 6=Sunday
-        df["month"] = df["sync_date"].dt.month     # 1–12
-        return df
-
-    def _compute_overall_avg(self, df: pd.DataFrame) -> float:
-        return float(df["captation_rate"].mean())
-
-    def _compute_dow_factors(
-        self, df: pd.DataFrame, overall_avg: float
-    ) -> dict[str, float]:
-        """Return day-of-week multipliers keyed by weekday number as a string."""
-        if overall_avg == 0:
-            return {str(d): 1.0 for d in range(7)}
-
-        dow_avg = df.groupby("dow")["captation_rate"].mean()
-        factors: dict[str, float] = {}
-        for d in range(7):
-            if d in dow_avg.index:
-                factors[str(d)] = round(float(dow_avg[d]) / overall_avg, 4)
-            else:
-                # No data for this weekday — use neutral factor
-                factors[str(d)] = 1.0
-        return factors
+        for sync_date, count, rate_sum in result.all():
+            self._add_decayed(stats, sync_date, count, float(rate_sum))
 
-    def _compute_monthly_factors(
-        self, df: pd.DataFrame, overall_avg: float
+    def _add_decayed(
+        self,
+        stats: CaptationRunningStats,
+        sync_date: date,
+        count: int,
+        rate_sum: float,
+    ) -> None:
+        """Fold *count* samples of one day into the decayed sums (O(1)).
+
+        A newer day moves the reference date forward, decaying everything
+        already stored; an older (late) day is added with its decayed weight.
+        """
+        reference = stats.ewma_reference_date
+        if reference is None or sync_date > reference:
+            if reference is not None:
+                self._decay(stats, 0.5 ** ((sync_date - reference).days / self.half_life_days))
+            stats.ewma_reference_date = sync_date
+            weight = 1.0
+        else:
+            weight = 0.5 ** ((reference - sync_date).days / self.half_life_days)
+
+        dow_key, month_key = str(sync_date.weekday()), str(sync_date.month)
+        weighted_count, weighted_sum = weight * count, weight * rate_sum
+        stats.ewma_weight += weighted_count
+        stats.ewma_rate_sum += weighted_sum
+        stats.ewma_dow_weights = {
+            **stats.ewma_dow_weights,
+            dow_key: stats.ewma_dow_weights.get(dow_key, 0.0) + weighted_count,
+        }
+        stats.ewma_dow_sums = {
+            **stats.ewma_dow_sums,
+            dow_key: stats.ewma_dow_sums.get(dow_key, 0.0) + weighted_sum,
+        }
+        stats.ewma_month_weights = {
+            **stats.ewma_month_weights,
+            month_key: stats.ewma_month_weights.get(month_key, 0.0) + weighted_count,
+        }
+        stats.ewma_month_sums = {
+            **stats.ewma_month_sums,
+            month_key: stats.ewma_month_sums.get(month_key, 0.0) + weighted_sum,
+        }
+
+    @staticmethod
+    def _decay(stats: CaptationRunningStats, factor: float) -> None:
+        """Multiply every decayed weight and sum by *factor*."""
+        stats.ewma_weight *= factor
+        stats.ewma_rate_sum *= factor
+        for column in ("ewma_dow_weights", "ewma_dow_sums", "ewma_month_weights", "ewma_month_sums"):
+            setattr(stats, column, {k: v * factor for k, v in getattr(stats, column).items()})
+
+    @staticmethod
+    def _factors_from_sums(
+        counts: dict, sums: dict, keys: range, overall_avg: float
     ) -> dict[str, float]:
-        """Return monthly multipliers keyed by month number as a string."""
+        """Per-key mean / overall mean, from running sums/counts (or decayed
+        sums/weights); matches ``_reference_*_factors`` in
+        tests/test_captation_service.py."""
         if overall_avg == 0:
-            return {str(m): 1.0 for m in range(1, 13)}
-
-        month_avg = df.groupby("month")["captation_rate"].mean()
+            return {str(k): 1.0 for k in keys}
         factors: dict[str, float] = {}
-        for m in range(1, 13):
-            if m in month_avg.index:
-                factors[str(m)] = round(float(month_avg[m]) / overall_avg, 4)
+        for k in map(str, keys):
+            if counts.get(k):
+                factors[k] = round(sums[k] / counts[k] / overall_avg, 4)
             else:
-                factors[str(m)] = 1.0
+                factors[k] = 1.0
         return factors
 
+    def _baseline_values(self, stats: CaptationRunningStats) -> dict:
+        """Baseline columns derived from running aggregates (plain or decayed)."""
+        if self.mode == "ewma":
+            weight, rate_sum = stats.ewma_weight, stats.ewma_rate_sum
+            dow = (stats.ewma_dow_weights, stats.ewma_dow_sums)
+            month = (stats.ewma_month_weights, stats.ewma_month_sums)
+        else:
+            weight, rate_sum = stats.samples_count, stats.rate_sum
+            dow = (stats.dow_counts, stats.dow_sums)
+            month = (stats.month_counts, stats.month_sums)
+        avg_rate = rate_sum / weight
+        return {
+            "period_start": stats.period_start,
+            "period_end": stats.period_end,
+            "avg_fb_revenue_per_room": avg_rate,
+            "dow_factors": self._factors_from_sums(*dow, range(7), avg_rate),
+            "monthly_factors": self._factors_from_sums(*month, range(1, 13), avg_rate),
+            "data_points_count": stats.samples_count,
+        }
+
+    async def _upsert_from_stats(
+        self, tenant_id: str, stats: CaptationRunningStats, db: AsyncSession
+    ) -> CaptationBaseline:
+        """Derive the baseline from running aggregates and upsert it."""
+        return await self._upsert_baseline(
+            tenant_id=tenant_id, db=db, **self._baseline_values(stats)
+        )
+
     async def _upsert_baseline(
         self,
         *,
@@ -0,0 +1,127 @@
+"""Bounded worker pool for CPU-bound work called from async code.
+
+Prophet inference (model deserialization, pandas frames, Stan-based
+uncertainty sampling) and other synchronous number crunching used to run
+directly inside coroutines, blocking the uvicorn event loop — and with it
+webhooks and every other in-flight request — for the duration of the call.
+``ComputePool.run`` executes such a function in a dedicated thread pool of
+COMPUTE_POOL_WORKERS threads and awaits the result.
+
+Threads rather than processes: the Prophet models live in the per-process
+model registry (app/services/model_registry.py), and numpy / Stan release
+the GIL for the heavy parts of a prediction.
+
+Queue depth (calls waiting for a free worker) and the number of running
+calls are exposed by ``stats()`` and served to superusers at
+``GET /metrics/compute-pool``; a growing queue means the pool is too small
+for the load.
+
+``get_compute_pool()`` returns the process-wide instance.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_WORKERS = int(os.getenv("COMPUTE_POOL_WORKERS", "4"))
+
+T = TypeVar("T")
+
+
+class ComputePool:
+    """Thread pool with queue-depth accounting."""
+
+    def __init__(self, max_workers: int = _WORKERS) -> None:
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queued = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` in the pool and return its result."""
+        # [True] while the call is counted in ``queued``; whichever of _call
+        # (started) or the finally below (cancelled before starting) comes
+        # first takes it off the queue.
+        waiting = [True]
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), partial(self._call, waiting, fn, args, kwargs)
+            )
+        finally:
+            self._dequeue(waiting)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "max_queued": self.max_queued,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ── Internal helpers ────────────────────────────────────────────────────
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="compute"
+                )
+            return self._executor
+
+    def _dequeue(self, waiting: list) -> None:
+        with self._lock:
+            if waiting[0]:
+                waiting[0] = False
+                self.queued -= 1
+
+    def _call(
+        self, waiting: list, fn: Callable[..., T], args: tuple, kwargs: dict
+    ) -> T:
+        self._dequeue(waiting)
+        with self._lock:
+            self.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+
+_pool: Optional[ComputePool] = None
+
+
+def get_compute_pool() -> ComputePool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ComputePool()
+    return _pool
+
+
+def shutdown_compute_pool() -> None:
+    """Stop the process-wide pool's threads (application shutdown)."""
+    if _pool is not None:
+        _pool.shutdown()
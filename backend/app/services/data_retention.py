@@ -0,0 +1,294 @@
+"""Data retention + time partition maintenance.
+
+Forecast and event tables only ever grow: every sync adds future hours and
+new events, nothing removes the past, while detection only looks 14 days
+ahead. This service keeps them bounded:
+
+  - ``weather_cell_forecasts`` is RANGE-partitioned by month on
+    ``forecast_timestamp`` (PostgreSQL). Partitions are created
+    PARTITION_MONTHS_AHEAD months in advance and whole months older than
+    WEATHER_RETENTION_DAYS are dropped — or detached and kept as standalone
+    archive tables when PARTITION_RETENTION_ACTION=detach. Rows outside the
+    created months go to the ``<table>_default`` partition; creating a month
+    moves its rows out of it first (PostgreSQL refuses to add a partition
+    whose range still has rows in the default one), and expired rows are
+    deleted from it.
+  - ``weather_cell_windows`` (4-hour rollups) share the weather retention
+    period and are pruned with an indexed DELETE.
+  - ``event_catalog`` is keyed by PredictHQ event_id (ON CONFLICT target and
+    FK target of property_events), which a start_dt partition key would
+    break, so ended events are pruned with an indexed DELETE instead.
+  - Legacy ``weather_forecasts`` / ``local_events`` (no longer written) are
+    pruned with the same DELETE path. ``local_events`` has no migration (it
+    only exists where the ORM created it), so it is skipped when absent.
+
+On non-PostgreSQL databases (SQLite in tests / local dev) every table uses
+the DELETE path.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+_WEATHER_RETENTION = timedelta(days=int(os.getenv("WEATHER_RETENTION_DAYS", "90")))
+_EVENT_RETENTION = timedelta(days=int(os.getenv("EVENT_RETENTION_DAYS", "90")))
+_PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "2"))
+_DETACH_EXPIRED = os.getenv("PARTITION_RETENTION_ACTION", "drop").lower() == "detach"
+
+# Partitioned parent table → partition key column. Names are interpolated
+# into DDL, so only these constants are ever used.
+_PARTITIONED_TABLES: Dict[str, str] = {
+    "weather_cell_forecasts": "forecast_timestamp",
+}
+
+_PARTITION_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    """One month of a RANGE-partitioned table: [start, end)."""
+
+    parent: str
+    start: date
+
+    @property
+    def name(self) -> str:
+        return f"{self.parent}_y{self.start.year:04d}m{self.start.month:02d}"
+
+    @property
+    def end(self) -> date:
+        return add_months(self.start, 1)
+
+    @property
+    def bounds(self) -> str:
+        return f"FROM ('{self.start.isoformat()}') TO ('{self.end.isoformat()}')"
+
+    def create_sql(self) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name} PARTITION OF {self.parent} "
+            f"FOR VALUES {self.bounds}"
+        )
+
+    def move_from_default_sqls(self, column: str) -> List[str]:
+        """Create the month detached, move its rows out of the default, attach it."""
+        default = default_partition(self.parent)
+        return [
+            f"CREATE TABLE IF NOT EXISTS {self.name} "
+            f"(LIKE {self.parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            f"WITH moved AS (DELETE FROM {default} "
+            f"WHERE {column} >= '{self.start.isoformat()}' "
+            f"AND {column} < '{self.end.isoformat()}' RETURNING *) "
+            f"INSERT INTO {self.name} SELECT * FROM moved",
+            f"ALTER TABLE {self.parent} ATTACH PARTITION {self.name} "
+            f"FOR VALUES {self.bounds}",
+        ]
+
+
+@dataclass
+class RetentionReport:
+    """What one maintenance run changed, per table."""
+
+    created: List[str] = field(default_factory=list)
+    expired: List[str] = field(default_factory=list)
+    deleted: Dict[str, int] = field(default_factory=dict)
+
+
+def add_months(month: date, n: int) -> date:
+    """First day of the month ``n`` months after ``month``."""
+    index = month.year * 12 + (month.month - 1) + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def default_partition(parent: str) -> str:
+    return f"{parent}_default"
+
+
+def month_floor(dt: datetime) -> date:
+    return date(dt.year, dt.month, 1)
+
+
+def partitions_to_create(parent: str, now: datetime, months_ahead: int) -> List[MonthlyPartition]:
+    """Current month plus ``months_ahead`` following months."""
+    first = month_floor(now)
+    return [MonthlyPartition(parent, add_months(first, i)) for i in range(months_ahead + 1)]
+
+
+def expired_partitions(parent: str, names: List[str], cutoff: datetime) -> List[MonthlyPartition]:
+    """Partitions of ``parent`` whose whole month ends on or before ``cutoff``.
+
+    Only months that are entirely past the cutoff are expired, so rows are
+    retained for at least the configured period (and at most one month more).
+    """
+    expired: List[MonthlyPartition] = []
+    for name in names:
+        if not name.startswith(f"{parent}_"):
+            continue
+        match = _PARTITION_SUFFIX.search(name)
+        if match is None:
+            continue
+        partition = MonthlyPartition(parent, date(int(match[1]), int(match[2]), 1))
+        if partition.name == name and partition.end <= cutoff.date():
+            expired.append(partition)
+    return sorted(expired, key=lambda p: p.start)
+
+
+class DataRetentionService:
+    """Creates upcoming partitions and prunes data past its retention window."""
+
+    async def run(self, db: AsyncSession, now: Optional[datetime] = None) -> RetentionReport:
+        """One maintenance pass over every managed table; commits at the end."""
+        now = now or datetime.now(tz=timezone.utc)
+        report = RetentionReport()
+        dialect_name: str = db.get_bind().dialect.name  # type: ignore[union-attr]
+        weather_cutoff = now - _WEATHER_RETENTION
+        event_cutoff = now - _EVENT_RETENTION
+
+        for parent, column in _PARTITIONED_TABLES.items():
+            if dialect_name == "postgresql":
+                report.created += await self.ensure_partitions(db, parent, now)
+                report.expired += await self.expire_partitions(db, parent, weather_cutoff)
+                report.deleted[default_partition(parent)] = await self._delete_before(
+                    db, default_partition(parent), column, weather_cutoff
+                )
+            else:
+                report.deleted[parent] = await self._delete_before(
+                    db, parent, column, weather_cutoff
+                )
+
+        report.deleted["weather_cell_windows"] = await self._delete_before(
+            db, "weather_cell_windows", "window_start", weather_cutoff
+        )
+
+        # property_events rows go first: SQLite does not enforce the cascade
+        report.deleted["property_events"] = await self._delete_rows(
+            db,
+            """
+            DELETE FROM property_events
+            WHERE event_id IN (
+                SELECT event_id FROM event_catalog
+                WHERE COALESCE(end_dt, start_dt) < :cutoff
+            )
+            """,
+            event_cutoff,
+        )
+        report.deleted["event_catalog"] = await self._delete_rows(
+            db,
+            "DELETE FROM event_catalog WHERE COALESCE(end_dt, start_dt) < :cutoff",
+            event_cutoff,
+        )
+        if await self._table_exists(db, "local_events"):
+            report.deleted["local_events"] = await self._delete_rows(
+                db,
+                "DELETE FROM local_events WHERE COALESCE(end_dt, start_dt) < :cutoff",
+                event_cutoff,
+            )
+        report.deleted["weather_forecasts"] = await self._delete_before(
+            db, "weather_forecasts", "forecast_timestamp", weather_cutoff
+        )
+
+        await db.commit()
+        logger.info(
+            "Retention OK  partitions_created=%d  partitions_expired=%d  rows_deleted=%s",
+            len(report.created),
+            len(report.expired),
+            report.deleted,
+        )
+        return report
+
+    async def ensure_partitions(
+        self,
+        db: AsyncSession,
+        parent: str,
+        now: datetime,
+        months_ahead: int = _PARTITION_MONTHS_AHEAD,
+    ) -> List[str]:
+        """Create missing monthly partitions from the current month onwards.
+
+        When the parent has a default partition, rows it already holds for
+        a new month are moved into that month's partition.
+        """
+        existing = set(await self._list_partitions(db, parent))
+        has_default = default_partition(parent) in existing
+        created: List[str] = []
+        column = _PARTITIONED_TABLES[parent]
+        for partition in partitions_to_create(parent, now, months_ahead):
+            if partition.name in existing:
+                continue
+            if has_default:
+                for sql in partition.move_from_default_sqls(column):
+                    await db.execute(text(sql))
+            else:
+                await db.execute(text(partition.create_sql()))
+            created.append(partition.name)
+        return created
+
+    async def expire_partitions(
+        self,
+        db: AsyncSession,
+        parent: str,
+        cutoff: datetime,
+    ) -> List[str]:
+        """Drop (or detach, to archive) partitions entirely older than ``cutoff``."""
+        expired: List[str] = []
+        names = await self._list_partitions(db, parent)
+        for partition in expired_partitions(parent, names, cutoff):
+            if _DETACH_EXPIRED:
+                await db.execute(
+                    text(f"ALTER TABLE {parent} DETACH PARTITION {partition.name}")
+                )
+                await db.execute(
+                    text(f"ALTER TABLE {partition.name} RENAME TO {partition.name}_archive")
+                )
+            else:
+                await db.execute(text(f"DROP TABLE IF EXISTS {partition.name}"))
+            expired.append(partition.name)
+        return expired
+
+    # ── Internal helpers ────────────────────────────────────────────────────
+
+    @staticmethod
+    async def _list_partitions(db: AsyncSession, parent: str) -> List[str]:
+        result = await db.execute(
+            text(
+                """
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                JOIN pg_class p ON p.oid = i.inhparent
+                WHERE p.relname = :parent
+                """
+            ),
+            {"parent": parent},
+        )
+        return [row[0] for row in result.fetchall()]
+
+    async def _delete_before(
+        self,
+        db: AsyncSession,
+        table: str,
+        column: str,
+        cutoff: datetime,
+    ) -> int:
+        return await self._delete_rows(
+            db, f"DELETE FROM {table} WHERE {column} < :cutoff", cutoff
+        )
+
+    @staticmethod
+    async def _table_exists(db: AsyncSession, table: str) -> bool:
+        return await db.run_sync(
+            lambda session: inspect(session.connection()).has_table(table)
+        )
+
+    @staticmethod
+    async def _delete_rows(db: AsyncSession, sql: str, cutoff: datetime) -> int:
+        result = await db.execute(text(sql), {"cutoff": cutoff})
+        return result.rowcount if result.rowcount is not None else 0
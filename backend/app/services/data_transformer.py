@@ -1,40 +1,67 @@
 import pandas as pd
-from typing import List, Dict, Any
+from typing import AsyncIterable, List, Dict, Any
 from datetime import datetime
 
+
+class DailyGuestAggregator:
+    """
+    Incremental guests-per-arrival-date totals for Prophet training.
+
+    Feed stay-record pages with ``add``; only one running total per day is
+    kept, so memory is bounded by the number of days, not by the number
+    of records in the export.
+    """
+
+    def __init__(self) -> None:
+        self._totals: Dict[str, int] = {}
+        self.records_seen = 0
+
+    def add(self, records: List[Dict[str, Any]]) -> None:
+        for rec in records:
+            self.records_seen += 1
+            arrival = rec.get("arrival", "")
+            # Arrival usually comes as ISO string
+            if arrival:
+                ds = arrival[:10]  # Extract YYYY-MM-DD
+                # Summing up total guests (adults + children) as a proxy for covers
+                total_guests = rec.get("adults", 0) + rec.get("children", 0)
+                self._totals[ds] = self._totals.get(ds, 0) + total_guests
+
+    def to_prophet(self) -> pd.DataFrame:
+        if not self._totals:
+            return pd.DataFrame(columns=['ds', 'y'])
+        daily_df = pd.DataFrame(
+            {"ds": pd.to_datetime(list(self._totals)), "y": list(self._totals.values())}
+        )
+        return daily_df.sort_values('ds', ignore_index=True)
+
+
 class DataTransformer:
     """
     Utility to transform PMS raw data into ML-ready formats.
     Focus: Apaleo Stay Records to Prophet (ds, y).
     """
-    
+
     @staticmethod
     def stay_records_to_prophet(records: List[Dict[str, Any]]) -> pd.DataFrame:
         """
         Aggregates guest counts by date for Prophet training.
         """
-        if not records:
-            return pd.DataFrame(columns=['ds', 'y'])
-            
-        data = []
-        for rec in records:
-            arrival = rec.get("arrival", "")
-            # Arrival usually comes as ISO string
-            if arrival:
-                ds = arrival[:10] # Extract YYYY-MM-DD
-                # Summing up total guests (adults + children) as a proxy for covers
-                total_guests = rec.get("adults", 0) + rec.get("children", 0)
-                data.append({"ds": ds, "y": total_guests})
-                
-        df = pd.DataFrame(data)
-        if df.empty:
-            return pd.DataFrame(columns=['ds', 'y'])
-            
-        # Group by date to get daily totals
-        df['ds'] = pd.to_datetime(df['ds'])
-        daily_df = df.groupby('ds')['y'].sum().reset_index()
-        
-        return daily_df
+        aggregator = DailyGuestAggregator()
+        aggregator.add(records)
+        return aggregator.to_prophet()
+
+    @staticmethod
+    async def stay_pages_to_prophet(pages: AsyncIterable[List[Dict[str, Any]]]) -> pd.DataFrame:
+        """
+        Streaming variant of ``stay_records_to_prophet``: consumes pages
+        (e.g. ``ApaleoPMSAdapter.iter_historical_pages``) one at a time, so
+        memory stays flat regardless of export size.
+        """
+        aggregator = DailyGuestAggregator()
+        async for page in pages:
+            aggregator.add(page)
+        return aggregator.to_prophet()
 
     @staticmethod
     def add_external_features(df: pd.DataFrame, weather_data: Dict[str, float]) -> pd.DataFrame:
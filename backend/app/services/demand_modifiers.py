@@ -1,7 +1,10 @@
 """Demand modifier functions for anomaly detection.
 
 Provides:
+  - wmo_condition(code) / wmo_severity(code) -> WMO code vocabulary
   - weather_modifier(condition_code) -> (float, dict)
+  - weather_window_modifier(window)  -> (float, dict)
+  - event_impact(event)              -> float
   - event_modifier(events)           -> (float, list[dict])
 
 Returns both a numeric multiplier offset and structured triggering_factor dicts
@@ -12,7 +15,8 @@ Architecture: Fat Backend — all modifier logic lives here, never in Next.js.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import math
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # Weather modifier table
@@ -28,19 +32,63 @@ _WEATHER_MODIFIERS: Dict[str, float] = {
 }
 
 
-def weather_modifier(condition_code: str) -> Tuple[float, Dict[str, Any]]:
+# Open-Meteo WMO weather interpretation codes → modifier table keys
+_WMO_CONDITIONS: Dict[int, str] = {
+    0: "clear", 1: "clear",
+    2: "partly_cloudy", 3: "partly_cloudy",
+    45: "fog", 48: "fog",
+    **{c: "rain" for c in (51, 53, 55, 56, 57, 61, 63, 65, 66, 67)},
+    **{c: "snow" for c in (71, 73, 75, 77, 85, 86)},
+    80: "showers", 81: "showers", 82: "showers",
+    95: "thunderstorm", 96: "thunderstorm", 99: "thunderstorm",
+}
+
+# Ordering used to pick the worst hour of a window
+_CONDITION_SEVERITY: Dict[str, int] = {
+    "clear": 0,
+    "partly_cloudy": 1,
+    "fog": 2,
+    "showers": 3,
+    "rain": 4,
+    "snow": 5,
+    "thunderstorm": 6,
+}
+
+# Aggregate thresholds for weather_window_modifier()
+_WET_CONDITIONS = frozenset({"rain", "showers", "snow", "thunderstorm"})
+_PRECIP_SHOWERS_THRESHOLD = 60   # % — dry code but likely rain → treat as showers
+_WIND_THRESHOLD_KMH = 40.0
+_WIND_MODIFIER = -0.05
+
+
+def wmo_condition(code: Optional[int]) -> str:
+    """Map a WMO weather code to a modifier table key ("unknown" if unmapped)."""
+    if code is None:
+        return "unknown"
+    return _WMO_CONDITIONS.get(int(code), "unknown")
+
+
+def wmo_severity(code: Optional[int]) -> int:
+    """Severity rank of a WMO code (higher is worse; unknown codes rank lowest)."""
+    return _CONDITION_SEVERITY.get(wmo_condition(code), -1)
+
+
+def weather_modifier(condition_code: Union[str, int]) -> Tuple[float, Dict[str, Any]]:
     """Return (modifier_offset, triggering_factor_dict) for a weather condition.
 
     Unknown condition codes default to 0.0 (no impact).
 
     Args:
-        condition_code: Normalised weather condition string, e.g. "thunderstorm".
+        condition_code: Normalised weather condition string, e.g. "thunderstorm",
+                        or a raw WMO code as stored by the weather sync.
 
     Returns:
         A tuple of:
           - float modifier offset (e.g. -0.20)
           - dict suitable for storage in triggering_factors JSONB
     """
+    if isinstance(condition_code, int):
+        condition_code = wmo_condition(condition_code)
     modifier = _WEATHER_MODIFIERS.get(condition_code.lower(), 0.0)
     impact_pct = f"{modifier:+.0%}"
     factor: Dict[str, Any] = {
@@ -51,6 +99,44 @@ def weather_modifier(condition_code: str) -> Tuple[float, Dict[str, Any]]:
     return modifier, factor
 
 
+def weather_window_modifier(window: Any) -> Tuple[float, Dict[str, Any]]:
+    """Return (modifier_offset, triggering_factor_dict) for a 4-hour weather rollup.
+
+    Consumes the aggregates materialised at ingestion (WeatherCellWindow):
+    the worst hour's condition drives the base offset; a dry code with a
+    high max precipitation probability counts as showers; a high mean wind
+    speed adds a further penalty.
+    """
+    condition = wmo_condition(getattr(window, "worst_condition_code", None))
+    precip = getattr(window, "max_precipitation_prob", None)
+    wind = getattr(window, "mean_wind_speed_kmh", None)
+    temperature = getattr(window, "mean_temperature_c", None)
+
+    if (
+        condition not in _WET_CONDITIONS
+        and precip is not None
+        and precip >= _PRECIP_SHOWERS_THRESHOLD
+    ):
+        condition = "showers"
+
+    modifier = _WEATHER_MODIFIERS.get(condition, 0.0)
+    if wind is not None and wind >= _WIND_THRESHOLD_KMH:
+        modifier += _WIND_MODIFIER
+
+    factor: Dict[str, Any] = {
+        "type": "weather",
+        "condition": condition,
+        "impact": f"{modifier:+.0%}",
+    }
+    if precip is not None:
+        factor["precipitation_prob"] = precip
+    if temperature is not None:
+        factor["temperature_c"] = round(temperature, 1)
+    if wind is not None:
+        factor["wind_speed_kmh"] = round(wind, 1)
+    return modifier, factor
+
+
 # ---------------------------------------------------------------------------
 # Event modifier table
 # ---------------------------------------------------------------------------
@@ -63,19 +149,68 @@ _EVENT_MODIFIERS: Dict[str, float] = {
     "other": +0.05,
 }
 
+# PredictHQ category slugs → modifier table keys
+_EVENT_CATEGORY_ALIASES: Dict[str, str] = {
+    "conferences": "conference",
+    "expos": "conference",
+    "concerts": "concert",
+    "performing-arts": "concert",
+    "festivals": "festival",
+}
+
 _EVENT_MODIFIER_CAP = 0.50  # maximum cumulative event modifier
 
+# Impact weighting — the category offset applies unscaled to an event of
+# _REFERENCE_ATTENDANCE people (or _REFERENCE_RANK when attendance is
+# unknown) located at the property; it halves every _DISTANCE_HALF_LIFE_KM.
+_REFERENCE_ATTENDANCE = 5000
+_REFERENCE_RANK = 50
+_SIZE_WEIGHT_MIN = 0.25
+_SIZE_WEIGHT_MAX = 2.0
+_DISTANCE_HALF_LIFE_KM = 1.5
+
+
+def event_impact(event: Any) -> float:
+    """Return the modifier offset contributed by one event.
+
+    ``category`` picks the base offset. It is scaled by event size —
+    log-attendance relative to _REFERENCE_ATTENDANCE, falling back to
+    ``rank`` / _REFERENCE_RANK — and by exponential distance decay on
+    ``distance_km``. Missing size or distance leaves that factor at 1.0.
+    """
+    category = _normalise_category(getattr(event, "category", "other"))
+    base = _EVENT_MODIFIERS.get(category, _EVENT_MODIFIERS["other"])
+
+    size_weight = 1.0
+    attendance = getattr(event, "phq_attendance", None)
+    rank = getattr(event, "rank", None)
+    if _is_number(attendance) and attendance >= 0:
+        size_weight = math.log1p(attendance) / math.log1p(_REFERENCE_ATTENDANCE)
+    elif _is_number(rank):
+        size_weight = rank / _REFERENCE_RANK
+    size_weight = max(_SIZE_WEIGHT_MIN, min(_SIZE_WEIGHT_MAX, size_weight))
+
+    distance_weight = 1.0
+    distance = getattr(event, "distance_km", None)
+    if _is_number(distance):
+        distance_weight = 0.5 ** (max(0.0, distance) / _DISTANCE_HALF_LIFE_KM)
+
+    return base * size_weight * distance_weight
+
 
 def event_modifier(
     events: List[Any],
 ) -> Tuple[float, List[Dict[str, Any]]]:
     """Return (cumulative_modifier_offset, triggering_factors_list) for a list of events.
 
-    The cumulative modifier is capped at +_EVENT_MODIFIER_CAP (default +0.50).
+    Each event contributes ``event_impact(event)``; the strongest events are
+    applied first and the cumulative modifier is capped at
+    +_EVENT_MODIFIER_CAP (default +0.50).
 
     Args:
-        events: List of LocalEvent ORM instances (or duck-typed objects with
-                `category`, `id`/`predicthq_event_id`, and `impact_score` attrs).
+        events: List of EventCatalog / NearbyEvent instances (or duck-typed
+                objects with `category`, `event_id`/`predicthq_event_id`/`id`
+                and optionally `phq_attendance`, `rank`, `distance_km`).
 
     Returns:
         A tuple of:
@@ -85,9 +220,12 @@ def event_modifier(
     cumulative = 0.0
     factors: List[Dict[str, Any]] = []
 
-    for event in events:
-        category = getattr(event, "category", "other").lower()
-        per_event = _EVENT_MODIFIERS.get(category, _EVENT_MODIFIERS["other"])
+    weighted = sorted(
+        ((event_impact(event), event) for event in events),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    for per_event, event in weighted:
         # Respect cap
         remaining_cap = _EVENT_MODIFIER_CAP - cumulative
         applied = min(per_event, remaining_cap)
@@ -97,14 +235,27 @@ def event_modifier(
 
         event_id = str(
             getattr(event, "predicthq_event_id", None)
+            or getattr(event, "event_id", None)
             or getattr(event, "id", "unknown")
         )
         factor: Dict[str, Any] = {
             "type": "event",
             "event_id": event_id,
-            "category": category,
+            "category": _normalise_category(getattr(event, "category", "other")),
             "impact": f"{applied:+.0%}",
         }
+        distance = getattr(event, "distance_km", None)
+        if _is_number(distance):
+            factor["distance_km"] = round(distance, 2)
         factors.append(factor)
 
     return cumulative, factors
+
+
+def _normalise_category(category: Any) -> str:
+    slug = str(category or "other").lower()
+    return _EVENT_CATEGORY_ALIASES.get(slug, slug)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
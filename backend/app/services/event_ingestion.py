@@ -1,21 +1,34 @@
 """EventIngestionService — HOS-84 Story 3.2.
 
 Fetches upcoming local events from PredictHQ (within a configurable radius
-around the property's GPS coordinates) and upserts normalized records into
-the ``local_events`` table.
+around the property's GPS coordinates) and stores them once in the shared
+``event_catalog`` table, linked to each property via ``property_events``.
 
 Design constraints followed:
 - Fat Backend: no PredictHQ API calls from Next.js (architecture constraint).
-- Tenacity retry: max 3 attempts, exponential back-off (SC #6).
-- Idempotency: ON CONFLICT DO NOTHING on (tenant_id, event_id) (SC #7).
-- Tenant isolation: every row carries tenant_id; RLS enforced at DB level (SC #5).
+- Tenacity retry: max 3 attempts per page, exponential back-off (SC #6).
+- Page prefetch: the next cursor page is fetched while the current page is
+  normalised and upserted; callers may inject one pooled httpx client.
+- Query clustering: nearby properties are grouped into one covering
+  ``within`` query, so a neighbourhood costs one PredictHQ query instead of
+  one per property.
+- Incremental mode: a per-cluster ``updated`` watermark limits each run to
+  events changed since the previous one; a full window re-fetch runs once
+  per EVENT_FULL_RESYNC_HOURS so events sliding into the window are caught.
+- Idempotency: ON CONFLICT on event_id updates only when PredictHQ's
+  ``updated`` is newer; links are unique on (property_id, event_id) (SC #7).
+- Tenant isolation: every link row carries tenant_id; RLS enforced at DB level (SC #5).
 """
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import math
 import os
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
 
 import httpx
 from tenacity import (
@@ -27,7 +40,8 @@ from tenacity import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import LocalEvent, RestaurantProfile
+from app.core.timeutils import as_utc
+from app.db.models import EventCatalog, EventSyncState, PropertyEvent, RestaurantProfile
 from app.schemas.events import EventRecord
 
 logger = logging.getLogger(__name__)
@@ -39,6 +53,21 @@ _PHQ_BASE_URL = "https://api.predicthq.com/v1"
 _DEFAULT_RADIUS_KM = 5
 _DEFAULT_DAYS_AHEAD = 30
 
+# Properties whose seed is within this distance share one covering query
+_CLUSTER_RADIUS_KM = float(os.getenv("EVENT_CLUSTER_RADIUS_KM", "3"))
+
+# Incremental runs fall back to a full window fetch after this long
+_FULL_RESYNC = timedelta(hours=float(os.getenv("EVENT_FULL_RESYNC_HOURS", "24")))
+
+_EARTH_RADIUS_KM = 6371.0088
+
+# Catalogue columns refreshed when PredictHQ reports a newer ``updated``
+_CATALOG_UPDATE_COLUMNS = (
+    "title", "category", "rank", "local_rank", "phq_attendance",
+    "start_dt", "end_dt", "latitude", "longitude", "raw_labels",
+    "phq_updated", "fetched_at",
+)
+
 # Categories relevant to F&B demand prediction
 _DEFAULT_CATEGORIES = (
     "conferences,concerts,festivals,performing-arts,sports,"
@@ -46,6 +75,74 @@ _DEFAULT_CATEGORIES = (
 )
 
 
+@dataclass(frozen=True)
+class EventCluster:
+    """A group of nearby properties served by one covering PredictHQ query.
+
+    ``radius_km`` is the per-property search radius; ``query_radius_km``
+    covers every member's search circle from the cluster centroid.
+    ``cluster_id`` is the seed property's tenant_id, so the key (and the sync
+    watermark stored under it) survives members joining, leaving or moving.
+    """
+
+    cluster_id: str
+    latitude: float
+    longitude: float
+    radius_km: float
+    query_radius_km: float
+    members: Tuple[RestaurantProfile, ...]
+
+
+def cluster_properties(
+    profiles: Sequence[RestaurantProfile],
+    radius_km: float = _DEFAULT_RADIUS_KM,
+    cluster_radius_km: float = _CLUSTER_RADIUS_KM,
+) -> List[EventCluster]:
+    """Greedily group properties with GPS into covering query clusters.
+
+    Profiles are visited in a deterministic (lat, lng, tenant_id) order; each
+    unassigned profile seeds a cluster that absorbs every other unassigned
+    profile within ``cluster_radius_km`` of it. The query circle is centred on
+    the members' centroid with a radius of ``radius_km`` plus the farthest
+    member's distance from it, so every member's own search circle is covered.
+    Each cluster is keyed by its seed's tenant_id.
+    """
+    pending = sorted(
+        (p for p in profiles if p.latitude is not None and p.longitude is not None),
+        key=lambda p: (p.latitude, p.longitude, p.tenant_id),
+    )
+    clusters: List[EventCluster] = []
+
+    while pending:
+        seed = pending[0]
+        members = [
+            p for p in pending
+            if haversine_km(seed.latitude, seed.longitude, p.latitude, p.longitude)
+            <= cluster_radius_km
+        ]
+        member_ids = {id(m) for m in members}
+        pending = [p for p in pending if id(p) not in member_ids]
+
+        lat = sum(m.latitude for m in members) / len(members)
+        lng = sum(m.longitude for m in members) / len(members)
+        spread = max(haversine_km(lat, lng, m.latitude, m.longitude) for m in members)
+        # Round up to 100 m so the PredictHQ ``within`` string stays short
+        query_radius = math.ceil((radius_km + spread) * 10) / 10
+
+        clusters.append(
+            EventCluster(
+                cluster_id=seed.tenant_id,
+                latitude=round(lat, 5),
+                longitude=round(lng, 5),
+                radius_km=radius_km,
+                query_radius_km=query_radius,
+                members=tuple(members),
+            )
+        )
+
+    return clusters
+
+
 class EventIngestionService:
     """Orchestrates fetching + normalizing + persisting PredictHQ event data."""
 
@@ -67,8 +164,8 @@ class EventIngestionService:
     ) -> int:
         """Fetch and persist upcoming events for one property.
 
-        Returns the number of rows upserted (new records only; duplicates
-        are silently ignored).
+        Runs as a single-member cluster. Returns the number of events newly
+        linked to the property (already-linked events are silently ignored).
 
         Raises ``ValueError`` if the property has no GPS coordinates.
         Raises ``RuntimeError`` if PREDICTHQ_API_KEY is not configured.
@@ -79,93 +176,180 @@ class EventIngestionService:
                 "set latitude/longitude before syncing events."
             )
 
+        cluster = cluster_properties([profile], radius_km=radius_km)[0]
+        linked = await self.sync_cluster(session, cluster, days_ahead=days_ahead)
+        return linked.get(profile.tenant_id, 0)
+
+    async def sync_cluster(
+        self,
+        session: AsyncSession,
+        cluster: EventCluster,
+        days_ahead: int = _DEFAULT_DAYS_AHEAD,
+        incremental: bool = True,
+    ) -> Dict[str, int]:
+        """Fetch events once for a property cluster and link them to members.
+
+        With ``incremental=True`` only events updated since the cluster's
+        stored watermark are requested, unless the last full fetch is older
+        than ``EVENT_FULL_RESYNC_HOURS``, no watermark exists yet, or a member
+        joined the cluster since (its links need the full window).
+        ``incremental=False`` always fetches the full window.
+
+        Returns a mapping of property_id → number of links inserted or whose
+        distance changed.
+        """
         if not self._api_key:
             raise RuntimeError(
                 "PREDICTHQ_API_KEY is not set. "
                 "Configure it in the environment before running event sync."
             )
 
-        raw_events = await self._fetch_events(
-            lat=profile.latitude,
-            lng=profile.longitude,
-            radius_km=radius_km,
+        now = datetime.now(tz=timezone.utc)
+        updated_since: Optional[datetime] = None
+        if incremental:
+            state = await session.get(EventSyncState, cluster.cluster_id)
+            if (
+                state is not None
+                and state.updated_watermark is not None
+                and now - as_utc(state.full_synced_at) < _FULL_RESYNC
+                and _member_ids(cluster) <= set((state.member_ids or "").split(","))
+            ):
+                updated_since = as_utc(state.updated_watermark)
+
+        watermark = updated_since
+        linked: Dict[str, int] = {m.tenant_id: 0 for m in cluster.members}
+        changed = 0
+        total = 0
+        pages = self._iter_event_pages(
+            lat=cluster.latitude,
+            lng=cluster.longitude,
+            radius_km=cluster.query_radius_km,
             days_ahead=days_ahead,
+            updated_since=updated_since,
+        )
+        # aclosing: an exception while persisting a page closes the generator
+        # right away, cancelling its in-flight prefetch
+        async with contextlib.aclosing(pages):
+            async for raw_events in pages:
+                # The next page is already in flight while this one is persisted
+                records = self._normalize(raw_events)
+                changed += await self._upsert(session, records)
+                for property_id, count in (
+                    await self._link_properties(session, cluster, records)
+                ).items():
+                    linked[property_id] += count
+                await session.commit()
+                total += len(records)
+                for r in records:
+                    if r.updated is not None and (
+                        watermark is None or r.updated > watermark
+                    ):
+                        watermark = r.updated
+
+        # Only advanced once every page is persisted — a failed run re-fetches
+        await self._save_sync_state(
+            session, cluster, watermark, now, full=updated_since is None
         )
-        records = self._normalize(raw_events)
-        inserted = await self._upsert(session, profile.tenant_id, records)
+        await session.commit()
+
         logger.info(
-            "Event sync OK  tenant=%s  rows_new=%d  rows_total=%d",
-            profile.tenant_id,
-            inserted,
-            len(records),
+            "Event sync OK  cluster=%s  mode=%s  properties=%d  events_changed=%d  "
+            "events_total=%d  links_new=%d",
+            cluster.cluster_id,
+            "full" if updated_since is None else "incremental",
+            len(cluster.members),
+            changed,
+            total,
+            sum(linked.values()),
         )
-        return inserted
+        return linked
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    @retry(
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
-    async def _fetch_events(
+    async def _iter_event_pages(
         self,
         lat: float,
         lng: float,
         radius_km: float,
         days_ahead: int,
-    ) -> List[dict]:
-        """GET PredictHQ /v1/events with tenacity retry (SC #6).
+        updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[dict]]:
+        """Yield raw PredictHQ events page by page, prefetching the next page.
 
-        Handles pagination automatically and returns a flat list of raw
-        event dicts across all pages.
+        PredictHQ uses cursor pagination (``next`` URL). As soon as a page
+        arrives, the request for the following page is started in the
+        background so network latency overlaps with the caller's
+        normalise/upsert work on the current page.
+
+        ``updated_since`` restricts the query to events changed at or after
+        that instant (``updated.gte``), sorted by ``updated``.
         """
         today = date.today()
         date_from = today.isoformat()
         date_to = (today + timedelta(days=days_ahead)).isoformat()
 
-        params = {
-            "within": f"{radius_km}km@{lat},{lng}",
+        params: Dict[str, Any] = {
+            "within": f"{radius_km:g}km@{lat},{lng}",
             "active.gte": date_from,
             "active.lte": date_to,
             "category": _DEFAULT_CATEGORIES,
             "limit": 100,
             "sort": "rank",
         }
+        if updated_since is not None:
+            params["updated.gte"] = updated_since.strftime("%Y-%m-%dT%H:%M:%S")
+            params["sort"] = "updated"
+
+        page = await self._fetch_page(f"{_PHQ_BASE_URL}/events/", params)
+        prefetch: Optional[asyncio.Task] = None
+        pages = 0
+        try:
+            while True:
+                pages += 1
+                next_url = page.get("next")
+                if next_url:
+                    # next URL already encodes all params
+                    prefetch = asyncio.create_task(self._fetch_page(next_url, {}))
+
+                yield page.get("results", [])
+
+                if prefetch is None:
+                    break
+                page = await prefetch
+                prefetch = None
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+                # Retrieve the outcome so a failed prefetch is not reported
+                # as a never-retrieved task exception
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+        logger.debug("PredictHQ returned %d page(s)", pages)
+
+    @retry(
+        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _fetch_page(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET one PredictHQ /v1/events page with tenacity retry (SC #6)."""
         headers = {
             "Authorization": f"Bearer {self._api_key}",
             "Accept": "application/json",
         }
 
-        all_results: List[dict] = []
-        url = f"{_PHQ_BASE_URL}/events/"
-
-        while url:
-            if self._client is not None:
-                resp = await self._client.get(url, params=params, headers=headers, timeout=15)
-            else:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(url, params=params, headers=headers, timeout=15)
-
-            resp.raise_for_status()
-            data = resp.json()
-
-            all_results.extend(data.get("results", []))
-
-            # Follow cursor-based pagination (PredictHQ uses `next` URL)
-            next_url = data.get("next")
-            if next_url:
-                url = next_url
-                params = {}  # next URL already encodes all params
-            else:
-                break
+        if self._client is not None:
+            resp = await self._client.get(url, params=params, headers=headers, timeout=15)
+        else:
+            async with httpx.AsyncClient() as client:
+                resp = await client.get(url, params=params, headers=headers, timeout=15)
 
-        logger.debug("PredictHQ returned %d raw events", len(all_results))
-        return all_results
+        resp.raise_for_status()
+        return resp.json()
 
     @staticmethod
     def _normalize(raw_events: List[dict]) -> List[EventRecord]:
@@ -203,6 +387,7 @@ class EventIngestionService:
                     latitude=lat,
                     longitude=lng,
                     raw_labels=ev.get("labels"),
+                    updated=_parse_phq_datetime(ev.get("updated")),
                 )
             )
 
@@ -211,15 +396,22 @@ class EventIngestionService:
     @staticmethod
     async def _upsert(
         session: AsyncSession,
-        tenant_id: str,
         records: List[EventRecord],
     ) -> int:
-        """Bulk-insert records; skip duplicates via ON CONFLICT DO NOTHING (SC #7).
+        """Bulk-upsert records into the shared catalogue (SC #7).
+
+        Known event_ids are overwritten only when PredictHQ reports a newer
+        ``updated`` timestamp (or the stored row has none), so re-delivered
+        unchanged events are no-ops.
 
         Uses the PostgreSQL dialect for production (Supabase) and falls back to
         the SQLite dialect when running tests against an in-memory database.
 
-        Returns the count of newly inserted rows.
+        Rows are written in ``event_id`` order: clusters sync concurrently
+        and overlap, and a common lock order keeps their upserts from
+        deadlocking on shared events.
+
+        Returns the count of inserted or changed events.
         """
         if not records:
             return 0
@@ -227,7 +419,6 @@ class EventIngestionService:
         now = datetime.now(tz=timezone.utc)
         values = [
             {
-                "tenant_id": tenant_id,
                 "event_id": r.event_id,
                 "title": r.title,
                 "category": r.category,
@@ -239,45 +430,127 @@ class EventIngestionService:
                 "latitude": r.latitude,
                 "longitude": r.longitude,
                 "raw_labels": r.raw_labels,
+                "phq_updated": r.updated,
                 "fetched_at": now,
                 "created_at": now,
             }
-            for r in records
+            for r in sorted(records, key=lambda r: r.event_id)
         ]
 
-        # Resolve dialect at runtime so the same service code works in tests
-        # (SQLite) and production (PostgreSQL / Supabase).
-        dialect_name: str = session.get_bind().dialect.name  # type: ignore[union-attr]
+        stmt = _dialect_insert(session)(EventCatalog).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["event_id"],
+            set_={
+                col: getattr(stmt.excluded, col)
+                for col in _CATALOG_UPDATE_COLUMNS
+            },
+            where=(
+                EventCatalog.phq_updated.is_(None)
+                | (stmt.excluded.phq_updated > EventCatalog.phq_updated)
+            ),
+        )
+        result = await session.execute(stmt)
+        return result.rowcount if result.rowcount is not None else 0
 
-        if dialect_name == "sqlite":
-            from sqlalchemy.dialects.sqlite import insert as _insert
+    @staticmethod
+    async def _link_properties(
+        session: AsyncSession,
+        cluster: EventCluster,
+        records: List[EventRecord],
+    ) -> Dict[str, int]:
+        """Link each cluster member to the events inside its own search radius.
 
-            stmt = (
-                _insert(LocalEvent)
-                .values(values)
-                .on_conflict_do_nothing()
-            )
-        else:
-            # PostgreSQL (default / production)
-            from sqlalchemy.dialects.postgresql import insert as _insert  # type: ignore[no-redef]
-
-            stmt = (
-                _insert(LocalEvent)
-                .values(values)
-                .on_conflict_do_nothing(
-                    index_elements=["tenant_id", "event_id"]
+        The covering query returns events for the whole cluster; each member
+        only keeps those within ``cluster.radius_km`` of its coordinates.
+        Events without a centroid cannot be placed and are linked to every
+        member with a NULL distance. An existing link gets the new distance
+        when the event (or the property) moved. Links are written in
+        ``(property_id, event_id)`` order, like ``_upsert``.
+
+        Returns a mapping of property_id → number of links inserted or updated.
+        """
+        linked: Dict[str, int] = {}
+        now = datetime.now(tz=timezone.utc)
+        insert = _dialect_insert(session)
+
+        ordered = sorted(records, key=lambda r: r.event_id)
+        for member in sorted(cluster.members, key=lambda m: m.tenant_id):
+            values = []
+            for r in ordered:
+                distance: Optional[float] = None
+                if r.latitude is not None and r.longitude is not None:
+                    distance = haversine_km(
+                        member.latitude, member.longitude, r.latitude, r.longitude
+                    )
+                    if distance > cluster.radius_km:
+                        continue
+                    distance = round(distance, 3)
+                values.append(
+                    {
+                        "property_id": member.tenant_id,
+                        "event_id": r.event_id,
+                        "tenant_id": member.tenant_id,
+                        "distance_km": distance,
+                        "created_at": now,
+                    }
                 )
+
+            if not values:
+                linked[member.tenant_id] = 0
+                continue
+
+            stmt = insert(PropertyEvent).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["property_id", "event_id"],
+                set_={"distance_km": stmt.excluded.distance_km},
+                where=PropertyEvent.distance_km.is_distinct_from(
+                    stmt.excluded.distance_km
+                ),
             )
+            result = await session.execute(stmt)
+            linked[member.tenant_id] = result.rowcount if result.rowcount is not None else 0
 
-        result = await session.execute(stmt)
-        await session.commit()
-        return result.rowcount if result.rowcount is not None else 0
+        return linked
+
+    @staticmethod
+    async def _save_sync_state(
+        session: AsyncSession,
+        cluster: EventCluster,
+        watermark: Optional[datetime],
+        synced_at: datetime,
+        full: bool,
+    ) -> None:
+        """Persist the cluster's incremental cursor (caller commits).
+
+        ``member_ids`` only changes on a full run: an incremental run never
+        covers a member that was not already synced.
+        """
+        values = {
+            "cluster_id": cluster.cluster_id,
+            "member_ids": ",".join(sorted(_member_ids(cluster))),
+            "updated_watermark": watermark,
+            "synced_at": synced_at,
+            "full_synced_at": synced_at,
+        }
+        update = ["updated_watermark", "synced_at"]
+        if full:
+            update += ["full_synced_at", "member_ids"]
+        stmt = _dialect_insert(session)(EventSyncState).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cluster_id"],
+            set_={col: getattr(stmt.excluded, col) for col in update},
+        )
+        await session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _member_ids(cluster: EventCluster) -> Set[str]:
+    return {m.tenant_id for m in cluster.members}
+
+
 def _parse_phq_datetime(value: Optional[str]) -> Optional[datetime]:
     """Parse a PredictHQ ISO-8601 datetime string → UTC-aware datetime."""
     if not value:
@@ -289,3 +562,26 @@ def _parse_phq_datetime(value: Optional[str]) -> Optional[datetime]:
         return dt
     except (ValueError, AttributeError):
         return None
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in kilometres between two WGS84 points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _dialect_insert(session: AsyncSession):
+    """Return the dialect-specific ``insert`` supporting ON CONFLICT.
+
+    Resolved at runtime so the same service code works in tests (SQLite)
+    and production (PostgreSQL / Supabase).
+    """
+    dialect_name: str = session.get_bind().dialect.name  # type: ignore[union-attr]
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as _insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert as _insert  # type: ignore[no-redef]
+    return _insert
@@ -0,0 +1,184 @@
+"""In-memory spatial index over PredictHQ event centroids.
+
+Used by the anomaly scan to find each property's nearby events without a
+per-window database query or a scan of the whole catalogue:
+
+  - Events are bucketed into a lat/lng grid of ``cell_km``-sized cells
+    (square in degrees; bucket key = integer cell coordinates).
+  - ``nearby()`` visits only the cells that can intersect the search circle
+    (widened in longitude by 1/cos(lat)) and computes exact great-circle
+    distances for the few candidates found there.
+  - The longitude axis wraps, so properties near the antimeridian still see
+    events on the other side.
+
+Events without a centroid cannot be placed on the grid. Like the
+property_events lookup they are still returned, with a NULL distance, to
+the properties they are linked to: ``load()`` reads those links and
+``nearby(..., linked_to=<property_id>)`` appends them.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.timeutils import as_utc
+from app.db.models import EventCatalog, PropertyEvent
+from app.services.event_ingestion import haversine_km
+
+_KM_PER_DEG_LAT = 111.32
+_MAX_LAT = 85.0  # beyond this longitude cells degenerate; clamp the widening
+
+
+@dataclass(frozen=True)
+class NearbyEvent:
+    """An event as seen from one property, with its distance from it."""
+
+    event_id: str
+    category: str
+    rank: Optional[int]
+    phq_attendance: Optional[int]
+    start_dt: datetime
+    end_dt: Optional[datetime]
+    distance_km: Optional[float]  # None when linked without a centroid
+
+    def overlaps(self, window_start: datetime, window_end: datetime) -> bool:
+        """True if the event is active at any point in [window_start, window_end)."""
+        return self.start_dt < window_end and (
+            self.end_dt is None or self.end_dt > window_start
+        )
+
+
+class EventSpatialIndex:
+    """Grid-bucket index over event centroids (duck-typed ``EventCatalog`` rows).
+
+    ``unlocated_links`` are (property_id, event) pairs for linked events
+    without a centroid.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[Any],
+        cell_km: float = 5.0,
+        unlocated_links: Iterable[Tuple[str, Any]] = (),
+    ) -> None:
+        self._step = cell_km / _KM_PER_DEG_LAT
+        self._lng_cells = max(1, math.ceil(360.0 / self._step))
+        self._buckets: Dict[Tuple[int, int], List[Any]] = {}
+        self._unlocated: Dict[str, List[Any]] = {}
+        self._size = 0
+
+        for property_id, event in unlocated_links:
+            self._unlocated.setdefault(property_id, []).append(event)
+
+        for event in events:
+            if event.latitude is None or event.longitude is None:
+                continue
+            self._buckets.setdefault(
+                self._cell(event.latitude, event.longitude), []
+            ).append(event)
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    async def load(
+        cls,
+        db: AsyncSession,
+        window_start: datetime,
+        window_end: datetime,
+        cell_km: float = 5.0,
+    ) -> "EventSpatialIndex":
+        """Build an index from the catalogued events active in the horizon.
+
+        Two queries: located events, and the property links of events
+        without a centroid.
+        """
+        active = (
+            EventCatalog.start_dt < window_end,
+            or_(EventCatalog.end_dt.is_(None), EventCatalog.end_dt > window_start),
+        )
+        located = await db.execute(
+            select(EventCatalog).where(
+                *active,
+                EventCatalog.latitude.isnot(None),
+                EventCatalog.longitude.isnot(None),
+            )
+        )
+        unlocated = await db.execute(
+            select(PropertyEvent.property_id, EventCatalog)
+            .join(EventCatalog, EventCatalog.event_id == PropertyEvent.event_id)
+            .where(
+                *active,
+                or_(EventCatalog.latitude.is_(None), EventCatalog.longitude.is_(None)),
+            )
+        )
+        return cls(
+            located.scalars().all(),
+            cell_km=cell_km,
+            unlocated_links=[(row[0], row[1]) for row in unlocated.all()],
+        )
+
+    def nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        linked_to: Optional[str] = None,
+    ) -> List[NearbyEvent]:
+        """Return events within ``radius_km`` of (lat, lng), nearest first.
+
+        With ``linked_to`` the events without a centroid linked to that
+        property follow, with ``distance_km=None``.
+        """
+        lat_idx, lng_idx = self._cell(lat, lng)
+        lat_span = math.ceil(radius_km / _KM_PER_DEG_LAT / self._step)
+        # A degree of longitude shrinks with cos(lat): widen the search so the
+        # circle is covered even at the far edge of the latitude band.
+        edge_lat = min(_MAX_LAT, abs(lat) + radius_km / _KM_PER_DEG_LAT)
+        lng_deg = radius_km / (_KM_PER_DEG_LAT * math.cos(math.radians(edge_lat)))
+        lng_span = min(self._lng_cells // 2, math.ceil(lng_deg / self._step))
+
+        found: List[NearbyEvent] = []
+        seen_lng = set()
+        for dlng in range(-lng_span, lng_span + 1):
+            wrapped = (lng_idx + dlng) % self._lng_cells
+            if wrapped in seen_lng:
+                continue
+            seen_lng.add(wrapped)
+            for dlat in range(-lat_span, lat_span + 1):
+                for event in self._buckets.get((lat_idx + dlat, wrapped), ()):
+                    distance = haversine_km(lat, lng, event.latitude, event.longitude)
+                    if distance <= radius_km:
+                        found.append(_nearby_event(event, round(distance, 3)))
+
+        found.sort(key=lambda e: e.distance_km)
+        if linked_to is not None:
+            found.extend(
+                _nearby_event(event, None)
+                for event in self._unlocated.get(linked_to, ())
+            )
+        return found
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        lat_idx = math.floor((lat + 90.0) / self._step)
+        lng_idx = math.floor((lng + 180.0) / self._step) % self._lng_cells
+        return lat_idx, lng_idx
+
+
+def _nearby_event(event: Any, distance_km: Optional[float]) -> NearbyEvent:
+    return NearbyEvent(
+        event_id=event.event_id,
+        category=event.category,
+        rank=event.rank,
+        phq_attendance=event.phq_attendance,
+        start_dt=as_utc(event.start_dt),
+        end_dt=as_utc(event.end_dt) if event.end_dt else None,
+        distance_km=distance_km,
+    )
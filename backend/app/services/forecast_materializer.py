@@ -0,0 +1,166 @@
+"""Materialized Prophet forecasts (``service_forecasts``).
+
+``AetherixEngine.get_forecast`` used to run Prophet inline on every
+``/predictions/current`` and ``/predictions/predict`` request. This module
+precomputes, for every tenant with a trained model (see
+app/services/model_registry.py), the forecast of each service type over the
+next FORECAST_HORIZON_DAYS days — one ``predict_many`` call per model, run
+in the compute pool — and upserts it with the model version and interval
+bounds.
+
+Refreshes run nightly (app/workers/forecast_refresh.py) and after a model
+is trained. A stored row is only served while its ``model_version`` matches
+the model currently in the registry: a newer model makes it a miss, and the
+engine predicts live until the next refresh.
+
+Rows are computed without per-request regressor values (like a live
+prediction without ``context["regressors"]``); requests that pass their own
+regressors always predict live.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.models import ServiceForecast
+from app.services.compute_pool import get_compute_pool
+from app.services.model_registry import ProphetModelRegistry, get_model_registry
+from app.services.prediction_engine import PredictionResult
+
+logger = logging.getLogger(__name__)
+
+HORIZON_DAYS = int(os.getenv("FORECAST_HORIZON_DAYS", "14"))
+
+_UPSERT_FORECASTS_SQL = """
+    INSERT INTO service_forecasts
+        (tenant_id, service_type, target_date, model_version,
+         predicted_covers, range_min, range_max, confidence, generated_at)
+    VALUES
+        (:tenant_id, :service_type, :target_date, :model_version,
+         :predicted_covers, :range_min, :range_max, :confidence, :generated_at)
+    ON CONFLICT (tenant_id, service_type, target_date) DO UPDATE SET
+        model_version    = EXCLUDED.model_version,
+        predicted_covers = EXCLUDED.predicted_covers,
+        range_min        = EXCLUDED.range_min,
+        range_max        = EXCLUDED.range_max,
+        confidence       = EXCLUDED.confidence,
+        generated_at     = EXCLUDED.generated_at
+"""
+
+
+def as_prediction_result(row: ServiceForecast) -> PredictionResult:
+    """The stored forecast in the shape returned by ``PredictionEngine.predict``."""
+    return PredictionResult(
+        predicted=row.predicted_covers,
+        lower=row.range_min,
+        upper=row.range_max,
+        confidence=row.confidence,
+        date=row.target_date.isoformat(),
+    )
+
+
+class ForecastMaterializer:
+    """Writes and reads ``service_forecasts`` rows."""
+
+    def __init__(
+        self,
+        registry: Optional[ProphetModelRegistry] = None,
+        horizon_days: int = HORIZON_DAYS,
+    ) -> None:
+        self.registry = registry or get_model_registry()
+        self.horizon_days = max(1, horizon_days)
+
+    async def refresh_tenant(
+        self,
+        tenant_id: str,
+        db: AsyncSession,
+        start: Optional[date] = None,
+        service_types: Optional[List[str]] = None,
+        *,
+        commit: bool = True,
+    ) -> int:
+        """Recompute the tenant's horizon from ``start`` (default today); returns rows written.
+
+        Service types without a trained model are skipped. Rows dated
+        before ``start`` are deleted.
+        """
+        start = start or date.today()
+        dates = [start + timedelta(days=i) for i in range(self.horizon_days)]
+        if service_types is None:
+            service_types = [s for t, s in self.registry.trained_keys() if t == tenant_id]
+
+        generated_at = datetime.utcnow()
+        rows = []
+        pool = get_compute_pool()
+        for service_type in service_types:
+            predicted = await pool.run(self._predict_horizon, tenant_id, service_type, dates)
+            if predicted is None:
+                continue
+            version, results = predicted
+            for result in results:
+                rows.append({
+                    "tenant_id": tenant_id,
+                    "service_type": service_type,
+                    "target_date": date.fromisoformat(result.date),
+                    "model_version": version,
+                    "predicted_covers": result.predicted,
+                    "range_min": result.lower,
+                    "range_max": result.upper,
+                    "confidence": result.confidence,
+                    "generated_at": generated_at,
+                })
+
+        await db.execute(
+            delete(ServiceForecast).where(
+                ServiceForecast.tenant_id == tenant_id,
+                ServiceForecast.target_date < start,
+            )
+        )
+        if rows:
+            await db.execute(text(_UPSERT_FORECASTS_SQL), rows)
+        if commit:
+            await db.commit()
+
+        logger.info(
+            "service_forecasts refreshed  tenant=%s  services=%d  rows=%d",
+            tenant_id,
+            len({r["service_type"] for r in rows}),
+            len(rows),
+        )
+        return len(rows)
+
+    def _predict_horizon(
+        self, tenant_id: str, service_type: str, dates: List[date]
+    ) -> Optional[Tuple[int, List[PredictionResult]]]:
+        """(model version, forecasts) for the dates; None without a model (compute pool)."""
+        version = self.registry.version(tenant_id, service_type)
+        engine = self.registry.get(tenant_id, service_type)
+        if engine is None or version is None:
+            return None
+        return version, engine.predict_many(dates)
+
+    async def lookup(
+        self,
+        tenant_id: str,
+        service_type: str,
+        target_date: date,
+        db: AsyncSession,
+    ) -> Optional[ServiceForecast]:
+        """The stored forecast, or None on a miss (absent, or stale model version)."""
+        result = await db.execute(
+            select(ServiceForecast).where(
+                ServiceForecast.tenant_id == tenant_id,
+                ServiceForecast.service_type == service_type,
+                ServiceForecast.target_date == target_date,
+            )
+        )
+        row = result.scalars().first()
+        if row is None or row.model_version != self.registry.version(tenant_id, service_type):
+            return None
+        return row
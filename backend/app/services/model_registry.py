@@ -0,0 +1,254 @@
+"""Per-tenant Prophet model registry with lazy, memory-bounded LRU loading.
+
+``PredictionEngine`` holds a single model, so every tenant used to get the
+same (usually untrained, mock) forecast. The registry keys serialized
+models by (tenant_id, service_type):
+
+    {PROPHET_MODEL_DIR}/{tenant_id}/{service_type}.json
+    {PROPHET_MODEL_DIR}/{tenant_id}/{service_type}.key   (original key, JSON)
+
+Path components are percent-escaped (``_safe_part``), so distinct keys
+never share a file; the ``.key`` sidecar keeps the exact (tenant_id,
+service_type) the model was saved under for ``trained_keys``.
+
+- Models are loaded from disk on first use only, then kept in an LRU
+  cache bounded both by count (PROPHET_REGISTRY_MAX_MODELS) and by memory
+  (PROPHET_REGISTRY_MAX_BYTES, accounted as the serialized model size, a
+  close proxy for the in-memory parameter arrays).
+- A model's version is the mtime of its file. ``get`` re-stats the file
+  and reloads when a newer version was trained (``save`` writes via an
+  atomic rename, so readers never see a partial file).
+- Thread-safe: lookups may come from executor threads.
+
+``get_model_registry()`` returns the process-wide instance.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+from app.services.prediction_engine import PredictionEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_DIR = Path(__file__).resolve().parents[2] / "models" / "prophet"
+MODEL_DIR = Path(os.getenv("PROPHET_MODEL_DIR", str(DEFAULT_MODEL_DIR)))
+_MAX_MODELS = int(os.getenv("PROPHET_REGISTRY_MAX_MODELS", "32"))
+_MAX_BYTES = int(os.getenv("PROPHET_REGISTRY_MAX_BYTES", str(256 * 1024 * 1024)))
+
+ModelKey = Tuple[str, str]
+
+
+@dataclass
+class _Entry:
+    engine: PredictionEngine
+    version: int  # file mtime (ns)
+    size_bytes: int
+
+
+def _safe_part(value: str) -> str:
+    """Path component for a tenant id / service type.
+
+    Characters other than ``[A-Za-z0-9_.-]``, and a leading dot, are
+    percent-escaped (``%`` included), so the mapping is injective and
+    never yields separators or dot-only names.
+    """
+    if not value:
+        raise ValueError(f"Invalid model key component {value!r}")
+    part = re.sub(
+        r"[^A-Za-z0-9_.-]",
+        lambda m: "".join(f"%{b:02X}" for b in m.group().encode()),
+        value,
+    )
+    return "%2E" + part[1:] if part.startswith(".") else part
+
+
+class ProphetModelRegistry:
+    """LRU cache of fitted per-(tenant, service_type) Prophet models."""
+
+    def __init__(
+        self,
+        model_dir: Path | str = MODEL_DIR,
+        max_models: int = _MAX_MODELS,
+        max_bytes: int = _MAX_BYTES,
+    ) -> None:
+        self.model_dir = Path(model_dir)
+        self.max_models = max(1, max_models)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+        self.hits = self.misses = self.reloads = self.evictions = 0
+
+    # ── Public interface ────────────────────────────────────────────────────
+
+    def path_for(self, tenant_id: str, service_type: str) -> Path:
+        return self.model_dir / _safe_part(tenant_id) / f"{_safe_part(service_type)}.json"
+
+    def version(self, tenant_id: str, service_type: str) -> Optional[int]:
+        """Version of the model on disk (file mtime in ns), or None if untrained."""
+        try:
+            return self.path_for(tenant_id, service_type).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def trained_keys(self) -> List[ModelKey]:
+        """(tenant_id, service_type) of every model on disk, sorted.
+
+        Keys come from the ``.key`` sidecars; a model without one (saved
+        before sidecars existed) is reported under its unescaped
+        directory/file names.
+        """
+        if not self.model_dir.is_dir():
+            return []
+        return sorted(
+            self._read_key(path) for path in self.model_dir.glob("*/*.json")
+        )
+
+    def get(self, tenant_id: str, service_type: str) -> Optional[PredictionEngine]:
+        """Trained engine for the key, loading or reloading it as needed.
+
+        Returns None when no model was trained for the key.
+        """
+        key = (tenant_id, service_type)
+        disk_version = self.version(tenant_id, service_type)
+        if disk_version is None:
+            self._drop(key)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == disk_version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.engine
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Single-flight per key: concurrent callers wait for one load.
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.version == disk_version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.engine
+            loaded = self._load(key)
+            if loaded is None:
+                return None
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous.size_bytes
+                    self.reloads += 1
+                else:
+                    self.misses += 1
+                self._entries[key] = loaded
+                self._bytes += loaded.size_bytes
+                self._evict()
+            return loaded.engine
+
+    def save(self, tenant_id: str, service_type: str, engine: PredictionEngine) -> Path:
+        """Serialize a trained engine as the key's new version (atomic replace)."""
+        if not engine.is_trained or engine.model is None:
+            raise ValueError("Cannot register an untrained model")
+        from prophet.serialize import model_to_json  # noqa: PLC0415
+
+        path = self.path_for(tenant_id, service_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Sidecar first: a visible model file always has its key next to it
+        _write_atomic(
+            path.with_suffix(".key"),
+            json.dumps({"tenant_id": tenant_id, "service_type": service_type}),
+        )
+        _write_atomic(path, model_to_json(engine.model))
+        self._drop((tenant_id, service_type))
+        logger.info("Prophet model registered  tenant=%s  service=%s  path=%s",
+                    tenant_id, service_type, path)
+        return path
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "models": len(self._entries),
+                "bytes": self._bytes,
+                "max_models": self.max_models,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ── Internal helpers ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _read_key(path: Path) -> ModelKey:
+        try:
+            meta = json.loads(path.with_suffix(".key").read_text())
+            return meta["tenant_id"], meta["service_type"]
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return unquote(path.parent.name), unquote(path.stem)
+
+    def _load(self, key: ModelKey) -> Optional[_Entry]:
+        from prophet.serialize import model_from_json  # noqa: PLC0415
+
+        path = self.path_for(*key)
+        try:
+            version = path.stat().st_mtime_ns
+            raw = path.read_text()
+        except FileNotFoundError:
+            return None
+        engine = PredictionEngine.from_model(model_from_json(raw))
+        logger.info("Prophet model loaded  tenant=%s  service=%s  bytes=%d", key[0], key[1], len(raw))
+        return _Entry(engine=engine, version=version, size_bytes=len(raw))
+
+    def _drop(self, key: ModelKey) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size_bytes
+
+    def _evict(self) -> None:
+        """Drop least recently used models until both bounds hold (lock held).
+
+        The most recently used model is always kept, even if alone it
+        exceeds the byte budget.
+        """
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_models or self._bytes > self.max_bytes
+        ):
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size_bytes
+            self.evictions += 1
+            logger.debug("Prophet model evicted  tenant=%s  service=%s", *key)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+
+_registry: Optional[ProphetModelRegistry] = None
+
+
+def get_model_registry() -> ProphetModelRegistry:
+    """Return the process-wide registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = ProphetModelRegistry()
+    return _registry
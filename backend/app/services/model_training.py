@@ -0,0 +1,276 @@
+"""Per-tenant Prophet training across a process pool.
+
+``scripts/train_prophet.py`` fits one model from a CSV in a single process.
+The orchestrator here retrains the portfolio:
+
+1. Builds every tenant's training frame from ``pms_sync_logs`` in one query
+   (last PROPHET_TRAINING_DAYS days of successful syncs). PMS data has no
+   covers per service, so the daily F&B revenue is converted into covers
+   with the tenant's ``avg_spend_per_cover`` and split across services with
+   the hour-block profile of the captation rates (``SERVICE_SHARES``).
+2. Fits one Prophet model per (tenant, service type) in a
+   ``ProcessPoolExecutor`` of PROPHET_TRAINING_WORKERS processes (default:
+   one per CPU). Each worker saves its model to the registry location
+   (app/services/model_registry.py) itself, so fitted models never travel
+   back through the parent process.
+3. Records each fit's outcome, duration and in-sample error in
+   ``model_training_runs``, then refreshes the materialized forecasts of
+   the retrained tenants (app/services/forecast_materializer.py).
+
+Frames with fewer than PROPHET_MIN_TRAINING_DAYS days are skipped. One fit
+failing never affects the others.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import distinct, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.config import DEFAULT_AVG_SPEND_PER_COVER
+from app.db.models import ModelTrainingRun, PMSSyncLog, RestaurantProfile
+from app.db.session import AsyncSessionLocal
+from app.services.captation_rates import HOUR_BLOCK_SHARES
+from app.services.forecast_materializer import ForecastMaterializer
+from app.services.model_registry import ProphetModelRegistry, get_model_registry
+from app.services.prediction_engine import PredictionEngine
+
+logger = logging.getLogger(__name__)
+
+_WORKERS = int(os.getenv("PROPHET_TRAINING_WORKERS", str(os.cpu_count() or 1)))
+TRAINING_DAYS = int(os.getenv("PROPHET_TRAINING_DAYS", "730"))
+MIN_TRAINING_DAYS = int(os.getenv("PROPHET_MIN_TRAINING_DAYS", "60"))
+
+# Hour blocks (see captation_rates.HOUR_BLOCK_SHARES) served by each service
+SERVICE_BLOCKS = {
+    "breakfast": (4, 8),
+    "lunch": (12,),
+    "dinner": (16, 20),
+}
+SERVICE_SHARES = {
+    service: sum(HOUR_BLOCK_SHARES[block] for block in blocks)
+    for service, blocks in SERVICE_BLOCKS.items()
+}
+SERVICE_TYPES = tuple(SERVICE_BLOCKS)
+
+TrainingFrame = Tuple[List[date], List[float]]  # (days, daily F&B revenue)
+
+
+@dataclass
+class TrainingOutcome:
+    """Outcome of one (tenant, service type) fit."""
+
+    tenant_id: str
+    service_type: str
+    status: str  # trained | insufficient_data | failed
+    training_rows: int = 0
+    fit_seconds: Optional[float] = None
+    in_sample_mae: Optional[float] = None
+    in_sample_mape: Optional[float] = None
+    model_version: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _FitTask:
+    """Picklable work item sent to a pool process."""
+
+    tenant_id: str
+    service_type: str
+    model_dir: str
+    ds: List[str]
+    y: List[float]
+
+
+def _fit_and_save(task: _FitTask) -> Dict[str, float]:
+    """Fit one model, save it to the registry location (runs in a pool process)."""
+    df = pd.DataFrame({"ds": pd.to_datetime(task.ds), "y": task.y})
+
+    started = time.perf_counter()
+    engine = PredictionEngine()
+    engine.train(df)
+    fit_seconds = time.perf_counter() - started
+
+    fitted = engine.model.predict(df[["ds"]])["yhat"].to_numpy()
+    actual = df["y"].to_numpy()
+    errors = np.abs(actual - fitted)
+    nonzero = actual > 0
+
+    path = ProphetModelRegistry(task.model_dir).save(task.tenant_id, task.service_type, engine)
+    return {
+        "fit_seconds": fit_seconds,
+        "in_sample_mae": float(errors.mean()),
+        "in_sample_mape": float((errors[nonzero] / actual[nonzero]).mean()) if nonzero.any() else None,
+        "model_version": path.stat().st_mtime_ns,
+    }
+
+
+async def load_training_frames(
+    tenant_ids: Sequence[str],
+    db: AsyncSession,
+    end: Optional[date] = None,
+) -> Dict[str, TrainingFrame]:
+    """Daily F&B revenue of each tenant over the last TRAINING_DAYS days (one query)."""
+    end = end or date.today()
+    result = await db.execute(
+        select(PMSSyncLog.tenant_id, PMSSyncLog.sync_date, func.max(PMSSyncLog.fb_revenue))
+        .where(
+            PMSSyncLog.tenant_id.in_(tenant_ids),
+            PMSSyncLog.status == "success",
+            PMSSyncLog.fb_revenue > 0,
+            PMSSyncLog.sync_date > end - timedelta(days=TRAINING_DAYS),
+            PMSSyncLog.sync_date <= end,
+        )
+        .group_by(PMSSyncLog.tenant_id, PMSSyncLog.sync_date)
+        .order_by(PMSSyncLog.tenant_id, PMSSyncLog.sync_date)
+    )
+    frames: Dict[str, TrainingFrame] = defaultdict(lambda: ([], []))
+    for tenant_id, sync_date, revenue in result.all():
+        days, revenues = frames[tenant_id]
+        days.append(sync_date)
+        revenues.append(float(revenue))
+    return dict(frames)
+
+
+async def _avg_spend(tenant_ids: Sequence[str], db: AsyncSession) -> Dict[str, float]:
+    result = await db.execute(
+        select(RestaurantProfile.tenant_id, RestaurantProfile.avg_spend_per_cover).where(
+            RestaurantProfile.tenant_id.in_(tenant_ids)
+        )
+    )
+    return {tenant_id: float(spend) for tenant_id, spend in result.all() if spend}
+
+
+def covers_frame(frame: TrainingFrame, service_type: str, avg_spend: float) -> List[float]:
+    """Estimated covers of one service per day of the frame."""
+    share = SERVICE_SHARES[service_type]
+    return [round(revenue * share / avg_spend, 2) for revenue in frame[1]]
+
+
+async def train_portfolio(
+    tenant_ids: Optional[Iterable[str]] = None,
+    service_types: Sequence[str] = SERVICE_TYPES,
+    workers: int = _WORKERS,
+    registry: Optional[ProphetModelRegistry] = None,
+) -> List[TrainingOutcome]:
+    """Retrain the models of every tenant (default: all with sync data)."""
+    registry = registry or get_model_registry()
+    t_start = time.monotonic()
+
+    async with AsyncSessionLocal() as db:
+        if tenant_ids is None:
+            result = await db.execute(select(distinct(PMSSyncLog.tenant_id)))
+            tenant_ids = sorted(result.scalars().all())
+        tenants = list(dict.fromkeys(tenant_ids))
+        frames = await load_training_frames(tenants, db)
+        spend = await _avg_spend(tenants, db)
+
+    outcomes: List[TrainingOutcome] = []
+    tasks: List[_FitTask] = []
+    for tenant_id in tenants:
+        frame = frames.get(tenant_id, ([], []))
+        for service_type in service_types:
+            if len(frame[0]) < MIN_TRAINING_DAYS:
+                outcomes.append(TrainingOutcome(
+                    tenant_id, service_type, "insufficient_data", training_rows=len(frame[0])
+                ))
+                continue
+            tasks.append(_FitTask(
+                tenant_id=tenant_id,
+                service_type=service_type,
+                model_dir=str(registry.model_dir),
+                ds=[d.isoformat() for d in frame[0]],
+                y=covers_frame(frame, service_type, spend.get(tenant_id, DEFAULT_AVG_SPEND_PER_COVER)),
+            ))
+
+    if tasks:
+        outcomes.extend(await _fit_all(tasks, workers))
+
+    async with AsyncSessionLocal() as db:
+        db.add_all([
+            ModelTrainingRun(
+                tenant_id=o.tenant_id,
+                service_type=o.service_type,
+                status=o.status,
+                model_version=o.model_version,
+                training_rows=o.training_rows,
+                fit_seconds=o.fit_seconds,
+                in_sample_mae=o.in_sample_mae,
+                in_sample_mape=o.in_sample_mape,
+                error_message=o.error[:1000] if o.error else None,
+            )
+            for o in outcomes
+        ])
+        await db.commit()
+
+        materializer = ForecastMaterializer(registry)
+        for tenant_id in sorted({o.tenant_id for o in outcomes if o.status == "trained"}):
+            try:
+                await materializer.refresh_tenant(tenant_id, db)
+            except Exception as exc:  # noqa: BLE001 — forecasts are refreshed again nightly
+                await db.rollback()
+                logger.warning("Forecast refresh after training FAILED  tenant=%s: %s", tenant_id, exc)
+
+    _log_summary(outcomes, time.monotonic() - t_start)
+    return outcomes
+
+
+async def _fit_all(tasks: List[_FitTask], workers: int) -> List[TrainingOutcome]:
+    """Run the fits in a process pool; failures are isolated per task."""
+    loop = asyncio.get_running_loop()
+    # spawn: forking a process that runs an event loop and DB pools is unsafe
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(workers, len(tasks))),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _fit_and_save, task) for task in tasks),
+            return_exceptions=True,
+        )
+
+    outcomes: List[TrainingOutcome] = []
+    for task, result in zip(tasks, results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                "Prophet fit FAILED  tenant=%s  service=%s: %s",
+                task.tenant_id, task.service_type, result,
+            )
+            outcomes.append(TrainingOutcome(
+                task.tenant_id, task.service_type, "failed",
+                training_rows=len(task.ds), error=str(result) or type(result).__name__,
+            ))
+            continue
+        outcomes.append(TrainingOutcome(
+            task.tenant_id, task.service_type, "trained", training_rows=len(task.ds), **result
+        ))
+    return outcomes
+
+
+def _log_summary(outcomes: List[TrainingOutcome], elapsed: float) -> None:
+    counts: Dict[str, int] = defaultdict(int)
+    for outcome in outcomes:
+        counts[outcome.status] += 1
+    fits = [o.fit_seconds for o in outcomes if o.fit_seconds is not None]
+    logger.info(
+        "Prophet training DONE  models=%d  trained=%d  insufficient=%d  failed=%d  "
+        "elapsed=%.1fs  fit_total=%.1fs  fit_max=%.1fs",
+        len(outcomes),
+        counts["trained"],
+        counts["insufficient_data"],
+        counts["failed"],
+        elapsed,
+        sum(fits),
+        max(fits, default=0.0),
+    )
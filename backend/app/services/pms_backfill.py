@@ -0,0 +1,345 @@
+"""Bulk PMS history backfill over a date range.
+
+Onboarding a property with years of history through ``sync_daily_data``
+means one adapter call pair, one PMSSyncLog commit and one full captation
+recalculation per day. The backfill instead:
+
+1. Splits [start_date, end_date] into ``chunk_days`` chunks.
+2. Fetches chunks concurrently (bounded by PMS_BACKFILL_CONCURRENCY) via
+   ``PMSAdapter.iter_historical_pages``.
+3. Aggregates each chunk's pages, as they arrive, into daily occupancy /
+   F&B revenue and bulk-inserts the PMSSyncLog rows, replacing any rows
+   already stored for those days, in the same transaction that records the
+   chunk as done.
+4. Recalculates the captation baseline, and the hour-block
+   ``captation_rates`` derived from it, once at the end (Story 2.4).
+
+Progress lives in ``PMSBackfillJob``: a failed or interrupted job is resumed
+by running it again, which only fetches the chunks not yet completed. A run
+first claims the job (``claim``), so a job is never run twice at once.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import PMSBackfillJob, PMSSyncLog
+from app.services.pms_sync import PMSAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_DAYS = int(os.getenv("PMS_BACKFILL_CHUNK_DAYS", "30"))
+_CONCURRENCY = int(os.getenv("PMS_BACKFILL_CONCURRENCY", "4"))
+
+DateRange = Tuple[date, date]
+
+
+@dataclass
+class DailyTotals:
+    """Occupancy and F&B revenue aggregated for one day."""
+
+    occupancy: int = 0
+    fb_revenue: Optional[float] = None
+    records: int = 0
+
+
+def split_date_range(start: date, end: date, chunk_days: int) -> List[DateRange]:
+    """Split the inclusive range [start, end] into consecutive inclusive chunks."""
+    if end < start:
+        raise ValueError(f"end_date {end} is before start_date {start}")
+    if chunk_days < 1:
+        raise ValueError("chunk_days must be >= 1")
+    chunks: List[DateRange] = []
+    cursor = start
+    while cursor <= end:
+        chunk_end = min(end, cursor + timedelta(days=chunk_days - 1))
+        chunks.append((cursor, chunk_end))
+        cursor = chunk_end + timedelta(days=1)
+    return chunks
+
+
+class DailyAggregator:
+    """Incremental per-day totals within [start, end], fed page by page.
+
+    Two record shapes are supported:
+
+    - daily metrics (``date``, ``occupancy``, ``fb_revenue``) — mock adapter;
+    - stay records / reservations (``arrival``, ``departure``) — Apaleo. Each
+      night of the stay counts as one occupied room; an F&B revenue amount
+      on the record (``fbRevenue`` / ``fb_revenue``) is booked on arrival.
+
+    Nights outside [start, end] are dropped, so a stay returned by two
+    adjacent chunk queries is never counted twice. Only one ``DailyTotals``
+    per day is kept, whatever the number of records consumed.
+    """
+
+    def __init__(self, start: date, end: date) -> None:
+        self.start = start
+        self.end = end
+        self.days: Dict[date, DailyTotals] = {}
+
+    def add(self, records: Iterable[Dict[str, Any]]) -> None:
+        for rec in records:
+            revenue = _revenue(rec)
+            if rec.get("date"):
+                self._add_daily(rec, revenue)
+            else:
+                self._add_stay(rec, revenue)
+
+    def _day(self, d: date) -> DailyTotals:
+        return self.days.setdefault(d, DailyTotals())
+
+    def _add_daily(self, rec: Dict[str, Any], revenue: Optional[float]) -> None:
+        d = _parse_date(rec["date"])
+        if d is None or not self.start <= d <= self.end:
+            return
+        totals = self._day(d)
+        totals.occupancy += int(rec.get("occupancy") or 0)
+        totals.records += 1
+        if revenue is not None:
+            totals.fb_revenue = (totals.fb_revenue or 0.0) + revenue
+
+    def _add_stay(self, rec: Dict[str, Any], revenue: Optional[float]) -> None:
+        arrival = _parse_date(rec.get("arrival"))
+        if arrival is None:
+            return
+        departure = _parse_date(rec.get("departure")) or arrival + timedelta(days=1)
+        night = max(arrival, self.start)
+        last_night = min(self.end, max(arrival, departure - timedelta(days=1)))
+        while night <= last_night:
+            totals = self._day(night)
+            totals.occupancy += 1
+            totals.records += 1
+            night += timedelta(days=1)
+        if revenue is not None and self.start <= arrival <= self.end:
+            totals = self._day(arrival)
+            totals.fb_revenue = (totals.fb_revenue or 0.0) + revenue
+
+
+def aggregate_daily(
+    records: Iterable[Dict[str, Any]],
+    start: date,
+    end: date,
+) -> Dict[date, DailyTotals]:
+    """Aggregate an in-memory list of records (see ``DailyAggregator``)."""
+    aggregator = DailyAggregator(start, end)
+    aggregator.add(records)
+    return aggregator.days
+
+
+class PMSBackfillService:
+    """Runs ``PMSBackfillJob``s against one PMS adapter."""
+
+    def __init__(self, adapter: PMSAdapter, concurrency: int = _CONCURRENCY) -> None:
+        self.adapter = adapter
+        self.concurrency = max(1, concurrency)
+
+    @staticmethod
+    async def create_job(
+        db: AsyncSession,
+        tenant_id: str,
+        start_date: date,
+        end_date: date,
+        adapter_name: str,
+        chunk_days: int = DEFAULT_CHUNK_DAYS,
+    ) -> PMSBackfillJob:
+        """Persist a pending job for [start_date, end_date] (validated).
+
+        Needs no adapter: the job runs later with the adapter named by
+        ``adapter_name`` (see app/workers/pms_backfill.py).
+        """
+        chunks = split_date_range(start_date, end_date, chunk_days)
+        job = PMSBackfillJob(
+            tenant_id=tenant_id,
+            start_date=start_date,
+            end_date=end_date,
+            chunk_days=chunk_days,
+            adapter=adapter_name,
+            status="pending",
+            chunks_total=len(chunks),
+            completed_chunks=[],
+            rows_written=0,
+        )
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    @staticmethod
+    async def claim(db: AsyncSession, job_id: int) -> bool:
+        """Atomically mark the job ``running``; False if it is running or completed."""
+        result = await db.execute(
+            update(PMSBackfillJob)
+            .where(
+                PMSBackfillJob.id == job_id,
+                PMSBackfillJob.status.not_in(("running", "completed")),
+            )
+            .values(status="running", error_message=None)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def run(self, db: AsyncSession, job: PMSBackfillJob) -> PMSBackfillJob:
+        """Fetch and store every chunk not yet completed, then recompute the baseline.
+
+        Per-chunk fetch failures are isolated: the job ends ``partial`` with
+        the failed chunks left for the next run. Any other error (storing a
+        chunk, a commit) marks the job ``failed`` and is re-raised; chunks
+        already committed stay done.
+        """
+        chunks = split_date_range(job.start_date, job.end_date, job.chunk_days)
+        done = set(job.completed_chunks or [])
+        pending = [c for c in chunks if c[0].isoformat() not in done]
+
+        job.status = "running"
+        job.error_message = None
+        await db.commit()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.create_task(self._fetch_chunk(job.tenant_id, chunk, semaphore))
+            for chunk in pending
+        ]
+        failures: List[str] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                chunk, days, error = await next_done
+                if error is not None:
+                    failures.append(f"{chunk[0].isoformat()}: {error}")
+                    continue
+                await self._store_chunk(db, job, chunk, days)
+        except Exception as exc:
+            await db.rollback()
+            await db.refresh(job)
+            job.status = "failed"
+            job.error_message = (str(exc) or type(exc).__name__)[:1000]
+            await db.commit()
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        job.status = "partial" if failures else "completed"
+        job.error_message = "; ".join(sorted(failures))[:1000] if failures else None
+        await db.commit()
+        logger.info(
+            "PMS backfill %s  job=%s  tenant=%s  chunks=%d/%d  rows=%d",
+            job.status.upper(),
+            job.id,
+            job.tenant_id,
+            len(job.completed_chunks),
+            job.chunks_total,
+            job.rows_written,
+        )
+
+        await self._recalculate_baseline(db, job.tenant_id)
+        return job
+
+    # ── Internal helpers ────────────────────────────────────────────────────
+
+    async def _fetch_chunk(
+        self,
+        tenant_id: str,
+        chunk: DateRange,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[DateRange, Dict[date, DailyTotals], Optional[str]]:
+        """Stream the chunk's pages into daily totals (one page in memory at a time)."""
+        aggregator = DailyAggregator(chunk[0], chunk[1])
+        async with semaphore:
+            try:
+                async for page in self.adapter.iter_historical_pages(tenant_id, chunk[0], chunk[1]):
+                    aggregator.add(page)
+            except Exception as exc:  # noqa: BLE001 — isolate per-chunk failures
+                logger.warning(
+                    "PMS backfill chunk FAILED  tenant=%s  %s→%s: %s",
+                    tenant_id, chunk[0], chunk[1], exc,
+                )
+                return chunk, {}, str(exc)
+        return chunk, aggregator.days, None
+
+    async def _store_chunk(
+        self,
+        db: AsyncSession,
+        job: PMSBackfillJob,
+        chunk: DateRange,
+        days: Dict[date, DailyTotals],
+    ) -> None:
+        """Replace the chunk's PMSSyncLog rows and mark it done (one commit)."""
+        await db.execute(
+            delete(PMSSyncLog).where(
+                PMSSyncLog.tenant_id == job.tenant_id,
+                PMSSyncLog.sync_date >= chunk[0],
+                PMSSyncLog.sync_date <= chunk[1],
+            )
+        )
+        if days:
+            created_at = datetime.utcnow()
+            await db.execute(
+                insert(PMSSyncLog),
+                [
+                    {
+                        "tenant_id": job.tenant_id,
+                        "sync_date": day,
+                        "occupancy": totals.occupancy,
+                        "fb_revenue": totals.fb_revenue,
+                        "raw_payload_summary": {
+                            "source": "backfill",
+                            "job_id": job.id,
+                            "records": totals.records,
+                        },
+                        "status": "success",
+                        "created_at": created_at,
+                    }
+                    for day, totals in sorted(days.items())
+                ],
+            )
+        # Reassign so SQLAlchemy notices the JSON change.
+        job.completed_chunks = sorted({*job.completed_chunks, chunk[0].isoformat()})
+        job.rows_written += len(days)
+        await db.commit()
+
+    @staticmethod
+    async def _recalculate_baseline(db: AsyncSession, tenant_id: str) -> None:
+        from app.services.captation_rates import CaptationRatesService  # noqa: PLC0415
+        from app.services.captation_service import (  # noqa: PLC0415
+            CaptationService,
+            InsufficientDataError,
+        )
+
+        try:
+            baseline = await CaptationService().calculate_baseline(tenant_id, db)
+            await CaptationRatesService().refresh(tenant_id, db, baseline)
+        except InsufficientDataError as exc:
+            logger.debug("Captation baseline skipped (not enough data): %s", exc)
+        except Exception as exc:  # noqa: BLE001 — never fail the backfill on the baseline
+            logger.warning("Captation baseline recalculation failed for %s: %s", tenant_id, exc)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and len(value) >= 10:
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _revenue(rec: Dict[str, Any]) -> Optional[float]:
+    value = rec.get("fb_revenue", rec.get("fbRevenue"))
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
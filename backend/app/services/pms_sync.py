@@ -1,11 +1,19 @@
 import abc
+import asyncio
 import hashlib
-from typing import List, Dict, Any, Optional
+import logging
+import os
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional
 from datetime import datetime, date
 from app.db.session import AsyncSessionLocal
 from app.db.models import PMSSyncLog
 from sqlalchemy.future import select
 
+logger = logging.getLogger(__name__)
+
+# Properties fetched at once by sync_portfolio — keep below the PMS rate limit.
+_PORTFOLIO_CONCURRENCY = int(os.getenv("PMS_SYNC_CONCURRENCY", "8"))
+
 class PMSAdapter(abc.ABC):
     """Base class for all Property Management System (PMS) adapters."""
     
@@ -24,6 +32,15 @@ class PMSAdapter(abc.ABC):
         """Fetch historical data for a range of dates."""
         ...
 
+    async def iter_historical_pages(self, property_id: str, start_date: date, end_date: date) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield historical data page by page.
+
+        Default: a single page from ``get_historical_data``. Adapters backed by
+        a paginated API override this so callers can aggregate large exports
+        without holding every record in memory.
+        """
+        yield await self.get_historical_data(property_id, start_date, end_date)
+
     @abc.abstractmethod
     async def update_staffing_in_pms(self, property_id: str, target_date: date, staffing_deltas: Dict[str, int]) -> bool:
         """Write staffing recommendations back to the PMS schedules/tasks."""
@@ -61,6 +78,21 @@ class MockPMSAdapter(PMSAdapter):
         print(f"Mocked push to {property_id} on {target_date}: {staffing_deltas}")
         return True
 
+PMS_ADAPTERS = ("mock", "apaleo_mcp", "apaleo_raw")
+
+
+def get_pms_adapter(name: str) -> PMSAdapter:
+    """Build the adapter for a label used by the /pms routes and jobs."""
+    if name == "mock":
+        return MockPMSAdapter()
+    if name == "apaleo_mcp":
+        from app.services.apaleo_mcp_adapter import ApaleoMCPAdapter  # noqa: PLC0415
+        return ApaleoMCPAdapter()
+    if name == "apaleo_raw":
+        from app.services.apaleo_adapter import ApaleoPMSAdapter  # noqa: PLC0415
+        return ApaleoPMSAdapter()
+    raise ValueError(f"Unknown PMS adapter '{name}' (expected one of {', '.join(PMS_ADAPTERS)})")
+
 class PIIStripper:
     """Utility to ensure GDPR compliance by stripping/hashing guest PII."""
     
@@ -92,8 +124,7 @@ class PMSSyncService:
 
     async def sync_daily_data(self, property_id: str, target_date: date):
         """Orchestrate the sync and storage of data for a specific day."""
-        occupancy = await self.adapter.get_occupancy(property_id, target_date)
-        revenue = await self.adapter.get_revenue(property_id, target_date, category="F&B")
+        occupancy, revenue = await self._fetch_metrics(property_id, target_date)
 
         # Story 2.2: Persist sync result to Supabase
         async with AsyncSessionLocal() as session:
@@ -107,8 +138,8 @@ class PMSSyncService:
             session.add(sync_log)
             await session.commit()
 
-        # Story 2.4: Recalculate captation baseline on every new data ingestion
-        await self._trigger_captation_recalculation(property_id)
+        # Story 2.4: Update the captation baseline on every new data ingestion
+        await self._trigger_captation_recalculation(property_id, target_date, occupancy, revenue)
 
         result = {
             "property_id": property_id,
@@ -135,20 +166,106 @@ class PMSSyncService:
         )
         return result
 
-    async def _trigger_captation_recalculation(self, property_id: str) -> None:
-        """Re-compute the captation baseline after each successful sync.
+    async def sync_portfolio(
+        self,
+        property_ids: Iterable[str],
+        target_date: date,
+        concurrency: int = _PORTFOLIO_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """Sync one day for many properties at once.
 
-        Errors are caught and logged so they never block the sync response.
+        Properties are fetched concurrently (at most ``concurrency`` at a
+        time, occupancy and revenue in parallel for each); one failing
+        property is recorded as ``failed`` without affecting the others.
+        All PMSSyncLog rows are written in a single transaction, then the
+        new day is folded into each synced property's captation baseline.
         """
-        import logging  # noqa: PLC0415
-        _log = logging.getLogger(__name__)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _fetch(property_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    occupancy, revenue = await self._fetch_metrics(property_id, target_date)
+                except Exception as exc:  # noqa: BLE001 — isolate per-property failures
+                    logger.warning("PMS sync FAILED  property=%s  date=%s: %s", property_id, target_date, exc)
+                    return {"property_id": property_id, "status": "failed", "error": str(exc)}
+            return {
+                "property_id": property_id,
+                "status": "success",
+                "occupancy": occupancy,
+                "fb_revenue": revenue,
+            }
+
+        results = list(await asyncio.gather(*(_fetch(pid) for pid in dict.fromkeys(property_ids))))
+        if not results:
+            return []
 
+        async with AsyncSessionLocal() as session:
+            session.add_all(
+                [
+                    PMSSyncLog(
+                        tenant_id=r["property_id"],
+                        sync_date=target_date,
+                        occupancy=r.get("occupancy"),
+                        fb_revenue=r.get("fb_revenue"),
+                        status=r["status"],
+                        error_message=r.get("error"),
+                    )
+                    for r in results
+                ]
+            )
+            await session.commit()
+
+        synced = [r for r in results if r["status"] == "success"]
+        for r in synced:
+            await self._trigger_captation_recalculation(
+                r["property_id"], target_date, r["occupancy"], r["fb_revenue"]
+            )
+
+        logger.info(
+            "PMS portfolio sync OK  date=%s  synced=%d  failed=%d",
+            target_date, len(synced), len(results) - len(synced),
+        )
+        return [{**r, "date": target_date.isoformat()} for r in results]
+
+    async def _fetch_metrics(self, property_id: str, target_date: date) -> tuple:
+        """Occupancy and F&B revenue for one day, requested concurrently."""
+        occupancy, revenue = await asyncio.gather(
+            self.adapter.get_occupancy(property_id, target_date),
+            self.adapter.get_revenue(property_id, target_date, category="F&B"),
+        )
+        return occupancy, revenue
+
+    async def _trigger_captation_recalculation(
+        self,
+        property_id: str,
+        sync_date: Optional[date] = None,
+        occupancy: Optional[int] = None,
+        fb_revenue: Optional[float] = None,
+    ) -> None:
+        """Update the captation baseline after each successful sync.
+
+        With the synced day given, it is folded into the running aggregates
+        (O(1), see ``CaptationService.record_sync``); without it the baseline
+        is fully recomputed. The tenant's ``captation_rates`` are then
+        refreshed from the new baseline. Errors are caught and logged so they never block
+        the sync response.
+        """
+        from app.services.captation_rates import CaptationRatesService  # noqa: PLC0415
         from app.services.captation_service import CaptationService, InsufficientDataError  # noqa: PLC0415
 
         try:
             async with AsyncSessionLocal() as session:
-                await CaptationService().calculate_baseline(property_id, session)
+                if sync_date is None:
+                    baseline = await CaptationService().calculate_baseline(property_id, session)
+                else:
+                    baseline = await CaptationService().record_sync(
+                        property_id, sync_date, occupancy, fb_revenue, session
+                    )
+                # Story 3.3a: keep the anomaly detector's hour-block baselines current
+                if baseline is not None:
+                    await CaptationRatesService().refresh(property_id, session, baseline)
         except InsufficientDataError as exc:
-            _log.debug("Captation baseline skipped (not enough data): %s", exc)
+            logger.debug("Captation baseline skipped (not enough data): %s", exc)
         except Exception as exc:  # pylint: disable=broad-except
-            _log.warning("Captation baseline recalculation failed for %s: %s", property_id, exc)
+            logger.warning("Captation baseline recalculation failed for %s: %s", property_id, exc)
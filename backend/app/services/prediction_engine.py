@@ -1,7 +1,7 @@
 from prophet import Prophet
 import pandas as pd
 from datetime import datetime, date
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence, Union
 import logging
 from pathlib import Path
 import os
@@ -88,44 +88,68 @@ class PredictionEngine:
         features: Optional[dict] = None
     ) -> PredictionResult:
         """Predicts covers for a specific date."""
+        return self.predict_many([target_date], features)[0]
+
+    def predict_many(
+        self,
+        dates: Sequence[date],
+        features: Union[dict, Sequence[Optional[dict]], None] = None
+    ) -> List[PredictionResult]:
+        """Predicts covers for several dates in a single Prophet call.
+
+        Prophet's per-call overhead (uncertainty sampling, seasonality
+        matrices) dominates one-row predictions, so a 14-day horizon costs
+        about as much as one day. ``features`` is either one dict of
+        regressor values shared by every date, or one dict (or None) per
+        date. Results are returned in the order of ``dates``.
+        """
+        dates = list(dates)
+        if not dates:
+            return []
+        if features is None or isinstance(features, dict):
+            per_date = [features] * len(dates)
+        else:
+            per_date = list(features)
+            if len(per_date) != len(dates):
+                raise ValueError("features must be a dict or have one entry per date")
+
         if not self.is_trained:
             logger.warning("Prophet model not trained. Returning mock prediction for pilot.")
             # Mock result for development/pilot without training
-            return PredictionResult(
-                predicted=45,
-                lower=38,
-                upper=52,
-                confidence=0.85,
-                date=target_date.isoformat(),
-                is_mock=True,
-            )
-        
-        date_str = target_date.isoformat()
-        future = pd.DataFrame({'ds': [pd.to_datetime(target_date)]})
-        
-        if features:
-            for reg in self.regressors:
-                future[reg] = features.get(reg, 0.0)
-        else:
-            for reg in self.regressors:
-                future[reg] = 0.0
-        
+            return [
+                PredictionResult(
+                    predicted=45,
+                    lower=38,
+                    upper=52,
+                    confidence=0.85,
+                    date=d.isoformat(),
+                    is_mock=True,
+                )
+                for d in dates
+            ]
+
+        # Prophet returns the forecast sorted by ds: predict in date order,
+        # then put each row back at its caller position.
+        order = sorted(range(len(dates)), key=lambda i: dates[i])
+        future = pd.DataFrame({'ds': pd.to_datetime([dates[i] for i in order])})
+        for reg in self.regressors:
+            future[reg] = [(per_date[i] or {}).get(reg, 0.0) for i in order]
+
         forecast = self.model.predict(future)
-        row = forecast.iloc[0]
-        
-        predicted = max(0, int(round(row['yhat'])))
-        lower = max(0, int(round(row['yhat_lower'])))
-        upper = max(0, int(round(row['yhat_upper'])))
-        
-        confidence = self._compute_confidence(lower, upper, predicted)
-        
-        return PredictionResult(
-            predicted=predicted,
-            lower=lower,
-            upper=upper,
-            confidence=confidence,
-            date=date_str
-        )
+
+        results: List[Optional[PredictionResult]] = [None] * len(dates)
+        for i, row in zip(order, forecast.itertuples(index=False)):
+            predicted = max(0, int(round(row.yhat)))
+            lower = max(0, int(round(row.yhat_lower)))
+            upper = max(0, int(round(row.yhat_upper)))
+            results[i] = PredictionResult(
+                predicted=predicted,
+                lower=lower,
+                upper=upper,
+                confidence=self._compute_confidence(lower, upper, predicted),
+                date=dates[i].isoformat()
+            )
+        return results
 
     def _compute_confidence(self, lower: int, upper: int, predicted: int) -> float:
         """Computes confidence score based on interval width."""
@@ -153,4 +177,14 @@ class PredictionEngine:
         from prophet.serialize import model_from_json
         with open(path, 'r') as f:
             self.model = model_from_json(f.read())
+        self.regressors = list(self.model.extra_regressors)
         self.is_trained = True
+
+    @classmethod
+    def from_model(cls, model: Prophet) -> "PredictionEngine":
+        """Wraps an already fitted Prophet model (e.g. from the model registry)."""
+        engine = cls()
+        engine.model = model
+        engine.regressors = list(model.extra_regressors)
+        engine.is_trained = True
+        return engine
@@ -2,27 +2,44 @@
 
 Responsibilities:
 - Fetch 7-day hourly forecasts from Open-Meteo (free, no API key).
-- Normalize raw JSON into WeatherForecast ORM rows.
-- Upsert into Supabase via SQLAlchemy (idempotent on tenant_id + property_id + forecast_timestamp).
+- Group properties by rounded lat/lon grid cell so each cell is fetched once.
+- Batch many cells into one Open-Meteo request (comma-separated coordinates).
+- Skip HTTP for cells fetched during the current model run within the
+  freshness TTL, and skip the upsert when the normalized payload is unchanged.
+- Normalize raw JSON straight into per-variable columns (HourlyColumns),
+  without building one ORM object per hourly slot.
+- Bulk-load via COPY into a temp staging table, then merge with one
+  INSERT ... ON CONFLICT (idempotent on cell_id + forecast_timestamp).
+- Materialise 4-hour UTC window rollups (worst condition, max precipitation
+  probability, mean temperature / wind) in the same transaction, so anomaly
+  detection reads one row per window from weather_cell_windows.
+- Link each property to its cell; readers join through property_weather_cells.
 - Retry failed HTTP calls with exponential backoff via tenacity (max 3 attempts).
 - Log failures; never crash the background task or affect other tenants.
 
 Architecture constraints:
 - Fat Backend: all HTTP calls stay in this service, not in routes.
-- No side effects on normalise() -- pure function, testable in isolation.
+- No side effects in normalise_columns() -- a pure function, testable in
+  isolation.
 - Tenacity retry: max 3 attempts, exponential back-off (SC #6).
-- Idempotency: ON CONFLICT DO UPDATE on (tenant_id, property_id, forecast_timestamp) (SC #7).
-- Tenant isolation: every row carries tenant_id; RLS enforced at DB level (SC #5).
+- Idempotency: ON CONFLICT DO UPDATE on (cell_id, forecast_timestamp) (SC #7).
+- Tenant isolation: forecasts are public data shared per cell; the
+  property -> cell link carries tenant_id and is RLS-protected (SC #5).
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Any
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator
 
 import httpx
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
 from tenacity import (
     before_sleep_log,
     retry,
@@ -31,7 +48,9 @@ from tenacity import (
     wait_exponential,
 )
 
-from app.db.models import RestaurantProfile, WeatherForecast
+from app.core.timeutils import as_utc
+from app.db.models import RestaurantProfile, WeatherFetchState
+from app.services.demand_modifiers import wmo_severity
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +58,244 @@ logger = logging.getLogger(__name__)
 _OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 _HOURLY_VARS = "temperature_2m,precipitation_probability,weathercode,windspeed_10m"
 
+# Grid resolution used to deduplicate nearby properties. 2 decimals is
+# ~1.1 km of latitude — finer than Open-Meteo's native model grid, so
+# properties sharing a cell would receive the same forecast anyway.
+_GRID_DECIMALS = int(os.getenv("WEATHER_GRID_DECIMALS", "2"))
+
+# Max locations per multi-location Open-Meteo request (keeps URLs well under
+# typical 8 KB proxy limits with 2-decimal coordinates).
+_BATCH_SIZE = int(os.getenv("WEATHER_BATCH_SIZE", "50"))
+
+# Fetch cache: a cell fetched during the current model run and less than
+# TTL ago is considered fresh. Open-Meteo's global models publish new runs
+# every 6 hours, so refetching within a run only returns identical data.
+_CACHE_TTL = timedelta(seconds=int(os.getenv("WEATHER_CACHE_TTL_SECONDS", "10800")))
+_MODEL_RUN_HOURS = 6
+
+# Rollup window length — must match AnomalyDetectionService.generate_windows
+_WINDOW_HOURS = 4
+
+
+@dataclass(frozen=True)
+class WeatherGridCell:
+    """A rounded lat/lon cell; the unit of fetching and storage."""
+
+    cell_id: str
+    latitude: float
+    longitude: float
+
+
+def grid_cell(
+    lat: float, lng: float, decimals: int = _GRID_DECIMALS
+) -> WeatherGridCell:
+    """Snap coordinates to their grid cell (centre point + stable string id)."""
+    rlat = round(float(lat), decimals)
+    rlng = round(float(lng), decimals)
+    # "+ 0.0" normalises -0.0 so both sides of the meridian share one id
+    return WeatherGridCell(
+        cell_id=f"{rlat + 0.0:.{decimals}f}:{rlng + 0.0:.{decimals}f}",
+        latitude=rlat,
+        longitude=rlng,
+    )
+
+
+def current_model_run(now: datetime | None = None) -> datetime:
+    """Return the start of the model run cycle containing *now* (UTC)."""
+    now = (now or datetime.now(tz=timezone.utc)).astimezone(timezone.utc)
+    return now.replace(
+        hour=(now.hour // _MODEL_RUN_HOURS) * _MODEL_RUN_HOURS,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+
+
+@dataclass
+class HourlyColumns:
+    """Open-Meteo hourly forecast in columnar form (one list per variable).
+
+    All lists have the same length; missing values are None.
+    """
+
+    timestamps: list[datetime] = field(default_factory=list)
+    condition_code: list[int | None] = field(default_factory=list)
+    temperature_c: list[float | None] = field(default_factory=list)
+    precipitation_prob: list[int | None] = field(default_factory=list)
+    wind_speed_kmh: list[float | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def records(self, cell_id: str, fetched_at: datetime) -> Iterator[tuple]:
+        """Yield COPY-ready tuples in ``_STAGE_COLUMNS`` order."""
+        for ts, code, temp, precip, wind in zip(
+            self.timestamps,
+            self.condition_code,
+            self.temperature_c,
+            self.precipitation_prob,
+            self.wind_speed_kmh,
+        ):
+            yield (cell_id, ts, code, temp, precip, wind, "open-meteo", fetched_at)
+
+
+# Column order shared by HourlyColumns.records(), COPY and the merge statement
+_STAGE_COLUMNS = (
+    "cell_id",
+    "forecast_timestamp",
+    "condition_code",
+    "temperature_c",
+    "precipitation_prob",
+    "wind_speed_kmh",
+    "source",
+    "fetched_at",
+)
+
+_UPSERT_SET = """
+    DO UPDATE SET
+        condition_code     = EXCLUDED.condition_code,
+        temperature_c      = EXCLUDED.temperature_c,
+        precipitation_prob = EXCLUDED.precipitation_prob,
+        wind_speed_kmh     = EXCLUDED.wind_speed_kmh,
+        source             = EXCLUDED.source,
+        fetched_at         = EXCLUDED.fetched_at
+"""
+
+_MERGE_FROM_STAGE_SQL = """
+    INSERT INTO weather_cell_forecasts (
+        cell_id, forecast_timestamp,
+        condition_code, temperature_c, precipitation_prob,
+        wind_speed_kmh, source, fetched_at, created_at
+    )
+    SELECT cell_id, forecast_timestamp,
+           condition_code, temperature_c, precipitation_prob,
+           wind_speed_kmh, source, fetched_at, NOW()
+    FROM weather_cell_stage
+    ON CONFLICT (cell_id, forecast_timestamp)
+""" + _UPSERT_SET
+
+_UPSERT_VALUES_SQL = """
+    INSERT INTO weather_cell_forecasts (
+        cell_id, forecast_timestamp,
+        condition_code, temperature_c, precipitation_prob,
+        wind_speed_kmh, source, fetched_at, created_at
+    )
+    VALUES (
+        :cell_id, :forecast_timestamp,
+        :condition_code, :temperature_c, :precipitation_prob,
+        :wind_speed_kmh, :source, :fetched_at, CURRENT_TIMESTAMP
+    )
+    ON CONFLICT (cell_id, forecast_timestamp)
+""" + _UPSERT_SET
+
+_UPSERT_WINDOWS_SQL = """
+    INSERT INTO weather_cell_windows (
+        cell_id, window_start, worst_condition_code, max_precipitation_prob,
+        mean_temperature_c, mean_wind_speed_kmh, hours, fetched_at
+    )
+    VALUES (
+        :cell_id, :window_start, :worst_condition_code, :max_precipitation_prob,
+        :mean_temperature_c, :mean_wind_speed_kmh, :hours, :fetched_at
+    )
+    ON CONFLICT (cell_id, window_start) DO UPDATE SET
+        worst_condition_code   = EXCLUDED.worst_condition_code,
+        max_precipitation_prob = EXCLUDED.max_precipitation_prob,
+        mean_temperature_c     = EXCLUDED.mean_temperature_c,
+        mean_wind_speed_kmh    = EXCLUDED.mean_wind_speed_kmh,
+        hours                  = EXCLUDED.hours,
+        fetched_at             = EXCLUDED.fetched_at
+"""
+
+
+def payload_hash(columns: HourlyColumns) -> str:
+    """Stable sha256 of the forecast values (ignores fetch time)."""
+    canonical = [
+        [ts.isoformat() for ts in columns.timestamps],
+        columns.condition_code,
+        columns.temperature_c,
+        columns.precipitation_prob,
+        columns.wind_speed_kmh,
+    ]
+    return hashlib.sha256(
+        json.dumps(canonical, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class WindowRollup:
+    """Aggregates of one cell's hourly forecasts over a 4-hour UTC window."""
+
+    window_start: datetime
+    worst_condition_code: int | None
+    max_precipitation_prob: int | None
+    mean_temperature_c: float | None
+    mean_wind_speed_kmh: float | None
+    hours: int
+
+
+def window_start_for(ts: datetime) -> datetime:
+    """Floor a timestamp to its 4-hour UTC window (00, 04, ... 20h)."""
+    ts = as_utc(ts).astimezone(timezone.utc)
+    return ts.replace(
+        hour=(ts.hour // _WINDOW_HOURS) * _WINDOW_HOURS,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+
+
+def rollup_windows(columns: HourlyColumns) -> list[WindowRollup]:
+    """Aggregate hourly columns into 4-hour window rollups (pure).
+
+    Missing values are ignored per aggregate; the worst condition is the
+    hour with the highest severity (see demand_modifiers.wmo_severity).
+    """
+    buckets: dict[datetime, list[int]] = {}
+    for i, ts in enumerate(columns.timestamps):
+        buckets.setdefault(window_start_for(ts), []).append(i)
+
+    def _present(values: list, idx: list[int]) -> list:
+        return [values[i] for i in idx if values[i] is not None]
+
+    rollups: list[WindowRollup] = []
+    for start, idx in buckets.items():
+        codes = _present(columns.condition_code, idx)
+        precip = _present(columns.precipitation_prob, idx)
+        temps = _present(columns.temperature_c, idx)
+        winds = _present(columns.wind_speed_kmh, idx)
+        rollups.append(
+            WindowRollup(
+                window_start=start,
+                worst_condition_code=(
+                    max(codes, key=lambda c: (wmo_severity(c), c)) if codes else None
+                ),
+                max_precipitation_prob=max(precip) if precip else None,
+                mean_temperature_c=sum(temps) / len(temps) if temps else None,
+                mean_wind_speed_kmh=sum(winds) / len(winds) if winds else None,
+                hours=len(idx),
+            )
+        )
+    return rollups
+
+
+def group_by_cell(
+    profiles: Iterable[RestaurantProfile],
+) -> dict[str, tuple[WeatherGridCell, list[RestaurantProfile]]]:
+    """Group profiles with GPS coordinates by grid cell.
+
+    Profiles without coordinates are skipped. Insertion order is preserved.
+    """
+    groups: dict[str, tuple[WeatherGridCell, list[RestaurantProfile]]] = {}
+    for profile in profiles:
+        if profile.latitude is None or profile.longitude is None:
+            continue
+        cell = grid_cell(profile.latitude, profile.longitude)
+        groups.setdefault(cell.cell_id, (cell, []))[1].append(profile)
+    return groups
+
 
 class WeatherIngestionService:
-    """Fetches, normalises, and persists weather forecast data for one property."""
+    """Fetches, normalises, and persists weather forecast data per grid cell."""
 
     def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         # Allow injection of a mock client in tests
@@ -50,14 +304,15 @@ class WeatherIngestionService:
     # ── Public API ─────────────────────────────────────────────────────────
 
     async def sync_property(self, property_id: str, db: AsyncSession) -> int:
-        """Fetch and upsert weather forecasts for a single property.
+        """Fetch and upsert weather forecasts for the grid cell of one property.
 
         Args:
             property_id: The tenant_id of the RestaurantProfile to sync.
-            db: Async SQLAlchemy session (caller owns commit/rollback).
+            db: Async SQLAlchemy session. The cell's rows and the property
+                link are committed here (see ``store_cell``).
 
         Returns:
-            Number of rows upserted.
+            Number of cell rows upserted.
 
         Raises:
             ValueError: If the property has no GPS coordinates configured.
@@ -70,70 +325,222 @@ class WeatherIngestionService:
                 "Set latitude and longitude in the restaurant profile."
             )
 
-        raw = await self._fetch_forecast(profile.latitude, profile.longitude)
-        rows = self.normalise(raw, tenant_id=profile.tenant_id, property_id=property_id)
-        count = await self._upsert(rows, db)
-        logger.info("Weather sync OK — property=%s rows=%d", property_id, count)
+        cell = grid_cell(profile.latitude, profile.longitude)
+        if not await self.stale_cells([cell], db):
+            await self.link_properties(cell, [profile], db)
+            logger.info(
+                "Weather sync skipped (cache fresh) — property=%s cell=%s",
+                property_id,
+                cell.cell_id,
+            )
+            return 0
+
+        count = await self.sync_cell(cell, [profile], db)
+        logger.info(
+            "Weather sync OK — property=%s cell=%s rows=%d",
+            property_id,
+            cell.cell_id,
+            count,
+        )
         return count
 
-    # ── Normalisation (pure, fully testable) ───────────────────────────────
+    async def sync_cell(
+        self,
+        cell: WeatherGridCell,
+        profiles: list[RestaurantProfile],
+        db: AsyncSession,
+    ) -> int:
+        """Fetch one forecast for *cell*, store it once, and link *profiles* to it.
 
-    @staticmethod
-    def normalise(
+        Returns:
+            Number of cell rows upserted.
+        """
+        raw = await self._fetch_forecast(cell.latitude, cell.longitude)
+        return await self.store_cell(cell, profiles, raw, db)
+
+    async def fetch_cells(
+        self,
+        cells: list[WeatherGridCell],
+        batch_size: int = _BATCH_SIZE,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch forecasts for many cells using multi-location requests.
+
+        Cells are chunked into groups of *batch_size*; each chunk costs one
+        HTTP call. A chunk that still fails after retries is logged and its
+        cells are omitted from the result so other chunks are unaffected.
+
+        Returns:
+            Mapping of cell_id to that cell's raw Open-Meteo payload.
+        """
+        payloads: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(cells), batch_size):
+            chunk = cells[start:start + batch_size]
+            try:
+                raws = await self._fetch_forecast_batch(chunk)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(
+                    "Weather batch fetch FAILED  cells=%s  error=%s",
+                    [c.cell_id for c in chunk],
+                    exc,
+                    exc_info=True,
+                )
+                continue
+            for cell, raw in zip(chunk, raws):
+                payloads[cell.cell_id] = raw
+        return payloads
+
+    async def store_cell(
+        self,
+        cell: WeatherGridCell,
+        profiles: list[RestaurantProfile],
         raw: dict[str, Any],
-        *,
-        tenant_id: str,
+        db: AsyncSession,
+    ) -> int:
+        """Normalise an already-fetched payload, upsert it, and link *profiles*.
+
+        The upsert is skipped when the normalized payload hash matches the
+        one recorded for the cell's previous fetch. Rows, window rollups,
+        fetch state and property links are committed in one transaction, so
+        the payload-hash cache never disagrees with the stored rows.
+
+        Returns:
+            Number of cell rows upserted (0 when unchanged).
+        """
+        columns = self.normalise_columns(raw)
+        digest = payload_hash(columns)
+        try:
+            states = await self._load_fetch_states([cell.cell_id], db)
+            previous = states.get(cell.cell_id)
+
+            if previous is not None and previous.payload_hash == digest:
+                count = 0
+                logger.debug(
+                    "Weather payload unchanged — cell=%s, upsert skipped", cell.cell_id
+                )
+            else:
+                count = await self._upsert(cell.cell_id, columns, db)
+
+            await self._save_fetch_state(cell.cell_id, digest, db)
+            await self.link_properties(cell, profiles, db, commit=False)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return count
+
+    async def stale_cells(
+        self,
+        cells: list[WeatherGridCell],
+        db: AsyncSession,
+        now: datetime | None = None,
+    ) -> list[WeatherGridCell]:
+        """Return the subset of *cells* that need an HTTP fetch.
+
+        A cell is fresh (skipped) when its last fetch belongs to the current
+        model run and happened less than the cache TTL ago.
+        """
+        now = now or datetime.now(tz=timezone.utc)
+        run = current_model_run(now)
+        states = await self._load_fetch_states([c.cell_id for c in cells], db)
+
+        stale: list[WeatherGridCell] = []
+        for cell in cells:
+            state = states.get(cell.cell_id)
+            if (
+                state is not None
+                and as_utc(state.model_run) == run
+                and now - as_utc(state.fetched_at) < _CACHE_TTL
+            ):
+                continue
+            stale.append(cell)
+        return stale
+
+    async def get_forecasts_for_property(
+        self,
         property_id: str,
-    ) -> list[WeatherForecast]:
-        """Transform Open-Meteo JSON into WeatherForecast ORM objects.
+        db: AsyncSession,
+        *,
+        start: datetime | None = None,
+        hours: int = 168,
+    ) -> list[dict[str, Any]]:
+        """Return hourly forecasts for *property_id*, joined through its grid cell."""
+        ts_from = start or datetime.now(tz=timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        )
+        result = await db.execute(
+            text(
+                """
+                SELECT wf.id, pc.tenant_id, pc.property_id, wf.condition_code,
+                       wf.temperature_c, wf.precipitation_prob, wf.wind_speed_kmh,
+                       wf.forecast_timestamp, wf.fetched_at
+                FROM property_weather_cells pc
+                JOIN weather_cell_forecasts wf ON wf.cell_id = pc.cell_id
+                WHERE pc.property_id = :property_id
+                  AND wf.forecast_timestamp >= :ts_from
+                  AND wf.forecast_timestamp <  :ts_to
+                ORDER BY wf.forecast_timestamp
+                """
+            ),
+            {
+                "property_id": property_id,
+                "ts_from": ts_from,
+                "ts_to": ts_from + timedelta(hours=hours),
+            },
+        )
+        return [dict(row._mapping) for row in result.fetchall()]
+
+    # ── Normalisation (pure, fully testable) ───────────────────────────────
+
+    @staticmethod
+    def normalise_columns(raw: dict[str, Any]) -> HourlyColumns:
+        """Parse Open-Meteo ``hourly`` arrays directly into typed columns.
 
-        The function is deterministic and side-effect-free — safe to unit test
-        without a database.
+        Unparseable timestamps are dropped and arrays shorter than ``time``
+        are padded with None. No ORM object is allocated per hourly slot —
+        this is the ingestion hot path.
         """
         hourly = raw.get("hourly", {})
-        timestamps: list[str] = hourly.get("time", [])
-        temperatures: list[float | None] = hourly.get("temperature_2m", [])
-        precip_probs: list[int | None] = hourly.get("precipitation_probability", [])
-        weathercodes: list[int | None] = hourly.get("weathercode", [])
-        windspeeds: list[float | None] = hourly.get("windspeed_10m", [])
-
-        fetched_at = datetime.now(tz=timezone.utc)
-        rows: list[WeatherForecast] = []
+        times: list[str] = hourly.get("time", [])
+        n = len(times)
 
-        for i, ts_str in enumerate(timestamps):
+        timestamps: list[datetime] = []
+        keep: list[int] = []
+        for i, ts_str in enumerate(times):
             try:
-                forecast_ts = datetime.fromisoformat(ts_str).replace(tzinfo=timezone.utc)
+                timestamps.append(datetime.fromisoformat(ts_str).replace(tzinfo=timezone.utc))
             except ValueError:
                 logger.warning("Skipping unparseable timestamp: %s", ts_str)
                 continue
-
-            rows.append(
-                WeatherForecast(
-                    tenant_id=tenant_id,
-                    property_id=property_id,
-                    forecast_timestamp=forecast_ts,
-                    condition_code=_safe_get(weathercodes, i),
-                    temperature_c=_safe_get(temperatures, i),
-                    precipitation_prob=_safe_get(precip_probs, i),
-                    wind_speed_kmh=_safe_get(windspeeds, i),
-                    source="open-meteo",
-                    fetched_at=fetched_at,
-                )
-            )
-
-        return rows
+            keep.append(i)
+
+        def column(name: str, cast: type) -> list:
+            values = hourly.get(name, [])
+            padded = list(values[:n]) + [None] * (n - len(values))
+            if len(keep) != n:
+                padded = [padded[i] for i in keep]
+            return [None if v is None else cast(v) for v in padded]
+
+        return HourlyColumns(
+            timestamps=timestamps,
+            condition_code=column("weathercode", int),
+            temperature_c=column("temperature_2m", float),
+            precipitation_prob=column("precipitation_probability", int),
+            wind_speed_kmh=column("windspeed_10m", float),
+        )
 
     # ── Private helpers ────────────────────────────────────────────────────
 
-    async def _get_profile(self, property_id: str, db: AsyncSession) -> RestaurantProfile:
-        from sqlalchemy.future import select
-
+    async def _get_profile(
+        self, property_id: str, db: AsyncSession
+    ) -> RestaurantProfile:
         result = await db.execute(
             select(RestaurantProfile).where(RestaurantProfile.tenant_id == property_id)
         )
         profile = result.scalars().first()
         if not profile:
-            raise ValueError(f"No restaurant profile found for property_id='{property_id}'")
+            raise ValueError(
+                f"No restaurant profile found for property_id='{property_id}'"
+            )
         return profile
 
     @retry(
@@ -145,14 +552,56 @@ class WeatherIngestionService:
     )
     async def _fetch_forecast(self, lat: float, lng: float) -> dict:
         """GET Open-Meteo with tenacity retry (SC #6)."""
-        params = {
-            "latitude": lat,
-            "longitude": lng,
-            "hourly": _HOURLY_VARS,
-            "forecast_days": 7,
-            "timezone": "auto",
-        }
+        return await self._get(
+            {
+                "latitude": lat,
+                "longitude": lng,
+                "hourly": _HOURLY_VARS,
+                "forecast_days": 7,
+                "timezone": "auto",
+            }
+        )
+
+    @retry(
+        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=16),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _fetch_forecast_batch(
+        self, cells: list[WeatherGridCell]
+    ) -> list[dict[str, Any]]:
+        """GET Open-Meteo for several locations in one call (SC #6 retry).
+
+        Open-Meteo accepts comma-separated latitude/longitude lists and
+        returns a JSON array with one object per location, in request order
+        (a single object when only one location is requested).
+
+        Raises:
+            ValueError: If the response does not contain one entry per cell.
+        """
+        if not cells:
+            return []
 
+        data = await self._get(
+            {
+                "latitude": ",".join(str(c.latitude) for c in cells),
+                "longitude": ",".join(str(c.longitude) for c in cells),
+                "hourly": _HOURLY_VARS,
+                "forecast_days": 7,
+                "timezone": "auto",
+            }
+        )
+        raws = data if isinstance(data, list) else [data]
+        if len(raws) != len(cells):
+            raise ValueError(
+                f"Open-Meteo returned {len(raws)} locations for {len(cells)} requested"
+            )
+        return raws
+
+    async def _get(self, params: dict[str, Any]) -> Any:
+        """Issue one GET against Open-Meteo on the injected (pooled) client."""
         if self._client is not None:
             resp = await self._client.get(_OPEN_METEO_URL, params=params, timeout=15)
         else:
@@ -162,63 +611,164 @@ class WeatherIngestionService:
         resp.raise_for_status()
         return resp.json()
 
-    async def _upsert(self, rows: list[WeatherForecast], db: AsyncSession) -> int:
-        """Upsert rows using PostgreSQL ON CONFLICT DO UPDATE.
+    async def _upsert(
+        self, cell_id: str, columns: HourlyColumns, db: AsyncSession
+    ) -> int:
+        """Upsert one cell's columns with ON CONFLICT DO UPDATE.
 
-        Idempotent: re-running for the same property + time window overwrites
-        with fresh data instead of creating duplicates (SC #7).
+        On PostgreSQL the columns are bulk-loaded with COPY into a temp
+        staging table and merged with a single INSERT ... SELECT; other
+        dialects (SQLite in tests) fall back to executemany. The cell's
+        4-hour window rollups are rewritten in the same transaction.
+
+        Idempotent: re-running for the same cell + time window overwrites
+        with fresh data instead of creating duplicates (SC #7). The caller
+        commits (see :meth:`store_cell`).
         """
-        if not rows:
+        if not len(columns):
             return 0
 
-        stmt = text(
-            """
-            INSERT INTO weather_forecasts (
-                tenant_id, property_id, forecast_timestamp,
-                condition_code, temperature_c, precipitation_prob,
-                wind_speed_kmh, source, fetched_at, created_at
+        fetched_at = datetime.now(tz=timezone.utc)
+        dialect_name: str = db.get_bind().dialect.name  # type: ignore[union-attr]
+
+        if dialect_name == "postgresql":
+            await self._copy_into_stage(cell_id, columns, fetched_at, db)
+            await db.execute(text(_MERGE_FROM_STAGE_SQL))
+        else:
+            await db.execute(
+                text(_UPSERT_VALUES_SQL),
+                [
+                    dict(zip(_STAGE_COLUMNS, record))
+                    for record in columns.records(cell_id, fetched_at)
+                ],
             )
-            VALUES (
-                :tenant_id, :property_id, :forecast_timestamp,
-                :condition_code, :temperature_c, :precipitation_prob,
-                :wind_speed_kmh, :source, :fetched_at, NOW()
+
+        rollups = rollup_windows(columns)
+        await db.execute(
+            text(_UPSERT_WINDOWS_SQL),
+            [
+                {
+                    "cell_id": cell_id,
+                    "window_start": r.window_start,
+                    "worst_condition_code": r.worst_condition_code,
+                    "max_precipitation_prob": r.max_precipitation_prob,
+                    "mean_temperature_c": r.mean_temperature_c,
+                    "mean_wind_speed_kmh": r.mean_wind_speed_kmh,
+                    "hours": r.hours,
+                    "fetched_at": fetched_at,
+                }
+                for r in rollups
+            ],
+        )
+        return len(columns)
+
+    async def _copy_into_stage(
+        self,
+        cell_id: str,
+        columns: HourlyColumns,
+        fetched_at: datetime,
+        db: AsyncSession,
+    ) -> None:
+        """COPY the columns into a transaction-scoped temp staging table."""
+        await db.execute(
+            text(
+                """
+                CREATE TEMP TABLE weather_cell_stage (
+                    cell_id            TEXT,
+                    forecast_timestamp TIMESTAMPTZ,
+                    condition_code     INTEGER,
+                    temperature_c      DOUBLE PRECISION,
+                    precipitation_prob INTEGER,
+                    wind_speed_kmh     DOUBLE PRECISION,
+                    source             TEXT,
+                    fetched_at         TIMESTAMPTZ
+                ) ON COMMIT DROP
+                """
             )
-            ON CONFLICT (tenant_id, property_id, forecast_timestamp)
-            DO UPDATE SET
-                condition_code     = EXCLUDED.condition_code,
-                temperature_c      = EXCLUDED.temperature_c,
-                precipitation_prob = EXCLUDED.precipitation_prob,
-                wind_speed_kmh     = EXCLUDED.wind_speed_kmh,
-                source             = EXCLUDED.source,
-                fetched_at         = EXCLUDED.fetched_at
-            """
+        )
+        conn = await db.connection()
+        raw_conn = await conn.get_raw_connection()
+        # asyncpg.Connection underneath the SQLAlchemy adapter
+        await raw_conn.driver_connection.copy_records_to_table(
+            "weather_cell_stage",
+            records=columns.records(cell_id, fetched_at),
+            columns=list(_STAGE_COLUMNS),
         )
 
-        values = [
+    async def _load_fetch_states(
+        self, cell_ids: list[str], db: AsyncSession
+    ) -> dict[str, WeatherFetchState]:
+        if not cell_ids:
+            return {}
+        result = await db.execute(
+            select(WeatherFetchState).where(WeatherFetchState.cell_id.in_(cell_ids))
+        )
+        return {state.cell_id: state for state in result.scalars().all()}
+
+    async def _save_fetch_state(
+        self, cell_id: str, digest: str, db: AsyncSession
+    ) -> None:
+        now = datetime.now(tz=timezone.utc)
+        await db.execute(
+            text(
+                """
+                INSERT INTO weather_fetch_state
+                    (cell_id, model_run, fetched_at, payload_hash)
+                VALUES (:cell_id, :model_run, :fetched_at, :payload_hash)
+                ON CONFLICT (cell_id)
+                DO UPDATE SET
+                    model_run    = EXCLUDED.model_run,
+                    fetched_at   = EXCLUDED.fetched_at,
+                    payload_hash = EXCLUDED.payload_hash
+                """
+            ),
             {
-                "tenant_id": row.tenant_id,
-                "property_id": row.property_id,
-                "forecast_timestamp": row.forecast_timestamp,
-                "condition_code": row.condition_code,
-                "temperature_c": float(row.temperature_c) if row.temperature_c is not None else None,
-                "precipitation_prob": row.precipitation_prob,
-                "wind_speed_kmh": float(row.wind_speed_kmh) if row.wind_speed_kmh is not None else None,
-                "source": row.source,
-                "fetched_at": row.fetched_at,
-            }
-            for row in rows
-        ]
-
-        await db.execute(stmt, values)
-        await db.commit()
-        return len(rows)
+                "cell_id": cell_id,
+                "model_run": current_model_run(now),
+                "fetched_at": now,
+                "payload_hash": digest,
+            },
+        )
 
+    async def link_properties(
+        self,
+        cell: WeatherGridCell,
+        profiles: list[RestaurantProfile],
+        db: AsyncSession,
+        *,
+        commit: bool = True,
+    ) -> None:
+        """Point every profile at *cell* (upsert on property_id).
 
-# ── Utilities ──────────────────────────────────────────────────────────────
+        ``commit=False`` leaves the upsert in the caller's transaction.
+        """
+        if not profiles:
+            return
 
-def _safe_get(lst: list, index: int) -> Any:
-    """Return lst[index] or None if out of bounds."""
-    try:
-        return lst[index]
-    except IndexError:
-        return None
+        stmt = text(
+            """
+            INSERT INTO property_weather_cells
+                (property_id, tenant_id, cell_id, updated_at)
+            VALUES (:property_id, :tenant_id, :cell_id, :updated_at)
+            ON CONFLICT (property_id)
+            DO UPDATE SET
+                tenant_id  = EXCLUDED.tenant_id,
+                cell_id    = EXCLUDED.cell_id,
+                updated_at = EXCLUDED.updated_at
+            """
+        )
+        now = datetime.now(tz=timezone.utc)
+        await db.execute(
+            stmt,
+            [
+                {
+                    "property_id": p.tenant_id,
+                    "tenant_id": p.tenant_id,
+                    "cell_id": cell.cell_id,
+                    "updated_at": now,
+                }
+                for p in profiles
+            ],
+        )
+        if commit:
+            await db.commit()
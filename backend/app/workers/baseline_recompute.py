@@ -0,0 +1,55 @@
+"""Portfolio baseline recompute — background task and command-line entry point.
+
+Recomputes every tenant's captation baseline (see
+app/services/baseline_recompute.py). Used by ``POST /baselines/recalculate``
+as a FastAPI background task and from the command line after a data fix::
+
+    python -m app.workers.baseline_recompute
+    python -m app.workers.baseline_recompute --tenant hotel_a --tenant hotel_b
+
+Architecture constraints:
+- Errors are logged, never raised into the request that started the run.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import List, Optional
+
+from app.services.baseline_recompute import TenantRecompute, recompute_portfolio
+
+logger = logging.getLogger(__name__)
+
+
+async def run_baseline_recompute(
+    tenant_ids: Optional[List[str]] = None,
+) -> List[TenantRecompute]:
+    """Run a portfolio recompute; returns per-tenant outcomes ([] on error)."""
+    try:
+        return await recompute_portfolio(tenant_ids)
+    except Exception:
+        logger.exception("baseline_recompute: unhandled error")
+        return []
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Recompute captation baselines for the portfolio.")
+    parser.add_argument("--tenant", action="append", dest="tenants",
+                        help="tenant_id to recompute (repeatable; default: all with PMS data)")
+    parser.add_argument("--slowest", type=int, default=10, help="number of slowest tenants to print")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    outcomes = asyncio.run(run_baseline_recompute(args.tenants))
+
+    for outcome in sorted(outcomes, key=lambda o: o.duration_ms, reverse=True)[: args.slowest]:
+        print(f"{outcome.tenant_id}: {outcome.status} — {outcome.duration_ms:.0f} ms, "
+              f"{outcome.data_points} points" + (f" ({outcome.error})" if outcome.error else ""))
+    failed = sum(1 for o in outcomes if o.status == "failed")
+    print(f"Recomputed {len(outcomes)} tenants, {failed} failed")
+    return 0 if outcomes and not failed else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+"""Data retention worker — daily partition maintenance and pruning.
+
+APScheduler cron job (daily 03:15 UTC, plus once at startup so a fresh
+deploy has its upcoming partitions before the first weather sync) that runs
+DataRetentionService: creates upcoming monthly partitions and drops, archives
+or deletes forecast/event data past its retention window.
+
+Register via register_data_retention_job() on the application-level
+scheduler in main.py (shared with anomaly_scan and other background jobs).
+
+Architecture constraints:
+- Job is registered on startup; no state is kept in this module.
+- Session is opened per job execution and closed cleanly on exit.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.db.session import AsyncSessionLocal
+from app.services.data_retention import DataRetentionService
+
+logger = logging.getLogger(__name__)
+
+_service = DataRetentionService()
+
+
+async def _run_data_retention_job() -> None:
+    """Entry point called by APScheduler daily (and once at startup)."""
+    logger.info("data_retention: starting maintenance run")
+    async with AsyncSessionLocal() as db:
+        try:
+            await _service.run(db)
+            logger.info("data_retention: maintenance run complete")
+        except Exception:
+            logger.exception("data_retention: unhandled error during maintenance run")
+
+
+def register_data_retention_job(scheduler: AsyncIOScheduler) -> None:
+    """Register the daily retention cron job on the provided scheduler.
+
+    Args:
+        scheduler: The application-level AsyncIOScheduler instance.
+    """
+    scheduler.add_job(
+        _run_data_retention_job,
+        trigger="cron",
+        hour=3,
+        minute=15,
+        timezone="UTC",
+        id="data_retention",
+        replace_existing=True,
+        misfire_grace_time=3600,
+        next_run_time=datetime.now(timezone.utc),
+    )
+    logger.info("data_retention: cron job registered (daily 03:15 UTC, first run now)")
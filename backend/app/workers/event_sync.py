@@ -1,33 +1,64 @@
-"""APScheduler background worker — PredictHQ event sync daily at 06:00 UTC (HOS-84 Story 3.2).
+"""APScheduler background worker — PredictHQ event sync (HOS-84 Story 3.2).
 
 The scheduler is started on FastAPI startup and stopped on shutdown.
+Two jobs share the same pipeline:
+  - daily at 06:00 UTC: full window re-fetch for every cluster;
+  - every EVENT_SYNC_INTERVAL_MINUTES: incremental fetch of events updated
+    since each cluster's stored watermark.
+
 Each job iteration:
   1. Fetches all RestaurantProfile rows that have GPS coordinates.
-  2. Calls EventIngestionService.sync_for_tenant for each profile.
-  3. Logs per-tenant success / failure; a per-tenant failure does NOT
-     abort the remaining tenants (SC #6).
+  2. Groups nearby profiles into covering query clusters.
+  3. Calls EventIngestionService.sync_cluster for each cluster, up to
+     EVENT_SYNC_CONCURRENCY clusters at a time over one pooled httpx client.
+  4. Logs per-cluster success / failure; a cluster failure does NOT
+     abort the remaining clusters (SC #6).
+
+The two jobs never overlap: an incremental run that fires while another
+run holds the sync lock is skipped (the next interval catches up), and the
+daily full run waits for an in-progress incremental run to finish.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+from typing import List
 
+import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.future import select
 
 from app.db.session import AsyncSessionLocal
 from app.db.models import RestaurantProfile
-from app.services.event_ingestion import EventIngestionService
+from app.services.event_ingestion import (
+    EventCluster,
+    EventIngestionService,
+    cluster_properties,
+)
 
 logger = logging.getLogger(__name__)
 
 _scheduler = AsyncIOScheduler()
 
+# Clusters synced in parallel; each holds at most one in-flight page request
+# plus one prefetch, so the pool is sized at twice the concurrency.
+_SYNC_CONCURRENCY = max(1, int(os.getenv("EVENT_SYNC_CONCURRENCY", "5")))
+_INCREMENTAL_INTERVAL_MINUTES = int(os.getenv("EVENT_SYNC_INTERVAL_MINUTES", "60"))
+
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=_SYNC_CONCURRENCY * 2,
+    max_keepalive_connections=_SYNC_CONCURRENCY,
+)
 
-async def _run_event_sync_for_all_tenants() -> None:
-    """Iterate every property with GPS coords and sync PredictHQ events."""
-    service = EventIngestionService()
+# Held by whichever job is syncing, so full and incremental runs never write
+# the same cluster's events and watermark concurrently
+_sync_lock = asyncio.Lock()
 
+
+async def _load_profiles_with_gps() -> List[RestaurantProfile]:
     async with AsyncSessionLocal() as session:
         result = await session.execute(
             select(RestaurantProfile).where(
@@ -35,31 +66,79 @@ async def _run_event_sync_for_all_tenants() -> None:
                 RestaurantProfile.longitude.isnot(None),
             )
         )
-        profiles = result.scalars().all()
+        return list(result.scalars().all())
 
-    logger.info("Event sync job started — %d properties with GPS", len(profiles))
 
-    for profile in profiles:
+async def _sync_one(
+    service: EventIngestionService,
+    cluster: EventCluster,
+    semaphore: asyncio.Semaphore,
+    incremental: bool,
+) -> None:
+    async with semaphore:
         try:
             async with AsyncSessionLocal() as session:
-                rows = await service.sync_for_tenant(session, profile)
-            logger.info(
-                "Event sync OK  tenant=%s  new_rows=%d",
-                profile.tenant_id,
-                rows,
-            )
+                linked = await service.sync_cluster(
+                    session, cluster, incremental=incremental
+                )
+            for tenant_id, rows in linked.items():
+                logger.info(
+                    "Event sync OK  tenant=%s  cluster=%s  new_links=%d",
+                    tenant_id,
+                    cluster.cluster_id,
+                    rows,
+                )
         except Exception as exc:  # noqa: BLE001
-            # Per-tenant failure must NOT affect other tenants (SC #6)
+            # Per-cluster failure must NOT affect other clusters (SC #6)
             logger.error(
-                "Event sync FAILED  tenant=%s  error=%s",
-                profile.tenant_id,
+                "Event sync FAILED  cluster=%s  tenants=%s  error=%s",
+                cluster.cluster_id,
+                ",".join(m.tenant_id for m in cluster.members),
                 exc,
                 exc_info=True,
             )
 
 
+async def _run_event_sync_for_all_tenants(incremental: bool = False) -> None:
+    """Sync PredictHQ events for every property cluster, concurrently.
+
+    ``incremental=True`` requests only events updated since each cluster's
+    watermark, and is skipped while another run is in progress; the default
+    performs a full window re-fetch, waiting for any running sync first.
+    """
+    if incremental and _sync_lock.locked():
+        logger.info("Event sync job skipped — mode=incremental  another run active")
+        return
+    async with _sync_lock:
+        await _sync_all_clusters(incremental)
+
+
+async def _sync_all_clusters(incremental: bool) -> None:
+    profiles = await _load_profiles_with_gps()
+    clusters = cluster_properties(profiles)
+
+    logger.info(
+        "Event sync job started — mode=%s  %d properties with GPS in %d clusters  "
+        "concurrency=%d",
+        "incremental" if incremental else "full",
+        len(profiles),
+        len(clusters),
+        _SYNC_CONCURRENCY,
+    )
+
+    semaphore = asyncio.Semaphore(_SYNC_CONCURRENCY)
+    async with httpx.AsyncClient(limits=_HTTP_LIMITS) as client:
+        service = EventIngestionService(http_client=client)
+        await asyncio.gather(
+            *(
+                _sync_one(service, cluster, semaphore, incremental)
+                for cluster in clusters
+            )
+        )
+
+
 def start_event_scheduler() -> None:
-    """Register the daily 06:00 UTC event sync job and start the scheduler."""
+    """Register the daily full and interval incremental event sync jobs and start the scheduler."""
     _scheduler.add_job(
         _run_event_sync_for_all_tenants,
         trigger=CronTrigger(hour=6, minute=0, timezone="UTC"),
@@ -68,8 +147,20 @@ def start_event_scheduler() -> None:
         max_instances=1,
         coalesce=True,
     )
+    _scheduler.add_job(
+        _run_event_sync_for_all_tenants,
+        trigger=IntervalTrigger(minutes=_INCREMENTAL_INTERVAL_MINUTES),
+        kwargs={"incremental": True},
+        id="event_sync_incremental",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
     _scheduler.start()
-    logger.info("Event scheduler started (cron=daily 06:00 UTC)")
+    logger.info(
+        "Event scheduler started (cron=daily 06:00 UTC full, incremental every %d min)",
+        _INCREMENTAL_INTERVAL_MINUTES,
+    )
 
 
 def stop_event_scheduler() -> None:
@@ -0,0 +1,98 @@
+"""Forecast refresh worker — nightly materialization of ``service_forecasts``.
+
+APScheduler cron job (daily 03:45 UTC, after the PMS sync and data
+retention jobs) that recomputes the FORECAST_HORIZON_DAYS-day forecast of
+every tenant with a trained Prophet model (see
+app/services/forecast_materializer.py). Also run after training, for the
+retrained tenants, and from the command line::
+
+    python -m app.workers.forecast_refresh
+    python -m app.workers.forecast_refresh --tenant hotel_a
+
+Register via register_forecast_refresh_job() on the application-level
+scheduler in main.py.
+
+Architecture constraints:
+- One tenant's failure never stops the others.
+- Errors are logged, never raised into the scheduler.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.db.session import AsyncSessionLocal
+from app.services.forecast_materializer import ForecastMaterializer
+
+logger = logging.getLogger(__name__)
+
+
+async def run_forecast_refresh(tenant_ids: Optional[List[str]] = None) -> Dict[str, int]:
+    """Refresh the given tenants (default: all with a model); returns rows per tenant.
+
+    Tenants whose refresh failed are absent from the result.
+    """
+    materializer = ForecastMaterializer()
+    if tenant_ids is None:
+        tenant_ids = sorted({tenant for tenant, _ in materializer.registry.trained_keys()})
+
+    written: Dict[str, int] = {}
+    for tenant_id in tenant_ids:
+        try:
+            async with AsyncSessionLocal() as db:
+                written[tenant_id] = await materializer.refresh_tenant(tenant_id, db)
+        except Exception as exc:  # noqa: BLE001 — isolate per-tenant failures
+            logger.warning("forecast_refresh: tenant=%s FAILED: %s", tenant_id, exc)
+    logger.info(
+        "forecast_refresh: %d/%d tenants refreshed, %d rows",
+        len(written), len(tenant_ids), sum(written.values()),
+    )
+    return written
+
+
+async def _run_forecast_refresh_job() -> None:
+    """Entry point called by APScheduler nightly."""
+    try:
+        await run_forecast_refresh()
+    except Exception:
+        logger.exception("forecast_refresh: unhandled error during nightly refresh")
+
+
+def register_forecast_refresh_job(scheduler: AsyncIOScheduler) -> None:
+    """Register the nightly forecast refresh on the provided scheduler.
+
+    Args:
+        scheduler: The application-level AsyncIOScheduler instance.
+    """
+    scheduler.add_job(
+        _run_forecast_refresh_job,
+        trigger="cron",
+        hour=3,
+        minute=45,
+        timezone="UTC",
+        id="forecast_refresh",
+        replace_existing=True,
+        misfire_grace_time=3600,
+    )
+    logger.info("forecast_refresh: cron job registered (daily 03:45 UTC)")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Materialize Prophet forecasts into service_forecasts.")
+    parser.add_argument("--tenant", action="append", dest="tenants",
+                        help="tenant_id to refresh (repeatable; default: all with a trained model)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    written = asyncio.run(run_forecast_refresh(args.tenants))
+    for tenant_id, rows in sorted(written.items()):
+        print(f"{tenant_id}: {rows} rows")
+    return 0 if args.tenants is None or len(written) == len(args.tenants) else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
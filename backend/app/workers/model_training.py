@@ -0,0 +1,103 @@
+"""Model training worker — nightly per-tenant Prophet retraining.
+
+APScheduler cron job (daily 03:00 UTC, after the PMS sync) that refits the
+Prophet model of every tenant and service type across a process pool (see
+app/services/model_training.py), then refreshes their materialized
+forecasts. Also runnable from the command line, e.g. after a backfill::
+
+    python -m app.workers.model_training
+    python -m app.workers.model_training --tenant hotel_a --service dinner --workers 4
+
+Register via register_model_training_job() on the application-level
+scheduler in main.py.
+
+Env vars:
+    PROPHET_TRAINING_WORKERS — pool size (default: CPU count)
+
+Architecture constraints:
+- Errors are logged, never raised into the scheduler.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import List, Optional, Sequence
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.services.model_training import (
+    _WORKERS,
+    SERVICE_TYPES,
+    TrainingOutcome,
+    train_portfolio,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_model_training(
+    tenant_ids: Optional[List[str]] = None,
+    service_types: Sequence[str] = SERVICE_TYPES,
+    workers: int = _WORKERS,
+) -> List[TrainingOutcome]:
+    """Run a portfolio training; returns per-model outcomes ([] on error)."""
+    try:
+        return await train_portfolio(tenant_ids, service_types, workers)
+    except Exception:
+        logger.exception("model_training: unhandled error")
+        return []
+
+
+async def _run_model_training_job() -> None:
+    """Entry point called by APScheduler nightly."""
+    await run_model_training()
+
+
+def register_model_training_job(scheduler: AsyncIOScheduler) -> None:
+    """Register the nightly portfolio retraining on the provided scheduler.
+
+    Args:
+        scheduler: The application-level AsyncIOScheduler instance.
+    """
+    scheduler.add_job(
+        _run_model_training_job,
+        trigger="cron",
+        hour=3,
+        minute=0,
+        timezone="UTC",
+        id="model_training",
+        replace_existing=True,
+        misfire_grace_time=3600,
+    )
+    logger.info("model_training: cron job registered (daily 03:00 UTC, workers=%d)", _WORKERS)
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Retrain per-tenant Prophet models.")
+    parser.add_argument("--tenant", action="append", dest="tenants",
+                        help="tenant_id to train (repeatable; default: all with PMS data)")
+    parser.add_argument("--service", action="append", dest="services", choices=SERVICE_TYPES,
+                        help="service type to train (repeatable; default: all)")
+    parser.add_argument("--workers", type=int, default=_WORKERS, help="process pool size")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    outcomes = asyncio.run(
+        run_model_training(args.tenants, args.services or SERVICE_TYPES, args.workers)
+    )
+
+    for o in sorted(outcomes, key=lambda o: (o.tenant_id, o.service_type)):
+        detail = (
+            f"fit {o.fit_seconds:.1f}s, MAE {o.in_sample_mae:.1f}"
+            if o.status == "trained" else (o.error or f"{o.training_rows} days")
+        )
+        print(f"{o.tenant_id}/{o.service_type}: {o.status} — {detail}")
+    failed = sum(1 for o in outcomes if o.status == "failed")
+    print(f"Trained {sum(1 for o in outcomes if o.status == 'trained')}/{len(outcomes)} models, "
+          f"{failed} failed")
+    return 0 if outcomes and not failed else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
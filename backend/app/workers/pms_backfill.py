@@ -0,0 +1,96 @@
+"""PMS backfill runner — background task and command-line entry point.
+
+Runs a ``PMSBackfillJob`` (see app/services/pms_backfill.py) in its own DB
+session. Used by ``POST /pms/backfill`` as a FastAPI background task and
+from the command line for onboarding imports::
+
+    python -m app.workers.pms_backfill --tenant hotel_a \\
+        --start 2024-01-01 --end 2025-12-31 --adapter apaleo_raw
+    python -m app.workers.pms_backfill --resume 42
+
+Architecture constraints:
+- Session is opened per run and closed cleanly on exit.
+- Errors are logged, never raised into the request that started the job.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import date
+from typing import Optional
+
+from app.db.models import PMSBackfillJob
+from app.db.session import AsyncSessionLocal
+from app.services.pms_backfill import DEFAULT_CHUNK_DAYS, PMSBackfillService
+from app.services.pms_sync import PMS_ADAPTERS, get_pms_adapter
+
+logger = logging.getLogger(__name__)
+
+
+async def run_backfill_job(job_id: int) -> Optional[PMSBackfillJob]:
+    """Run (or resume) one backfill job; returns it, or None if unknown.
+
+    A job that is already running or completed is returned without running.
+    """
+    async with AsyncSessionLocal() as db:
+        claimed = await PMSBackfillService.claim(db, job_id)
+        job = await db.get(PMSBackfillJob, job_id)
+        if job is None:
+            logger.error("pms_backfill: job %s not found", job_id)
+            return None
+        if not claimed:
+            logger.warning("pms_backfill: job %s is %s, not run", job_id, job.status)
+            return job
+        try:
+            return await PMSBackfillService(get_pms_adapter(job.adapter)).run(db, job)
+        except Exception:
+            logger.exception("pms_backfill: unhandled error in job %s", job_id)
+            return job
+
+
+async def _main(args: argparse.Namespace) -> int:
+    if args.resume is not None:
+        job_id = args.resume
+    else:
+        async with AsyncSessionLocal() as db:
+            job = await PMSBackfillService.create_job(
+                db,
+                tenant_id=args.tenant,
+                start_date=args.start,
+                end_date=args.end,
+                adapter_name=args.adapter,
+                chunk_days=args.chunk_days,
+            )
+            job_id = job.id
+        print(f"Created backfill job {job_id}")
+
+    job = await run_backfill_job(job_id)
+    if job is None:
+        return 1
+    print(
+        f"Backfill job {job.id}: {job.status} — "
+        f"{len(job.completed_chunks)}/{job.chunks_total} chunks, {job.rows_written} days written"
+    )
+    return 0 if job.status == "completed" else 2
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Backfill PMS history into pms_sync_logs.")
+    parser.add_argument("--tenant", help="tenant_id / property to backfill")
+    parser.add_argument("--start", type=date.fromisoformat, help="first day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--adapter", choices=PMS_ADAPTERS, default="apaleo_raw")
+    parser.add_argument("--chunk-days", type=int, default=DEFAULT_CHUNK_DAYS)
+    parser.add_argument("--resume", type=int, metavar="JOB_ID", help="resume an existing job")
+    args = parser.parse_args(argv)
+
+    if args.resume is None and not (args.tenant and args.start and args.end):
+        parser.error("--tenant, --start and --end are required unless --resume is given")
+
+    logging.basicConfig(level=logging.INFO)
+    return asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""PMS sync worker — nightly portfolio sync.
+
+APScheduler cron job (daily 02:30 UTC) that syncs the previous day's
+occupancy and F&B revenue for every property with a PMS via
+PMSSyncService.sync_portfolio: properties are fetched concurrently
+(bounded by PMS_SYNC_CONCURRENCY) and all PMSSyncLog rows are written in
+one batch.
+
+Register via register_pms_sync_job() on the application-level scheduler in
+main.py (shared with anomaly_scan and other background jobs).
+
+Env vars:
+    PMS_NIGHTLY_ADAPTER — adapter label, see pms_sync.get_pms_adapter
+                          (default "apaleo_raw")
+
+Architecture constraints:
+- Job is registered on startup; no state is kept in this module.
+- Errors are logged, never raised into the scheduler.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy.future import select
+
+from app.db.models import RestaurantProfile
+from app.db.session import AsyncSessionLocal
+from app.services.pms_sync import PMSSyncService, get_pms_adapter
+
+logger = logging.getLogger(__name__)
+
+_ADAPTER = os.getenv("PMS_NIGHTLY_ADAPTER", "apaleo_raw")
+
+
+async def _load_pms_property_ids() -> List[str]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(RestaurantProfile.tenant_id).where(RestaurantProfile.pms_type.isnot(None))
+        )
+        return list(result.scalars().all())
+
+
+async def _run_pms_sync_job(target_date: Optional[date] = None) -> None:
+    """Entry point called by APScheduler nightly."""
+    if _ADAPTER != "mock" and not os.getenv("APALEO_CLIENT_ID"):
+        logger.info("pms_sync: APALEO_CLIENT_ID not set — nightly sync skipped")
+        return
+
+    target_date = target_date or datetime.now(timezone.utc).date() - timedelta(days=1)
+    try:
+        property_ids = await _load_pms_property_ids()
+        if not property_ids:
+            logger.info("pms_sync: no PMS-linked properties")
+            return
+        logger.info("pms_sync: syncing %d properties for %s", len(property_ids), target_date)
+        await PMSSyncService(get_pms_adapter(_ADAPTER)).sync_portfolio(property_ids, target_date)
+    except Exception:
+        logger.exception("pms_sync: unhandled error during nightly sync")
+
+
+def register_pms_sync_job(scheduler: AsyncIOScheduler) -> None:
+    """Register the nightly portfolio PMS sync on the provided scheduler.
+
+    Args:
+        scheduler: The application-level AsyncIOScheduler instance.
+    """
+    scheduler.add_job(
+        _run_pms_sync_job,
+        trigger="cron",
+        hour=2,
+        minute=30,
+        timezone="UTC",
+        id="pms_portfolio_sync",
+        replace_existing=True,
+        misfire_grace_time=3600,
+    )
+    logger.info("pms_sync: cron job registered (daily 02:30 UTC, adapter=%s)", _ADAPTER)
@@ -5,8 +5,13 @@ Story 3.1: Ingest Localized Weather Data (HOS-83).
 Schedule: every 12 hours (00:00 UTC and 12:00 UTC).
 Behaviour:
 - Queries all active restaurant profiles that have GPS coordinates configured.
-- Calls WeatherIngestionService.sync_property() for each in sequence.
-- Failures for one tenant are caught and logged; other tenants are not affected.
+- Groups them by rounded lat/lon grid cell and fetches all cells with
+  multi-location Open-Meteo requests over one pooled HTTP client, then
+  stores each cell once via WeatherIngestionService.store_cell().
+- Cells fetched during the current model run within the cache TTL are not
+  refetched, so the two 12-hour schedulers and ad-hoc /weather/sync calls
+  do not repeat identical downloads.
+- Failures for one cell are caught and logged; other cells are not affected.
 - The scheduler instance is created once and stored on the FastAPI app state
   so that it can be started/stopped with the application lifecycle.
 
@@ -27,27 +32,26 @@ from __future__ import annotations
 
 import logging
 
+import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.future import select
 
 from app.db.models import RestaurantProfile
 from app.db.session import AsyncSessionLocal
-from apscheduler.triggers.interval import IntervalTrigger
-from app.services.weather_ingestion import WeatherIngestionService
+from app.services.weather_ingestion import WeatherIngestionService, group_by_cell
 
 logger = logging.getLogger(__name__)
 
-_service = WeatherIngestionService()
 _scheduler = AsyncIOScheduler()
 
+# Connection pool shared by every request of one sync job
+_HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
 
-async def run_weather_sync_all_tenants() -> None:
-    """Sync weather forecasts for every property with GPS coordinates.
 
-    Invoked by APScheduler every 12 hours.
-    Errors for individual tenants are isolated and do not abort the loop.
-    """
+async def _load_profiles_with_gps() -> list[RestaurantProfile]:
+    """Return every restaurant profile that has GPS coordinates configured."""
     async with AsyncSessionLocal() as session:
         result = await session.execute(
             select(RestaurantProfile).where(
@@ -55,53 +59,65 @@ async def run_weather_sync_all_tenants() -> None:
                 RestaurantProfile.longitude.isnot(None),
             )
         )
-        profiles = result.scalars().all()
-
-    logger.info("Weather sync: %d properties to process", len(profiles))
-
-    for profile in profiles:
-        try:
-            async with AsyncSessionLocal() as db:
-                count = await _service.sync_property(profile.tenant_id, db)
-            logger.info("Weather sync OK  tenant=%s  rows=%d", profile.tenant_id, count)
-        except Exception as exc:  # noqa: BLE001
-            logger.error(
-                "Weather sync FAILED  tenant=%s  error=%s",
-                profile.tenant_id,
-                exc,
-                exc_info=True,
-            )
+        return list(result.scalars().all())
 
-    logger.info("Weather sync job finished")
 
+async def _sync_all_cells() -> None:
+    """Group properties by grid cell, batch-fetch all cells, store each once.
 
-async def _run_weather_sync_for_all_tenants() -> None:
-    """Iterate every property with GPS coords and sync weather (interval scheduler)."""
-    service = WeatherIngestionService()
+    Registered directly on APScheduler (every 12 hours).
 
-    async with AsyncSessionLocal() as session:
-        result = await session.execute(
-            select(RestaurantProfile).where(
-                RestaurantProfile.latitude.isnot(None),
-                RestaurantProfile.longitude.isnot(None),
-            )
+    One pooled HTTP client serves the whole job; cells are fetched in
+    multi-location batches. Errors for individual cells (or batches) are
+    isolated and do not abort the loop.
+    """
+    profiles = await _load_profiles_with_gps()
+    cells = group_by_cell(profiles)
+
+    logger.info(
+        "Weather sync: %d properties in %d grid cells to process",
+        len(profiles),
+        len(cells),
+    )
+
+    async with httpx.AsyncClient(timeout=15, limits=_HTTP_LIMITS) as client:
+        service = WeatherIngestionService(http_client=client)
+        async with AsyncSessionLocal() as db:
+            stale = await service.stale_cells([cell for cell, _ in cells.values()], db)
+        stale_ids = {cell.cell_id for cell in stale}
+        logger.info(
+            "Weather sync: %d cells stale, %d served from cache",
+            len(stale_ids),
+            len(cells) - len(stale_ids),
         )
-        profiles = result.scalars().all()
-
-    logger.info("Weather sync: %d properties to process", len(profiles))
-
-    for profile in profiles:
-        try:
-            async with AsyncSessionLocal() as db:
-                rows = await service.sync_for_tenant(db, profile)
-            logger.info("Weather synced  tenant=%s  new_rows=%d", profile.tenant_id, rows)
-        except Exception as exc:  # noqa: BLE001
-            logger.error(
-                "Weather sync FAILED  tenant=%s  error=%s",
-                profile.tenant_id,
-                exc,
-                exc_info=True,
-            )
+        payloads = await service.fetch_cells(stale)
+
+        for cell, members in cells.values():
+            tenants = [p.tenant_id for p in members]
+            raw = payloads.get(cell.cell_id)
+            if cell.cell_id in stale_ids and raw is None:
+                continue  # batch failure already logged by fetch_cells
+            try:
+                async with AsyncSessionLocal() as db:
+                    if raw is None:
+                        # Fresh cell: keep links current for newly added properties
+                        await service.link_properties(cell, members, db)
+                        continue
+                    count = await service.store_cell(cell, members, raw, db)
+                logger.info(
+                    "Weather sync OK  cell=%s  tenants=%s  rows=%d",
+                    cell.cell_id,
+                    tenants,
+                    count,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.error(
+                    "Weather sync FAILED  cell=%s  tenants=%s  error=%s",
+                    cell.cell_id,
+                    tenants,
+                    exc,
+                    exc_info=True,
+                )
 
     logger.info("Weather sync job finished")
 
@@ -114,7 +130,7 @@ def create_weather_scheduler() -> AsyncIOScheduler:
     """
     scheduler = AsyncIOScheduler()
     scheduler.add_job(
-        run_weather_sync_all_tenants,
+        _sync_all_cells,
         trigger=CronTrigger(hour="0,12", minute=0, timezone="UTC"),
         id="weather_sync",
         name="Weather Forecast Sync (12h)",
@@ -123,10 +139,11 @@ def create_weather_scheduler() -> AsyncIOScheduler:
     )
     return scheduler
 
+
 def start_weather_scheduler() -> None:
     """Register the 12-hour weather job and start the scheduler."""
     _scheduler.add_job(
-        _run_weather_sync_for_all_tenants,
+        _sync_all_cells,
         trigger=IntervalTrigger(hours=12),
         id="weather_sync_12h",
         replace_existing=True,
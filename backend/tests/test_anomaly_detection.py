@@ -11,6 +11,8 @@ Test categories:
   6. Integration — POST /api/v1/anomalies/scan returns 202
   7. Integration — RLS tenant isolation
   8. Performance — run_full_scan() with 50 mocked properties under 5s
+  9. Unit — weighted event impact + EventSpatialIndex
+ 10. Unit — weather_window_modifier() over ingestion rollups
 """
 from __future__ import annotations
 
@@ -27,8 +29,16 @@ from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 
 from app.core.error_handlers import problem_details_handler
+from app.db.models import WeatherCellWindow
 from app.services.anomaly_detection import AnomalyDetectionService
-from app.services.demand_modifiers import event_modifier, weather_modifier
+from app.services.demand_modifiers import (
+    event_impact,
+    event_modifier,
+    weather_modifier,
+    weather_window_modifier,
+)
+from app.services.event_ingestion import haversine_km
+from app.services.event_spatial_index import EventSpatialIndex, NearbyEvent
 
 
 # ===========================================================================
@@ -182,6 +192,16 @@ class TestEventModifier:
 # ===========================================================================
 # 4. Unit — detect_for_property() (mocked DB)
 # ===========================================================================
+def _storm_window() -> WeatherCellWindow:
+    """4-hour rollup whose worst hour is a thunderstorm (WMO 95) → -20%."""
+    return WeatherCellWindow(
+        worst_condition_code=95,
+        max_precipitation_prob=80,
+        mean_temperature_c=18.0,
+        mean_wind_speed_kmh=20.0,
+    )
+
+
 class TestDetectForProperty:
     """AC 2, 3, 4, 5 — mocked DB scenarios."""
 
@@ -213,8 +233,7 @@ class TestDetectForProperty:
         Use two conferences (+25% + capped remainder) to push above 20%.
         """
         # thunderstorm: -0.20, two conferences: +0.25+0.25 = +0.50 combined → net +0.30 → +30%
-        weather_mock = MagicMock()
-        weather_mock.condition_code = "thunderstorm"
+        weather_mock = _storm_window()
         events = [_make_event("conference", "ev-1"), _make_event("conference", "ev-2")]
 
         with (
@@ -238,8 +257,7 @@ class TestDetectForProperty:
         # Rain alone gives -10%, which is below the 20% threshold, so no anomaly.
         # Use snow (-15%) + rain scenario won't work directly because they're separate calls.
         # To create a lull anomaly we need deviation >= 20%: use thunderstorm (-20%).
-        weather_mock = MagicMock()
-        weather_mock.condition_code = "thunderstorm"
+        weather_mock = _storm_window()
 
         with (
             patch.object(self.service, "_get_baseline_demand", return_value=Decimal("1000.00")),
@@ -258,8 +276,7 @@ class TestDetectForProperty:
     @pytest.mark.asyncio
     async def test_triggering_factors_included(self):
         """AC 5: triggering_factors must include weather and event entries."""
-        weather_mock = MagicMock()
-        weather_mock.condition_code = "thunderstorm"
+        weather_mock = _storm_window()
         events = [_make_event("conference", "conf-1"), _make_event("concert", "conc-1")]
 
         with (
@@ -291,8 +308,7 @@ class TestIdempotency:
         property_id = uuid.uuid4()
         tenant_id = uuid.uuid4()
 
-        weather_mock = MagicMock()
-        weather_mock.condition_code = "thunderstorm"
+        weather_mock = _storm_window()
 
         upserted_windows: List[List[str]] = []
 
@@ -387,8 +403,7 @@ class TestTenantIsolation:
         property_id = uuid.uuid4()
         tenant_id_a = uuid.uuid4()
 
-        weather_mock = MagicMock()
-        weather_mock.condition_code = "thunderstorm"
+        weather_mock = _storm_window()
 
         captured: List[dict] = []
 
@@ -427,7 +442,7 @@ class TestNFR5Performance:
         ]
 
         # Mock detect_for_property to be nearly instant (simulates I/O-bound with gather)
-        async def mock_detect(db, property_id, tenant_id):
+        async def mock_detect(db, property_id, tenant_id, **kwargs):
             await asyncio.sleep(0.01)  # 10ms per property
             return []
 
@@ -438,7 +453,10 @@ class TestNFR5Performance:
         mock_result.fetchall.return_value = property_rows
         mock_db.execute = AsyncMock(return_value=mock_result)
 
-        with patch.object(service, "detect_for_property", side_effect=mock_detect):
+        with (
+            patch.object(service, "detect_for_property", side_effect=mock_detect),
+            patch.object(service, "_load_event_index", return_value=(None, {})),
+        ):
             t_start = time.monotonic()
             await service.run_full_scan(mock_db)
             elapsed = time.monotonic() - t_start
@@ -452,3 +470,199 @@ class TestNFR5Performance:
             f"run_full_scan is not running in parallel: elapsed={elapsed:.3f}s "
             f"(expected ~0.01s with gather)"
         )
+
+
+# ===========================================================================
+# 9. Unit — weighted event impact + EventSpatialIndex
+# ===========================================================================
+def _nearby(
+    category: str = "conference",
+    attendance: int | None = 5000,
+    distance_km: float | None = 0.0,
+    rank: int | None = None,
+    event_id: str = "ev-w",
+) -> NearbyEvent:
+    start = datetime(2026, 10, 20, 8, tzinfo=timezone.utc)
+    return NearbyEvent(
+        event_id=event_id,
+        category=category,
+        rank=rank,
+        phq_attendance=attendance,
+        start_dt=start,
+        end_dt=start + timedelta(hours=6),
+        distance_km=distance_km,
+    )
+
+
+def _catalog_point(event_id: str, lat: float, lng: float) -> MagicMock:
+    e = MagicMock()
+    e.event_id = event_id
+    e.category = "concerts"
+    e.rank = 60
+    e.phq_attendance = 2000
+    e.start_dt = datetime(2026, 10, 20, 18, tzinfo=timezone.utc)
+    e.end_dt = datetime(2026, 10, 20, 23, tzinfo=timezone.utc)
+    e.latitude = lat
+    e.longitude = lng
+    return e
+
+
+class TestWeightedEventImpact:
+    def test_reference_event_at_property_gets_full_category_offset(self):
+        assert event_impact(_nearby()) == pytest.approx(0.25)
+
+    def test_larger_attendance_has_more_impact(self):
+        small = event_impact(_nearby(attendance=300))
+        large = event_impact(_nearby(attendance=40000))
+        assert small < 0.25 < large
+
+    def test_distance_decay_halves_at_half_life(self):
+        near = event_impact(_nearby(distance_km=0.0))
+        far = event_impact(_nearby(distance_km=1.5))
+        assert far == pytest.approx(near / 2)
+
+    def test_rank_fallback_when_attendance_unknown(self):
+        assert event_impact(_nearby(attendance=None, rank=100)) == pytest.approx(0.50)
+
+    def test_predicthq_plural_categories_are_mapped(self):
+        assert event_impact(_nearby(category="conferences")) == pytest.approx(0.25)
+        assert event_impact(_nearby(category="concerts")) == pytest.approx(0.20)
+
+    def test_strongest_events_consume_cap_first(self):
+        events = [
+            _nearby(event_id="far", distance_km=4.0),
+            _nearby(event_id="near-1"),
+            _nearby(event_id="near-2"),
+        ]
+        mod, factors = event_modifier(events)
+        assert mod == pytest.approx(0.50)
+        assert [f["event_id"] for f in factors] == ["near-1", "near-2"]
+        assert factors[0]["distance_km"] == 0.0
+
+
+class TestEventSpatialIndex:
+    def test_nearby_filters_by_radius_and_sorts(self):
+        index = EventSpatialIndex([
+            _catalog_point("close", 48.8570, 2.3530),
+            _catalog_point("mid", 48.8700, 2.3522),
+            _catalog_point("out", 48.9500, 2.3522),
+            _catalog_point("nogeo", None, None),
+        ])
+        found = index.nearby(48.8566, 2.3522, radius_km=5)
+        assert [e.event_id for e in found] == ["close", "mid"]
+        assert found[0].distance_km < found[1].distance_km
+        assert len(index) == 3
+
+    def test_unlocated_events_returned_only_for_linked_property(self):
+        nogeo = _catalog_point("nogeo", None, None)
+        index = EventSpatialIndex(
+            [_catalog_point("close", 48.8570, 2.3530), nogeo],
+            unlocated_links=[("tenant_a", nogeo)],
+        )
+        found = index.nearby(48.8566, 2.3522, radius_km=5, linked_to="tenant_a")
+        assert [e.event_id for e in found] == ["close", "nogeo"]
+        assert found[1].distance_km is None
+        other = index.nearby(48.8566, 2.3522, radius_km=5, linked_to="tenant_b")
+        assert [e.event_id for e in other] == ["close"]
+
+    def test_wraps_across_antimeridian(self):
+        index = EventSpatialIndex([_catalog_point("fiji", -17.0, -179.99)])
+        found = index.nearby(-17.0, 179.99, radius_km=5)
+        assert [e.event_id for e in found] == ["fiji"]
+
+    def test_matches_brute_force(self):
+        import random
+
+        rng = random.Random(7)
+        points = [
+            _catalog_point(f"e{i}", 48.5 + rng.random(), 2.0 + rng.random())
+            for i in range(400)
+        ]
+        index = EventSpatialIndex(points, cell_km=2.0)
+        for _ in range(25):
+            lat, lng = 48.5 + rng.random(), 2.0 + rng.random()
+            expected = {
+                p.event_id for p in points
+                if haversine_km(lat, lng, p.latitude, p.longitude) <= 5
+            }
+            assert {e.event_id for e in index.nearby(lat, lng, 5)} == expected
+
+    @pytest.mark.asyncio
+    async def test_detect_uses_index_without_per_window_queries(self):
+        service = AnomalyDetectionService()
+        now = datetime.now(timezone.utc)
+        big = _catalog_point("stadium", 48.8570, 2.3530)
+        big.category = "conferences"
+        big.phq_attendance = 80000
+        big.start_dt = now
+        big.end_dt = now + timedelta(days=14)
+        index = EventSpatialIndex([big, _catalog_point("far", 45.0, 5.0)])
+
+        captured: List[dict] = []
+
+        async def capture_upsert(db, anomalies):
+            captured.extend(anomalies)
+            return [a["id"] for a in anomalies]
+
+        mock_db = AsyncMock()
+        with (
+            patch.object(service, "_get_baseline_demand", return_value=Decimal("1000.00")),
+            patch.object(service, "_get_weather_for_window", return_value=None),
+            patch.object(service, "_bulk_upsert", side_effect=capture_upsert),
+        ):
+            await service.detect_for_property(
+                mock_db,
+                uuid.uuid4(),
+                uuid.uuid4(),
+                event_index=index,
+                coordinates=(48.8566, 2.3522),
+            )
+
+        mock_db.execute.assert_not_called()
+        assert captured, "expected surge anomalies from the nearby stadium event"
+        event_ids = {
+            f["event_id"]
+            for a in captured
+            for f in a["triggering_factors"]
+            if f["type"] == "event"
+        }
+        assert event_ids == {"stadium"}
+
+
+# ===========================================================================
+# 10. Unit — weather_window_modifier() over ingestion rollups
+# ===========================================================================
+class TestWeatherWindowModifier:
+    def _window(self, code, precip=None, temp=None, wind=None) -> WeatherCellWindow:
+        return WeatherCellWindow(
+            worst_condition_code=code,
+            max_precipitation_prob=precip,
+            mean_temperature_c=temp,
+            mean_wind_speed_kmh=wind,
+        )
+
+    def test_worst_code_drives_condition(self):
+        mod, factor = weather_window_modifier(self._window(95, precip=80, temp=18.0, wind=10.0))
+        assert mod == pytest.approx(-0.20)
+        assert factor["condition"] == "thunderstorm"
+        assert factor["precipitation_prob"] == 80
+        assert factor["temperature_c"] == 18.0
+
+    def test_dry_code_with_high_precip_counts_as_showers(self):
+        mod, factor = weather_window_modifier(self._window(2, precip=70))
+        assert factor["condition"] == "showers"
+        assert mod == pytest.approx(-0.10)
+
+    def test_strong_wind_adds_penalty(self):
+        mod, _ = weather_window_modifier(self._window(0, precip=0, wind=45.0))
+        assert mod == pytest.approx(0.05 - 0.05)
+
+    def test_unknown_code_has_no_impact(self):
+        mod, factor = weather_window_modifier(self._window(None))
+        assert mod == 0.0
+        assert factor["condition"] == "unknown"
+
+    def test_weather_modifier_accepts_raw_wmo_code(self):
+        mod, factor = weather_modifier(61)
+        assert mod == -0.10
+        assert factor["condition"] == "rain"
@@ -0,0 +1,178 @@
+"""
+Tests for the process-wide Apaleo token cache and pooled HTTP client.
+
+Coverage:
+  - ApaleoTokenManager   concurrent callers share one refresh (single-flight)
+  - ApaleoTokenManager   cached until the expiry buffer, then refreshed
+  - ApaleoTokenManager   tokens keyed by scope; invalidate() forces refresh
+  - get_apaleo_http_client  one client per event loop, recreated after close
+  - ApaleoPMSAdapter     new instances reuse the shared token + pooled client
+  - ApaleoPMSAdapter     401 drops the shared token
+  - ApaleoMCPClient      shares the same token manager
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.integrations import apaleo_http
+from app.integrations.apaleo_http import (
+    ApaleoTokenManager,
+    close_apaleo_http_client,
+    get_apaleo_http_client,
+)
+from app.integrations.apaleo_mcp_client import ApaleoMCPClient
+from app.services.apaleo_adapter import ApaleoPMSAdapter, ApaleoSyncError
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _token_response(token: str = "tok-1", expires_in: int = 3600) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.raise_for_status = MagicMock()
+    resp.json.return_value = {"access_token": token, "expires_in": expires_in}
+    return resp
+
+
+def _json_response(status_code: int, payload: dict | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = payload or {}
+    return resp
+
+
+def _http_client(**responses) -> AsyncMock:
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.post = AsyncMock(return_value=responses.get("post", _token_response()))
+    client.get = AsyncMock(return_value=responses.get("get", _json_response(200)))
+    return client
+
+
+# ---------------------------------------------------------------------------
+# ApaleoTokenManager
+# ---------------------------------------------------------------------------
+
+class TestTokenManager:
+    async def test_concurrent_callers_share_one_refresh(self) -> None:
+        manager = ApaleoTokenManager()
+        http = _http_client()
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _token_response("shared")
+
+        http.post = AsyncMock(side_effect=slow_post)
+
+        results = await asyncio.gather(
+            *(manager.get_token("id", "secret", http_client=http) for _ in range(10))
+        )
+
+        assert {token for token, _ in results} == {"shared"}
+        http.post.assert_awaited_once()
+
+    async def test_cached_until_expiry_buffer(self) -> None:
+        manager = ApaleoTokenManager()
+        http = _http_client()
+
+        await manager.get_token("id", "secret", http_client=http)
+        await manager.get_token("id", "secret", http_client=http)
+        assert http.post.await_count == 1
+
+        # 30s left is inside the 60s buffer → refreshed
+        with patch.object(apaleo_http.time, "time", return_value=time.time() + 3600 - 30):
+            await manager.get_token("id", "secret", http_client=http)
+        assert http.post.await_count == 2
+
+    async def test_scope_is_part_of_the_cache_key(self) -> None:
+        manager = ApaleoTokenManager()
+        http = _http_client()
+
+        await manager.get_token("id", "secret", "read:occupancy", http_client=http)
+        await manager.get_token("id", "secret", http_client=http)
+
+        assert http.post.await_count == 2
+        assert http.post.await_args_list[0].kwargs["data"]["scope"] == "read:occupancy"
+        assert "scope" not in http.post.await_args_list[1].kwargs["data"]
+
+    async def test_invalidate_forces_refresh(self) -> None:
+        manager = ApaleoTokenManager()
+        http = _http_client()
+
+        await manager.get_token("id", "secret", http_client=http)
+        manager.invalidate("id")
+        await manager.get_token("id", "secret", http_client=http)
+
+        assert http.post.await_count == 2
+
+    async def test_missing_credentials_raise(self) -> None:
+        with pytest.raises(ValueError, match="credentials missing"):
+            await ApaleoTokenManager().get_token("", "", http_client=_http_client())
+
+
+# ---------------------------------------------------------------------------
+# Pooled HTTP client
+# ---------------------------------------------------------------------------
+
+class TestSharedHttpClient:
+    async def test_same_client_within_a_loop(self) -> None:
+        try:
+            assert get_apaleo_http_client() is get_apaleo_http_client()
+        finally:
+            await close_apaleo_http_client()
+
+    async def test_recreated_after_close(self) -> None:
+        first = get_apaleo_http_client()
+        await close_apaleo_http_client()
+        second = get_apaleo_http_client()
+        try:
+            assert first.is_closed
+            assert second is not first
+        finally:
+            await close_apaleo_http_client()
+
+
+# ---------------------------------------------------------------------------
+# Adapters on the shared cache
+# ---------------------------------------------------------------------------
+
+class TestAdaptersShareTokens:
+    async def test_new_rest_adapters_reuse_token_and_client(self) -> None:
+        manager = ApaleoTokenManager()
+        http = _http_client(get=_json_response(200, {"occupancy": 72}))
+
+        for _ in range(3):
+            adapter = ApaleoPMSAdapter("id", "secret", http_client=http, token_manager=manager)
+            assert await adapter.get_occupancy("MUC", date(2026, 3, 30)) == 72
+
+        http.post.assert_awaited_once()  # one token request
+        assert http.get.await_count == 3
+        assert http.get.await_args.kwargs["headers"] == {"Authorization": "Bearer tok-1"}
+
+    async def test_401_drops_shared_token(self) -> None:
+        manager = ApaleoTokenManager()
+        http = _http_client(get=_json_response(401))
+        adapter = ApaleoPMSAdapter("id", "secret", http_client=http, token_manager=manager)
+
+        with pytest.raises(ApaleoSyncError, match="401"):
+            await adapter.get_revenue("MUC", date(2026, 3, 30))
+
+        assert adapter.access_token is None
+        await adapter._authenticate()
+        assert http.post.await_count == 2
+
+    async def test_mcp_client_uses_shared_manager(self) -> None:
+        manager = ApaleoTokenManager()
+        manager.get_token = AsyncMock(return_value=("tok-mcp", time.time() + 3600))  # type: ignore[method-assign]
+
+        client = ApaleoMCPClient("id", "secret", "https://mcp.example.com", token_manager=manager)
+
+        assert await client._get_token() == "tok-mcp"
+        manager.get_token.assert_awaited_once_with("id", "secret")
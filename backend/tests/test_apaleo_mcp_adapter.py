@@ -1,17 +1,22 @@
 """
 Tests for ApaleoMCPAdapter and ApaleoMCPClient.
 
-These tests mock the MCP transport layer so no live server is required.
+These tests mock the MCP transport layer so no live server is required,
+including the persistent session pool (reuse, reconnect, cached tools).
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.integrations.apaleo_mcp_client import ApaleoMCPClient
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+from app.integrations.apaleo_mcp_client import ApaleoMCPClient, ApaleoMCPSessionPool
 from app.services.apaleo_mcp_adapter import ApaleoMCPAdapter
 
 
@@ -99,6 +104,182 @@ class TestApaleoMCPClientCallTool:
         assert result == {"occupancy": 85}
 
 
+# ---------------------------------------------------------------------------
+# ApaleoMCPSessionPool — persistent sessions
+# ---------------------------------------------------------------------------
+
+class _FakeMCPServer:
+    """Stands in for streamablehttp_client + ClientSession; one session per connect."""
+
+    def __init__(self) -> None:
+        self.headers: list[dict] = []
+        self.sessions: list[AsyncMock] = []
+
+    def transport(self, url: str, headers: dict) -> MagicMock:
+        self.headers.append(headers)
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=("r", "w", lambda: None))
+        cm.__aexit__ = AsyncMock(return_value=False)
+        return cm
+
+    def session(self, read_stream, write_stream) -> MagicMock:
+        content = MagicMock()
+        content.type = "text"
+        content.text = '{"ok": true}'
+        tool = MagicMock()
+        tool.name = "APALEO_GET_OCCUPANCY_METRICS"
+        session = AsyncMock()
+        session.call_tool = AsyncMock(return_value=MagicMock(content=[content]))
+        session.list_tools = AsyncMock(return_value=MagicMock(tools=[tool]))
+        self.sessions.append(session)
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=session)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        return cm
+
+
+@pytest.fixture
+def mcp_server():
+    server = _FakeMCPServer()
+    with (
+        patch("app.integrations.apaleo_mcp_client.streamablehttp_client",
+              side_effect=server.transport),
+        patch("app.integrations.apaleo_mcp_client.ClientSession", side_effect=server.session),
+    ):
+        yield server
+
+
+@pytest.fixture
+async def pooled_client(mcp_server: _FakeMCPServer):
+    token = AsyncMock(return_value="tok")
+    pool = ApaleoMCPSessionPool("https://mcp.example.com", token, size=2)
+    client = ApaleoMCPClient("id", "secret", "https://mcp.example.com", session_pool=pool)
+    client.token = token  # type: ignore[attr-defined]
+    yield client
+    await pool.close()
+
+
+class TestSessionPool:
+    async def test_calls_reuse_one_initialised_session(
+        self, pooled_client: ApaleoMCPClient, mcp_server: _FakeMCPServer
+    ) -> None:
+        for _ in range(3):
+            assert await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {}) == {"ok": True}
+
+        assert len(mcp_server.sessions) == 1
+        mcp_server.sessions[0].initialize.assert_awaited_once()
+        assert mcp_server.sessions[0].call_tool.await_count == 3
+
+    async def test_token_rotation_reconnects(
+        self, pooled_client: ApaleoMCPClient, mcp_server: _FakeMCPServer
+    ) -> None:
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+        pooled_client.token.return_value = "tok-2"  # type: ignore[attr-defined]
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+
+        assert [h["Authorization"] for h in mcp_server.headers] == ["Bearer tok", "Bearer tok-2"]
+
+    async def test_transport_failure_on_read_reconnects_and_retries(
+        self, pooled_client: ApaleoMCPClient, mcp_server: _FakeMCPServer
+    ) -> None:
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+        mcp_server.sessions[0].call_tool.side_effect = ConnectionError("stream closed")
+
+        result = await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+
+        assert result == {"ok": True}
+        assert len(mcp_server.sessions) == 2
+
+    async def test_write_is_not_retried(
+        self,
+        pooled_client: ApaleoMCPClient,
+        mcp_server: _FakeMCPServer,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("APALEO_READONLY", "false")
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+        mcp_server.sessions[0].call_tool.side_effect = ConnectionError("stream closed")
+
+        with pytest.raises(ConnectionError):
+            await pooled_client.call_tool("APALEO_UPDATE_SCHEDULE", {})
+        assert len(mcp_server.sessions) == 1
+
+    async def test_tool_error_keeps_session(
+        self, pooled_client: ApaleoMCPClient, mcp_server: _FakeMCPServer
+    ) -> None:
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+        mcp_server.sessions[0].call_tool.side_effect = McpError(
+            ErrorData(code=-32602, message="bad arguments")
+        )
+        with pytest.raises(McpError):
+            await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+
+        mcp_server.sessions[0].call_tool.side_effect = None
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+        assert len(mcp_server.sessions) == 1
+
+    async def test_idle_session_failing_ping_is_replaced(
+        self, pooled_client: ApaleoMCPClient, mcp_server: _FakeMCPServer
+    ) -> None:
+        await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+        mcp_server.sessions[0].send_ping.side_effect = ConnectionError("gone")
+
+        with patch("app.integrations.apaleo_mcp_client._PING_AFTER_IDLE", 0.0):
+            await pooled_client.call_tool("APALEO_GET_OCCUPANCY_METRICS", {})
+
+        mcp_server.sessions[0].send_ping.assert_awaited_once()
+        assert len(mcp_server.sessions) == 2
+
+    async def test_tool_list_is_cached(
+        self, pooled_client: ApaleoMCPClient, mcp_server: _FakeMCPServer
+    ) -> None:
+        first = await pooled_client.list_tools()
+        second = await pooled_client.list_tools()
+        await pooled_client.list_tools(refresh=True)
+
+        assert [t.name for t in first] == ["APALEO_GET_OCCUPANCY_METRICS"]
+        assert second is first
+        assert mcp_server.sessions[0].list_tools.await_count == 2
+
+
+    async def test_hanging_handshake_times_out_and_stops_owner_task(
+        self, mcp_server: _FakeMCPServer
+    ) -> None:
+        cancelled = asyncio.Event()
+        original_session = mcp_server.session
+
+        def _hanging_session(read_stream, write_stream):
+            cm = original_session(read_stream, write_stream)
+
+            async def _initialize():
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            mcp_server.sessions[-1].initialize = AsyncMock(side_effect=_initialize)
+            return cm
+
+        token = AsyncMock(return_value="tok")
+        pool = ApaleoMCPSessionPool("https://mcp.example.com", token)
+        with (
+            patch("app.integrations.apaleo_mcp_client.ClientSession",
+                  side_effect=_hanging_session),
+            patch("app.integrations.apaleo_mcp_client._CONNECT_TIMEOUT", 0.05),
+            pytest.raises(asyncio.TimeoutError),
+        ):
+            async with pool.acquire():
+                pass
+
+        assert cancelled.is_set()
+        owners = [
+            t for t in asyncio.all_tasks()
+            if t.get_coro().__qualname__ == "_PooledSession._run"
+        ]
+        assert owners == []
+
+
 # ---------------------------------------------------------------------------
 # ApaleoMCPAdapter — get_occupancy
 # ---------------------------------------------------------------------------
@@ -335,17 +335,16 @@ class TestApaleoPMSAdapterWriteGuard:
         monkeypatch.setenv("APALEO_READONLY", "false")
         adapter.access_token = "tok"
         adapter.token_expiry = float("inf")
-        with patch("app.services.apaleo_adapter.httpx.AsyncClient") as mock_client_cls:
-            mock_response = MagicMock()
-            mock_response.status_code = 201
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        with patch("app.services.apaleo_adapter.get_apaleo_http_client", return_value=mock_client):
             result = await adapter.update_staffing_in_pms(
                 "MUC", date(2026, 3, 30), {"waiter": 1}
             )
         assert result is True
+        mock_client.post.assert_awaited_once()
 
 
 # ===========================================================================
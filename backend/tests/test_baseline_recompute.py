@@ -0,0 +1,158 @@
+"""Tests for the portfolio-wide captation baseline recompute.
+
+Coverage:
+  - every tenant with sync data recomputed; results equal calculate_baseline
+  - results written once per batch; tenants below MIN_DATA_POINTS get
+    running aggregates only
+  - per-tenant failures isolated; concurrency bounded
+  - POST /baselines/recalculate: superusers only
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.api.routes import baselines
+from app.core.security import get_current_user
+from app.db.models import Base, CaptationBaseline, CaptationRunningStats, PMSSyncLog
+from app.services.baseline_recompute import recompute_portfolio
+from app.services.captation_service import CaptationService
+
+_SESSION = "app.services.baseline_recompute.AsyncSessionLocal"
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        for tenant_id, days in (("hotel_a", 14), ("hotel_b", 3), ("hotel_c", 20)):
+            session.add_all(
+                PMSSyncLog(tenant_id=tenant_id, sync_date=date(2025, 1, 1) + timedelta(days=i),
+                           occupancy=100, fb_revenue=1500.0 + 50 * (i % 7), status="success")
+                for i in range(days)
+            )
+        await session.commit()
+
+    yield factory
+
+    await engine.dispose()
+
+
+class TestRecomputePortfolio:
+    @pytest.mark.asyncio
+    async def test_recomputes_all_tenants_in_batches(self, session_factory):
+        with (
+            patch(_SESSION, session_factory),
+            patch.object(CaptationService, "store_baselines",
+                         autospec=True, side_effect=CaptationService.store_baselines) as store,
+        ):
+            outcomes = await recompute_portfolio(batch_size=2)
+
+        by_tenant = {o.tenant_id: o for o in outcomes}
+        assert {t: o.status for t, o in by_tenant.items()} == {
+            "hotel_a": "recalculated",
+            "hotel_b": "insufficient_data",
+            "hotel_c": "recalculated",
+        }
+        assert by_tenant["hotel_c"].data_points == 20
+        assert all(o.duration_ms >= 0 for o in outcomes)
+        assert store.call_count == 2
+
+        async with session_factory() as db:
+            stored = {b.tenant_id: b for b in (await db.execute(select(CaptationBaseline))).scalars()}
+            assert set(stored) == {"hotel_a", "hotel_c"}
+            assert await db.get(CaptationRunningStats, "hotel_b") is not None
+            expected = await CaptationService().calculate_baseline("hotel_c", db)
+        assert stored["hotel_c"].avg_fb_revenue_per_room == pytest.approx(expected.avg_fb_revenue_per_room)
+        assert stored["hotel_c"].dow_factors == expected.dow_factors
+
+    @pytest.mark.asyncio
+    async def test_failing_tenant_is_isolated(self, session_factory):
+        original = CaptationService.aggregate_stats
+
+        async def _aggregate(self, tenant_id, db):
+            if tenant_id == "hotel_a":
+                raise RuntimeError("statement timeout")
+            return await original(self, tenant_id, db)
+
+        with (
+            patch(_SESSION, session_factory),
+            patch.object(CaptationService, "aggregate_stats", _aggregate),
+        ):
+            outcomes = await recompute_portfolio(["hotel_a", "hotel_c"])
+
+        assert [(o.tenant_id, o.status) for o in outcomes] == [
+            ("hotel_a", "failed"), ("hotel_c", "recalculated"),
+        ]
+        assert "timeout" in outcomes[0].error
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, session_factory):
+        state = {"in_flight": 0, "max": 0}
+        original = CaptationService.aggregate_stats
+
+        async def _aggregate(self, tenant_id, db):
+            state["in_flight"] += 1
+            state["max"] = max(state["max"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return await original(self, tenant_id, db)
+
+        with (
+            patch(_SESSION, session_factory),
+            patch.object(CaptationService, "aggregate_stats", _aggregate),
+        ):
+            await recompute_portfolio([f"hotel_{i}" for i in range(6)], concurrency=2)
+
+        assert state["max"] == 2
+
+
+def _baselines_app(is_superuser: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(baselines.router)
+    app.dependency_overrides[get_current_user] = lambda: {
+        "id": "u1", "email": "ops@example.com", "is_superuser": is_superuser,
+    }
+    return app
+
+
+class TestRecalculatePortfolioRoute:
+    @pytest.mark.asyncio
+    async def test_regular_user_is_forbidden(self):
+        with patch.object(baselines, "run_baseline_recompute") as run:
+            async with AsyncClient(
+                transport=ASGITransport(app=_baselines_app(False)), base_url="http://test"
+            ) as client:
+                resp = await client.post("/baselines/recalculate", json={})
+
+        assert resp.status_code == 403
+        run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_superuser_starts_recompute(self):
+        with patch.object(baselines, "run_baseline_recompute") as run:
+            async with AsyncClient(
+                transport=ASGITransport(app=_baselines_app(True)), base_url="http://test"
+            ) as client:
+                resp = await client.post(
+                    "/baselines/recalculate", json={"tenant_ids": ["hotel_a"]}
+                )
+
+        assert resp.status_code == 202
+        run.assert_called_once_with(["hotel_a"])
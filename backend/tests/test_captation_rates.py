@@ -0,0 +1,161 @@
+"""Tests for the hour-block captation_rates materializer (Story 2.4 → 3.3a).
+
+Coverage:
+  - block_rates(): 42 rows, weekday factor and block shares applied
+  - CaptationRatesService.refresh(): one row set per active property,
+    idempotent upsert, no-op without properties
+  - AnomalyDetectionService: baseline served from the materialized rows,
+    read once per property scan
+"""
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, CaptationBaseline, CaptationRate, PMSSyncLog
+from app.services.anomaly_detection import AnomalyDetectionService
+from app.services.captation_rates import (
+    HOUR_BLOCK_SHARES,
+    CaptationRatesService,
+    block_rates,
+)
+from app.services.captation_service import CaptationService
+
+TENANT = "hotel_a"
+PROPERTY = str(uuid.uuid4())
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Not an ORM model: mirrors the Supabase table the anomaly scan reads
+        await conn.execute(text(
+            "CREATE TABLE properties (id TEXT PRIMARY KEY, tenant_id TEXT, is_active BOOLEAN)"
+        ))
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def _baseline(**overrides) -> CaptationBaseline:
+    values = dict(
+        tenant_id=TENANT,
+        period_start=date(2025, 1, 1),
+        period_end=date(2025, 1, 28),
+        avg_fb_revenue_per_room=20.0,
+        dow_factors={"0": 0.5, "5": 1.5},
+        monthly_factors={},
+        data_points_count=28,
+    )
+    values.update(overrides)
+    return CaptationBaseline(**values)
+
+
+async def _seed(session: AsyncSession, active_properties=(PROPERTY,)) -> CaptationBaseline:
+    for property_id in active_properties:
+        await session.execute(
+            text("INSERT INTO properties VALUES (:id, :tenant_id, 1)"),
+            {"id": property_id, "tenant_id": TENANT},
+        )
+    start = date(2025, 1, 1)
+    session.add_all(
+        PMSSyncLog(tenant_id=TENANT, sync_date=start + timedelta(days=i),
+                   occupancy=100, fb_revenue=2000.0, status="success")
+        for i in range(28)
+    )
+    await session.commit()
+    return await CaptationService().calculate_baseline(TENANT, session)
+
+
+class TestBlockRates:
+    def test_weekday_factor_and_block_share(self):
+        rates = {(dow, block): rev for dow, block, rev in block_rates(_baseline(), 80.0)}
+
+        assert len(rates) == 42
+        assert sum(HOUR_BLOCK_SHARES.values()) == pytest.approx(1.0)
+        # Monday: 20 × 0.5 × 80 = 800/day; Saturday 2400/day; Tuesday neutral 1600/day
+        assert rates[("monday", 12)] == pytest.approx(800 * HOUR_BLOCK_SHARES[12])
+        assert rates[("saturday", 16)] == pytest.approx(2400 * HOUR_BLOCK_SHARES[16])
+        assert sum(r for (dow, _), r in rates.items() if dow == "tuesday") == pytest.approx(1600)
+
+
+class TestRefresh:
+    @pytest.mark.asyncio
+    async def test_writes_42_rows_per_property_idempotently(self, async_session):
+        other = str(uuid.uuid4())
+        baseline = await _seed(async_session, active_properties=(PROPERTY, other))
+        service = CaptationRatesService()
+
+        assert await service.refresh(TENANT, async_session, baseline) == 84
+        assert await service.refresh(TENANT, async_session) == 84
+
+        count = await async_session.scalar(select(func.count()).select_from(CaptationRate))
+        assert count == 84
+        rate = await async_session.get(CaptationRate, (PROPERTY, "friday", 16))
+        # uniform history: 20/room × 100 rooms × dinner share
+        assert float(rate.baseline_revenue) == pytest.approx(2000 * HOUR_BLOCK_SHARES[16])
+
+    @pytest.mark.asyncio
+    async def test_no_active_property_is_noop(self, async_session):
+        baseline = await _seed(async_session, active_properties=())
+        assert await CaptationRatesService().refresh(TENANT, async_session, baseline) == 0
+
+
+class TestAnomalyLookup:
+    @pytest.mark.asyncio
+    async def test_baseline_served_from_materialized_rows(self, async_session):
+        baseline = await _seed(async_session)
+        await CaptationRatesService().refresh(TENANT, async_session, baseline)
+        service = AnomalyDetectionService()
+        cache: dict = {}
+        friday_evening = datetime(2025, 2, 7, 17, tzinfo=timezone.utc)
+
+        with patch.object(
+            service, "_load_captation_rates", wraps=service._load_captation_rates
+        ) as load:
+            demand = await service._get_baseline_demand(
+                async_session, PROPERTY, TENANT, friday_evening, cache=cache
+            )
+            await service._get_baseline_demand(
+                async_session, PROPERTY, TENANT, friday_evening + timedelta(hours=4), cache=cache
+            )
+
+        assert demand == Decimal(str(round(2000 * HOUR_BLOCK_SHARES[16], 2)))
+        assert load.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_property_falls_back(self, async_session):
+        demand = await AnomalyDetectionService()._get_baseline_demand(
+            async_session, uuid.uuid4(), TENANT, datetime(2025, 2, 7, 17, tzinfo=timezone.utc)
+        )
+        assert demand == Decimal("1000.00")
+
+    @pytest.mark.asyncio
+    async def test_scan_reads_rates_once_per_property(self):
+        service = AnomalyDetectionService()
+        with (
+            patch.object(service, "_load_captation_rates", new_callable=AsyncMock,
+                         return_value={}) as load,
+            patch.object(service, "_get_weather_for_window", return_value=None),
+            patch.object(service, "_get_events_for_window", return_value=[]),
+        ):
+            await service.detect_for_property(AsyncMock(), uuid.uuid4(), uuid.uuid4())
+
+        load.assert_awaited_once()
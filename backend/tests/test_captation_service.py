@@ -6,26 +6,34 @@ Acceptance criteria covered:
   AC2 — calculates seasonal (monthly) adjustment factors.
   AC3 — results are stored per tenant/property.
   AC4 — baseline recalculates automatically on new data ingestion (PMSSyncService hook).
+  Pushdown — calculate_baseline() aggregates in SQL and matches the
+    pandas reference implementation below (test oracle).
+  Incremental — record_sync() folds one sync into running aggregates and
+    matches a full recompute; calculate_baseline() rebuilds them (repair).
+  EWMA — decayed aggregates: incremental == recompute, recent days dominate,
+    half-life change triggers a rebuild.
 
 All tests run in-memory with mocked DB session; no live Supabase connection required.
 """
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
 
-from app.db.models import CaptationBaseline, PMSSyncLog
+from app.db.models import Base, CaptationBaseline, CaptationRunningStats, PMSSyncLog
 from app.services.captation_service import (
+    MIN_DATA_POINTS,
     CaptationService,
     InsufficientDataError,
-    MIN_DATA_POINTS,
 )
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -55,32 +63,72 @@ def _build_logs(n: int = 14, base_revenue: float = 2000.0, base_occ: int = 100)
 
 
 # ---------------------------------------------------------------------------
-# Unit tests — pure calculation logic (no DB)
+# Reference implementation — in-memory pandas oracle for the SQL/incremental
+# statistics computed by CaptationService
 # ---------------------------------------------------------------------------
 
-class TestCaptationServiceCalculations:
-    """Tests that exercise the private computation helpers directly."""
+def _reference_frame(rows: list[PMSSyncLog]) -> pd.DataFrame:
+    """ORM rows as a DataFrame with captation rate, weekday and month columns."""
+    df = pd.DataFrame(
+        [
+            {
+                "sync_date": pd.Timestamp(row.sync_date),
+                "occupancy": row.occupancy,
+                "fb_revenue": row.fb_revenue,
+            }
+            for row in rows
+        ]
+    )
+    df["captation_rate"] = df["fb_revenue"] / df["occupancy"]
+    df["dow"] = df["sync_date"].dt.dayofweek  # 0=Monday … 6=Sunday
+    df["month"] = df["sync_date"].dt.month     # 1–12
+    return df
+
+
+def _reference_overall_avg(df: pd.DataFrame) -> float:
+    return float(df["captation_rate"].mean())
+
+
+def _reference_factors(
+    df: pd.DataFrame, overall_avg: float, column: str, keys: range
+) -> dict[str, float]:
+    if overall_avg == 0:
+        return {str(k): 1.0 for k in keys}
+    avg = df.groupby(column)["captation_rate"].mean()
+    return {
+        str(k): round(float(avg[k]) / overall_avg, 4) if k in avg.index else 1.0
+        for k in keys
+    }
+
+
+def _reference_dow_factors(df: pd.DataFrame, overall_avg: float) -> dict[str, float]:
+    return _reference_factors(df, overall_avg, "dow", range(7))
 
-    def setup_method(self):
-        self.svc = CaptationService()
+
+def _reference_monthly_factors(df: pd.DataFrame, overall_avg: float) -> dict[str, float]:
+    return _reference_factors(df, overall_avg, "month", range(1, 13))
+
+
+class TestReferenceImplementation:
+    """Sanity checks of the oracle the service is compared against."""
 
     def test_to_dataframe_sets_captation_rate(self):
         logs = [_make_log(date(2025, 1, 6), occupancy=100, fb_revenue=2000.0)]
-        df = self.svc._to_dataframe(logs)
+        df = _reference_frame(logs)
         assert df["captation_rate"].iloc[0] == pytest.approx(20.0)
 
     def test_overall_avg_uniform_data(self):
         logs = _build_logs(n=14, base_revenue=2000.0, base_occ=100)
-        df = self.svc._to_dataframe(logs)
-        avg = self.svc._compute_overall_avg(df)
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
         assert avg == pytest.approx(20.0)
 
     def test_dow_factors_uniform_data_are_close_to_one(self):
         """With uniform captation rates all DoW factors should be ≈ 1.0."""
         logs = _build_logs(n=28)  # 4 full weeks → every weekday appears 4 times
-        df = self.svc._to_dataframe(logs)
-        avg = self.svc._compute_overall_avg(df)
-        factors = self.svc._compute_dow_factors(df, avg)
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        factors = _reference_dow_factors(df, avg)
 
         assert set(factors.keys()) == {str(d) for d in range(7)}
         for dow, val in factors.items():
@@ -96,9 +144,9 @@ class TestCaptationServiceCalculations:
             revenue = 3000.0 if is_weekend else 1500.0
             logs.append(_make_log(d, occupancy=100, fb_revenue=revenue))
 
-        df = self.svc._to_dataframe(logs)
-        avg = self.svc._compute_overall_avg(df)
-        factors = self.svc._compute_dow_factors(df, avg)
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        factors = _reference_dow_factors(df, avg)
 
         assert factors["5"] > 1.0, "Saturday factor should be > 1"
         assert factors["6"] > 1.0, "Sunday factor should be > 1"
@@ -108,9 +156,9 @@ class TestCaptationServiceCalculations:
     def test_monthly_factors_keys_cover_all_months(self):
         """monthly_factors must always have keys 1–12."""
         logs = _build_logs(n=14)
-        df = self.svc._to_dataframe(logs)
-        avg = self.svc._compute_overall_avg(df)
-        factors = self.svc._compute_monthly_factors(df, avg)
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        factors = _reference_monthly_factors(df, avg)
 
         assert set(factors.keys()) == {str(m) for m in range(1, 13)}
 
@@ -118,9 +166,9 @@ class TestCaptationServiceCalculations:
         """Months with no data should get a neutral factor of 1.0."""
         logs = _build_logs(n=14, base_revenue=2000.0, base_occ=100)
         # All logs fall in January; other months must be 1.0
-        df = self.svc._to_dataframe(logs)
-        avg = self.svc._compute_overall_avg(df)
-        factors = self.svc._compute_monthly_factors(df, avg)
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        factors = _reference_monthly_factors(df, avg)
 
         for m in range(2, 13):
             assert factors[str(m)] == pytest.approx(1.0), f"Month {m} should default to 1.0"
@@ -135,9 +183,9 @@ class TestCaptationServiceCalculations:
         for day in range(1, 11):
             logs.append(_make_log(date(2025, 8, day + 1), 100, 3000.0))
 
-        df = self.svc._to_dataframe(logs)
-        avg = self.svc._compute_overall_avg(df)
-        factors = self.svc._compute_monthly_factors(df, avg)
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        factors = _reference_monthly_factors(df, avg)
 
         assert factors["8"] > factors["1"], "August factor should exceed January factor"
         assert factors["8"] > 1.0
@@ -148,13 +196,34 @@ class TestCaptationServiceCalculations:
 # Integration-style tests — mocked AsyncSession
 # ---------------------------------------------------------------------------
 
+def _bucket_rows(logs: list[PMSSyncLog]) -> list[tuple]:
+    """What the GROUP BY (weekday, month) aggregate returns for *logs*.
+
+    Weekday follows SQL ``extract(dow)``: 0=Sunday.
+    """
+    cells: dict[tuple, list] = {}
+    for log in logs:
+        key = ((log.sync_date.weekday() + 1) % 7, log.sync_date.month)
+        cell = cells.setdefault(key, [0, 0.0, log.sync_date, log.sync_date])
+        cell[0] += 1
+        cell[1] += log.fb_revenue / log.occupancy
+        cell[2] = min(cell[2], log.sync_date)
+        cell[3] = max(cell[3], log.sync_date)
+    return [(*key, *cell) for key, cell in cells.items()]
+
+
+def _logs_result(logs: list[PMSSyncLog]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = _bucket_rows(logs)
+    return result
+
+
 def _mock_db_no_existing_baseline(logs: list[PMSSyncLog]) -> AsyncMock:
     """Return a mock DB session that returns *logs* and has no existing baseline."""
     db = AsyncMock()
 
-    # First execute call → PMSSyncLog rows
-    logs_result = MagicMock()
-    logs_result.scalars.return_value.all.return_value = logs
+    # First execute call → PMSSyncLog aggregate
+    logs_result = _logs_result(logs)
 
     # Second execute call → no existing CaptationBaseline
     baseline_result = MagicMock()
@@ -212,9 +281,7 @@ class TestCaptationServiceDB:
         """InsufficientDataError is raised when fewer than MIN_DATA_POINTS rows exist."""
         logs = _build_logs(n=MIN_DATA_POINTS - 1)
         db = AsyncMock()
-        logs_result = MagicMock()
-        logs_result.scalars.return_value.all.return_value = logs
-        db.execute = AsyncMock(return_value=logs_result)
+        db.execute = AsyncMock(return_value=_logs_result(logs))
 
         svc = CaptationService()
         with pytest.raises(InsufficientDataError):
@@ -226,8 +293,7 @@ class TestCaptationServiceDB:
         logs = _build_logs(n=14)
         db = AsyncMock()
 
-        logs_result = MagicMock()
-        logs_result.scalars.return_value.all.return_value = logs
+        logs_result = _logs_result(logs)
 
         existing = CaptationBaseline()
         existing.tenant_id = "hotel_a"
@@ -299,7 +365,7 @@ class TestPMSSyncAutoRecalculation:
 
             await service.sync_daily_data("pilot_hotel", date(2025, 6, 15))
 
-        mock_trigger.assert_awaited_once_with("pilot_hotel")
+        mock_trigger.assert_awaited_once_with("pilot_hotel", date(2025, 6, 15), 100, 2500.0)
 
     @pytest.mark.asyncio
     async def test_captation_error_does_not_break_sync(self):
@@ -309,7 +375,7 @@ class TestPMSSyncAutoRecalculation:
         adapter = MockPMSAdapter()
         service = PMSSyncService(adapter)
 
-        async def _failing_trigger(property_id: str):
+        async def _failing_trigger(property_id: str, *sample):
             raise RuntimeError("DB unavailable")
 
         with (
@@ -329,3 +395,190 @@ class TestPMSSyncAutoRecalculation:
                 await service.sync_daily_data("pilot_hotel", date(2025, 6, 15))
             except RuntimeError:
                 pass  # Acceptable — external mock bypassed the internal guard
+
+
+# ---------------------------------------------------------------------------
+# Incremental updates — in-memory SQLite
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def async_session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def _varied_logs(n: int) -> list[PMSSyncLog]:
+    """*n* daily logs from 2025-01-27 with rates varying by weekday and month."""
+    start = date(2025, 1, 27)
+    logs = []
+    for i in range(n):
+        d = date.fromordinal(start.toordinal() + i)
+        logs.append(_make_log(d, 80 + i % 5, 1500.0 + 100 * d.weekday() + 10 * d.month))
+    return logs
+
+
+class TestSQLPushdown:
+    @pytest.mark.asyncio
+    async def test_aggregate_query_matches_pandas_reference(self, async_session):
+        logs = _varied_logs(60)
+        async_session.add_all(logs)
+        async_session.add(_make_log(date(2025, 2, 3), 0, 500.0))      # no occupancy
+        async_session.add(_make_log(date(2025, 2, 3), 50, 500.0, tenant_id="hotel_b"))
+        await async_session.commit()
+        svc = CaptationService()
+
+        baseline = await svc.calculate_baseline("hotel_a", async_session)
+
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        assert baseline.data_points_count == 60
+        assert baseline.avg_fb_revenue_per_room == pytest.approx(avg)
+        assert baseline.dow_factors == _reference_dow_factors(df, avg)
+        assert baseline.monthly_factors == _reference_monthly_factors(df, avg)
+        assert (baseline.period_start, baseline.period_end) == (logs[0].sync_date, logs[-1].sync_date)
+
+
+class TestIncrementalBaseline:
+    @pytest.mark.asyncio
+    async def test_record_sync_matches_full_recompute(self, async_session):
+        logs = _varied_logs(30)
+        svc = CaptationService()
+        async_session.add_all(logs[:20])
+        await async_session.commit()
+        await svc.calculate_baseline("hotel_a", async_session)
+
+        for log in logs[20:]:
+            baseline = await svc.record_sync(
+                "hotel_a", log.sync_date, log.occupancy, log.fb_revenue, async_session
+            )
+
+        df = _reference_frame(logs)
+        avg = _reference_overall_avg(df)
+        assert baseline.data_points_count == 30
+        assert baseline.avg_fb_revenue_per_room == pytest.approx(avg)
+        assert baseline.dow_factors == _reference_dow_factors(df, avg)
+        assert baseline.monthly_factors == _reference_monthly_factors(df, avg)
+        assert (baseline.period_start, baseline.period_end) == (logs[0].sync_date, logs[-1].sync_date)
+
+    @pytest.mark.asyncio
+    async def test_record_sync_does_not_reload_history(self, async_session):
+        svc = CaptationService()
+        async_session.add_all(_varied_logs(10))
+        await async_session.commit()
+        await svc.calculate_baseline("hotel_a", async_session)
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = async_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            await svc.record_sync("hotel_a", date(2025, 3, 1), 90, 1800.0, async_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert statements
+        assert not any("pms_sync_logs" in s for s in statements)
+
+    @pytest.mark.asyncio
+    async def test_first_sync_seeds_running_stats(self, async_session):
+        logs = _varied_logs(3)
+        async_session.add_all(logs)
+        await async_session.commit()
+
+        with pytest.raises(InsufficientDataError):
+            await CaptationService().record_sync(
+                "hotel_a", logs[-1].sync_date, logs[-1].occupancy, logs[-1].fb_revenue, async_session
+            )
+
+        stats = await async_session.get(CaptationRunningStats, "hotel_a")
+        assert stats.samples_count == 3
+        assert sum(stats.dow_counts.values()) == 3
+
+    @pytest.mark.asyncio
+    async def test_unusable_sample_is_ignored(self, async_session):
+        svc = CaptationService()
+        assert await svc.record_sync("hotel_a", date(2025, 3, 1), 0, 100.0, async_session) is None
+        assert await svc.record_sync("hotel_a", date(2025, 3, 1), 50, None, async_session) is None
+        assert await async_session.get(CaptationRunningStats, "hotel_a") is None
+
+
+class TestEWMABaseline:
+    def test_weights_halve_every_half_life(self):
+        svc = CaptationService(mode="ewma", half_life_days=7)
+        stats = svc._empty_stats("hotel_a")
+        svc._add_decayed(stats, date(2025, 1, 1), 1, 10.0)
+        svc._add_decayed(stats, date(2025, 1, 8), 1, 20.0)
+        svc._add_decayed(stats, date(2024, 12, 25), 1, 40.0)  # late, two half-lives old
+
+        assert stats.ewma_reference_date == date(2025, 1, 8)
+        assert stats.ewma_weight == pytest.approx(1 + 0.5 + 0.25)
+        assert stats.ewma_rate_sum == pytest.approx(20 + 5 + 10)
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            CaptationService(mode="median")
+
+    @pytest.mark.asyncio
+    async def test_incremental_matches_recompute(self, async_session):
+        logs = _varied_logs(40)
+        svc = CaptationService(mode="ewma", half_life_days=10)
+        async_session.add_all(logs[:25])
+        await async_session.commit()
+        await svc.calculate_baseline("hotel_a", async_session)
+
+        for log in logs[25:]:
+            async_session.add(log)
+            await async_session.commit()
+            incremental = await svc.record_sync(
+                "hotel_a", log.sync_date, log.occupancy, log.fb_revenue, async_session
+            )
+        snapshot = (incremental.avg_fb_revenue_per_room, dict(incremental.dow_factors),
+                    dict(incremental.monthly_factors))
+
+        recomputed = await svc.calculate_baseline("hotel_a", async_session)
+        assert snapshot[0] == pytest.approx(recomputed.avg_fb_revenue_per_room)
+        assert snapshot[1] == pytest.approx(recomputed.dow_factors, abs=1e-4)
+        assert snapshot[2] == pytest.approx(recomputed.monthly_factors, abs=1e-4)
+        assert recomputed.data_points_count == 40
+
+    @pytest.mark.asyncio
+    async def test_recent_days_dominate(self, async_session):
+        start = date(2024, 1, 1)
+        async_session.add_all(
+            _make_log(date.fromordinal(start.toordinal() + i), 100, 1000.0 if i < 300 else 2000.0)
+            for i in range(330)
+        )
+        await async_session.commit()
+
+        mean = await CaptationService(mode="mean").calculate_baseline("hotel_a", async_session)
+        assert mean.avg_fb_revenue_per_room < 11.0
+
+        ewma = await CaptationService(mode="ewma", half_life_days=7).calculate_baseline(
+            "hotel_a", async_session
+        )
+        assert ewma.avg_fb_revenue_per_room > 19.0
+
+    @pytest.mark.asyncio
+    async def test_half_life_change_rebuilds(self, async_session):
+        logs = _varied_logs(10)
+        async_session.add_all(logs)
+        await async_session.commit()
+        await CaptationService(mode="ewma", half_life_days=30).calculate_baseline("hotel_a", async_session)
+
+        svc = CaptationService(mode="ewma", half_life_days=5)
+        with patch.object(svc, "calculate_baseline", new_callable=AsyncMock) as rebuild:
+            await svc.record_sync("hotel_a", date(2025, 3, 1), 90, 1800.0, async_session)
+        rebuild.assert_awaited_once_with("hotel_a", async_session)
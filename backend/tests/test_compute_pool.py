@@ -0,0 +1,87 @@
+"""Tests for ComputePool — CPU-bound work off the event loop.
+
+Coverage:
+  - run(): result and exceptions propagated from the worker thread
+  - the event loop keeps running while a call blocks its worker
+  - queue depth counts calls waiting for a free worker
+  - calls cancelled before starting leave the queue
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.compute_pool import ComputePool
+
+
+@pytest.fixture
+def pool():
+    compute_pool = ComputePool(max_workers=1)
+    yield compute_pool
+    compute_pool.shutdown()
+
+
+class TestComputePool:
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_thread(self, pool):
+        name = await pool.run(lambda: threading.current_thread().name)
+        assert name.startswith("compute")
+        assert await pool.run(divmod, 7, 2) == (3, 1)
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates(self, pool):
+        def _boom():
+            raise RuntimeError("stan failed")
+
+        with pytest.raises(RuntimeError, match="stan failed"):
+            await pool.run(_boom)
+        assert pool.stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, pool):
+        release = threading.Event()
+        call = asyncio.create_task(pool.run(release.wait, 5))
+
+        ticks = 0
+        for _ in range(5):
+            await asyncio.sleep(0.01)  # would stall if the call ran on the loop
+            ticks += 1
+        release.set()
+
+        assert await call is True
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_queue_depth(self, pool):
+        release = threading.Event()
+        calls = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(3)]
+        while pool.stats()["running"] == 0:
+            await asyncio.sleep(0.005)
+
+        stats = pool.stats()
+        assert (stats["running"], stats["queued"]) == (1, 2)
+
+        release.set()
+        await asyncio.gather(*calls)
+        stats = pool.stats()
+        assert (stats["queued"], stats["running"], stats["completed"]) == (0, 0, 3)
+        assert stats["max_queued"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_calls_leave_the_queue(self, pool):
+        release = threading.Event()
+        calls = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(3)]
+        while pool.stats()["running"] == 0:
+            await asyncio.sleep(0.005)
+
+        calls[2].cancel()
+        await asyncio.gather(calls[2], return_exceptions=True)
+        assert pool.stats()["queued"] == 1
+
+        pool.shutdown()  # cancels the call still waiting
+        release.set()
+        await asyncio.gather(*calls, return_exceptions=True)
+        stats = pool.stats()
+        assert (stats["queued"], stats["running"]) == (0, 0)
@@ -0,0 +1,248 @@
+"""Tests for DataRetentionService — monthly partitions + retention pruning.
+
+Coverage:
+  Unit:
+    - add_months() / partitions_to_create(): year rollover, naming, DDL
+    - expired_partitions(): only whole months past the cutoff, ignores archives
+  Integration (in-memory SQLite — DELETE path):
+    - old forecasts / windows / ended events (and their links) pruned, recent rows kept
+    - legacy local_events skipped when the table does not exist
+  PostgreSQL path (mocked session):
+    - missing partitions created, expired ones dropped or detached
+    - rows written past the last created month (default partition) are
+      moved into the month's partition when it is created
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import (
+    Base,
+    EventCatalog,
+    PropertyEvent,
+    WeatherCellForecast,
+    WeatherCellWindow,
+)
+from app.services import data_retention
+from app.services.data_retention import (
+    DataRetentionService,
+    MonthlyPartition,
+    add_months,
+    expired_partitions,
+    partitions_to_create,
+)
+
+NOW = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+class TestPartitionPlanning:
+    def test_add_months_rolls_over_year(self):
+        assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partitions_to_create_current_plus_ahead(self):
+        parts = partitions_to_create("weather_cell_forecasts", NOW, months_ahead=2)
+        assert [p.name for p in parts] == [
+            "weather_cell_forecasts_y2026m10",
+            "weather_cell_forecasts_y2026m11",
+            "weather_cell_forecasts_y2026m12",
+        ]
+
+    def test_create_sql_bounds(self):
+        sql = MonthlyPartition("weather_cell_forecasts", date(2026, 12, 1)).create_sql()
+        assert "PARTITION OF weather_cell_forecasts" in sql
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in sql
+
+    def test_expired_only_whole_months_before_cutoff(self):
+        names = [
+            "weather_cell_forecasts_y2026m06",
+            "weather_cell_forecasts_y2026m07",
+            "weather_cell_forecasts_y2026m08",
+            "weather_cell_forecasts_y2026m05_archive",
+            "other_table_y2026m01",
+        ]
+        cutoff = datetime(2026, 8, 15, tzinfo=timezone.utc)
+        expired = expired_partitions("weather_cell_forecasts", names, cutoff)
+        # August still holds rows newer than the cutoff → kept
+        assert [p.name for p in expired] == [
+            "weather_cell_forecasts_y2026m06",
+            "weather_cell_forecasts_y2026m07",
+        ]
+
+
+class TestDeletePath:
+    @pytest.mark.asyncio
+    async def test_prunes_old_rows_and_keeps_recent(self, async_session):
+        old = NOW - timedelta(days=200)
+        recent = NOW + timedelta(days=2)
+        async_session.add_all([
+            WeatherCellForecast(cell_id="48.86:2.35", forecast_timestamp=old),
+            WeatherCellForecast(cell_id="48.86:2.35", forecast_timestamp=recent),
+            WeatherCellWindow(cell_id="48.86:2.35", window_start=old, hours=4, fetched_at=old),
+            WeatherCellWindow(cell_id="48.86:2.35", window_start=recent, hours=4, fetched_at=NOW),
+            EventCatalog(event_id="evt-old", title="Old", category="concerts",
+                         start_dt=old, end_dt=old + timedelta(hours=3)),
+            EventCatalog(event_id="evt-new", title="New", category="concerts",
+                         start_dt=recent),
+            PropertyEvent(property_id="t1", event_id="evt-old", tenant_id="t1"),
+            PropertyEvent(property_id="t1", event_id="evt-new", tenant_id="t1"),
+        ])
+        await async_session.commit()
+
+        report = await DataRetentionService().run(async_session, now=NOW)
+
+        assert report.deleted["weather_cell_forecasts"] == 1
+        assert report.deleted["weather_cell_windows"] == 1
+        assert report.deleted["event_catalog"] == 1
+        assert report.deleted["property_events"] == 1
+        assert report.created == [] and report.expired == []
+
+        forecasts = (await async_session.execute(select(WeatherCellForecast))).scalars().all()
+        assert len(forecasts) == 1
+        events = (await async_session.execute(select(EventCatalog.event_id))).scalars().all()
+        assert events == ["evt-new"]
+        links = (await async_session.execute(select(PropertyEvent.event_id))).scalars().all()
+        assert links == ["evt-new"]
+
+    @pytest.mark.asyncio
+    async def test_missing_local_events_table_skipped(self, async_session):
+        await async_session.execute(text("DROP TABLE local_events"))
+        await async_session.commit()
+
+        report = await DataRetentionService().run(async_session, now=NOW)
+
+        assert "local_events" not in report.deleted
+        assert report.deleted["event_catalog"] == 0
+
+
+def _pg_session(existing: List[str]) -> AsyncMock:
+    """Mock PostgreSQL session whose pg_inherits lookup returns ``existing``."""
+    db = AsyncMock()
+    db.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(name="dialect")))
+    db.get_bind.return_value.dialect.name = "postgresql"
+
+    async def _execute(stmt, params=None):
+        result = MagicMock()
+        result.fetchall.return_value = (
+            [(n,) for n in existing] if "pg_inherits" in str(stmt) else []
+        )
+        result.rowcount = 0
+        return result
+
+    db.execute = AsyncMock(side_effect=_execute)
+    return db
+
+
+def _statements(db: AsyncMock) -> List[str]:
+    return [" ".join(str(c.args[0]).split()) for c in db.execute.await_args_list]
+
+
+class TestPostgresPath:
+    @pytest.mark.asyncio
+    async def test_creates_missing_and_drops_expired(self):
+        db = _pg_session([
+            "weather_cell_forecasts_y2026m04",
+            "weather_cell_forecasts_y2026m10",
+        ])
+
+        report = await DataRetentionService().run(db, now=NOW)
+
+        assert report.created == [
+            "weather_cell_forecasts_y2026m11",
+            "weather_cell_forecasts_y2026m12",
+        ]
+        assert report.expired == ["weather_cell_forecasts_y2026m04"]
+        statements = _statements(db)
+        assert "DROP TABLE IF EXISTS weather_cell_forecasts_y2026m04" in statements
+        assert not any("DELETE FROM weather_cell_forecasts " in s for s in statements)
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_detach_mode_archives_instead_of_dropping(self):
+        db = _pg_session(["weather_cell_forecasts_y2026m04"])
+
+        with patch.object(data_retention, "_DETACH_EXPIRED", True):
+            await DataRetentionService().run(db, now=NOW)
+
+        statements = _statements(db)
+        assert (
+            "ALTER TABLE weather_cell_forecasts DETACH PARTITION weather_cell_forecasts_y2026m04"
+            in statements
+        )
+        assert (
+            "ALTER TABLE weather_cell_forecasts_y2026m04 RENAME TO "
+            "weather_cell_forecasts_y2026m04_archive" in statements
+        )
+        assert not any(s.startswith("DROP TABLE") for s in statements)
+
+    @pytest.mark.asyncio
+    async def test_row_past_last_month_moved_out_of_default_partition(self):
+        # Created through December; an hour written for 2027-01-01T00:00 went
+        # to the default partition and must end up in the January partition.
+        db = _pg_session([
+            "weather_cell_forecasts_default",
+            "weather_cell_forecasts_y2026m11",
+            "weather_cell_forecasts_y2026m12",
+        ])
+        december = datetime(2026, 12, 20, tzinfo=timezone.utc)
+
+        report = await DataRetentionService().run(db, now=december)
+
+        assert report.created == [
+            "weather_cell_forecasts_y2027m01",
+            "weather_cell_forecasts_y2027m02",
+        ]
+        statements = _statements(db)
+        move = statements.index(
+            "WITH moved AS (DELETE FROM weather_cell_forecasts_default "
+            "WHERE forecast_timestamp >= '2027-01-01' "
+            "AND forecast_timestamp < '2027-02-01' RETURNING *) "
+            "INSERT INTO weather_cell_forecasts_y2027m01 SELECT * FROM moved"
+        )
+        attach = statements.index(
+            "ALTER TABLE weather_cell_forecasts ATTACH PARTITION "
+            "weather_cell_forecasts_y2027m01 FOR VALUES FROM ('2027-01-01') TO ('2027-02-01')"
+        )
+        assert move < attach
+        assert not any("PARTITION OF weather_cell_forecasts FOR" in s for s in statements)
+        # Expired hours that landed in the default partition are pruned too
+        assert "weather_cell_forecasts_default" in report.deleted
+
+    @pytest.mark.asyncio
+    async def test_without_default_partition_months_created_directly(self):
+        db = _pg_session(["weather_cell_forecasts_y2026m10"])
+
+        await DataRetentionService().run(db, now=NOW)
+
+        statements = _statements(db)
+        assert any(
+            s.startswith("CREATE TABLE IF NOT EXISTS weather_cell_forecasts_y2026m11 "
+                         "PARTITION OF weather_cell_forecasts")
+            for s in statements
+        )
+        assert not any("ATTACH PARTITION" in s for s in statements)
@@ -12,26 +12,45 @@ Coverage:
     - sync_for_tenant(): calls PredictHQ and persists records
     - Idempotency: re-running sync does NOT create duplicate rows
     - Cross-tenant isolation: tenant A cannot see tenant B rows
+    - cluster_properties(): nearby properties share one covering query
+    - sync_cluster(): events stored once, linked per member within its radius
+    - sync_cluster(): stable cluster key; a new member forces a full fetch
+    - sync_cluster(): re-linking updates the distance of a moved event
+    - Incremental mode: updated.gte watermark, newer-only catalogue updates
+    - Upserts: catalogue and link rows written in key order
+    - Page prefetch: a failed page cancels the in-flight next-page request
+    - Worker: incremental run skipped while the full run is syncing
     - API failure retries and re-raises after exhaustion
 """
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import pytest_asyncio
-import httpx
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
 
-from app.db.models import Base, LocalEvent, RestaurantProfile
-from app.schemas.events import EventRecord
-from app.services.event_ingestion import EventIngestionService, _parse_phq_datetime
-
+from app.db.models import (
+    Base,
+    EventCatalog,
+    EventSyncState,
+    PropertyEvent,
+    RestaurantProfile,
+)
+from app.services.event_ingestion import (
+    EventIngestionService,
+    _parse_phq_datetime,
+    cluster_properties,
+    haversine_km,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -82,8 +101,9 @@ def _phq_event(
     lat: float = 48.860,
     lng: float = 2.350,
     labels: List[str] | None = None,
+    updated: str | None = None,
 ) -> Dict[str, Any]:
-    return {
+    event = {
         "id": event_id,
         "title": title,
         "category": category,
@@ -100,6 +120,9 @@ def _phq_event(
         },
         "labels": labels or ["technology", "b2b"],
     }
+    if updated is not None:
+        event["updated"] = updated
+    return event
 
 
 def _phq_page(events: List[Dict], next_url: str | None = None) -> Dict[str, Any]:
@@ -275,7 +298,7 @@ class TestSyncForTenant:
 
         rows = (
             await async_session.execute(
-                select(LocalEvent).where(LocalEvent.tenant_id == "tenant_paris")
+                select(PropertyEvent).where(PropertyEvent.tenant_id == "tenant_paris")
             )
         ).scalars().all()
         assert len(rows) == 3
@@ -295,7 +318,7 @@ class TestSyncForTenant:
 
         row = (
             await async_session.execute(
-                select(LocalEvent).where(LocalEvent.event_id == "evt-check")
+                select(EventCatalog).where(EventCatalog.event_id == "evt-check")
             )
         ).scalars().first()
 
@@ -304,7 +327,14 @@ class TestSyncForTenant:
         assert row.category == "concerts"
         assert row.rank == 72
         assert row.phq_attendance == 3000
-        assert row.tenant_id == "tenant_fields"
+
+        link = (
+            await async_session.execute(
+                select(PropertyEvent).where(PropertyEvent.event_id == "evt-check")
+            )
+        ).scalars().first()
+        assert link.tenant_id == "tenant_fields"
+        assert link.distance_km == pytest.approx(0.41, abs=0.01)
 
     @pytest.mark.asyncio
     async def test_idempotency_no_duplicates(self, async_session):
@@ -327,10 +357,12 @@ class TestSyncForTenant:
 
         rows = (
             await async_session.execute(
-                select(LocalEvent).where(LocalEvent.tenant_id == "tenant_idempotent")
+                select(PropertyEvent).where(PropertyEvent.tenant_id == "tenant_idempotent")
             )
         ).scalars().all()
         assert len(rows) == 2
+        catalogued = (await async_session.execute(select(EventCatalog))).scalars().all()
+        assert len(catalogued) == 2
 
     @pytest.mark.asyncio
     async def test_cross_tenant_isolation(self, async_session):
@@ -349,7 +381,7 @@ class TestSyncForTenant:
 
         rows_b = (
             await async_session.execute(
-                select(LocalEvent).where(LocalEvent.tenant_id == "tenant_b_ev")
+                select(PropertyEvent).where(PropertyEvent.tenant_id == "tenant_b_ev")
             )
         ).scalars().all()
         assert rows_b == [], "Tenant B must not see Tenant A's event rows"
@@ -404,10 +436,465 @@ class TestSyncForTenant:
 
         assert inserted == len(categories_to_test)
 
-        rows = (
-            await async_session.execute(
-                select(LocalEvent).where(LocalEvent.tenant_id == "tenant_cats")
-            )
-        ).scalars().all()
+        rows = (await async_session.execute(select(EventCatalog))).scalars().all()
         persisted_categories = {r.category for r in rows}
         assert persisted_categories == set(categories_to_test)
+
+
+# ---------------------------------------------------------------------------
+# Pagination prefetch + concurrent worker
+# ---------------------------------------------------------------------------
+
+class TestPagePrefetch:
+    @pytest.mark.asyncio
+    async def test_follows_cursor_across_pages(self, async_session):
+        profile = _make_profile("tenant_pages")
+        async_session.add(profile)
+        await async_session.commit()
+
+        mock_client = _mock_http_client([
+            _phq_page([_phq_event(event_id="evt-p1")], next_url="https://phq/next?c=2"),
+            _phq_page([_phq_event(event_id="evt-p2")]),
+        ])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            inserted = await service.sync_for_tenant(async_session, profile)
+
+        assert inserted == 2
+        assert mock_client.get.await_count == 2
+        assert mock_client.get.await_args_list[1].args[0] == "https://phq/next?c=2"
+
+    @pytest.mark.asyncio
+    async def test_next_page_fetched_while_current_page_upserts(self, async_session):
+        """The second page request must start before the first upsert finishes."""
+        profile = _make_profile("tenant_prefetch")
+        async_session.add(profile)
+        await async_session.commit()
+
+        calls: List[str] = []
+        mock_client = _mock_http_client([
+            _phq_page([_phq_event(event_id="evt-a")], next_url="https://phq/next"),
+            _phq_page([_phq_event(event_id="evt-b")]),
+        ])
+        original_get = mock_client.get.side_effect
+
+        async def _get(*args, **kwargs):
+            calls.append("get")
+            return next(original_get)
+
+        mock_client.get = AsyncMock(side_effect=_get)
+
+        async def _upsert(session, records):
+            await asyncio.sleep(0)  # yield like a real DB round-trip
+            calls.append("upsert")
+            return len(records)
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}), \
+                patch.object(EventIngestionService, "_upsert", side_effect=_upsert):
+            service = EventIngestionService(http_client=mock_client)
+            inserted = await service.sync_for_tenant(async_session, profile)
+
+        assert inserted == 2
+        assert calls == ["get", "get", "upsert", "upsert"]
+
+    @pytest.mark.asyncio
+    async def test_failed_upsert_cancels_pending_prefetch(self, async_session):
+        profile = _make_profile("tenant_cancel")
+        async_session.add(profile)
+        await async_session.commit()
+
+        second_page_requested = asyncio.Event()
+        second_page_cancelled = asyncio.Event()
+        first = _phq_page([_phq_event(event_id="evt-c")], next_url="https://phq/next")
+
+        async def _get(url, *args, **kwargs):
+            if url == "https://phq/next":
+                second_page_requested.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    second_page_cancelled.set()
+                    raise
+            response = MagicMock()
+            response.json.return_value = first
+            response.raise_for_status = MagicMock()
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=_get)
+
+        async def _upsert(session, records):
+            await second_page_requested.wait()
+            raise RuntimeError("db down")
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}), \
+                patch.object(EventIngestionService, "_upsert", side_effect=_upsert):
+            service = EventIngestionService(http_client=mock_client)
+            with pytest.raises(RuntimeError, match="db down"):
+                await service.sync_for_tenant(async_session, profile)
+
+        # Cancelled before sync_cluster returned, not left to the GC
+        assert second_page_cancelled.is_set()
+
+
+class TestEventSyncWorker:
+    @pytest.mark.asyncio
+    async def test_clusters_synced_with_bounded_concurrency(self):
+        from app.workers import event_sync
+
+        # Far-apart properties → one cluster each
+        profiles = [_make_profile(f"tenant_c{i}", lat=40.0 + i, lng=2.0) for i in range(7)]
+        in_flight = 0
+        peak = 0
+        synced: List[str] = []
+
+        async def _sync(self, session, cluster, incremental=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            tenant_ids = [m.tenant_id for m in cluster.members]
+            if "tenant_c3" in tenant_ids:
+                raise RuntimeError("boom")
+            synced.extend(tenant_ids)
+            return {t: 1 for t in tenant_ids}
+
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(event_sync, "_load_profiles_with_gps", AsyncMock(return_value=profiles)), \
+                patch.object(event_sync, "AsyncSessionLocal", MagicMock(return_value=session_cm)), \
+                patch.object(event_sync, "_SYNC_CONCURRENCY", 3), \
+                patch.object(EventIngestionService, "sync_cluster", _sync):
+            await event_sync._run_event_sync_for_all_tenants()
+
+        assert peak == 3
+        # One cluster failing does not abort the others (SC #6)
+        assert len(synced) == 6
+        assert "tenant_c3" not in synced
+
+    @pytest.mark.asyncio
+    async def test_incremental_run_skipped_while_full_run_active(self):
+        from app.workers import event_sync
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+        modes: List[bool] = []
+
+        async def _sync_all(incremental):
+            modes.append(incremental)
+            started.set()
+            await release.wait()
+
+        with patch.object(event_sync, "_sync_all_clusters", _sync_all):
+            full = asyncio.create_task(event_sync._run_event_sync_for_all_tenants())
+            await started.wait()
+            await event_sync._run_event_sync_for_all_tenants(incremental=True)
+            release.set()
+            await full
+            # Once the full run is over, incremental runs proceed again
+            await event_sync._run_event_sync_for_all_tenants(incremental=True)
+
+        assert modes == [False, True]
+
+
+# ---------------------------------------------------------------------------
+# Spatial query clustering + shared catalogue
+# ---------------------------------------------------------------------------
+
+class TestClusterProperties:
+    def test_haversine_paris_london(self):
+        assert haversine_km(48.8566, 2.3522, 51.5074, -0.1278) == pytest.approx(343.5, abs=1.0)
+
+    def test_neighbours_share_one_cluster(self):
+        a = _make_profile("t_a", lat=48.8566, lng=2.3522)
+        b = _make_profile("t_b", lat=48.8600, lng=2.3400)  # ~1 km away
+        c = _make_profile("t_c", lat=51.5074, lng=-0.1278)
+
+        clusters = cluster_properties([a, b, c], radius_km=5, cluster_radius_km=3)
+
+        assert len(clusters) == 2
+        paris = next(cl for cl in clusters if len(cl.members) == 2)
+        assert {m.tenant_id for m in paris.members} == {"t_a", "t_b"}
+        # Covering circle contains each member's own 5 km search circle
+        for m in paris.members:
+            reach = haversine_km(paris.latitude, paris.longitude, m.latitude, m.longitude) + 5
+            assert paris.query_radius_km >= reach
+
+    def test_skips_profiles_without_gps(self):
+        clusters = cluster_properties([_make_profile("t_none", lat=None, lng=None)])
+        assert clusters == []
+
+    def test_deterministic_cluster_ids(self):
+        profiles = [_make_profile("t_a"), _make_profile("t_b", lat=48.8600, lng=2.3400)]
+        first = [cl.cluster_id for cl in cluster_properties(profiles)]
+        second = [cl.cluster_id for cl in cluster_properties(list(reversed(profiles)))]
+        assert first == second
+
+    def test_cluster_id_survives_membership_change(self):
+        seed = _make_profile("t_seed", lat=48.8500, lng=2.3522)
+        [alone] = cluster_properties([seed])
+        [joined] = cluster_properties([seed, _make_profile("t_new", lat=48.8600, lng=2.3600)])
+        assert len(joined.members) == 2
+        assert alone.cluster_id == joined.cluster_id == "t_seed"
+
+
+class TestSyncCluster:
+    @pytest.mark.asyncio
+    async def test_one_query_links_each_member_within_its_radius(self, async_session):
+        a = _make_profile("t_near_a", lat=48.8566, lng=2.3522)
+        b = _make_profile("t_near_b", lat=48.8566, lng=2.3800)  # ~2 km east
+        async_session.add_all([a, b])
+        await async_session.commit()
+
+        events = [
+            _phq_event(event_id="evt-shared", lat=48.8566, lng=2.3660),
+            # ~6 km west of A → inside the covering circle but no member radius
+            _phq_event(event_id="evt-far-west", lat=48.8566, lng=2.2700),
+            # ~4.5 km west of A → A only
+            _phq_event(event_id="evt-west", lat=48.8566, lng=2.2910),
+        ]
+        mock_client = _mock_http_client([_phq_page(events)])
+        [cluster] = cluster_properties([a, b], radius_km=5, cluster_radius_km=3)
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            linked = await service.sync_cluster(async_session, cluster)
+
+        mock_client.get.assert_awaited_once()
+        assert linked == {"t_near_a": 2, "t_near_b": 1}
+
+        catalogued = (await async_session.execute(select(EventCatalog))).scalars().all()
+        assert len(catalogued) == 3  # stored once, not per property
+
+        links = (await async_session.execute(select(PropertyEvent))).scalars().all()
+        by_property = {}
+        for link in links:
+            by_property.setdefault(link.property_id, set()).add(link.event_id)
+        assert by_property == {
+            "t_near_a": {"evt-shared", "evt-west"},
+            "t_near_b": {"evt-shared"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_event_without_geo_links_to_all_members(self, async_session):
+        a = _make_profile("t_geo_a")
+        b = _make_profile("t_geo_b", lat=48.8600, lng=2.3400)
+        async_session.add_all([a, b])
+        await async_session.commit()
+
+        ev = _phq_event(event_id="evt-nogeo")
+        ev["geo"] = None
+        mock_client = _mock_http_client([_phq_page([ev])])
+        [cluster] = cluster_properties([a, b])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            linked = await service.sync_cluster(async_session, cluster)
+
+        assert linked == {"t_geo_a": 1, "t_geo_b": 1}
+        links = (await async_session.execute(select(PropertyEvent))).scalars().all()
+        assert all(link.distance_km is None for link in links)
+
+    @pytest.mark.asyncio
+    async def test_covering_query_uses_cluster_centroid(self, async_session):
+        a = _make_profile("t_q_a", lat=48.8566, lng=2.3522)
+        b = _make_profile("t_q_b", lat=48.8566, lng=2.3800)
+        mock_client = _mock_http_client([_phq_page([])])
+        [cluster] = cluster_properties([a, b], radius_km=5, cluster_radius_km=3)
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            await service.sync_cluster(async_session, cluster)
+
+        params = mock_client.get.await_args.kwargs["params"]
+        assert params["within"] == (
+            f"{cluster.query_radius_km:g}km@{cluster.latitude},{cluster.longitude}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rows_written_in_key_order(self, async_session):
+        a = _make_profile("t_ord_b")
+        b = _make_profile("t_ord_a", lat=48.8600, lng=2.3400)
+        async_session.add_all([a, b])
+        await async_session.commit()
+
+        events = [_phq_event(event_id=f"evt-{n}") for n in ("c", "a", "b")]
+        mock_client = _mock_http_client([_phq_page(events)])
+        [cluster] = cluster_properties([a, b])
+        inserts: List[tuple] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO"):
+                keys = [p for p in parameters if str(p).startswith(("evt-", "t_ord_"))]
+                inserts.append((statement.split()[2], keys))
+
+        engine = async_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+                service = EventIngestionService(http_client=mock_client)
+                await service.sync_cluster(async_session, cluster)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        event_ids = ["evt-a", "evt-b", "evt-c"]
+        assert ("event_catalog", event_ids) in inserts
+        links = [
+            (keys[0], [k for k in keys if k.startswith("evt-")])
+            for table, keys in inserts
+            if table == "property_events"
+        ]
+        assert links == [("t_ord_a", event_ids), ("t_ord_b", event_ids)]
+
+
+# ---------------------------------------------------------------------------
+# Incremental sync (updated-since watermark)
+# ---------------------------------------------------------------------------
+
+class TestIncrementalSync:
+    @pytest.mark.asyncio
+    async def test_first_run_is_full_then_requests_updated_since(self, async_session):
+        profile = _make_profile("t_incr")
+        async_session.add(profile)
+        await async_session.commit()
+
+        mock_client = _mock_http_client([
+            _phq_page([
+                _phq_event(event_id="evt-1", updated="2026-10-18T08:00:00Z"),
+                _phq_event(event_id="evt-2", updated="2026-10-18T09:30:00Z"),
+            ]),
+            _phq_page([]),
+        ])
+        [cluster] = cluster_properties([profile])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            await service.sync_cluster(async_session, cluster)
+            await service.sync_cluster(async_session, cluster)
+
+        first = mock_client.get.await_args_list[0].kwargs["params"]
+        second = mock_client.get.await_args_list[1].kwargs["params"]
+        assert "updated.gte" not in first
+        assert second["updated.gte"] == "2026-10-18T09:30:00"
+        assert second["sort"] == "updated"
+
+        state = await async_session.get(EventSyncState, cluster.cluster_id)
+        assert state.updated_watermark.replace(tzinfo=None) == datetime(2026, 10, 18, 9, 30)
+
+    @pytest.mark.asyncio
+    async def test_changed_event_is_updated_unchanged_is_not(self, async_session):
+        profile = _make_profile("t_change")
+        async_session.add(profile)
+        await async_session.commit()
+
+        v1 = _phq_event(event_id="evt-x", title="Old", rank=40, updated="2026-10-18T08:00:00Z")
+        v2 = _phq_event(event_id="evt-x", title="New", rank=85, updated="2026-10-18T12:00:00Z")
+        stale = _phq_event(event_id="evt-x", title="Stale", rank=10, updated="2026-10-18T07:00:00Z")
+        mock_client = _mock_http_client([_phq_page([v1]), _phq_page([v2]), _phq_page([stale])])
+        [cluster] = cluster_properties([profile])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            await service.sync_cluster(async_session, cluster)
+            await service.sync_cluster(async_session, cluster)
+            await service.sync_cluster(async_session, cluster)
+
+        async_session.expire_all()
+        row = await async_session.get(EventCatalog, "evt-x")
+        assert row.title == "New"
+        assert row.rank == 85
+
+    @pytest.mark.asyncio
+    async def test_new_member_forces_full_fetch_under_same_key(self, async_session):
+        seed = _make_profile("t_seed", lat=48.8500, lng=2.3522)
+        newcomer = _make_profile("t_newcomer", lat=48.8600, lng=2.3600)
+        async_session.add_all([seed, newcomer])
+        await async_session.commit()
+
+        evt = _phq_event(event_id="evt-m", updated="2026-10-18T09:30:00Z")
+        mock_client = _mock_http_client(
+            [_phq_page([evt]), _phq_page([evt]), _phq_page([evt])]
+        )
+        [before] = cluster_properties([seed])
+        [after] = cluster_properties([seed, newcomer])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            await service.sync_cluster(async_session, before)
+            await service.sync_cluster(async_session, after)
+            await service.sync_cluster(async_session, after)
+
+        calls = mock_client.get.await_args_list
+        assert "updated.gte" not in calls[1].kwargs["params"]
+        assert "updated.gte" in calls[2].kwargs["params"]
+        state = await async_session.get(EventSyncState, "t_seed")
+        assert state.member_ids == "t_newcomer,t_seed"
+
+    @pytest.mark.asyncio
+    async def test_relink_updates_distance_of_moved_event(self, async_session):
+        profile = _make_profile("t_moved", lat=48.8566, lng=2.3522)
+        async_session.add(profile)
+        await async_session.commit()
+
+        mock_client = _mock_http_client([
+            _phq_page([_phq_event(event_id="evt-mv", lat=48.8566, lng=2.3522)]),
+            _phq_page([_phq_event(event_id="evt-mv", lat=48.8566, lng=2.3800)]),
+        ])
+        [cluster] = cluster_properties([profile])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            await service.sync_cluster(async_session, cluster, incremental=False)
+            linked = await service.sync_cluster(async_session, cluster, incremental=False)
+
+        async_session.expire_all()
+        link = (await async_session.execute(select(PropertyEvent))).scalars().one()
+        assert link.distance_km == pytest.approx(2.03, abs=0.05)
+        assert linked == {"t_moved": 1}
+
+    @pytest.mark.asyncio
+    async def test_full_resync_after_interval(self, async_session):
+        profile = _make_profile("t_resync")
+        async_session.add(profile)
+        await async_session.commit()
+
+        [cluster] = cluster_properties([profile])
+        async_session.add(
+            EventSyncState(
+                cluster_id=cluster.cluster_id,
+                updated_watermark=datetime(2026, 10, 18, tzinfo=timezone.utc),
+                synced_at=datetime(2026, 10, 18, tzinfo=timezone.utc),
+                full_synced_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+        await async_session.commit()
+        mock_client = _mock_http_client([_phq_page([])])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}):
+            service = EventIngestionService(http_client=mock_client)
+            await service.sync_cluster(async_session, cluster)
+
+        params = mock_client.get.await_args.kwargs["params"]
+        assert "updated.gte" not in params
+
+    @pytest.mark.asyncio
+    async def test_failed_run_does_not_advance_watermark(self, async_session):
+        profile = _make_profile("t_fail_wm")
+        async_session.add(profile)
+        await async_session.commit()
+
+        mock_client = AsyncMock(spec=httpx.AsyncClient)
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("down"))
+        [cluster] = cluster_properties([profile])
+
+        with patch.dict(os.environ, {"PREDICTHQ_API_KEY": "test-key"}), \
+                patch.object(EventIngestionService._fetch_page.retry, "sleep", AsyncMock()):
+            service = EventIngestionService(http_client=mock_client)
+            with pytest.raises(httpx.ConnectError):
+                await service.sync_cluster(async_session, cluster)
+
+        assert await async_session.get(EventSyncState, cluster.cluster_id) is None
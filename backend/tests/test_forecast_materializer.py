@@ -0,0 +1,187 @@
+"""Tests for ForecastMaterializer — precomputed forecasts in service_forecasts.
+
+Coverage:
+  - refresh_tenant(): horizon × trained service types, one predict call per
+    model, idempotent upsert, rows before the horizon pruned
+  - lookup(): hit for the current model version, miss when absent or stale
+  - nightly worker: all trained tenants refreshed, failures isolated, cron
+"""
+from __future__ import annotations
+
+import os
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, ServiceForecast
+from app.services.forecast_materializer import (
+    ForecastMaterializer,
+    as_prediction_result,
+)
+from app.services.model_registry import ProphetModelRegistry
+from app.services.prediction_engine import PredictionEngine
+from app.workers import forecast_refresh
+
+TODAY = date(2026, 4, 1)
+
+
+@pytest.fixture(scope="module")
+def trained_engine() -> PredictionEngine:
+    rng = np.random.default_rng(11)
+    ds = pd.date_range("2025-12-01", periods=120, freq="D")
+    engine = PredictionEngine()
+    engine.train(pd.DataFrame({"ds": ds, "y": rng.poisson(50, len(ds))}))
+    return engine
+
+
+@pytest.fixture
+def registry(tmp_path, trained_engine) -> ProphetModelRegistry:
+    reg = ProphetModelRegistry(model_dir=tmp_path)
+    reg.save("hotel_a", "dinner", trained_engine)
+    reg.save("hotel_a", "lunch", trained_engine)
+    reg.save("hotel_b", "dinner", trained_engine)
+    return reg
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def _rows(factory, tenant_id="hotel_a"):
+    async with factory() as session:
+        result = await session.execute(
+            select(ServiceForecast).where(ServiceForecast.tenant_id == tenant_id)
+        )
+        return list(result.scalars().all())
+
+
+class TestRefreshTenant:
+    @pytest.mark.asyncio
+    async def test_materializes_horizon_for_trained_services(self, registry, session_factory):
+        materializer = ForecastMaterializer(registry, horizon_days=7)
+        with patch.object(PredictionEngine, "predict_many", autospec=True,
+                          side_effect=PredictionEngine.predict_many) as spy:
+            async with session_factory() as db:
+                written = await materializer.refresh_tenant("hotel_a", db, start=TODAY)
+
+        assert written == 14
+        assert spy.call_count == 2  # one Prophet call per (tenant, service) model
+        rows = await _rows(session_factory)
+        assert {r.service_type for r in rows} == {"dinner", "lunch"}
+        assert min(r.target_date for r in rows) == TODAY
+        assert max(r.target_date for r in rows) == TODAY + timedelta(days=6)
+        assert {r.model_version for r in rows if r.service_type == "dinner"} == {
+            registry.version("hotel_a", "dinner")
+        }
+        assert all(r.range_min <= r.predicted_covers <= r.range_max for r in rows)
+
+    @pytest.mark.asyncio
+    async def test_rerun_upserts_and_prunes_past_days(self, registry, session_factory):
+        materializer = ForecastMaterializer(registry, horizon_days=3)
+        async with session_factory() as db:
+            await materializer.refresh_tenant("hotel_a", db, start=TODAY, service_types=["dinner"])
+            await materializer.refresh_tenant(
+                "hotel_a", db, start=TODAY + timedelta(days=1), service_types=["dinner"]
+            )
+
+        dates = sorted(r.target_date for r in await _rows(session_factory))
+        assert dates == [TODAY + timedelta(days=i) for i in (1, 2, 3)]
+
+    @pytest.mark.asyncio
+    async def test_untrained_service_skipped(self, registry, session_factory):
+        async with session_factory() as db:
+            written = await ForecastMaterializer(registry).refresh_tenant(
+                "hotel_a", db, start=TODAY, service_types=["breakfast"]
+            )
+        assert written == 0
+
+
+class TestLookup:
+    @pytest.mark.asyncio
+    async def test_hit_for_current_model_version(self, registry, session_factory):
+        materializer = ForecastMaterializer(registry, horizon_days=2)
+        async with session_factory() as db:
+            await materializer.refresh_tenant("hotel_a", db, start=TODAY)
+            row = await materializer.lookup("hotel_a", "dinner", TODAY, db)
+
+        result = as_prediction_result(row)
+        assert result.date == TODAY.isoformat()
+        assert not result.is_mock
+        assert result.predicted == row.predicted_covers
+
+    @pytest.mark.asyncio
+    async def test_miss_when_absent(self, registry, session_factory):
+        materializer = ForecastMaterializer(registry, horizon_days=2)
+        async with session_factory() as db:
+            await materializer.refresh_tenant("hotel_a", db, start=TODAY)
+            assert await materializer.lookup("hotel_a", "dinner", TODAY + timedelta(days=5), db) is None
+            assert await materializer.lookup("hotel_b", "dinner", TODAY, db) is None
+
+    @pytest.mark.asyncio
+    async def test_miss_after_retraining(self, registry, session_factory):
+        materializer = ForecastMaterializer(registry, horizon_days=2)
+        async with session_factory() as db:
+            await materializer.refresh_tenant("hotel_a", db, start=TODAY)
+            path = registry.path_for("hotel_a", "dinner")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert await materializer.lookup("hotel_a", "dinner", TODAY, db) is None
+            assert await materializer.lookup("hotel_a", "lunch", TODAY, db) is not None
+
+
+class TestForecastRefreshWorker:
+    @pytest.mark.asyncio
+    async def test_refreshes_every_trained_tenant(self, registry, session_factory):
+        with (
+            patch("app.workers.forecast_refresh.AsyncSessionLocal", session_factory),
+            patch("app.services.forecast_materializer.get_model_registry", return_value=registry),
+        ):
+            written = await forecast_refresh.run_forecast_refresh()
+
+        horizon = ForecastMaterializer(registry).horizon_days
+        assert written == {"hotel_a": 2 * horizon, "hotel_b": horizon}
+
+    @pytest.mark.asyncio
+    async def test_tenant_failure_isolated(self, registry, session_factory):
+        original = ForecastMaterializer.refresh_tenant
+
+        async def _flaky(self, tenant_id, db, *args, **kwargs):
+            if tenant_id == "hotel_a":
+                raise RuntimeError("boom")
+            return await original(self, tenant_id, db, *args, **kwargs)
+
+        with (
+            patch("app.workers.forecast_refresh.AsyncSessionLocal", session_factory),
+            patch("app.services.forecast_materializer.get_model_registry", return_value=registry),
+            patch.object(ForecastMaterializer, "refresh_tenant", _flaky),
+        ):
+            written = await forecast_refresh.run_forecast_refresh()
+
+        assert list(written) == ["hotel_b"]
+
+    def test_registers_nightly_cron(self):
+        scheduler = MagicMock()
+        forecast_refresh.register_forecast_refresh_job(scheduler)
+
+        kwargs = scheduler.add_job.call_args.kwargs
+        assert kwargs["trigger"] == "cron"
+        assert (kwargs["hour"], kwargs["minute"]) == (3, 45)
+        assert kwargs["id"] == "forecast_refresh"
@@ -0,0 +1,158 @@
+"""Tests for ProphetModelRegistry — lazy, LRU-bounded per-tenant Prophet models.
+
+Coverage:
+  - nothing loaded until first get(); untrained key → None
+  - cache hit on repeated get(); separate models per (tenant, service_type)
+  - LRU eviction by model count and by serialized size
+  - a newer model file is reloaded on the next get()
+  - save(): atomic write, regressors preserved, untrained engine rejected
+  - trained_keys(): original (unsanitized) ids from the .key sidecars
+"""
+from __future__ import annotations
+
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.model_registry import ProphetModelRegistry
+from app.services.prediction_engine import PredictionEngine
+
+TARGET = date(2026, 5, 1)
+
+
+@pytest.fixture(scope="module")
+def trained_engine() -> PredictionEngine:
+    rng = np.random.default_rng(7)
+    ds = pd.date_range("2025-12-01", periods=120, freq="D")
+    df = pd.DataFrame({
+        "ds": ds,
+        "y": rng.poisson(40 + 10 * (ds.dayofweek >= 5)),
+        "weather_score": rng.uniform(0, 1, len(ds)),
+    })
+    engine = PredictionEngine()
+    engine.train(df)
+    return engine
+
+
+@pytest.fixture
+def registry(tmp_path, trained_engine) -> ProphetModelRegistry:
+    reg = ProphetModelRegistry(model_dir=tmp_path, max_models=2, max_bytes=10**9)
+    for tenant in ("hotel_a", "hotel_b", "hotel_c"):
+        reg.save(tenant, "dinner", trained_engine)
+    return reg
+
+
+class TestLazyLoading:
+    def test_nothing_loaded_until_first_get(self, registry):
+        assert registry.stats()["models"] == 0
+
+        engine = registry.get("hotel_a", "dinner")
+
+        assert engine is not None and engine.is_trained
+        assert engine.regressors == ["weather_score"]
+        assert registry.stats()["misses"] == 1
+
+    def test_repeated_get_is_a_cache_hit(self, registry):
+        first = registry.get("hotel_a", "dinner")
+        assert registry.get("hotel_a", "dinner") is first
+        assert registry.stats()["hits"] == 1
+
+    def test_untrained_key_returns_none(self, registry):
+        assert registry.get("hotel_a", "breakfast") is None
+        assert registry.get("unknown", "dinner") is None
+
+    def test_loaded_model_predicts(self, registry):
+        result = registry.get("hotel_b", "dinner").predict(TARGET, {"weather_score": 0.5})
+        assert not result.is_mock
+        assert result.lower <= result.predicted <= result.upper
+
+
+class TestEviction:
+    def test_least_recently_used_evicted_by_count(self, registry):
+        a = registry.get("hotel_a", "dinner")
+        registry.get("hotel_b", "dinner")
+        registry.get("hotel_a", "dinner")  # b is now least recently used
+        registry.get("hotel_c", "dinner")
+
+        stats = registry.stats()
+        assert stats["models"] == 2
+        assert stats["evictions"] == 1
+        assert registry.get("hotel_a", "dinner") is a
+        assert registry.get("hotel_b", "dinner") is not None
+        assert registry.stats()["misses"] == 4
+
+    def test_evicted_by_memory_budget(self, tmp_path, trained_engine):
+        reg = ProphetModelRegistry(model_dir=tmp_path, max_models=10, max_bytes=1)
+        reg.save("hotel_a", "dinner", trained_engine)
+        reg.save("hotel_b", "dinner", trained_engine)
+
+        reg.get("hotel_a", "dinner")
+        reg.get("hotel_b", "dinner")
+
+        stats = reg.stats()
+        # The most recent model always stays, even above the budget
+        assert stats["models"] == 1
+        assert stats["bytes"] == reg.path_for("hotel_b", "dinner").stat().st_size
+
+
+class TestVersioning:
+    def test_newer_model_file_is_reloaded(self, registry):
+        first = registry.get("hotel_a", "dinner")
+        path = registry.path_for("hotel_a", "dinner")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = registry.get("hotel_a", "dinner")
+
+        assert second is not first
+        assert registry.stats()["reloads"] == 1
+        assert registry.stats()["models"] == 1
+
+    def test_save_invalidates_cached_model(self, registry, trained_engine):
+        first = registry.get("hotel_a", "dinner")
+        registry.save("hotel_a", "dinner", trained_engine)
+        assert registry.get("hotel_a", "dinner") is not first
+
+    def test_deleted_model_is_dropped(self, registry):
+        registry.get("hotel_a", "dinner")
+        registry.path_for("hotel_a", "dinner").unlink()
+        assert registry.get("hotel_a", "dinner") is None
+        assert registry.stats()["models"] == 0
+
+
+class TestSave:
+    def test_untrained_engine_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            ProphetModelRegistry(model_dir=tmp_path).save("hotel_a", "dinner", PredictionEngine())
+
+    def test_layout_and_no_temp_files_left(self, registry, tmp_path):
+        assert sorted(p.name for p in (tmp_path / "hotel_a").iterdir()) == [
+            "dinner.json",
+            "dinner.key",
+        ]
+
+    def test_key_components_are_sanitized(self, registry):
+        path = registry.path_for("../etc", "din/ner")
+        assert path.parent.parent == registry.model_dir
+        assert (path.parent.name, path.name) == ("%2E.%2Fetc", "din%2Fner.json")
+
+    def test_distinct_keys_never_share_a_file(self, registry):
+        keys = [("a/b", "d"), ("a_b", "d"), ("a%2Fb", "d"), (".x", "d"), ("%2Ex", "d")]
+        assert len({registry.path_for(*key) for key in keys}) == len(keys)
+        path = registry.path_for("hotel_a", "dinner")
+        assert path == registry.model_dir / "hotel_a" / "dinner.json"
+
+    def test_trained_keys_return_original_ids(self, tmp_path, trained_engine):
+        reg = ProphetModelRegistry(model_dir=tmp_path)
+        reg.save("hotel a/1", "late dinner", trained_engine)
+        reg.save("hotel_b", "dinner", trained_engine)
+
+        assert reg.trained_keys() == [("hotel a/1", "late dinner"), ("hotel_b", "dinner")]
+        assert reg.get(*reg.trained_keys()[0]) is not None
+
+    def test_model_without_sidecar_reported_by_path(self, registry, tmp_path):
+        (tmp_path / "hotel_a" / "dinner.key").unlink()
+        assert ("hotel_a", "dinner") in registry.trained_keys()
@@ -0,0 +1,153 @@
+"""Tests for the per-tenant Prophet training orchestrator.
+
+Coverage:
+  - load_training_frames(): one query, per-day dedup, window and status filters
+  - covers_frame(): revenue → covers with the service share and avg spend
+  - train_portfolio(): fits across a process pool, models saved to the
+    registry, runs recorded with fit duration / in-sample error, short
+    histories skipped, failed fits isolated, forecasts materialized
+  - worker: nightly cron registered
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, ModelTrainingRun, PMSSyncLog, ServiceForecast
+from app.services.model_registry import ProphetModelRegistry
+from app.services.model_training import (
+    SERVICE_SHARES,
+    covers_frame,
+    load_training_frames,
+    train_portfolio,
+)
+from app.workers import model_training as model_training_worker
+
+END = date.today()
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rng = np.random.default_rng(5)
+    async with factory() as session:
+        session.add_all([
+            PMSSyncLog(
+                tenant_id="hotel_a",
+                sync_date=END - timedelta(days=i),
+                occupancy=100,
+                fb_revenue=float(4000 + rng.normal(0, 200) + 1500 * ((END - timedelta(days=i)).weekday() >= 5)),
+                status="success",
+            )
+            for i in range(90)
+        ])
+        session.add_all([
+            PMSSyncLog(tenant_id="hotel_b", sync_date=END - timedelta(days=i), occupancy=50,
+                       fb_revenue=1000.0, status="success")
+            for i in range(10)
+        ])
+        await session.commit()
+
+    yield factory
+
+    await engine.dispose()
+
+
+class TestTrainingFrames:
+    @pytest.mark.asyncio
+    async def test_one_row_per_day_within_window(self, session_factory):
+        async with session_factory() as session:
+            session.add_all([
+                # duplicate day (re-sync) → highest revenue kept
+                PMSSyncLog(tenant_id="hotel_b", sync_date=END, occupancy=50,
+                           fb_revenue=1200.0, status="success"),
+                PMSSyncLog(tenant_id="hotel_b", sync_date=END - timedelta(days=20), occupancy=0,
+                           fb_revenue=None, status="failed"),
+            ])
+            await session.commit()
+            frames = await load_training_frames(["hotel_b", "unknown"], session, end=END)
+
+        days, revenues = frames["hotel_b"]
+        assert len(days) == 10 and days == sorted(days)
+        assert revenues[-1] == 1200.0
+        assert "unknown" not in frames
+
+    def test_covers_from_revenue(self):
+        frame = ([END], [4000.0])
+        assert covers_frame(frame, "dinner", 40.0) == [round(4000 * SERVICE_SHARES["dinner"] / 40, 2)]
+        assert SERVICE_SHARES["dinner"] > SERVICE_SHARES["breakfast"]
+
+
+class TestTrainPortfolio:
+    @pytest.mark.asyncio
+    async def test_fits_in_process_pool_and_records_runs(self, session_factory, tmp_path):
+        registry = ProphetModelRegistry(model_dir=tmp_path)
+        with (
+            patch("app.services.model_training.AsyncSessionLocal", session_factory),
+            patch("app.services.model_training.MIN_TRAINING_DAYS", 60),
+        ):
+            outcomes = await train_portfolio(
+                service_types=("lunch", "dinner"), workers=2, registry=registry
+            )
+
+        by_key = {(o.tenant_id, o.service_type): o for o in outcomes}
+        assert {o.status for k, o in by_key.items() if k[0] == "hotel_b"} == {"insufficient_data"}
+        dinner = by_key[("hotel_a", "dinner")]
+        assert dinner.status == "trained"
+        assert dinner.training_rows == 90
+        assert dinner.fit_seconds > 0
+        assert 0 <= dinner.in_sample_mape < 0.5
+        assert dinner.model_version == registry.version("hotel_a", "dinner")
+        assert registry.trained_keys() == [("hotel_a", "dinner"), ("hotel_a", "lunch")]
+
+        async with session_factory() as session:
+            runs = (await session.execute(select(ModelTrainingRun))).scalars().all()
+            forecasts = (await session.execute(select(ServiceForecast))).scalars().all()
+        assert len(runs) == 4
+        assert {(r.tenant_id, r.status) for r in runs} == {
+            ("hotel_a", "trained"), ("hotel_b", "insufficient_data")
+        }
+        assert all(r.in_sample_mae is not None for r in runs if r.status == "trained")
+        assert {f.service_type for f in forecasts} == {"lunch", "dinner"}
+
+    @pytest.mark.asyncio
+    async def test_failed_fit_isolated_and_recorded(self, session_factory, tmp_path):
+        # A file where the model directory should be: saving fails in the worker
+        blocked = tmp_path / "blocked"
+        blocked.write_text("")
+        with patch("app.services.model_training.AsyncSessionLocal", session_factory):
+            outcomes = await train_portfolio(
+                ["hotel_a"], service_types=("dinner",), workers=1,
+                registry=ProphetModelRegistry(model_dir=blocked),
+            )
+
+        assert [o.status for o in outcomes] == ["failed"]
+        assert outcomes[0].error
+        async with session_factory() as session:
+            run = (await session.execute(select(ModelTrainingRun))).scalars().one()
+        assert run.status == "failed" and run.error_message
+
+
+class TestModelTrainingWorker:
+    def test_registers_nightly_cron(self):
+        scheduler = MagicMock()
+        model_training_worker.register_model_training_job(scheduler)
+
+        kwargs = scheduler.add_job.call_args.kwargs
+        assert kwargs["trigger"] == "cron"
+        assert (kwargs["hour"], kwargs["minute"]) == (3, 0)
+        assert kwargs["id"] == "model_training"
@@ -0,0 +1,331 @@
+"""Tests for PMSBackfillService — chunked, concurrent, resumable PMS history import.
+
+Coverage:
+  Unit:
+    - split_date_range(): inclusive chunks, validation
+    - aggregate_daily(): daily-metric and stay-record shapes, chunk clipping
+  Streaming:
+    - ApaleoPMSAdapter.iter_historical_pages(): one page per request
+    - DailyAggregator / DataTransformer.stay_pages_to_prophet(): page-by-page
+      totals equal the all-in-memory result
+  Integration (in-memory SQLite):
+    - every chunk fetched once, rows bulk-inserted, baseline recomputed once
+    - re-running replaces existing days instead of duplicating them
+    - failed chunk → job 'partial'; resume fetches only the missing chunk
+    - concurrent fetches bounded by the service concurrency
+    - claim() refuses running and completed jobs
+    - a storage error marks the job 'failed' instead of leaving it 'running'
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, PMSSyncLog
+from app.services.apaleo_adapter import ApaleoPMSAdapter
+from app.services.data_transformer import DataTransformer
+from app.services.pms_backfill import (
+    DailyAggregator,
+    PMSBackfillService,
+    aggregate_daily,
+    split_date_range,
+)
+from app.services.pms_sync import MockPMSAdapter
+
+_BASELINE = "app.services.captation_service.CaptationService.calculate_baseline"
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+class _DailyAdapter(MockPMSAdapter):
+    """Returns one daily-metric record per day of the requested range."""
+
+    def __init__(self, fail_on: tuple = ()) -> None:
+        super().__init__()
+        self.calls: List[tuple] = []
+        self.fail_on = set(fail_on)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_historical_data(self, property_id, start_date, end_date) -> List[Dict[str, Any]]:
+        self.calls.append((start_date, end_date))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if start_date in self.fail_on:
+                raise RuntimeError("HTTP 503")
+            days = (end_date - start_date).days + 1
+            return [
+                {
+                    "date": (start_date + timedelta(days=i)).isoformat(),
+                    "occupancy": 100,
+                    "fb_revenue": 2000.0,
+                }
+                for i in range(days)
+            ]
+        finally:
+            self.in_flight -= 1
+
+
+async def _logs(session: AsyncSession) -> List[PMSSyncLog]:
+    result = await session.execute(select(PMSSyncLog).order_by(PMSSyncLog.sync_date))
+    return list(result.scalars().all())
+
+
+# ---------------------------------------------------------------------------
+# Unit
+# ---------------------------------------------------------------------------
+
+class TestSplitDateRange:
+    def test_inclusive_chunks_cover_range(self):
+        chunks = split_date_range(date(2025, 1, 1), date(2025, 1, 25), 10)
+        assert chunks == [
+            (date(2025, 1, 1), date(2025, 1, 10)),
+            (date(2025, 1, 11), date(2025, 1, 20)),
+            (date(2025, 1, 21), date(2025, 1, 25)),
+        ]
+
+    def test_single_day(self):
+        assert split_date_range(date(2025, 1, 1), date(2025, 1, 1), 30) == [
+            (date(2025, 1, 1), date(2025, 1, 1))
+        ]
+
+    def test_reversed_range_rejected(self):
+        with pytest.raises(ValueError):
+            split_date_range(date(2025, 2, 1), date(2025, 1, 1), 30)
+
+
+class TestAggregateDaily:
+    def test_stay_nights_clipped_to_chunk(self):
+        records = [
+            # 3 nights: Jan 9, 10, 11 — only Jan 9-10 fall in the chunk
+            {"arrival": "2025-01-09T15:00:00+01:00", "departure": "2025-01-12T11:00:00+01:00"},
+            {"arrival": "2025-01-10", "departure": "2025-01-11", "fbRevenue": 45.5},
+        ]
+        days = aggregate_daily(records, date(2025, 1, 1), date(2025, 1, 10))
+
+        assert sorted(days) == [date(2025, 1, 9), date(2025, 1, 10)]
+        assert days[date(2025, 1, 9)].occupancy == 1
+        assert days[date(2025, 1, 10)].occupancy == 2
+        assert days[date(2025, 1, 10)].fb_revenue == pytest.approx(45.5)
+        assert days[date(2025, 1, 9)].fb_revenue is None
+
+    def test_daily_metric_records(self):
+        records = [
+            {"date": "2025-01-05", "occupancy": 80, "fb_revenue": 1500.0},
+            {"date": "2024-12-31", "occupancy": 90, "fb_revenue": 1.0},  # outside
+        ]
+        days = aggregate_daily(records, date(2025, 1, 1), date(2025, 1, 31))
+        assert list(days) == [date(2025, 1, 5)]
+        assert days[date(2025, 1, 5)].occupancy == 80
+        assert days[date(2025, 1, 5)].fb_revenue == 1500.0
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+_STAYS = [
+    {"arrival": "2025-01-01T14:00:00Z", "departure": "2025-01-03T10:00:00Z", "adults": 2, "children": 1},
+    {"arrival": "2025-01-02T14:00:00Z", "departure": "2025-01-03T10:00:00Z", "adults": 1, "children": 0},
+    {"arrival": "2025-01-01T18:00:00Z", "departure": "2025-01-02T10:00:00Z", "adults": 2, "children": 0},
+]
+
+
+def _page_response(records, next_token=None) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = {
+        "stayRecords": records,
+        "pageInfo": {"hasNext": next_token is not None, "nextPageToken": next_token},
+    }
+    return resp
+
+
+async def _pages(*pages):
+    for page in pages:
+        yield page
+
+
+class TestStreamingPages:
+    @pytest.mark.asyncio
+    async def test_adapter_yields_one_page_per_request(self):
+        http = AsyncMock()
+        http.get = AsyncMock(side_effect=[
+            _page_response(_STAYS[:2], next_token="p2"),
+            _page_response(_STAYS[2:]),
+        ])
+        adapter = ApaleoPMSAdapter("id", "secret", http_client=http)
+        adapter.access_token, adapter.token_expiry = "tok", float("inf")
+
+        pages = [
+            page async for page in
+            adapter.iter_historical_pages("MUC", date(2025, 1, 1), date(2025, 1, 31))
+        ]
+
+        assert [len(p) for p in pages] == [2, 1]
+        assert http.get.await_args_list[1].kwargs["params"]["pageToken"] == "p2"
+
+    def test_page_by_page_totals_match_in_memory(self):
+        aggregator = DailyAggregator(date(2025, 1, 1), date(2025, 1, 31))
+        for record in _STAYS:
+            aggregator.add([record])
+
+        expected = aggregate_daily(_STAYS, date(2025, 1, 1), date(2025, 1, 31))
+        assert aggregator.days == expected
+        assert expected[date(2025, 1, 1)].occupancy == 2
+        assert expected[date(2025, 1, 2)].occupancy == 2
+
+    @pytest.mark.asyncio
+    async def test_prophet_frame_from_pages_matches_list_variant(self):
+        streamed = await DataTransformer.stay_pages_to_prophet(_pages(_STAYS[:1], _STAYS[1:]))
+        in_memory = DataTransformer.stay_records_to_prophet(_STAYS)
+
+        assert streamed.equals(in_memory)
+        assert list(streamed["y"]) == [5, 1]
+        assert str(streamed["ds"].dtype).startswith("datetime64")
+
+
+# ---------------------------------------------------------------------------
+# Integration
+# ---------------------------------------------------------------------------
+
+class TestBackfillRun:
+    @pytest.mark.asyncio
+    async def test_create_job_needs_no_adapter(self, async_session):
+        job = await PMSBackfillService.create_job(
+            async_session, "hotel_a", date(2025, 1, 1), date(2025, 1, 7), "apaleo_raw"
+        )
+        assert job.status == "pending"
+        assert job.adapter == "apaleo_raw"
+        assert job.chunks_total == 1
+
+    @pytest.mark.asyncio
+    async def test_fetches_chunks_and_recomputes_baseline_once(self, async_session):
+        adapter = _DailyAdapter()
+        service = PMSBackfillService(adapter, concurrency=4)
+        job = await service.create_job(
+            async_session, "hotel_a", date(2025, 1, 1), date(2025, 3, 31), "mock", chunk_days=30
+        )
+
+        with patch(_BASELINE, new_callable=AsyncMock) as baseline:
+            job = await service.run(async_session, job)
+
+        assert job.status == "completed"
+        assert job.chunks_total == 3
+        assert len(job.completed_chunks) == 3
+        assert job.rows_written == 90
+        assert sorted(adapter.calls)[0] == (date(2025, 1, 1), date(2025, 1, 30))
+        logs = await _logs(async_session)
+        assert len(logs) == 90
+        assert logs[0].raw_payload_summary["source"] == "backfill"
+        baseline.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rerun_replaces_existing_days(self, async_session):
+        async_session.add(
+            PMSSyncLog(tenant_id="hotel_a", sync_date=date(2025, 1, 3), occupancy=5,
+                       fb_revenue=10.0, status="success")
+        )
+        await async_session.commit()
+        service = PMSBackfillService(_DailyAdapter())
+
+        with patch(_BASELINE, new_callable=AsyncMock):
+            for _ in range(2):
+                job = await service.create_job(
+                    async_session, "hotel_a", date(2025, 1, 1), date(2025, 1, 7), "mock"
+                )
+                await service.run(async_session, job)
+
+        logs = await _logs(async_session)
+        assert len(logs) == 7
+        assert {log.occupancy for log in logs} == {100}
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_resumed(self, async_session):
+        adapter = _DailyAdapter(fail_on=(date(2025, 1, 11),))
+        service = PMSBackfillService(adapter)
+        job = await service.create_job(
+            async_session, "hotel_a", date(2025, 1, 1), date(2025, 1, 30), "mock", chunk_days=10
+        )
+
+        with patch(_BASELINE, new_callable=AsyncMock):
+            job = await service.run(async_session, job)
+            assert job.status == "partial"
+            assert "2025-01-11" in job.error_message
+            assert job.completed_chunks == ["2025-01-01", "2025-01-21"]
+
+            adapter.fail_on.clear()
+            adapter.calls.clear()
+            job = await service.run(async_session, job)
+
+        assert job.status == "completed"
+        assert adapter.calls == [(date(2025, 1, 11), date(2025, 1, 20))]
+        assert len(await _logs(async_session)) == 30
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, async_session):
+        adapter = _DailyAdapter()
+        service = PMSBackfillService(adapter, concurrency=2)
+        job = await service.create_job(
+            async_session, "hotel_a", date(2025, 1, 1), date(2025, 1, 10), "mock", chunk_days=1
+        )
+
+        with patch(_BASELINE, new_callable=AsyncMock):
+            await service.run(async_session, job)
+
+        assert len(adapter.calls) == 10
+        assert adapter.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_claim_refuses_running_and_completed_jobs(self, async_session):
+        job = await PMSBackfillService.create_job(
+            async_session, "hotel_a", date(2025, 1, 1), date(2025, 1, 7), "mock"
+        )
+
+        assert await PMSBackfillService.claim(async_session, job.id) is True
+        assert await PMSBackfillService.claim(async_session, job.id) is False
+
+        await async_session.refresh(job)
+        job.status = "completed"
+        await async_session.commit()
+        assert await PMSBackfillService.claim(async_session, job.id) is False
+
+    @pytest.mark.asyncio
+    async def test_store_error_marks_job_failed(self, async_session):
+        service = PMSBackfillService(_DailyAdapter())
+        job = await service.create_job(
+            async_session, "hotel_a", date(2025, 1, 1), date(2025, 1, 7), "mock"
+        )
+
+        store = AsyncMock(side_effect=RuntimeError("disk full"))
+        with patch.object(service, "_store_chunk", store), pytest.raises(RuntimeError):
+            await service.run(async_session, job)
+
+        await async_session.refresh(job)
+        assert job.status == "failed"
+        assert job.error_message == "disk full"
+        assert await PMSBackfillService.claim(async_session, job.id) is True
@@ -39,33 +39,15 @@ async def client(app: FastAPI) -> AsyncClient:
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _mock_transport():
-    """Return a wired async-context-manager fake for streamablehttp_client."""
-    transport = MagicMock()
-    transport.__aenter__ = AsyncMock(return_value=("r", "w", lambda: None))
-    transport.__aexit__ = AsyncMock(return_value=False)
-    return transport
-
-
-def _mock_session(tool_names: list[str]):
-    """Return a wired async-context-manager fake for ClientSession."""
+def _tools(tool_names: list[str]) -> list[MagicMock]:
+    """Return fake MCP Tool objects as served by the session pool."""
     # MagicMock(name=...) sets the mock's repr name, NOT the .name attribute.
     tool_mocks = []
     for n in tool_names:
         t = MagicMock()
         t.name = n
         tool_mocks.append(t)
-    list_result = MagicMock()
-    list_result.tools = tool_mocks
-
-    session = AsyncMock()
-    session.initialize = AsyncMock()
-    session.list_tools = AsyncMock(return_value=list_result)
-
-    wrapper = MagicMock()
-    wrapper.__aenter__ = AsyncMock(return_value=session)
-    wrapper.__aexit__ = AsyncMock(return_value=False)
-    return wrapper
+    return tool_mocks
 
 
 # ---------------------------------------------------------------------------
@@ -88,15 +70,13 @@ class TestProbeOk:
     async def test_returns_200_with_tool_list(self, client: AsyncClient) -> None:
         tool_names = ["APALEO_GET_OCCUPANCY_METRICS", "APALEO_GET_RESERVATIONS"]
 
-        with (
-            patch("app.api.routes.pms.ApaleoMCPClient") as MockClient,
-            patch("app.api.routes.pms.streamablehttp_client", return_value=_mock_transport()),
-            patch("app.api.routes.pms.ClientSession", return_value=_mock_session(tool_names)),
-        ):
+        with patch("app.api.routes.pms.ApaleoMCPClient") as MockClient:
             instance = MockClient.return_value
             instance.is_configured = True
             instance.server_url = "https://mcp.apaleo.com/mcp/"
             instance._get_token = AsyncMock(return_value="tok")
+            instance.ping = AsyncMock()
+            instance.list_tools = AsyncMock(return_value=_tools(tool_names))
 
             resp = await client.get("/pms/mcp/probe")
 
@@ -107,18 +87,12 @@ class TestProbeOk:
         assert "APALEO_GET_OCCUPANCY_METRICS" in body["tools"]
 
     async def test_returns_503_on_transport_error(self, client: AsyncClient) -> None:
-        broken_transport = MagicMock()
-        broken_transport.__aenter__ = AsyncMock(side_effect=RuntimeError("connection refused"))
-        broken_transport.__aexit__ = AsyncMock(return_value=False)
-
-        with (
-            patch("app.api.routes.pms.ApaleoMCPClient") as MockClient,
-            patch("app.api.routes.pms.streamablehttp_client", return_value=broken_transport),
-        ):
+        with patch("app.api.routes.pms.ApaleoMCPClient") as MockClient:
             instance = MockClient.return_value
             instance.is_configured = True
             instance.server_url = "https://mcp.apaleo.com/mcp/"
             instance._get_token = AsyncMock(return_value="tok")
+            instance.ping = AsyncMock(side_effect=RuntimeError("connection refused"))
 
             resp = await client.get("/pms/mcp/probe")
 
@@ -0,0 +1,164 @@
+"""Tests for concurrent PMS sync — per-property metric fan-out and portfolio runs.
+
+Coverage:
+  - sync_daily_data(): occupancy and revenue requested concurrently
+  - sync_portfolio(): bounded property concurrency, failures isolated,
+    all PMSSyncLog rows written in one batch, baseline only for synced ones
+  - nightly worker: skipped without credentials, syncs yesterday, cron registered
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, PMSSyncLog
+from app.services.pms_sync import MockPMSAdapter, PMSSyncService
+from app.workers import pms_sync as pms_sync_worker
+
+DAY = date(2026, 10, 18)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+class _GatedAdapter(MockPMSAdapter):
+    """Occupancy only returns once revenue has been requested (deadlocks if sequential)."""
+
+    def __init__(self, fail_for: tuple = ()) -> None:
+        super().__init__()
+        self.fail_for = set(fail_for)
+        self._revenue_requested: dict = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _event(self, property_id: str) -> asyncio.Event:
+        return self._revenue_requested.setdefault(property_id, asyncio.Event())
+
+    async def get_occupancy(self, property_id, target_date):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self._event(property_id).wait()
+            if property_id in self.fail_for:
+                raise RuntimeError("HTTP 503")
+            return 100
+        finally:
+            self.in_flight -= 1
+
+    async def get_revenue(self, property_id, target_date, category="Total"):
+        self._event(property_id).set()
+        await asyncio.sleep(0)
+        return 2500.0
+
+
+class TestConcurrentMetrics:
+    @pytest.mark.asyncio
+    async def test_sync_daily_data_fetches_metrics_concurrently(self):
+        service = PMSSyncService(_GatedAdapter())
+        with (
+            patch.object(service, "_trigger_captation_recalculation", new_callable=AsyncMock),
+            patch("app.services.pms_sync.AsyncSessionLocal") as mock_session_cls,
+            patch("app.services.ops_dispatcher.dispatch_report", new_callable=AsyncMock),
+            patch("app.integrations.obsidian.VAULT_FOLDERS", {"sync_logs": "logs"}, create=True),
+        ):
+            mock_session = AsyncMock()
+            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_session.__aexit__ = AsyncMock(return_value=False)
+            mock_session_cls.return_value = mock_session
+
+            result = await asyncio.wait_for(service.sync_daily_data("hotel_a", DAY), timeout=2)
+
+        assert result["occupancy"] == 100
+        assert result["fb_revenue"] == 2500.0
+
+
+class TestSyncPortfolio:
+    @pytest.mark.asyncio
+    async def test_fans_out_and_writes_one_batch(self, session_factory):
+        adapter = _GatedAdapter(fail_for=("hotel_c",))
+        service = PMSSyncService(adapter)
+        properties = [f"hotel_{c}" for c in "abcdef"]
+
+        with (
+            patch("app.services.pms_sync.AsyncSessionLocal", session_factory),
+            patch.object(service, "_trigger_captation_recalculation", new_callable=AsyncMock) as trigger,
+        ):
+            results = await asyncio.wait_for(
+                service.sync_portfolio(properties, DAY, concurrency=3), timeout=2
+            )
+
+        assert adapter.max_in_flight == 3
+        by_property = {r["property_id"]: r for r in results}
+        assert by_property["hotel_c"]["status"] == "failed"
+        assert "503" in by_property["hotel_c"]["error"]
+        assert by_property["hotel_a"] == {
+            "property_id": "hotel_a",
+            "status": "success",
+            "occupancy": 100,
+            "fb_revenue": 2500.0,
+            "date": DAY.isoformat(),
+        }
+
+        async with session_factory() as session:
+            logs = (await session.execute(select(PMSSyncLog))).scalars().all()
+        assert len(logs) == 6
+        assert {log.status for log in logs if log.tenant_id == "hotel_c"} == {"failed"}
+
+        assert sorted(c.args[0] for c in trigger.await_args_list) == [
+            "hotel_a", "hotel_b", "hotel_d", "hotel_e", "hotel_f",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_portfolio_is_noop(self, session_factory):
+        service = PMSSyncService(MockPMSAdapter())
+        with patch("app.services.pms_sync.AsyncSessionLocal", session_factory):
+            assert await service.sync_portfolio([], DAY) == []
+
+
+class TestNightlyWorker:
+    @pytest.mark.asyncio
+    async def test_skipped_without_credentials(self, monkeypatch):
+        monkeypatch.delenv("APALEO_CLIENT_ID", raising=False)
+        with patch.object(pms_sync_worker, "_load_pms_property_ids", new_callable=AsyncMock) as load:
+            await pms_sync_worker._run_pms_sync_job()
+        load.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_syncs_previous_day_for_all_properties(self, monkeypatch):
+        monkeypatch.setenv("APALEO_CLIENT_ID", "id")
+        with (
+            patch.object(pms_sync_worker, "_load_pms_property_ids",
+                         new_callable=AsyncMock, return_value=["hotel_a", "hotel_b"]),
+            patch.object(PMSSyncService, "sync_portfolio", new_callable=AsyncMock) as sync,
+        ):
+            await pms_sync_worker._run_pms_sync_job()
+
+        yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+        sync.assert_awaited_once_with(["hotel_a", "hotel_b"], yesterday)
+
+    def test_registers_nightly_cron(self):
+        scheduler = MagicMock()
+        pms_sync_worker.register_pms_sync_job(scheduler)
+
+        kwargs = scheduler.add_job.call_args.kwargs
+        assert kwargs["trigger"] == "cron"
+        assert (kwargs["hour"], kwargs["minute"]) == (2, 30)
+        assert kwargs["id"] == "pms_portfolio_sync"
@@ -0,0 +1,79 @@
+"""Tests for PredictionEngine.predict_many — batched multi-date forecasting.
+
+Coverage:
+  - one Prophet predict call for the whole horizon, results in date order
+  - unsorted dates: each result matches its own date and features
+  - point forecasts identical to per-date predict()
+  - shared vs per-date regressor values
+  - untrained engine → mock results; empty horizon → []
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.prediction_engine import PredictionEngine
+
+START = date(2026, 4, 1)
+HORIZON = [START + timedelta(days=i) for i in range(14)]
+
+
+@pytest.fixture(scope="module")
+def engine() -> PredictionEngine:
+    rng = np.random.default_rng(3)
+    ds = pd.date_range("2025-12-01", periods=120, freq="D")
+    df = pd.DataFrame({
+        "ds": ds,
+        "y": rng.poisson(40 + 15 * (ds.dayofweek >= 5)),
+        "weather_score": rng.uniform(0, 1, len(ds)),
+    })
+    trained = PredictionEngine()
+    trained.train(df)
+    return trained
+
+
+class TestPredictMany:
+    def test_single_model_call_for_horizon(self, engine):
+        with patch.object(engine.model, "predict", wraps=engine.model.predict) as spy:
+            results = engine.predict_many(HORIZON, {"weather_score": 0.5})
+
+        spy.assert_called_once()
+        assert len(spy.call_args.args[0]) == 14
+        assert [r.date for r in results] == [d.isoformat() for d in HORIZON]
+        assert all(not r.is_mock and r.lower <= r.predicted <= r.upper for r in results)
+
+    def test_matches_per_date_predictions(self, engine):
+        batched = engine.predict_many(HORIZON, {"weather_score": 0.5})
+        single = [engine.predict(d, {"weather_score": 0.5}) for d in HORIZON]
+        assert [r.predicted for r in batched] == [r.predicted for r in single]
+
+    def test_per_date_features(self, engine):
+        features = [{"weather_score": 0.0}, None, {"weather_score": 0.0}]
+        with patch.object(engine.model, "predict", wraps=engine.model.predict) as spy:
+            engine.predict_many(HORIZON[:3], features)
+        assert list(spy.call_args.args[0]["weather_score"]) == [0.0, 0.0, 0.0]
+
+        with pytest.raises(ValueError):
+            engine.predict_many(HORIZON[:3], [{"weather_score": 1.0}])
+
+    def test_unsorted_dates_keep_caller_order(self, engine):
+        dates = [HORIZON[5], HORIZON[0], HORIZON[12], HORIZON[3], HORIZON[5]]
+        features = [{"weather_score": w} for w in (1.0, 0.0, 0.5, 0.9, 0.0)]
+
+        batched = engine.predict_many(dates, features)
+        single = [engine.predict(d, f) for d, f in zip(dates, features)]
+
+        assert [r.date for r in batched] == [d.isoformat() for d in dates]
+        assert [r.predicted for r in batched] == [r.predicted for r in single]
+
+    def test_untrained_engine_returns_mock_results(self):
+        results = PredictionEngine().predict_many(HORIZON[:2])
+        assert [r.to_dict()["predicted_covers"] for r in results] == [45, 45]
+        assert all(r.is_mock for r in results)
+
+    def test_empty_horizon(self, engine):
+        assert engine.predict_many([]) == []
@@ -1,34 +1,55 @@
 """Tests for WeatherIngestionService -- HOS-83 Story 3.1.
 
 Coverage:
-  Unit:
-    - normalise(): maps Open-Meteo response correctly
-    - normalise(): skips unparseable timestamps
-    - normalise(): handles arrays shorter than timestamps
   Integration (mocked HTTP):
     - sync_property(): raises ValueError when GPS missing
     - sync_property(): raises ValueError when no profile found
     - sync_property(): happy path with mocked HTTP + DB
-  Cross-tenant isolation:
-    - normalise() tags every row with the supplied tenant_id
+  Unit (columnar hot path):
+    - normalise_columns(): maps Open-Meteo response, one list per variable
+    - normalise_columns(): drops unparseable timestamps, pads short arrays
+    - _upsert(): SQLite fallback merges idempotently (no duplicates)
+  Grid cells:
+    - grid_cell() snaps nearby coordinates to the same cell
+    - group_by_cell() fetches each cell once for clustered properties
+    - sync_cell() upserts once and links every member property
+  Batch fetching:
+    - fetch_cells() sends comma-separated coordinates, one call per chunk
+    - fetch_cells() splits the array response per cell
+    - fetch_cells() skips a failed chunk without losing the others
+  Fetch cache (in-memory SQLite):
+    - stale_cells() skips cells fetched in the current model run within TTL
+    - stale_cells() refetches after TTL expiry or a new model run
+    - store_cell() skips the upsert when the payload hash is unchanged
   API:
     - POST /api/v1/weather/sync returns 202 immediately
     - POST /api/v1/weather/sync returns 404 when user has no profile
     - Response uses camelCase aliases (propertyId not property_id)
+    - GET /api/v1/weather/forecasts returns joined cell rows
 """
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
 
 from app.core.error_handlers import problem_details_handler
-from app.services.weather_ingestion import WeatherIngestionService
-
+from app.db.models import Base, WeatherFetchState
+from app.services.weather_ingestion import (
+    WeatherIngestionService,
+    current_model_run,
+    grid_cell,
+    group_by_cell,
+    payload_hash,
+    rollup_windows,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -50,88 +71,64 @@ def _open_meteo_payload(hours: int = 4) -> dict[str, Any]:
 
 
 # ---------------------------------------------------------------------------
-# Unit tests -- normalise()
+# Unit tests -- normalise_columns() (columnar ingestion path)
 # ---------------------------------------------------------------------------
 
-class TestNormalise:
-    def test_returns_correct_row_count(self):
+class TestNormaliseColumns:
+    def test_columns_mapped_correctly(self):
         payload = _open_meteo_payload(hours=4)
-        rows = WeatherIngestionService.normalise(
-            payload, tenant_id="tenant-A", property_id="prop-1"
-        )
-        assert len(rows) == 4
-
-    def test_row_fields_mapped_correctly(self):
-        payload = _open_meteo_payload(hours=1)
-        rows = WeatherIngestionService.normalise(
-            payload, tenant_id="tenant-A", property_id="prop-1"
-        )
-        row = rows[0]
-        assert row.tenant_id == "tenant-A"
-        assert row.property_id == "prop-1"
-        assert row.condition_code == 1
-        assert row.temperature_c == 15.5
-        assert row.precipitation_prob == 0
-        assert row.wind_speed_kmh == 5.0
-        assert row.source == "open-meteo"
-        assert row.forecast_timestamp.tzinfo is not None
+        cols = WeatherIngestionService.normalise_columns(payload)
+        assert len(cols) == 4
+        assert cols.condition_code == [1, 2, 3, 45]
+        assert cols.temperature_c == [15.5, 16.5, 17.5, 18.5]
+        assert cols.precipitation_prob == [0, 10, 20, 30]
+        assert cols.wind_speed_kmh == [5.0, 6.0, 7.0, 8.0]
 
     def test_timestamps_are_utc_aware(self):
-        payload = _open_meteo_payload(hours=2)
-        rows = WeatherIngestionService.normalise(
-            payload, tenant_id="t", property_id="p"
-        )
-        for row in rows:
-            assert row.forecast_timestamp.tzinfo == timezone.utc
+        cols = WeatherIngestionService.normalise_columns(_open_meteo_payload(hours=2))
+        assert all(ts.tzinfo == timezone.utc for ts in cols.timestamps)
 
-    def test_skips_invalid_timestamps(self):
+    def test_idempotency_same_input_same_output(self):
+        payload = _open_meteo_payload(hours=3)
+        first = WeatherIngestionService.normalise_columns(payload)
+        second = WeatherIngestionService.normalise_columns(payload)
+        assert first.timestamps == second.timestamps
+        assert payload_hash(first) == payload_hash(second)
+
+    def test_types_are_coerced(self):
         payload = {
             "hourly": {
-                "time": ["not-a-date", "2026-03-22T01:00"],
-                "temperature_2m": [10.0, 11.0],
-                "precipitation_probability": [0, 5],
-                "weathercode": [1, 2],
-                "windspeed_10m": [3.0, 4.0],
+                "time": ["2026-03-22T00:00"],
+                "temperature_2m": [10],
+                "precipitation_probability": [5.0],
+                "weathercode": [3.0],
+                "windspeed_10m": [4],
             }
         }
-        rows = WeatherIngestionService.normalise(
-            payload, tenant_id="t", property_id="p"
-        )
-        assert len(rows) == 1
-        assert rows[0].temperature_c == 11.0
+        cols = WeatherIngestionService.normalise_columns(payload)
+        assert isinstance(cols.temperature_c[0], float)
+        assert isinstance(cols.precipitation_prob[0], int)
+        assert isinstance(cols.condition_code[0], int)
+        assert isinstance(cols.wind_speed_kmh[0], float)
 
-    def test_handles_short_arrays(self):
-        """Arrays shorter than `time` list should yield None for missing slots."""
+    def test_skips_invalid_timestamps_and_pads_short_arrays(self):
         payload = {
             "hourly": {
-                "time": ["2026-03-22T00:00", "2026-03-22T01:00"],
-                "temperature_2m": [10.0],   # only 1 item for 2 timestamps
+                "time": ["not-a-date", "2026-03-22T01:00", "2026-03-22T02:00"],
+                "temperature_2m": [10.0, 11.0],
                 "precipitation_probability": [],
-                "weathercode": [],
-                "windspeed_10m": [],
+                "weathercode": [1, 2, 3],
+                "windspeed_10m": [3.0, 4.0, 5.0],
             }
         }
-        rows = WeatherIngestionService.normalise(
-            payload, tenant_id="t", property_id="p"
-        )
-        assert rows[0].temperature_c == 10.0
-        assert rows[1].temperature_c is None
-        assert rows[0].precipitation_prob is None
+        cols = WeatherIngestionService.normalise_columns(payload)
+        assert len(cols) == 2
+        assert cols.temperature_c == [11.0, None]
+        assert cols.precipitation_prob == [None, None]
+        assert cols.condition_code == [2, 3]
 
-    def test_empty_payload_returns_empty_list(self):
-        rows = WeatherIngestionService.normalise(
-            {"hourly": {}}, tenant_id="t", property_id="p"
-        )
-        assert rows == []
-
-    def test_idempotency_same_input_same_output(self):
-        payload = _open_meteo_payload(hours=3)
-        rows1 = WeatherIngestionService.normalise(payload, tenant_id="t", property_id="p")
-        rows2 = WeatherIngestionService.normalise(payload, tenant_id="t", property_id="p")
-        assert len(rows1) == len(rows2)
-        for r1, r2 in zip(rows1, rows2):
-            assert r1.forecast_timestamp == r2.forecast_timestamp
-            assert r1.condition_code == r2.condition_code
+    def test_empty_payload(self):
+        assert len(WeatherIngestionService.normalise_columns({"hourly": {}})) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -197,23 +194,384 @@ class TestSyncPropertyMockedHTTP:
 
 
 # ---------------------------------------------------------------------------
-# Cross-tenant isolation
+# Grid cells -- geo-deduplicated fetching
 # ---------------------------------------------------------------------------
 
-class TestCrossTenantIsolation:
-    def test_normalise_tags_rows_with_caller_tenant(self):
-        payload = _open_meteo_payload(hours=2)
-        rows_a = WeatherIngestionService.normalise(payload, tenant_id="A", property_id="pA")
-        rows_b = WeatherIngestionService.normalise(payload, tenant_id="B", property_id="pB")
+def _profile(tenant_id: str, lat: float | None, lng: float | None) -> MagicMock:
+    p = MagicMock()
+    p.tenant_id = tenant_id
+    p.latitude = lat
+    p.longitude = lng
+    return p
+
+
+class TestGridCells:
+    def test_nearby_coordinates_share_a_cell(self):
+        # ~300 m apart in central Paris
+        a = grid_cell(48.8566, 2.3522)
+        b = grid_cell(48.8581, 2.3491)
+        assert a.cell_id == b.cell_id == "48.86:2.35"
+        assert a.latitude == 48.86
+        assert a.longitude == 2.35
+
+    def test_distant_coordinates_get_distinct_cells(self):
+        assert grid_cell(48.8566, 2.3522).cell_id != grid_cell(51.5074, -0.1278).cell_id
+
+    def test_negative_zero_normalised(self):
+        assert grid_cell(-0.001, -0.001).cell_id == "0.00:0.00"
+
+    def test_group_by_cell_clusters_and_skips_missing_gps(self):
+        profiles = [
+            _profile("A", 48.8566, 2.3522),
+            _profile("B", 48.8581, 2.3491),
+            _profile("C", 51.5074, -0.1278),
+            _profile("D", None, None),
+        ]
+        groups = group_by_cell(profiles)
+        assert len(groups) == 2
+        members = {cid: [p.tenant_id for p in ps] for cid, (_, ps) in groups.items()}
+        assert members["48.86:2.35"] == ["A", "B"]
+
+    def test_column_records_tag_rows_with_cell(self):
+        cols = WeatherIngestionService.normalise_columns(_open_meteo_payload(hours=3))
+        fetched_at = datetime(2026, 3, 22, tzinfo=timezone.utc)
+        records = list(cols.records("48.86:2.35", fetched_at))
+        assert len(records) == 3
+        assert {r[0] for r in records} == {"48.86:2.35"}
+        assert records[0][2] == 1  # condition_code
+
+    @pytest.mark.asyncio
+    async def test_sync_cell_fetches_once_and_links_all_members(self):
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json = MagicMock(return_value=_open_meteo_payload(hours=2))
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(return_value=mock_response)
+
+        service = WeatherIngestionService(http_client=mock_http)
+        members = [_profile("A", 48.8566, 2.3522), _profile("B", 48.8581, 2.3491)]
+        cell = grid_cell(48.8566, 2.3522)
+        mock_db = AsyncMock()
+        no_state = MagicMock()
+        no_state.scalars.return_value.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=no_state)
+
+        with patch.object(service, "_upsert", new=AsyncMock(return_value=2)) as mock_upsert:
+            count = await service.sync_cell(cell, members, mock_db)
+
+        assert count == 2
+        mock_http.get.assert_awaited_once()
+        params = mock_http.get.call_args.kwargs["params"]
+        assert (params["latitude"], params["longitude"]) == (48.86, 2.35)
+        mock_upsert.assert_awaited_once()
+        link_params = mock_db.execute.call_args[0][1]
+        assert [p["property_id"] for p in link_params] == ["A", "B"]
+        assert {p["cell_id"] for p in link_params} == {"48.86:2.35"}
+
+
+# ---------------------------------------------------------------------------
+# Batch fetching -- multi-location Open-Meteo requests
+# ---------------------------------------------------------------------------
+
+def _json_response(payload: Any) -> MagicMock:
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.json = MagicMock(return_value=payload)
+    return resp
+
+
+class TestFetchCells:
+    @pytest.mark.asyncio
+    async def test_single_call_for_many_cells(self):
+        cells = [grid_cell(48.85, 2.35), grid_cell(51.51, -0.13), grid_cell(52.52, 13.40)]
+        payloads = [_open_meteo_payload(hours=h) for h in (1, 2, 3)]
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(return_value=_json_response(payloads))
+
+        result = await WeatherIngestionService(http_client=mock_http).fetch_cells(cells)
+
+        mock_http.get.assert_awaited_once()
+        params = mock_http.get.call_args.kwargs["params"]
+        assert params["latitude"] == "48.85,51.51,52.52"
+        assert params["longitude"] == "2.35,-0.13,13.4"
+        # Response array is split per cell, in request order
+        assert [len(result[c.cell_id]["hourly"]["time"]) for c in cells] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_chunks_by_batch_size(self):
+        cells = [grid_cell(40 + i, 2.0) for i in range(5)]
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(
+            side_effect=[
+                _json_response([_open_meteo_payload(1)] * 2),
+                _json_response([_open_meteo_payload(1)] * 2),
+                _json_response(_open_meteo_payload(1)),  # single location → object
+            ]
+        )
+
+        result = await WeatherIngestionService(http_client=mock_http).fetch_cells(
+            cells, batch_size=2
+        )
+
+        assert mock_http.get.await_count == 3
+        assert set(result) == {c.cell_id for c in cells}
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_skipped(self):
+        cells = [grid_cell(40 + i, 2.0) for i in range(2)]
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(
+            side_effect=[
+                _json_response([_open_meteo_payload(1)] * 3),  # length mismatch
+                _json_response(_open_meteo_payload(1)),
+            ]
+        )
 
-        for r in rows_a:
-            assert r.tenant_id == "A"
-        for r in rows_b:
-            assert r.tenant_id == "B"
+        result = await WeatherIngestionService(http_client=mock_http).fetch_cells(
+            cells, batch_size=1
+        )
 
-        ids_a = {r.tenant_id for r in rows_a}
-        ids_b = {r.tenant_id for r in rows_b}
-        assert ids_a.isdisjoint(ids_b)
+        assert set(result) == {cells[1].cell_id}
+
+
+# ---------------------------------------------------------------------------
+# Fetch cache -- model-run + TTL freshness, payload hash (in-memory SQLite)
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def async_session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+class TestFetchCache:
+    def test_current_model_run_floors_to_6h_cycle(self):
+        now = datetime(2026, 3, 22, 13, 47, tzinfo=timezone.utc)
+        assert current_model_run(now) == datetime(2026, 3, 22, 12, tzinfo=timezone.utc)
+
+    def test_payload_hash_depends_only_on_values(self):
+        payload = _open_meteo_payload(hours=3)
+        cols1 = WeatherIngestionService.normalise_columns(payload)
+        cols2 = WeatherIngestionService.normalise_columns(payload)
+        assert payload_hash(cols1) == payload_hash(cols2)
+        cols2.temperature_c[1] = 99.0
+        assert payload_hash(cols1) != payload_hash(cols2)
+
+    @pytest.mark.asyncio
+    async def test_fresh_cell_is_not_stale(self, async_session):
+        now = datetime(2026, 3, 22, 13, 0, tzinfo=timezone.utc)
+        async_session.add(
+            WeatherFetchState(
+                cell_id="48.86:2.35",
+                model_run=current_model_run(now),
+                fetched_at=now - timedelta(minutes=30),
+                payload_hash="x",
+            )
+        )
+        await async_session.commit()
+
+        cells = [grid_cell(48.8566, 2.3522), grid_cell(51.5074, -0.1278)]
+        stale = await WeatherIngestionService().stale_cells(cells, async_session, now=now)
+
+        assert [c.cell_id for c in stale] == ["51.51:-0.13"]
+
+    @pytest.mark.asyncio
+    async def test_expired_or_new_run_is_stale(self, async_session):
+        now = datetime(2026, 3, 22, 13, 0, tzinfo=timezone.utc)
+        async_session.add_all(
+            [
+                WeatherFetchState(  # same run, but older than the TTL
+                    cell_id="48.86:2.35",
+                    model_run=current_model_run(now),
+                    fetched_at=now - timedelta(hours=5),
+                    payload_hash="x",
+                ),
+                WeatherFetchState(  # recent, but from the previous run
+                    cell_id="51.51:-0.13",
+                    model_run=current_model_run(now) - timedelta(hours=6),
+                    fetched_at=now - timedelta(minutes=10),
+                    payload_hash="x",
+                ),
+            ]
+        )
+        await async_session.commit()
+
+        cells = [grid_cell(48.8566, 2.3522), grid_cell(51.5074, -0.1278)]
+        stale = await WeatherIngestionService().stale_cells(cells, async_session, now=now)
+
+        assert len(stale) == 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_fallback_is_idempotent(self, async_session):
+        from sqlalchemy import func, select
+
+        from app.db.models import WeatherCellForecast
+
+        service = WeatherIngestionService()
+        cols = WeatherIngestionService.normalise_columns(_open_meteo_payload(hours=3))
+
+        assert await service._upsert("48.86:2.35", cols, async_session) == 3
+        cols.temperature_c[0] = 30.0
+        assert await service._upsert("48.86:2.35", cols, async_session) == 3
+
+        total = await async_session.scalar(select(func.count()).select_from(WeatherCellForecast))
+        first = await async_session.scalar(
+            select(WeatherCellForecast.temperature_c).order_by(
+                WeatherCellForecast.forecast_timestamp
+            )
+        )
+        assert total == 3
+        assert first == 30.0
+
+    @pytest.mark.asyncio
+    async def test_unchanged_payload_skips_upsert(self, async_session):
+        service = WeatherIngestionService()
+        cell = grid_cell(48.8566, 2.3522)
+        payload = _open_meteo_payload(hours=3)
+
+        with (
+            patch.object(service, "_upsert", new=AsyncMock(return_value=3)) as mock_upsert,
+            patch.object(service, "link_properties", new=AsyncMock()),
+        ):
+            first = await service.store_cell(cell, [], payload, async_session)
+            second = await service.store_cell(cell, [], payload, async_session)
+
+        assert (first, second) == (3, 0)
+        mock_upsert.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_store_cell_is_one_transaction(self, async_session):
+        from sqlalchemy import func, select
+
+        from app.db.models import WeatherCellForecast, WeatherFetchState
+
+        service = WeatherIngestionService()
+        cell = grid_cell(48.8566, 2.3522)
+
+        with patch.object(
+            service, "link_properties", new=AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            with pytest.raises(RuntimeError):
+                await service.store_cell(
+                    cell, [], _open_meteo_payload(hours=3), async_session
+                )
+
+        # Neither the rows nor the payload hash survive the failed store
+        rows = await async_session.scalar(
+            select(func.count()).select_from(WeatherCellForecast)
+        )
+        states = await async_session.scalar(
+            select(func.count()).select_from(WeatherFetchState)
+        )
+        assert (rows, states) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_sync_property_skips_http_when_fresh(self):
+        mock_http = AsyncMock()
+        service = WeatherIngestionService(http_client=mock_http)
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = _profile("A", 48.8566, 2.3522)
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        with (
+            patch.object(service, "stale_cells", new=AsyncMock(return_value=[])),
+            patch.object(service, "link_properties", new=AsyncMock()) as mock_link,
+        ):
+            count = await service.sync_property("A", mock_db)
+
+        assert count == 0
+        mock_http.get.assert_not_called()
+        mock_link.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Window rollups -- 4-hour aggregates materialised at ingestion
+# ---------------------------------------------------------------------------
+
+def _hourly_payload(start_hour: int, codes: list, precip: list, temps: list, winds: list) -> dict:
+    return {
+        "hourly": {
+            "time": [f"2026-03-22T{start_hour + i:02d}:00" for i in range(len(codes))],
+            "temperature_2m": temps,
+            "precipitation_probability": precip,
+            "weathercode": codes,
+            "windspeed_10m": winds,
+        }
+    }
+
+
+class TestWindowRollups:
+    def test_hours_grouped_into_utc_aligned_windows(self):
+        payload = _hourly_payload(
+            2,
+            codes=[0, 1, 2, 3, 45, 3],
+            precip=[0, 10, 20, 30, 40, 50],
+            temps=[10.0, 12.0, 14.0, 16.0, 18.0, 20.0],
+            winds=[5.0, 7.0, 9.0, 11.0, 13.0, 15.0],
+        )
+        rollups = rollup_windows(WeatherIngestionService.normalise_columns(payload))
+
+        assert [r.window_start.hour for r in rollups] == [0, 4]
+        first, second = rollups
+        assert first.hours == 2 and second.hours == 4
+        assert first.mean_temperature_c == pytest.approx(11.0)
+        assert second.max_precipitation_prob == 50
+        assert second.mean_wind_speed_kmh == pytest.approx(12.0)
+        assert second.worst_condition_code == 45  # fog outranks overcast
+
+    def test_worst_condition_uses_severity_not_code_order(self):
+        # showers (80) has the highest code but rain (61) is more severe
+        payload = _hourly_payload(
+            8, codes=[3, 61, 45, 80], precip=[0, 0, 0, 0],
+            temps=[0.0] * 4, winds=[0.0] * 4,
+        )
+        [rollup] = rollup_windows(WeatherIngestionService.normalise_columns(payload))
+        assert rollup.worst_condition_code == 61
+
+    def test_missing_values_are_ignored(self):
+        payload = _hourly_payload(
+            0, codes=[None, 95], precip=[None, None], temps=[None, 9.0], winds=[None, 3.0],
+        )
+        [rollup] = rollup_windows(WeatherIngestionService.normalise_columns(payload))
+        assert rollup.worst_condition_code == 95
+        assert rollup.max_precipitation_prob is None
+        assert rollup.mean_temperature_c == 9.0
+
+    @pytest.mark.asyncio
+    async def test_upsert_materialises_windows_read_by_detection(self, async_session):
+        from app.db.models import PropertyWeatherCell
+        from app.services.anomaly_detection import AnomalyDetectionService
+
+        async_session.add(PropertyWeatherCell(property_id="A", tenant_id="A", cell_id="48.86:2.35"))
+        await async_session.commit()
+
+        payload = _hourly_payload(
+            12, codes=[1, 95, 2, 3], precip=[10, 90, 20, 5],
+            temps=[20.0, 18.0, 16.0, 14.0], winds=[10.0, 50.0, 30.0, 30.0],
+        )
+        cols = WeatherIngestionService.normalise_columns(payload)
+        await WeatherIngestionService()._upsert("48.86:2.35", cols, async_session)
+
+        window = await AnomalyDetectionService()._get_weather_for_window(
+            async_session, "A", datetime(2026, 3, 22, 12, tzinfo=timezone.utc)
+        )
+
+        assert window is not None
+        assert window.worst_condition_code == 95
+        assert window.max_precipitation_prob == 90
+        assert window.mean_temperature_c == pytest.approx(17.0)
+        assert window.mean_wind_speed_kmh == pytest.approx(30.0)
 
 
 # ---------------------------------------------------------------------------
@@ -291,3 +649,71 @@ class TestWeatherSyncEndpoint:
         data = resp.json()
         assert "propertyId" in data
         assert "property_id" not in data
+
+    def test_forecasts_returns_joined_rows(self):
+        from app.core.security import get_current_user
+        from app.db.session import get_db
+
+        app = _make_weather_app()
+        app.dependency_overrides[get_current_user] = lambda: self._user()
+        app.dependency_overrides[get_db] = self._db_with_profile(self._mock_profile())
+
+        row = {
+            "id": 1,
+            "tenant_id": "tenant-A",
+            "property_id": "tenant-A",
+            "condition_code": 61,
+            "temperature_c": 12.5,
+            "precipitation_prob": 80,
+            "wind_speed_kmh": 14.0,
+            "forecast_timestamp": datetime(2026, 3, 22, 12, tzinfo=timezone.utc),
+            "fetched_at": None,
+        }
+        with patch(
+            "app.api.routes.weather._service.get_forecasts_for_property",
+            new=AsyncMock(return_value=[row]),
+        ) as mock_get:
+            resp = TestClient(app).get("/api/v1/weather/forecasts?hours=24")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data[0]["propertyId"] == "tenant-A"
+        assert data[0]["conditionCode"] == 61
+        assert mock_get.call_args.kwargs["hours"] == 24
+
+    def test_forecasts_rejects_property_of_another_user(self):
+        from app.core.security import get_current_user
+        from app.db.session import get_db
+
+        app = _make_weather_app()
+        app.dependency_overrides[get_current_user] = lambda: self._user()
+        # The owner-scoped lookup finds nothing for a foreign tenant_id
+        app.dependency_overrides[get_db] = self._db_with_profile(None)
+
+        with patch(
+            "app.api.routes.weather._service.get_forecasts_for_property",
+            new=AsyncMock(return_value=[]),
+        ) as mock_get:
+            resp = TestClient(app).get("/api/v1/weather/forecasts?tenant_id=tenant-B")
+
+        assert resp.status_code == 403
+        mock_get.assert_not_awaited()
+
+    def test_forecasts_for_owned_property(self):
+        from app.core.security import get_current_user
+        from app.db.session import get_db
+
+        app = _make_weather_app()
+        app.dependency_overrides[get_current_user] = lambda: self._user()
+        app.dependency_overrides[get_db] = self._db_with_profile(
+            self._mock_profile(tenant_id="tenant-B")
+        )
+
+        with patch(
+            "app.api.routes.weather._service.get_forecasts_for_property",
+            new=AsyncMock(return_value=[]),
+        ) as mock_get:
+            resp = TestClient(app).get("/api/v1/weather/forecasts?tenant_id=tenant-B")
+
+        assert resp.status_code == 200
+        assert mock_get.call_args.args[0] == "tenant-B"
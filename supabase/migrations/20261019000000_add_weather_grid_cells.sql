@@ -0,0 +1,47 @@
+-- HOS-83 follow-up: geo-deduplicated weather storage
+-- Properties are grouped by rounded lat/lon grid cell (2 decimals ≈ 1.1 km);
+-- each cell's 7-day hourly forecast is fetched and stored once and joined to
+-- properties at read time via property_weather_cells.
+--
+-- weather_forecasts (per-property copy) is no longer written by the sync job.
+
+-- ── Shared per-cell forecasts ───────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS weather_cell_forecasts (
+    id                 BIGSERIAL   PRIMARY KEY,
+    cell_id            TEXT        NOT NULL,   -- "<lat>:<lng>" rounded, e.g. "48.86:2.35"
+    condition_code     INTEGER,
+    temperature_c      DOUBLE PRECISION,
+    precipitation_prob INTEGER     CHECK (precipitation_prob BETWEEN 0 AND 100),
+    wind_speed_kmh     DOUBLE PRECISION,
+    forecast_timestamp TIMESTAMPTZ NOT NULL,
+    source             TEXT        NOT NULL DEFAULT 'open-meteo',
+    fetched_at         TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at         TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT uq_weather_cell_forecast UNIQUE (cell_id, forecast_timestamp)
+);
+
+CREATE INDEX IF NOT EXISTS idx_weather_cell_ts
+    ON weather_cell_forecasts (forecast_timestamp);
+
+-- Forecasts are public data — no tenant column; readable by any authenticated user.
+ALTER TABLE weather_cell_forecasts ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "read_all_authenticated" ON weather_cell_forecasts FOR SELECT
+    TO authenticated USING (true);
+
+
+-- ── Property -> cell link ───────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS property_weather_cells (
+    property_id TEXT        PRIMARY KEY,
+    tenant_id   TEXT        NOT NULL
+                    REFERENCES restaurant_profiles(tenant_id)
+                    ON DELETE CASCADE,
+    cell_id     TEXT        NOT NULL,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_property_weather_cells_tenant ON property_weather_cells (tenant_id);
+CREATE INDEX IF NOT EXISTS idx_property_weather_cells_cell   ON property_weather_cells (cell_id);
+
+ALTER TABLE property_weather_cells ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON property_weather_cells FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
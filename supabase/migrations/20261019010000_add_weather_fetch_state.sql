@@ -0,0 +1,14 @@
+-- HOS-83 follow-up: conditional / cached weather fetches
+-- One row per weather grid cell recording the last fetch. The sync job skips
+-- the HTTP call while (model_run = current 6-hour run AND fetched_at within
+-- the freshness TTL), and skips the upsert when payload_hash is unchanged.
+
+CREATE TABLE IF NOT EXISTS weather_fetch_state (
+    cell_id      TEXT        PRIMARY KEY,
+    model_run    TIMESTAMPTZ NOT NULL,
+    fetched_at   TIMESTAMPTZ NOT NULL,
+    payload_hash TEXT        NOT NULL   -- sha256 hex of normalized forecast values
+);
+
+-- Internal bookkeeping only — no tenant data, not exposed to clients.
+ALTER TABLE weather_fetch_state ENABLE ROW LEVEL SECURITY;
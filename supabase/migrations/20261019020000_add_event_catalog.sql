@@ -0,0 +1,53 @@
+-- HOS-84 follow-up: shared PredictHQ event catalogue
+-- Nearby properties are clustered into one covering `within` query; each
+-- event is stored once in event_catalog (keyed by PredictHQ event_id) and
+-- linked to every property whose search radius contains it via
+-- property_events.
+--
+-- local_events (per-tenant copy) is no longer written by the sync job.
+
+-- ── Shared event catalogue ──────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS event_catalog (
+    event_id       TEXT        PRIMARY KEY,   -- PredictHQ event UUID
+    title          TEXT        NOT NULL,
+    category       TEXT        NOT NULL,
+    rank           INTEGER     CHECK (rank BETWEEN 0 AND 100),
+    local_rank     INTEGER     CHECK (local_rank BETWEEN 0 AND 100),
+    phq_attendance INTEGER,
+    start_dt       TIMESTAMPTZ NOT NULL,
+    end_dt         TIMESTAMPTZ,
+    latitude       DOUBLE PRECISION,
+    longitude      DOUBLE PRECISION,
+    raw_labels     JSONB,
+    fetched_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_catalog_start ON event_catalog (start_dt);
+
+-- Events are public data — no tenant column; readable by any authenticated user.
+ALTER TABLE event_catalog ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "read_all_authenticated" ON event_catalog FOR SELECT
+    TO authenticated USING (true);
+
+
+-- ── Property -> event link ──────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS property_events (
+    property_id TEXT        NOT NULL,
+    event_id    TEXT        NOT NULL
+                    REFERENCES event_catalog(event_id)
+                    ON DELETE CASCADE,
+    tenant_id   TEXT        NOT NULL
+                    REFERENCES restaurant_profiles(tenant_id)
+                    ON DELETE CASCADE,
+    distance_km DOUBLE PRECISION,             -- NULL when the event has no centroid
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (property_id, event_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_property_events_tenant ON property_events (tenant_id);
+CREATE INDEX IF NOT EXISTS idx_property_events_event  ON property_events (event_id);
+
+ALTER TABLE property_events ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON property_events FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
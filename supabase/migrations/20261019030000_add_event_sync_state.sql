@@ -0,0 +1,18 @@
+-- HOS-84 follow-up: incremental PredictHQ sync
+-- event_catalog keeps PredictHQ's `updated` timestamp so re-delivered events
+-- overwrite the stored row only when newer. event_sync_state stores a
+-- per-cluster watermark; incremental runs request `updated.gte=<watermark>`
+-- and a full window re-fetch is forced once full_synced_at is older than
+-- EVENT_FULL_RESYNC_HOURS (default 24).
+
+ALTER TABLE event_catalog ADD COLUMN IF NOT EXISTS phq_updated TIMESTAMPTZ;
+
+CREATE TABLE IF NOT EXISTS event_sync_state (
+    cluster_id        TEXT        PRIMARY KEY,   -- "<lat>:<lng>:<query_radius_km>"
+    updated_watermark TIMESTAMPTZ,               -- NULL until PredictHQ returns `updated`
+    synced_at         TIMESTAMPTZ NOT NULL,
+    full_synced_at    TIMESTAMPTZ NOT NULL
+);
+
+-- Internal sync bookkeeping — service role only, no tenant access.
+ALTER TABLE event_sync_state ENABLE ROW LEVEL SECURITY;
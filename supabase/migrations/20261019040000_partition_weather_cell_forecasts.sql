@@ -0,0 +1,75 @@
+-- Monthly RANGE partitioning + retention for weather_cell_forecasts
+-- Detection only reads the next 14 days, yet forecasts for past hours were
+-- never removed. The table is rebuilt as a partitioned table on
+-- forecast_timestamp; DataRetentionService (daily job) creates partitions
+-- PARTITION_MONTHS_AHEAD months ahead and drops/detaches months older than
+-- WEATHER_RETENTION_DAYS.
+--
+-- Partitioned tables require the partition key in every unique constraint,
+-- hence PRIMARY KEY (id, forecast_timestamp). uq_weather_cell_forecast
+-- already includes it, so the ingestion ON CONFLICT target is unchanged.
+--
+-- event_catalog is not partitioned: its event_id key is both the upsert
+-- target and the property_events FK target. Ended events are pruned by an
+-- indexed DELETE in the same job instead.
+
+ALTER TABLE weather_cell_forecasts RENAME TO weather_cell_forecasts_unpartitioned;
+ALTER TABLE weather_cell_forecasts_unpartitioned
+    RENAME CONSTRAINT uq_weather_cell_forecast TO uq_weather_cell_forecast_unpartitioned;
+ALTER INDEX IF EXISTS idx_weather_cell_ts RENAME TO idx_weather_cell_ts_unpartitioned;
+
+CREATE TABLE weather_cell_forecasts (
+    id                 BIGSERIAL,
+    cell_id            TEXT        NOT NULL,
+    condition_code     INTEGER,
+    temperature_c      DOUBLE PRECISION,
+    precipitation_prob INTEGER     CHECK (precipitation_prob BETWEEN 0 AND 100),
+    wind_speed_kmh     DOUBLE PRECISION,
+    forecast_timestamp TIMESTAMPTZ NOT NULL,
+    source             TEXT        NOT NULL DEFAULT 'open-meteo',
+    fetched_at         TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at         TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, forecast_timestamp),
+    CONSTRAINT uq_weather_cell_forecast UNIQUE (cell_id, forecast_timestamp)
+) PARTITION BY RANGE (forecast_timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_weather_cell_ts
+    ON weather_cell_forecasts (forecast_timestamp);
+
+-- Partitions from the retention horizon (3 months back) to 2 months ahead,
+-- named <table>_yYYYYmMM as expected by DataRetentionService.
+DO $$
+DECLARE
+    m DATE := (date_trunc('month', NOW()) - INTERVAL '3 months')::date;
+BEGIN
+    WHILE m <= (date_trunc('month', NOW()) + INTERVAL '2 months')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF weather_cell_forecasts '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'weather_cell_forecasts_' || to_char(m, '"y"YYYY"m"MM'),
+            m,
+            (m + INTERVAL '1 month')::date
+        );
+        m := (m + INTERVAL '1 month')::date;
+    END LOOP;
+END $$;
+
+INSERT INTO weather_cell_forecasts (
+    cell_id, condition_code, temperature_c, precipitation_prob,
+    wind_speed_kmh, forecast_timestamp, source, fetched_at, created_at
+)
+SELECT cell_id, condition_code, temperature_c, precipitation_prob,
+       wind_speed_kmh, forecast_timestamp, source, fetched_at, created_at
+FROM weather_cell_forecasts_unpartitioned
+WHERE forecast_timestamp >= date_trunc('month', NOW()) - INTERVAL '3 months'
+  AND forecast_timestamp <  date_trunc('month', NOW()) + INTERVAL '3 months';
+
+DROP TABLE weather_cell_forecasts_unpartitioned;
+
+ALTER TABLE weather_cell_forecasts ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "read_all_authenticated" ON weather_cell_forecasts FOR SELECT
+    TO authenticated USING (true);
+
+-- Retention DELETE for ended events (COALESCE(end_dt, start_dt) < cutoff)
+CREATE INDEX IF NOT EXISTS idx_event_catalog_expiry
+    ON event_catalog ((COALESCE(end_dt, start_dt)));
@@ -0,0 +1,29 @@
+-- HOS-83 follow-up: 4-hour weather rollups materialised at ingestion
+-- Each weather sync aggregates a cell's hourly forecast into UTC-aligned
+-- 4-hour windows (00, 04, ... 20h) — worst WMO condition by severity, max
+-- precipitation probability, mean temperature and wind — so anomaly
+-- detection reads one row per window instead of sorting hourly rows.
+
+CREATE TABLE IF NOT EXISTS weather_cell_windows (
+    cell_id                TEXT        NOT NULL,
+    window_start           TIMESTAMPTZ NOT NULL,
+    worst_condition_code   INTEGER,
+    max_precipitation_prob INTEGER     CHECK (max_precipitation_prob BETWEEN 0 AND 100),
+    mean_temperature_c     DOUBLE PRECISION,
+    mean_wind_speed_kmh    DOUBLE PRECISION,
+    hours                  INTEGER     NOT NULL,   -- hourly rows aggregated (<= 4)
+    fetched_at             TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (cell_id, window_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_weather_cell_windows_start
+    ON weather_cell_windows (window_start);
+
+-- Forecasts are public data — no tenant column; readable by any authenticated user.
+ALTER TABLE weather_cell_windows ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "read_all_authenticated" ON weather_cell_windows FOR SELECT
+    TO authenticated USING (true);
+
+-- Forget stored payload hashes so the next sync rewrites every cell (and
+-- backfills its windows) instead of skipping unchanged forecasts.
+DELETE FROM weather_fetch_state;
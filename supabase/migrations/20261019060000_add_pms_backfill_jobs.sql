@@ -0,0 +1,30 @@
+-- Story 2.2 follow-up: resumable bulk PMS history backfill
+-- A backfill splits [start_date, end_date] into chunk_days chunks fetched
+-- concurrently through the PMS adapter. Each chunk's pms_sync_logs rows and
+-- its entry in completed_chunks are committed together, so re-running a
+-- failed or interrupted job only fetches the missing chunks.
+
+CREATE TABLE IF NOT EXISTS pms_backfill_jobs (
+    id               SERIAL      PRIMARY KEY,
+    tenant_id        TEXT        NOT NULL
+                         REFERENCES restaurant_profiles(tenant_id)
+                         ON DELETE CASCADE,
+    start_date       DATE        NOT NULL,
+    end_date         DATE        NOT NULL,          -- inclusive
+    chunk_days       INTEGER     NOT NULL CHECK (chunk_days > 0),
+    adapter          TEXT        NOT NULL,          -- mock | apaleo_mcp | apaleo_raw
+    status           TEXT        NOT NULL DEFAULT 'pending',  -- pending, running, completed, partial, failed
+    chunks_total     INTEGER     NOT NULL DEFAULT 0,
+    completed_chunks JSONB       NOT NULL DEFAULT '[]'::jsonb, -- ISO start date per finished chunk
+    rows_written     INTEGER     NOT NULL DEFAULT 0,
+    error_message    TEXT,
+    created_at       TIMESTAMP   NOT NULL DEFAULT NOW(),
+    updated_at       TIMESTAMP   NOT NULL DEFAULT NOW(),
+    CHECK (end_date >= start_date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pms_backfill_jobs_tenant ON pms_backfill_jobs (tenant_id);
+
+ALTER TABLE pms_backfill_jobs ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON pms_backfill_jobs FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
@@ -0,0 +1,25 @@
+-- Story 2.4 follow-up: incremental captation baselines
+-- Every baseline factor is a ratio of means, so per-weekday and per-month
+-- captation-rate sums and counts are enough to derive it. Each PMS sync
+-- folds its day into this row in O(1); CaptationService.calculate_baseline
+-- rebuilds it from pms_sync_logs (repair path, and after a backfill).
+-- Tenants without a row are seeded by their next sync.
+
+CREATE TABLE IF NOT EXISTS captation_running_stats (
+    tenant_id      TEXT        PRIMARY KEY
+                       REFERENCES restaurant_profiles(tenant_id)
+                       ON DELETE CASCADE,
+    samples_count  INTEGER     NOT NULL DEFAULT 0,
+    rate_sum       DOUBLE PRECISION NOT NULL DEFAULT 0,
+    dow_counts     JSONB       NOT NULL DEFAULT '{}'::jsonb,  -- {"0": n, ...} 0=Monday
+    dow_sums       JSONB       NOT NULL DEFAULT '{}'::jsonb,
+    month_counts   JSONB       NOT NULL DEFAULT '{}'::jsonb,  -- {"1": n, ..., "12": n}
+    month_sums     JSONB       NOT NULL DEFAULT '{}'::jsonb,
+    period_start   DATE,
+    period_end     DATE,
+    updated_at     TIMESTAMP   NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE captation_running_stats ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON captation_running_stats FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
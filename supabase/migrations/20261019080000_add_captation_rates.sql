@@ -0,0 +1,23 @@
+-- Story 2.4 → 3.3a: hour-block captation rates for the anomaly detector
+-- AnomalyDetectionService looks up baseline F&B demand per
+-- (property, weekday, 4-hour UTC block). Rows are materialized from
+-- captation_baselines by app/services/captation_rates.py after every
+-- baseline update: 42 rows per property (7 weekdays × 6 blocks).
+
+CREATE TABLE IF NOT EXISTS captation_rates (
+    property_id      TEXT          NOT NULL,
+    day_of_week      TEXT          NOT NULL
+                         CHECK (day_of_week IN ('monday', 'tuesday', 'wednesday', 'thursday',
+                                                'friday', 'saturday', 'sunday')),
+    hour_block       SMALLINT      NOT NULL CHECK (hour_block IN (0, 4, 8, 12, 16, 20)),
+    tenant_id        TEXT          NOT NULL,
+    baseline_revenue NUMERIC(10,2) NOT NULL,
+    updated_at       TIMESTAMP     NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (property_id, day_of_week, hour_block)
+);
+
+CREATE INDEX IF NOT EXISTS idx_captation_rates_tenant ON captation_rates (tenant_id);
+
+ALTER TABLE captation_rates ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON captation_rates FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
@@ -0,0 +1,16 @@
+-- Story 2.4 follow-up: exponentially weighted captation baselines
+-- With CAPTATION_BASELINE_MODE=ewma every baseline mean is weighted by
+-- 0.5 ^ (age_days / half_life), relative to ewma_reference_date (the newest
+-- sample). The decayed sums are updated in O(1) per sync like the plain
+-- ones. NULL ewma_half_life_days = not maintained (mean mode); a tenant whose
+-- half-life differs from the configured one is rebuilt on its next sync.
+
+ALTER TABLE captation_running_stats
+    ADD COLUMN IF NOT EXISTS ewma_half_life_days DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS ewma_reference_date DATE,
+    ADD COLUMN IF NOT EXISTS ewma_weight         DOUBLE PRECISION NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS ewma_rate_sum       DOUBLE PRECISION NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS ewma_dow_weights    JSONB NOT NULL DEFAULT '{}'::jsonb,
+    ADD COLUMN IF NOT EXISTS ewma_dow_sums       JSONB NOT NULL DEFAULT '{}'::jsonb,
+    ADD COLUMN IF NOT EXISTS ewma_month_weights  JSONB NOT NULL DEFAULT '{}'::jsonb,
+    ADD COLUMN IF NOT EXISTS ewma_month_sums     JSONB NOT NULL DEFAULT '{}'::jsonb;
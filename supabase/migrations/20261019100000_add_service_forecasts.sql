@@ -0,0 +1,22 @@
+-- Materialized Prophet forecasts per (tenant, service type, date)
+-- Written nightly and after training by app/services/forecast_materializer.py
+-- for the next FORECAST_HORIZON_DAYS days. AetherixEngine.get_forecast reads
+-- this table and only runs Prophet live on a miss (no row, or a row computed
+-- by an older model_version than the one in the model registry).
+
+CREATE TABLE IF NOT EXISTS service_forecasts (
+    tenant_id        TEXT             NOT NULL,
+    service_type     TEXT             NOT NULL,
+    target_date      DATE             NOT NULL,
+    model_version    BIGINT           NOT NULL,
+    predicted_covers INTEGER          NOT NULL CHECK (predicted_covers >= 0),
+    range_min        INTEGER          NOT NULL,
+    range_max        INTEGER          NOT NULL,
+    confidence       DOUBLE PRECISION NOT NULL,
+    generated_at     TIMESTAMP        NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (tenant_id, service_type, target_date)
+);
+
+ALTER TABLE service_forecasts ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON service_forecasts FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
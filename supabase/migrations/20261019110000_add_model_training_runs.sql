@@ -0,0 +1,26 @@
+-- Per-tenant Prophet training runs
+-- app/services/model_training.py fits one model per (tenant, service type)
+-- in a process pool and saves it to the model registry. Each fit records its
+-- outcome, duration and in-sample error (MAE / MAPE on the training frame).
+
+CREATE TABLE IF NOT EXISTS model_training_runs (
+    id             SERIAL           PRIMARY KEY,
+    tenant_id      TEXT             NOT NULL,
+    service_type   TEXT             NOT NULL,
+    status         TEXT             NOT NULL
+                       CHECK (status IN ('trained', 'insufficient_data', 'failed')),
+    model_version  BIGINT,
+    training_rows  INTEGER          NOT NULL DEFAULT 0,
+    fit_seconds    DOUBLE PRECISION,
+    in_sample_mae  DOUBLE PRECISION,
+    in_sample_mape DOUBLE PRECISION,
+    error_message  TEXT,
+    created_at     TIMESTAMP        NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_model_training_runs_tenant
+    ON model_training_runs (tenant_id, service_type, created_at DESC);
+
+ALTER TABLE model_training_runs ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "tenant_isolation" ON model_training_runs FOR ALL
+    USING (tenant_id = (auth.jwt() ->> 'tenant_id'));
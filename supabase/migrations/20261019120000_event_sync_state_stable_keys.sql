@@ -0,0 +1,13 @@
+-- Stable event sync cluster keys
+-- event_sync_state was keyed by "<lat>:<lng>:<query_radius_km>" of the
+-- cluster centroid, so any membership change orphaned the row and reset the
+-- watermark. Clusters are now keyed by their seed property's tenant_id, and
+-- member_ids records the properties covered by the stored watermark: a
+-- cluster that gained a member is fully re-fetched once so the newcomer's
+-- links are complete.
+
+ALTER TABLE event_sync_state ADD COLUMN IF NOT EXISTS member_ids TEXT;  -- comma-separated, sorted
+
+-- Rows under the old centroid keys can never be matched again; the next run
+-- of each cluster performs a full fetch and writes the new key.
+DELETE FROM event_sync_state;
@@ -0,0 +1,10 @@
+-- DEFAULT partition for weather_cell_forecasts
+-- Without it, an upsert for an hour beyond the last pre-created month (job
+-- not run yet, clock skew, a longer forecast horizon) fails with "no
+-- partition of relation found for row" and aborts the whole cell. Such
+-- rows now land in weather_cell_forecasts_default; when DataRetentionService
+-- later creates that month's partition it moves the rows out of the default
+-- partition before attaching the new one, and prunes expired rows from it.
+
+CREATE TABLE IF NOT EXISTS weather_cell_forecasts_default
+    PARTITION OF weather_cell_forecasts DEFAULT;